@@ -14,15 +14,21 @@ break the band.
 
 Standard deviation uses the *population* form (``statistics.pstdev``) so the
 band reflects the full observed history rather than an inferential estimate.
+``compute_wellness_baseline_series`` is the date-range form: it computes the
+same bands for every day in one NumPy sliding-window pass.
 """
 
 from __future__ import annotations
 
 import statistics
+from bisect import bisect_right
 from collections.abc import Sequence
 from dataclasses import asdict, dataclass
 from typing import Any
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
 # Default trailing window (days) used to build the personal baseline band.
 DEFAULT_WINDOW_DAYS = 30
 
@@ -89,20 +95,44 @@ def compute_metric_baseline(
     n = len(present)
 
     if n < min_samples or today is None:
-        return MetricBaseline(
-            metric=metric,
-            mean=None,
-            std=None,
-            today=today,
-            z=None,
-            flag="insufficient",
-            adverse=False,
-            n=n,
-        )
+        return _insufficient(metric, today, n)
+
+    return _position_in_band(
+        metric,
+        statistics.mean(present),
+        statistics.pstdev(present),
+        today,
+        n,
+        direction=direction,
+        sd_threshold=sd_threshold,
+    )
 
-    mean = statistics.mean(present)
-    std = statistics.pstdev(present)
 
+def _insufficient(metric: str, today: float | None, n: int) -> MetricBaseline:
+    """Block for a band with too few samples or an unmeasured day."""
+    return MetricBaseline(
+        metric=metric,
+        mean=None,
+        std=None,
+        today=today,
+        z=None,
+        flag="insufficient",
+        adverse=False,
+        n=n,
+    )
+
+
+def _position_in_band(
+    metric: str,
+    mean: float,
+    std: float,
+    today: float,
+    n: int,
+    *,
+    direction: str,
+    sd_threshold: float,
+) -> MetricBaseline:
+    """Judge ``today`` against a band given its (unrounded) mean / SD."""
     if std == 0:
         # Degenerate band: no spread -> today cannot deviate in SD units.
         z = 0.0
@@ -167,13 +197,7 @@ def compute_wellness_baseline_deviation(
         ``rows`` yields all-``insufficient`` blocks and ``overall_flag=False``.
     """
     if not rows:
-        empty = {
-            label: asdict(
-                compute_metric_baseline([], None, metric=label, direction=direction)
-            )
-            for label, _col, direction in _METRICS
-        }
-        return {"date": None, **empty, "overall_flag": False}
+        return _empty_deviation()
 
     today_row = rows[-1]
     history = rows[:-1][-window_days:]
@@ -197,6 +221,112 @@ def compute_wellness_baseline_deviation(
     return result
 
 
+def compute_wellness_baseline_series(
+    rows: Sequence[dict[str, Any]],
+    days: Sequence[str],
+    *,
+    window_days: int = DEFAULT_WINDOW_DAYS,
+    sd_threshold: float = DEFAULT_SD_THRESHOLD,
+) -> list[dict[str, Any]]:
+    """``compute_wellness_baseline_deviation`` for every day of a range at once.
+
+    Instead of re-slicing ``rows`` and re-running ``statistics`` per day, each
+    metric's trailing-window count / mean / SD is computed for *every* row in
+    one NumPy pass over a ``(rows, window_days)`` sliding-window view, and each
+    requested day then reads the statistics of its latest row.
+
+    Args:
+        rows: ``daily_wellness`` rows ascending by date (same shape as for
+            ``compute_wellness_baseline_deviation``).
+        days: Target ``YYYY-MM-DD`` days, ascending.
+        window_days: Trailing window (days) used to build each band.
+        sd_threshold: Band half-width in SDs.
+
+    Returns:
+        One deviation dict per entry of ``days``, equal to
+        ``compute_wellness_baseline_deviation`` over the rows dated on or
+        before that day (trimmed to ``window_days + 1``). A day with no rows on
+        or before it gets the empty all-``insufficient`` result.
+    """
+    if not rows or not days:
+        return [_empty_deviation() for _ in days]
+
+    row_dates = [_row_date(r) or "" for r in rows]
+    stats = {}
+    for _label, col, _direction in _METRICS:
+        raw = [r.get(col) for r in rows]
+        stats[col] = (raw, *_trailing_stats(raw, window_days))
+
+    results: list[dict[str, Any]] = []
+    for day in days:
+        k = bisect_right(row_dates, day) - 1
+        if k < 0:
+            results.append(_empty_deviation())
+            continue
+
+        result: dict[str, Any] = {"date": row_dates[k]}
+        overall_flag = False
+        for label, col, direction in _METRICS:
+            raw, n, mean, std = stats[col]
+            today = raw[k]
+            if n[k] < DEFAULT_MIN_SAMPLES or today is None:
+                baseline = _insufficient(label, today, int(n[k]))
+            else:
+                baseline = _position_in_band(
+                    label,
+                    float(mean[k]),
+                    float(std[k]),
+                    today,
+                    int(n[k]),
+                    direction=direction,
+                    sd_threshold=sd_threshold,
+                )
+            result[label] = asdict(baseline)
+            if baseline.adverse and baseline.flag in {"low", "high"}:
+                overall_flag = True
+        result["overall_flag"] = overall_flag
+        results.append(result)
+    return results
+
+
+def _trailing_stats(
+    values: Sequence[float | None], window_days: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Non-null count, mean and population SD of the window before each row.
+
+    Row ``k``'s window is ``values[max(0, k - window_days):k]`` (the row itself
+    excluded). A window whose present values are all equal gets an SD of
+    exactly ``0.0`` (as ``statistics.pstdev`` would), not float residue.
+    """
+    arr = np.array([np.nan if v is None else float(v) for v in values])
+    padded = np.concatenate([np.full(window_days, np.nan), arr])
+    windows = sliding_window_view(padded, window_days)[: len(arr)]
+
+    present = ~np.isnan(windows)
+    n = present.sum(axis=1)
+    safe_n = np.maximum(n, 1)
+    filled = np.where(present, windows, 0.0)
+    mean = filled.sum(axis=1) / safe_n
+    dev = np.where(present, windows - mean[:, None], 0.0)
+    std = np.sqrt((dev * dev).sum(axis=1) / safe_n)
+    flat = np.where(present, windows, -np.inf).max(axis=1) == np.where(
+        present, windows, np.inf
+    ).min(axis=1)
+    std = np.where(flat, 0.0, std)
+    return n, mean, std
+
+
+def _empty_deviation() -> dict[str, Any]:
+    """All-``insufficient`` result for a day without wellness rows."""
+    empty = {
+        label: asdict(
+            compute_metric_baseline([], None, metric=label, direction=direction)
+        )
+        for label, _col, direction in _METRICS
+    }
+    return {"date": None, **empty, "overall_flag": False}
+
+
 def _row_date(row: dict[str, Any]) -> str | None:
     """Stringified ``date`` field of a row (null-safe)."""
     value = row.get("date")
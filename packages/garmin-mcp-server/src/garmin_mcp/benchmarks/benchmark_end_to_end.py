@@ -0,0 +1,509 @@
+"""
+End-to-end benchmark on a synthetic multi-year dataset.
+
+For each dataset size (default 100 / 1,000 / 5,000 activities) a fresh data
+directory is generated with ``benchmarks/synthetic_dataset.py`` and measured:
+1. Ingest: weight + wellness range ingest, then ``GarminIngestWorker``
+   per activity (raw cache only, no Garmin API calls)
+2. Every registered MCP tool called through ``tools.registry.dispatch``
+   (tools that write or call the Garmin API are skipped)
+3. Every garmin-web ``/api`` GET endpoint through FastAPI's ``TestClient``
+   (skipped when garmin-web is not installed)
+4. Full regeneration with ``DuckDBRegenerator(delete_old_db=True)``
+
+Results are compared against ``REGRESSION_THRESHOLDS`` (absolute budgets) and,
+when present, the previous results file (relative tolerance); regressions are
+listed in the results JSON and make the CLI exit non-zero.
+
+Usage:
+    python -m garmin_mcp.benchmarks.benchmark_end_to_end \
+        [--sizes 100 1000 5000] [--repeat N] [--sample-interval S]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import date, timedelta
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from garmin_mcp.benchmarks.synthetic_dataset import (
+    SyntheticActivity,
+    SyntheticDataset,
+    generate_dataset,
+)
+from garmin_mcp.config import get_config
+from garmin_mcp.database.connection import get_db_path
+from garmin_mcp.database.db_reader import GarminDBReader
+from garmin_mcp.database.db_writer import GarminDBWriter
+from garmin_mcp.handlers.base import format_json_response
+from garmin_mcp.ingest.garmin_worker import GarminIngestWorker
+from garmin_mcp.ingest.weight_ingest import ingest_weight_range
+from garmin_mcp.ingest.wellness_ingest import ingest_wellness_range
+from garmin_mcp.scripts.regenerate_duckdb import DuckDBRegenerator
+from garmin_mcp.tools import ALL_DEFS, ALL_DEFS_BY_NAME
+from garmin_mcp.tools.registry import ToolDef, dispatch
+from garmin_mcp.utils.paths import get_result_dir
+
+SIZES = (100, 1_000, 5_000)
+
+# Absolute budgets per size; a metric above its budget is a regression.
+REGRESSION_THRESHOLDS: dict[str, float] = {
+    "ingest_s_per_activity": 15.0,
+    "regenerate_s_per_activity": 15.0,
+    "slowest_tool_median_ms": 5_000.0,
+    "slowest_endpoint_median_ms": 5_000.0,
+}
+
+# Allowed slowdown against the previous results file, ignoring differences
+# below the noise floor.
+RELATIVE_TOLERANCE = 1.25
+NOISE_FLOOR_MS = 50.0
+
+# Tools that write user data, schedule workouts or call the Garmin API.
+EXCLUDED_TOOLS = frozenset(
+    {
+        "ingest_activity",
+        "insert_section_analysis_dict",
+        "get_garmin_scheduled_workouts",
+        "save_athlete_profile",
+        "save_weekly_review",
+        "ingest_strength_sessions",
+        "catch_up_ingest",
+        "schedule_custom_workout",
+        "cleanup_generated_workouts",
+        "ingest_hiking_sessions",
+    }
+)
+
+
+def benchmark_output_path() -> Path:
+    """Path for the end-to-end benchmark results JSON (under the result dir)."""
+    return get_result_dir() / "benchmarks" / "end_to_end.json"
+
+
+@contextmanager
+def _isolated_data_dir(data_dir: Path) -> Iterator[None]:
+    """Point ``GARMIN_DATA_DIR`` / ``GARMIN_RESULT_DIR`` at ``data_dir``."""
+    saved = {
+        key: os.environ.get(key) for key in ("GARMIN_DATA_DIR", "GARMIN_RESULT_DIR")
+    }
+    os.environ["GARMIN_DATA_DIR"] = str(data_dir)
+    os.environ["GARMIN_RESULT_DIR"] = str(data_dir / "results")
+    get_config.cache_clear()
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        get_config.cache_clear()
+
+
+def _timed(func: Callable[[], Any], repeat: int) -> tuple[Any, list[float]]:
+    """Run ``func`` ``repeat`` times; return the last result and timings (ms)."""
+    result: Any = None
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return result, timings
+
+
+def _probe_activity(dataset: SyntheticDataset) -> SyntheticActivity:
+    """Most recent interval session (richest splits), else the latest run."""
+    intervals = [a for a in dataset.activities if a.workout == "intervals"]
+    return (intervals or dataset.activities)[-1]
+
+
+def _tool_values(dataset: SyntheticDataset) -> dict[str, Any]:
+    """Synthetic values for required tool parameters, by parameter name."""
+    probe = _probe_activity(dataset)
+    return {
+        "activity_id": probe.activity_id,
+        "date": probe.date,
+        "activity_date": probe.date,
+        "start_date": dataset.activities[0].date,
+        "end_date": dataset.end_date,
+        "activity_ids": dataset.activity_ids[-10:],
+        "metric": "pace",
+        "split_number": 1,
+        "start_time_s": 600,
+        "end_time_s": 900,
+        "keywords": ["pace"],
+        "query": "SELECT activity_id, activity_date, total_distance_km FROM activities",
+        "section_type": "split",
+        "analysis_data": {},
+    }
+
+
+def _tool_arguments(
+    tool_def: ToolDef, values: dict[str, Any]
+) -> tuple[dict[str, Any] | None, str | None]:
+    """Arguments for a tool's required parameters, or a skip reason."""
+    if tool_def.name in EXCLUDED_TOOLS:
+        return None, "writes data or calls the Garmin API"
+    arguments = {}
+    for name, field_info in tool_def.params.model_fields.items():
+        if not field_info.is_required():
+            continue
+        if name not in values:
+            return None, f"no synthetic value for {name}"
+        arguments[name] = values[name]
+    return arguments, None
+
+
+def _benchmark_tools(
+    db_path: Path, dataset: SyntheticDataset, repeat: int
+) -> dict[str, dict[str, Any]]:
+    """Time every registered tool through ``dispatch``."""
+    reader = GarminDBReader(db_path=str(db_path))
+    values = _tool_values(dataset)
+    results: dict[str, dict[str, Any]] = {}
+    for tool_def in ALL_DEFS:
+        arguments, reason = _tool_arguments(tool_def, values)
+        if arguments is None:
+            results[tool_def.name] = {"status": "skipped", "reason": reason}
+            continue
+        try:
+            result, timings = _timed(
+                partial(dispatch, ALL_DEFS_BY_NAME, reader, tool_def.name, arguments),
+                repeat,
+            )
+        except Exception as e:  # noqa: BLE001 - recorded, benchmark continues
+            results[tool_def.name] = {"status": "error", "error": str(e)}
+            continue
+        results[tool_def.name] = {
+            "status": "ok",
+            "is_error": isinstance(result, dict) and "error" in result,
+            "median_ms": statistics.median(timings),
+            "max_ms": max(timings),
+            "response_bytes": len(
+                format_json_response(result, default=str).encode("utf-8")
+            ),
+        }
+    return results
+
+
+def _endpoint_values(dataset: SyntheticDataset) -> dict[str, Any]:
+    """Synthetic values for path and required query parameters, by name."""
+    probe = _probe_activity(dataset)
+    end = date.fromisoformat(dataset.end_date)
+    monday = (end - timedelta(days=end.weekday())).isoformat()
+    return {
+        "activity_id": probe.activity_id,
+        "week_start_date": monday,
+        "period_start": monday,
+        "start_date": dataset.activities[0].date,
+        "end_date": dataset.end_date,
+        "metrics": "heart_rate,speed,cadence",
+    }
+
+
+def _benchmark_endpoints(
+    db_path: Path, dataset: SyntheticDataset, repeat: int
+) -> dict[str, dict[str, Any]]:
+    """Time every garmin-web ``/api`` GET route, if garmin-web is installed.
+
+    Routes and their required parameters are read from the app's OpenAPI
+    schema, so new endpoints are picked up without touching this module.
+    """
+    try:
+        from fastapi.testclient import TestClient
+        from garmin_web.app import create_app
+    except ImportError:
+        return {}
+
+    app = create_app(db_path=db_path, static_dir=db_path.parent / "no-frontend")
+    client = TestClient(app)
+    values = _endpoint_values(dataset)
+    results: dict[str, dict[str, Any]] = {}
+    for route, operations in app.openapi()["paths"].items():
+        if not route.startswith("/api") or "get" not in operations:
+            continue
+        path = route
+        params: dict[str, Any] = {}
+        missing = None
+        for parameter in operations["get"].get("parameters", []):
+            name = parameter["name"]
+            if parameter["in"] == "path":
+                if name not in values:
+                    missing = name
+                    break
+                path = path.replace(f"{{{name}}}", str(values[name]))
+            elif parameter.get("required"):
+                if name not in values:
+                    missing = name
+                    break
+                params[name] = values[name]
+        if missing:
+            results[route] = {
+                "status": "skipped",
+                "reason": f"no synthetic value for {missing}",
+            }
+            continue
+        response, timings = _timed(partial(client.get, path, params=params), repeat)
+        results[route] = {
+            "status": "ok" if response.status_code < 500 else "error",
+            "status_code": response.status_code,
+            "median_ms": statistics.median(timings),
+            "max_ms": max(timings),
+            "response_bytes": len(response.content),
+        }
+    return results
+
+
+def _raw_bytes(raw_dir: Path) -> int:
+    return sum(path.stat().st_size for path in raw_dir.rglob("*.json"))
+
+
+def _slowest(results: dict[str, dict[str, Any]]) -> float:
+    return max(
+        (r["median_ms"] for r in results.values() if r["status"] == "ok"),
+        default=0.0,
+    )
+
+
+def run_size(
+    data_dir: Path,
+    n_activities: int,
+    repeat: int = 3,
+    sample_interval_s: int = 1,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Generate, ingest, query and regenerate one dataset size.
+
+    Args:
+        data_dir: Empty working directory used as ``GARMIN_DATA_DIR``.
+        n_activities: Number of synthetic activities.
+        repeat: Calls per tool / endpoint (median reported).
+        sample_interval_s: Seconds between activity_details samples.
+        seed: Dataset seed.
+
+    Returns:
+        Timings for every phase plus the flat ``metrics`` used for regression
+        checks.
+    """
+    with _isolated_data_dir(data_dir):
+        start = time.perf_counter()
+        # End the dataset today: several tools look back from the current date.
+        dataset = generate_dataset(
+            data_dir,
+            n_activities=n_activities,
+            seed=seed,
+            end_date=date.today(),
+            sample_interval_s=sample_interval_s,
+        )
+        generate_s = time.perf_counter() - start
+
+        # The regenerator always targets the default database path, so the
+        # whole run uses it.
+        db_path = get_db_path()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        GarminDBWriter(db_path=str(db_path))
+        start = time.perf_counter()
+        ingest_weight_range(
+            dataset.start_date, dataset.end_date, str(db_path), throttle_seconds=0
+        )
+        ingest_wellness_range(
+            dataset.start_date, dataset.end_date, str(db_path), throttle_seconds=0
+        )
+        daily_s = time.perf_counter() - start
+
+        worker = GarminIngestWorker(db_path=str(db_path))
+        ingest_errors = 0
+        start = time.perf_counter()
+        for activity in dataset.activities:
+            result = worker.process_activity(activity.activity_id, activity.date)
+            ingest_errors += int(result["status"] != "success")
+        ingest_s = time.perf_counter() - start
+        db_bytes = db_path.stat().st_size
+
+        tools = _benchmark_tools(db_path, dataset, repeat)
+        endpoints = _benchmark_endpoints(db_path, dataset, repeat)
+
+        start = time.perf_counter()
+        regen = DuckDBRegenerator(delete_old_db=True).regenerate_all(
+            activity_ids=dataset.activity_ids
+        )
+        regenerate_s = time.perf_counter() - start
+
+    return {
+        "n_activities": n_activities,
+        "first_activity_date": dataset.activities[0].date,
+        "last_activity_date": dataset.activities[-1].date,
+        "raw_bytes": _raw_bytes(data_dir / "raw"),
+        "db_bytes": db_bytes,
+        "generate_s": generate_s,
+        "ingest": {
+            "daily_s": daily_s,
+            "activities_s": ingest_s,
+            "errors": ingest_errors,
+        },
+        "regenerate": {"total_s": regenerate_s, "errors": regen.get("error", 0)},
+        "tools": tools,
+        "endpoints": endpoints,
+        "metrics": {
+            "ingest_s_per_activity": ingest_s / n_activities,
+            "regenerate_s_per_activity": regenerate_s / n_activities,
+            "slowest_tool_median_ms": _slowest(tools),
+            "slowest_endpoint_median_ms": _slowest(endpoints),
+        },
+    }
+
+
+def check_regressions(
+    results: dict[str, Any],
+    baseline: dict[str, Any] | None = None,
+    thresholds: dict[str, float] | None = None,
+    tolerance: float = RELATIVE_TOLERANCE,
+) -> list[str]:
+    """List metrics over budget or slower than the baseline run.
+
+    Args:
+        results: ``run_benchmark`` results.
+        baseline: Previous results to compare against (same sizes only).
+        thresholds: Absolute budgets (default: ``REGRESSION_THRESHOLDS``).
+        tolerance: Allowed slowdown factor against ``baseline``.
+
+    Returns:
+        Human-readable regression descriptions (empty when none).
+    """
+    thresholds = REGRESSION_THRESHOLDS if thresholds is None else thresholds
+    regressions = []
+    for size, current in results["sizes"].items():
+        for metric, budget in thresholds.items():
+            value = current["metrics"].get(metric, 0.0)
+            if value > budget:
+                regressions.append(f"{size}: {metric} {value:.2f} > budget {budget}")
+
+        previous = (baseline or {}).get("sizes", {}).get(size)
+        if previous is None:
+            continue
+        for metric, value in current["metrics"].items():
+            before = previous.get("metrics", {}).get(metric)
+            if before and value > before * tolerance:
+                regressions.append(
+                    f"{size}: {metric} {value:.2f} > {tolerance} x baseline "
+                    f"{before:.2f}"
+                )
+        for kind in ("tools", "endpoints"):
+            for name, stats in current[kind].items():
+                before_stats = previous.get(kind, {}).get(name, {})
+                if stats["status"] != "ok" or before_stats.get("status") != "ok":
+                    continue
+                now, before = stats["median_ms"], before_stats["median_ms"]
+                if now > before * tolerance and now - before > NOISE_FLOOR_MS:
+                    regressions.append(
+                        f"{size}: {name} median {now:.1f} ms > {tolerance} x "
+                        f"baseline {before:.1f} ms"
+                    )
+    return regressions
+
+
+def run_benchmark(
+    sizes: tuple[int, ...] = SIZES,
+    repeat: int = 3,
+    sample_interval_s: int = 1,
+    seed: int = 0,
+    output_path: Path | None = None,
+    baseline_path: Path | None = None,
+) -> dict[str, Any]:
+    """Run every size, check regressions and write the results JSON.
+
+    Args:
+        sizes: Dataset sizes (number of activities).
+        repeat: Calls per tool / endpoint (median reported).
+        sample_interval_s: Seconds between activity_details samples.
+        seed: Dataset seed.
+        output_path: Results JSON path (default: :func:`benchmark_output_path`).
+        baseline_path: Previous results to compare against (default: the
+            existing ``output_path``, if any).
+
+    Returns:
+        Results dict (also written to ``output_path``).
+    """
+    # Resolve paths before the per-size runs repoint GARMIN_RESULT_DIR.
+    path = output_path or benchmark_output_path()
+    baseline_file = baseline_path or path
+    baseline = json.loads(baseline_file.read_text()) if baseline_file.exists() else None
+
+    results: dict[str, Any] = {
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "seed": seed,
+        "repeat": repeat,
+        "sample_interval_s": sample_interval_s,
+        "sizes": {},
+    }
+    for size in sizes:
+        data_dir = Path(tempfile.mkdtemp(prefix=f"garmin_e2e_{size}_"))
+        try:
+            results["sizes"][str(size)] = run_size(
+                data_dir, size, repeat, sample_interval_s, seed
+            )
+        finally:
+            shutil.rmtree(data_dir, ignore_errors=True)
+    results["regressions"] = check_regressions(results, baseline)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+    return results
+
+
+def main() -> None:
+    """Run the end-to-end benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--sample-interval", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, default=None)
+    args = parser.parse_args()
+
+    output_path = benchmark_output_path()
+    results = run_benchmark(
+        tuple(args.sizes),
+        args.repeat,
+        args.sample_interval,
+        args.seed,
+        output_path=output_path,
+        baseline_path=args.baseline,
+    )
+    print(
+        "| Activities | Ingest (s/act) | Regenerate (s/act) "
+        "| Slowest tool (ms) | Slowest endpoint (ms) |"
+    )
+    print(
+        "|------------|----------------|--------------------"
+        "|-------------------|-----------------------|"
+    )
+    for size, stats in results["sizes"].items():
+        metrics = stats["metrics"]
+        print(
+            f"| {int(size):,} | {metrics['ingest_s_per_activity']:.2f} "
+            f"| {metrics['regenerate_s_per_activity']:.2f} "
+            f"| {metrics['slowest_tool_median_ms']:.1f} "
+            f"| {metrics['slowest_endpoint_median_ms']:.1f} |"
+        )
+    print(f"\n✓ Results saved to: {output_path}")
+    if results["regressions"]:
+        print("\nRegressions:")
+        for regression in results["regressions"]:
+            print(f"  - {regression}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+Storage and scan benchmark for the time_series_metrics layout.
+
+Builds the legacy layout (DOUBLE metrics, ``(activity_id, seq_no)`` PRIMARY
+KEY, ``idx_time_series_activity`` / ``idx_time_series_timestamp``) and the
+compact layout (``database/time_series_layout.py``: the same DOUBLE columns,
+no PK / indexes, rows in activity order) side by side from the same synthetic
+1 Hz activities, and measures:
+1. Insert time (per-activity DELETE + INSERT, as the inserter does)
+2. On-disk database size after CHECKPOINT
+3. Scan time for single-activity range statistics and a full-table aggregate
+
+Usage:
+    python -m garmin_mcp.benchmarks.benchmark_time_series_layout \
+        [--activities N] [--seconds S]
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import duckdb
+import numpy as np
+import polars as pl
+
+from garmin_mcp.database.time_series_layout import (
+    TIME_SERIES_METRICS,
+    time_series_insert_select_sql,
+    time_series_metrics_ddl,
+)
+from garmin_mcp.utils.paths import get_result_dir
+
+# Legacy DDL as shipped before the compact layout (kept here as the baseline).
+_LEGACY_DDL = (
+    "CREATE TABLE time_series_metrics ("
+    "activity_id BIGINT NOT NULL, seq_no INTEGER NOT NULL, "
+    "timestamp_s INTEGER NOT NULL, "
+    + ", ".join(f"{metric} DOUBLE" for metric in TIME_SERIES_METRICS)
+    + ", PRIMARY KEY (activity_id, seq_no))"
+)
+_LEGACY_INDEXES = (
+    "CREATE INDEX idx_time_series_activity ON time_series_metrics(activity_id)",
+    "CREATE INDEX idx_time_series_timestamp "
+    "ON time_series_metrics(activity_id, timestamp_s)",
+)
+
+_SCAN_QUERIES = {
+    "activity_range_stats": (
+        "SELECT AVG(heart_rate), STDDEV(heart_rate), MIN(speed), MAX(speed), "
+        "COUNT(*) FROM time_series_metrics "
+        "WHERE activity_id = ? AND timestamp_s >= ? AND timestamp_s < ?"
+    ),
+    "full_table_aggregate": (
+        "SELECT activity_id, AVG(heart_rate), AVG(speed), AVG(cadence), "
+        "AVG(ground_contact_time) FROM time_series_metrics GROUP BY activity_id"
+    ),
+}
+
+
+def benchmark_output_path() -> Path:
+    """Path for the layout benchmark results JSON (under the result dir)."""
+    return get_result_dir() / "benchmarks" / "time_series_layout.json"
+
+
+def synthetic_activity(activity_id: int, n_seconds: int, seed: int) -> pl.DataFrame:
+    """Realistic-looking 1 Hz samples for one activity (device resolution)."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(n_seconds)
+    speed = np.round(3.2 + 0.3 * np.sin(t / 300) + rng.normal(0, 0.05, n_seconds), 3)
+    data: dict[str, Any] = {
+        "activity_id": np.full(n_seconds, activity_id, dtype=np.int64),
+        "seq_no": t.astype(np.int32),
+        "timestamp_s": t.astype(np.int32),
+        "sum_moving_duration": t.astype(np.float64),
+        "sum_duration": t.astype(np.float64),
+        "sum_elapsed_duration": t.astype(np.float64),
+        "sum_distance": np.round(np.cumsum(speed), 2),
+        "sum_accumulated_power": np.cumsum(np.full(n_seconds, 250.0)),
+        "heart_rate": np.round(
+            140 + 15 * (t / n_seconds) + rng.normal(0, 2, n_seconds)
+        ),
+        "speed": speed,
+        "grade_adjusted_speed": np.round(speed + rng.normal(0, 0.02, n_seconds), 3),
+        "cadence": np.round(178 + rng.normal(0, 2, n_seconds)),
+        "cadence_single_foot": np.full(n_seconds, None),
+        "cadence_total": np.full(n_seconds, None),
+        "power": np.round(250 + rng.normal(0, 15, n_seconds)),
+        "ground_contact_time": np.round(240 + rng.normal(0, 5, n_seconds), 1),
+        "vertical_oscillation": np.round(8.5 + rng.normal(0, 0.3, n_seconds), 2),
+        "vertical_ratio": np.round(7.2 + rng.normal(0, 0.2, n_seconds), 2),
+        "stride_length": np.round(105 + rng.normal(0, 3, n_seconds), 2),
+        "vertical_speed": np.round(rng.normal(0, 0.1, n_seconds), 3),
+        "elevation": np.round(40 + 10 * np.sin(t / 600), 2),
+        "air_temperature": np.round(np.full(n_seconds, 24.0), 1),
+        "latitude": np.round(35.68 + np.cumsum(rng.normal(0, 1e-5, n_seconds)), 7),
+        "longitude": np.round(139.76 + np.cumsum(rng.normal(0, 1e-5, n_seconds)), 7),
+        "available_stamina": np.round(np.linspace(100, 60, n_seconds), 2),
+        "potential_stamina": np.round(np.linspace(100, 70, n_seconds), 2),
+        "body_battery": np.round(np.linspace(80, 70, n_seconds)),
+        "performance_condition": np.round(rng.normal(0, 2, n_seconds)),
+    }
+    return pl.DataFrame(data).with_columns(
+        pl.col("cadence_single_foot").cast(pl.Float64),
+        pl.col("cadence_total").cast(pl.Float64),
+    )
+
+
+def _build(
+    db_path: Path, layout: str, activities: list[pl.DataFrame]
+) -> dict[str, Any]:
+    """Create ``layout`` at ``db_path``, insert all activities, time it."""
+    conn = duckdb.connect(str(db_path))  # benchmark; noqa duckdb-connect
+    try:
+        if layout == "legacy":
+            conn.execute(_LEGACY_DDL)
+            for ddl in _LEGACY_INDEXES:
+                conn.execute(ddl)
+        else:
+            conn.execute(time_series_metrics_ddl())
+        insert_sql = time_series_insert_select_sql(TIME_SERIES_METRICS, "samples")
+
+        start = time.perf_counter()
+        for frame in activities:
+            activity_id = int(frame["activity_id"][0])
+            conn.register("samples", frame)
+            conn.execute(
+                "DELETE FROM time_series_metrics WHERE activity_id = ?", [activity_id]
+            )
+            conn.execute(insert_sql)
+            conn.unregister("samples")
+        insert_s = time.perf_counter() - start
+        conn.execute("CHECKPOINT")
+    finally:
+        conn.close()
+    return {"insert_s": insert_s, "size_bytes": db_path.stat().st_size}
+
+
+def _scan(db_path: Path, activity_id: int, repeat: int) -> dict[str, float]:
+    """Median wall time (seconds) per scan query."""
+    conn = duckdb.connect(str(db_path), read_only=True)  # noqa duckdb-connect
+    try:
+        timings: dict[str, float] = {}
+        for name, query in _SCAN_QUERIES.items():
+            params = [activity_id, 600, 1800] if "?" in query else []
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                conn.execute(query, params).fetchall()
+                samples.append(time.perf_counter() - start)
+            timings[name] = float(np.median(samples))
+        return timings
+    finally:
+        conn.close()
+
+
+def run_benchmark(
+    n_activities: int = 50,
+    n_seconds: int = 3600,
+    repeat: int = 5,
+    output_path: Path | None = None,
+) -> dict[str, Any]:
+    """Compare both layouts and write the results JSON.
+
+    Args:
+        n_activities: Number of synthetic activities.
+        n_seconds: Samples (seconds) per activity.
+        repeat: Runs per scan query (median reported).
+        output_path: Results JSON path (default: :func:`benchmark_output_path`).
+
+    Returns:
+        Results dict (also written to ``output_path``).
+    """
+    activities = [
+        synthetic_activity(1_000_000 + i, n_seconds, seed=i)
+        for i in range(n_activities)
+    ]
+    probe_activity = 1_000_000 + n_activities // 2
+
+    layouts: dict[str, dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for layout in ("legacy", "compact"):
+            db_path = Path(tmp_dir) / f"{layout}.duckdb"
+            layouts[layout] = _build(db_path, layout, activities)
+            layouts[layout]["scan_s"] = _scan(db_path, probe_activity, repeat)
+
+    legacy, compact = layouts["legacy"], layouts["compact"]
+    results = {
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "n_activities": n_activities,
+        "n_seconds": n_seconds,
+        "rows": n_activities * n_seconds,
+        "layouts": layouts,
+        "size_ratio": compact["size_bytes"] / legacy["size_bytes"],
+        "insert_speedup": legacy["insert_s"] / compact["insert_s"],
+        "scan_speedup": {
+            name: legacy["scan_s"][name] / compact["scan_s"][name]
+            for name in _SCAN_QUERIES
+        },
+    }
+
+    path = output_path or benchmark_output_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+    return results
+
+
+def main() -> None:
+    """Run the layout benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--activities", type=int, default=50)
+    parser.add_argument("--seconds", type=int, default=3600)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.activities, args.seconds, args.repeat)
+    print(f"Rows: {results['rows']:,}")
+    print("| Layout | Size (MB) | Insert (s) | Range stats (ms) | Full scan (ms) |")
+    print("|--------|-----------|------------|------------------|----------------|")
+    for layout, stats in results["layouts"].items():
+        print(
+            f"| {layout} | {stats['size_bytes'] / 1e6:.1f} "
+            f"| {stats['insert_s']:.2f} "
+            f"| {stats['scan_s']['activity_range_stats'] * 1e3:.2f} "
+            f"| {stats['scan_s']['full_table_aggregate'] * 1e3:.2f} |"
+        )
+    print(f"Compact/legacy size: {results['size_ratio']:.2f}")
+    print(f"\n✓ Results saved to: {benchmark_output_path()}")
+
+
+if __name__ == "__main__":
+    main()
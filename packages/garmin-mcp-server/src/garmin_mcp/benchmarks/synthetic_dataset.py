@@ -0,0 +1,716 @@
+"""
+Deterministic synthetic raw dataset for end-to-end benchmarks.
+
+Writes N years of realistic-looking raw cache files in the layout the ingest
+pipeline reads (so no Garmin API call is ever made):
+
+- ``raw/activity/{activity_id}/``: activity.json, activity_details.json
+  (1 Hz ``metricDescriptors`` / ``activityDetailMetrics`` by default), splits.json
+  (``lapDTOs``), hr_zones.json, weather.json, gear.json, vo2_max.json and
+  lactate_threshold.json
+- ``raw/wellness/{date}.json``: daily stats, HRV, sleep and training readiness
+- ``raw/weight/{date}.json``: daily body composition
+
+Training follows a weekly pattern of five runs (intervals, easy, tempo, easy,
+long) with fitness improving over the span and seasonal temperatures. Every
+value is drawn from ``numpy.random.default_rng([seed, index])``, so the same
+arguments always produce byte-identical files.
+
+Usage:
+    python -m garmin_mcp.benchmarks.synthetic_dataset DATA_DIR \
+        [--activities N | --years Y] [--seed S] [--sample-interval S]
+"""
+
+import argparse
+import json
+import math
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from scipy.signal import lfilter
+
+# Activity IDs are offset well above real Garmin IDs seen in fixtures.
+ACTIVITY_ID_BASE = 19_000_000_000
+
+DEFAULT_END_DATE = date(2025, 12, 28)
+
+# (weekday, workout) slots of the weekly training pattern (0 = Monday).
+WEEKLY_PATTERN: tuple[tuple[int, str], ...] = (
+    (1, "intervals"),
+    (2, "easy"),
+    (3, "tempo"),
+    (5, "easy"),
+    (6, "long"),
+)
+
+MAX_HR = 188
+_HR_ZONE_FRACTIONS = (0.5, 0.6, 0.7, 0.8, 0.9)
+_TZ_OFFSET = timedelta(hours=9)  # Asia/Tokyo local time
+_GEAR = (
+    ("Nike Pegasus 41", "2023-01-01"),
+    ("ASICS Novablast 5", "2023-06-01"),
+    ("Nike Vaporfly 3", "2024-01-01"),
+)
+_TRAINING_EFFECT_LABEL = {
+    "easy": "AEROBIC_BASE",
+    "long": "AEROBIC_BASE",
+    "tempo": "TEMPO",
+    "intervals": "VO2MAX",
+}
+_WORKOUT_NAME = {
+    "easy": "Easy Run",
+    "long": "Long Run",
+    "tempo": "Tempo Run",
+    "intervals": "Interval Run",
+}
+
+_UNIT_IDS = {
+    "gmt": 120,
+    "second": 30,
+    "meter": 1,
+    "watt": 5,
+    "bpm": 100,
+    "mps": 20,
+    "stepsPerMinute": 92,
+    "ms": 40,
+    "cm": 200,
+    "percent": 60,
+    "celcius": 10,
+    "dd": 4,
+    "dimensionless": 7,
+}
+# activity_details metric keys with Garmin's unit descriptors. Values are
+# written in real units (m/s, m, s); the factor is informational only, as in
+# the API (see inserters/time_series_metrics.py).
+_METRIC_DESCRIPTORS: tuple[tuple[str, str, float], ...] = (
+    ("directTimestamp", "gmt", 1.0),
+    ("sumDuration", "second", 1000.0),
+    ("sumMovingDuration", "second", 1000.0),
+    ("sumElapsedDuration", "second", 1000.0),
+    ("sumDistance", "meter", 100.0),
+    ("sumAccumulatedPower", "watt", 1.0),
+    ("directHeartRate", "bpm", 1.0),
+    ("directSpeed", "mps", 0.1),
+    ("directGradeAdjustedSpeed", "mps", 0.1),
+    ("directDoubleCadence", "stepsPerMinute", 1.0),
+    ("directPower", "watt", 1.0),
+    ("directGroundContactTime", "ms", 1.0),
+    ("directVerticalOscillation", "cm", 1.0),
+    ("directVerticalRatio", "percent", 1.0),
+    ("directStrideLength", "cm", 1.0),
+    ("directVerticalSpeed", "mps", 0.1),
+    ("directElevation", "meter", 100.0),
+    ("directAirTemperature", "celcius", 1.0),
+    ("directLatitude", "dd", 1.0),
+    ("directLongitude", "dd", 1.0),
+    ("directAvailableStamina", "percent", 1.0),
+    ("directPotentialStamina", "percent", 1.0),
+    ("directBodyBattery", "dimensionless", 1.0),
+    ("directPerformanceCondition", "dimensionless", 1.0),
+)
+
+
+@dataclass(frozen=True)
+class SyntheticActivity:
+    """One generated activity."""
+
+    activity_id: int
+    date: str
+    workout: str
+    duration_s: int
+    distance_m: float
+
+
+@dataclass
+class SyntheticDataset:
+    """Summary of a generated dataset.
+
+    Attributes:
+        data_dir: Root data directory (``raw/`` lives underneath).
+        activities: Generated activities in chronological order.
+        start_date: First day with wellness / weight files (``YYYY-MM-DD``).
+        end_date: Last day with wellness / weight files (``YYYY-MM-DD``).
+    """
+
+    data_dir: Path
+    activities: list[SyntheticActivity] = field(default_factory=list)
+    start_date: str = ""
+    end_date: str = ""
+
+    @property
+    def activity_ids(self) -> list[int]:
+        return [activity.activity_id for activity in self.activities]
+
+
+def _schedule(n_activities: int, end_date: date) -> list[tuple[date, str]]:
+    """Dates and workout kinds of ``n_activities`` runs ending by ``end_date``."""
+    n_weeks = math.ceil(n_activities / len(WEEKLY_PATTERN))
+    last_monday = end_date - timedelta(days=end_date.weekday())
+    first_monday = last_monday - timedelta(weeks=n_weeks - 1)
+    slots = [
+        (first_monday + timedelta(weeks=week, days=weekday), workout)
+        for week in range(n_weeks)
+        for weekday, workout in WEEKLY_PATTERN
+    ]
+    return slots[:n_activities]
+
+
+def _segments(workout: str, rng: np.random.Generator) -> list[tuple[int, float, str]]:
+    """Workout structure as ``(seconds, speed factor, intensityType)`` segments."""
+    if workout == "intervals":
+        reps = int(rng.integers(5, 9))
+        work: list[tuple[int, float, str]] = []
+        for _ in range(reps):
+            work.append((240, 1.38, "INTERVAL"))
+            work.append((120, 0.75, "RECOVERY"))
+        return [(900, 0.95, "WARMUP"), *work, (600, 0.9, "COOLDOWN")]
+    if workout == "tempo":
+        tempo_s = int(rng.integers(20, 31)) * 60
+        return [(900, 0.95, "WARMUP"), (tempo_s, 1.2, "ACTIVE"), (600, 0.9, "COOLDOWN")]
+    if workout == "long":
+        return [(int(rng.integers(90, 121)) * 60, 0.97, "ACTIVE")]
+    return [(int(rng.integers(40, 61)) * 60, 1.0, "ACTIVE")]
+
+
+def _lag(values: np.ndarray, tau_s: float, dt: float) -> np.ndarray:
+    """First-order response (exponential lag) of ``values``."""
+    alpha = 1 - math.exp(-dt / tau_s)
+    lagged: np.ndarray = lfilter(
+        [alpha], [1, alpha - 1], values, zi=[values[0] * (1 - alpha)]
+    )[0]
+    return lagged
+
+
+def _simulate(
+    workout: str,
+    progress: float,
+    temperature_c: float,
+    rng: np.random.Generator,
+    sample_interval_s: int,
+) -> tuple[dict[str, np.ndarray], list[str]]:
+    """Per-sample metrics for one run plus each sample's intensityType."""
+    segments = _segments(workout, rng)
+    base_speed = 2.75 + 0.45 * progress + rng.normal(0, 0.05)
+    target = np.concatenate(
+        [np.full(seconds, base_speed * factor) for seconds, factor, _ in segments]
+    )
+    labels = [label for seconds, _, label in segments for _ in range(seconds)]
+    t = np.arange(0, len(target), sample_interval_s, dtype=np.float64)
+    idx = t.astype(np.int64)
+    target = target[idx]
+    labels = [labels[i] for i in idx]
+    n = len(t)
+    dt = float(sample_interval_s)
+
+    speed = np.clip(_lag(target, 8.0, dt) + rng.normal(0, 0.06, n), 1.0, 7.0)
+    distance = np.cumsum(speed * dt)
+    phase = rng.uniform(0, 2 * math.pi)
+    elevation = 40 + 12 * np.sin(distance / 1400 + phase)
+    vertical_speed = np.gradient(elevation, dt)
+    grade = np.clip(vertical_speed / speed, -0.15, 0.15)
+    gap = speed * (1 + 3.3 * grade)
+
+    # HR tracks effort with a ~30 s lag, cardiac drift and heat cost.
+    effort_hr = 58 + 26 * speed * (1 - 0.06 * progress)
+    drift = 0.12 * t / 60 * (1 + max(temperature_c - 15, 0) / 20)
+    hr = np.clip(_lag(effort_hr, 30.0, dt) + drift + rng.normal(0, 1.5, n), 80, MAX_HR)
+
+    cadence = np.clip(152 + 8 * speed + rng.normal(0, 1.5, n), 140, 205)
+    power = np.clip(72 * gap + rng.normal(0, 6, n), 50, 600)
+    gct = 305 - 18 * speed + rng.normal(0, 4, n)
+    vo = 9.8 - 0.25 * speed + rng.normal(0, 0.2, n)
+    stride = speed / (cadence / 60) * 100
+    vr = vo / stride * 100
+
+    heading = np.cumsum(rng.normal(0, 0.02, n)) + phase
+    lat = 35.68 + np.cumsum(speed * dt * np.cos(heading)) / 111_000
+    lon = 139.76 + np.cumsum(speed * dt * np.sin(heading)) / 90_000
+    load = np.cumsum((hr / MAX_HR) ** 3 * dt) / 100
+    body_battery_start = rng.integers(55, 95)
+
+    metrics = {
+        "sumDuration": t,
+        "sumMovingDuration": t,
+        "sumElapsedDuration": t,
+        "sumDistance": np.round(distance, 1),
+        "sumAccumulatedPower": np.round(np.cumsum(power * dt)),
+        "directHeartRate": np.round(hr),
+        "directSpeed": np.round(speed, 3),
+        "directGradeAdjustedSpeed": np.round(gap, 3),
+        "directDoubleCadence": np.round(cadence),
+        "directPower": np.round(power),
+        "directGroundContactTime": np.round(gct, 1),
+        "directVerticalOscillation": np.round(vo, 2),
+        "directVerticalRatio": np.round(vr, 2),
+        "directStrideLength": np.round(stride, 1),
+        "directVerticalSpeed": np.round(vertical_speed, 3),
+        "directElevation": np.round(elevation, 1),
+        "directAirTemperature": np.round(temperature_c + 3 + rng.normal(0, 0.3, n), 1),
+        "directLatitude": np.round(lat, 7),
+        "directLongitude": np.round(lon, 7),
+        "directAvailableStamina": np.round(np.clip(100 - load * 1.4, 0, 100)),
+        "directPotentialStamina": np.round(np.clip(100 - load, 0, 100)),
+        "directBodyBattery": np.round(body_battery_start - load / 10),
+        "directPerformanceCondition": np.round(
+            np.clip(rng.normal(2 * progress, 2.5, n), -20, 20)
+        ),
+    }
+    return metrics, labels
+
+
+def _activity_details(
+    activity_id: int, metrics: dict[str, np.ndarray], start_ms: int
+) -> dict[str, Any]:
+    """activity_details.json payload (chart data)."""
+    columns = {
+        "directTimestamp": start_ms + metrics["sumDuration"] * 1000,
+        **metrics,
+    }
+    descriptors = [
+        {
+            "metricsIndex": i,
+            "key": key,
+            "unit": {"id": _UNIT_IDS[unit], "key": unit, "factor": factor},
+        }
+        for i, (key, unit, factor) in enumerate(_METRIC_DESCRIPTORS)
+    ]
+    matrix = np.column_stack([columns[key] for key, _, _ in _METRIC_DESCRIPTORS])
+    rows = matrix.tolist()
+    # Timestamps are integral milliseconds.
+    for row in rows:
+        row[0] = int(row[0])
+    return {
+        "activityId": activity_id,
+        "measurementCount": len(rows),
+        "metricsCount": len(rows),
+        "metricDescriptors": descriptors,
+        "activityDetailMetrics": [{"metrics": row} for row in rows],
+        "detailsAvailable": True,
+    }
+
+
+def _lap_bounds(
+    workout: str, metrics: dict[str, np.ndarray], labels: list[str]
+) -> list[tuple[int, int]]:
+    """Sample index ranges of each lap (workout steps or 1 km auto-laps)."""
+    n = len(labels)
+    if workout in ("intervals", "tempo"):
+        bounds = [0] + [i for i in range(1, n) if labels[i] != labels[i - 1]] + [n]
+    else:
+        distance = metrics["sumDistance"]
+        km_marks = np.arange(1000, distance[-1], 1000)
+        cuts = np.searchsorted(distance, km_marks).tolist()
+        bounds = [0, *cuts, n]
+    return [
+        (start, end)
+        for start, end in zip(bounds, bounds[1:], strict=False)
+        if end > start
+    ]
+
+
+def _laps(
+    workout: str,
+    metrics: dict[str, np.ndarray],
+    labels: list[str],
+    start_gmt: datetime,
+    sample_interval_s: int,
+) -> list[dict[str, Any]]:
+    """splits.json ``lapDTOs`` aggregated from the samples."""
+    laps: list[dict[str, Any]] = []
+    distance = metrics["sumDistance"]
+    elevation = metrics["directElevation"]
+    for index, (start, end) in enumerate(_lap_bounds(workout, metrics, labels), 1):
+        span = slice(start, end)
+        prev_distance = distance[start - 1] if start else 0.0
+        lap_distance = float(distance[end - 1] - prev_distance)
+        duration = float((end - start) * sample_interval_s)
+        climb = np.diff(elevation[max(start - 1, 0) : end])
+        power = metrics["directPower"][span]
+        laps.append(
+            {
+                "lapIndex": index,
+                "distance": round(lap_distance, 1),
+                "duration": duration,
+                "movingDuration": duration,
+                "startTimeGMT": (
+                    start_gmt + timedelta(seconds=start * sample_interval_s)
+                ).strftime("%Y-%m-%dT%H:%M:%S.0"),
+                "intensityType": labels[start],
+                "averageHR": round(float(metrics["directHeartRate"][span].mean())),
+                "maxHR": int(metrics["directHeartRate"][span].max()),
+                "averageRunCadence": round(
+                    float(metrics["directDoubleCadence"][span].mean()), 1
+                ),
+                "maxRunCadence": int(metrics["directDoubleCadence"][span].max()),
+                "averagePower": round(float(power.mean())),
+                "maxPower": int(power.max()),
+                "normalizedPower": round(float(np.mean(power**4) ** 0.25)),
+                "groundContactTime": round(
+                    float(metrics["directGroundContactTime"][span].mean()), 1
+                ),
+                "verticalOscillation": round(
+                    float(metrics["directVerticalOscillation"][span].mean()), 2
+                ),
+                "verticalRatio": round(
+                    float(metrics["directVerticalRatio"][span].mean()), 2
+                ),
+                "strideLength": round(
+                    float(metrics["directStrideLength"][span].mean()), 1
+                ),
+                "elevationGain": round(float(climb[climb > 0].sum()), 1),
+                "elevationLoss": round(float(-climb[climb < 0].sum()), 1),
+                "averageSpeed": round(lap_distance / duration, 3),
+                "avgGradeAdjustedSpeed": round(
+                    float(metrics["directGradeAdjustedSpeed"][span].mean()), 3
+                ),
+            }
+        )
+    return laps
+
+
+def _hr_zones(hr: np.ndarray, sample_interval_s: int) -> list[dict[str, Any]]:
+    """hr_zones.json: seconds per zone from the HR samples."""
+    lows = [round(MAX_HR * fraction) for fraction in _HR_ZONE_FRACTIONS]
+    counts = np.histogram(hr, bins=[*lows, np.inf])[0]
+    return [
+        {
+            "zoneNumber": zone,
+            "zoneLowBoundary": low,
+            "secsInZone": float(count * sample_interval_s),
+        }
+        for zone, (low, count) in enumerate(zip(lows, counts, strict=True), 1)
+    ]
+
+
+def _temperature_c(day: date, rng: np.random.Generator) -> float:
+    """Seasonal air temperature (Tokyo-like) with day-to-day noise."""
+    seasonal = 16 + 10 * math.sin(2 * math.pi * (day.timetuple().tm_yday - 110) / 365)
+    return float(seasonal + rng.normal(0, 2.5))
+
+
+def _write_json(path: Path, payload: Any) -> None:
+    # json.dumps uses the C encoder; json.dump would stream through Python.
+    path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+
+
+def _write_activity(
+    raw_dir: Path,
+    index: int,
+    activity_id: int,
+    day: date,
+    workout: str,
+    progress: float,
+    seed: int,
+    sample_interval_s: int,
+) -> SyntheticActivity:
+    """Write the eight raw files of one activity."""
+    rng = np.random.default_rng([seed, index])
+    temperature_c = _temperature_c(day, rng)
+    metrics, labels = _simulate(
+        workout, progress, temperature_c, rng, sample_interval_s
+    )
+    start_local = datetime(day.year, day.month, day.day, 6, 30) + timedelta(
+        minutes=int(rng.integers(0, 90))
+    )
+    start_gmt = start_local - _TZ_OFFSET
+    start_ms = int((start_gmt - datetime(1970, 1, 1)).total_seconds() * 1000)
+
+    hr = metrics["directHeartRate"]
+    duration = float(len(hr) * sample_interval_s)
+    distance = float(metrics["sumDistance"][-1])
+    elevation_step = np.diff(metrics["directElevation"])
+    aerobic_te = round(min(5.0, 2.0 + duration / 3600 + 0.6 * (workout != "easy")), 1)
+    anaerobic_te = round(1.5 + 1.5 * (workout == "intervals") + rng.uniform(0, 0.5), 1)
+    vo2 = 46 + 6 * progress + rng.normal(0, 0.3)
+    lt_speed = 3.4 + 0.5 * progress
+    weight_kg = 66 - 2 * progress
+    ftp = round(72 * lt_speed * 1.05)
+
+    activity_dir = raw_dir / "activity" / str(activity_id)
+    activity_dir.mkdir(parents=True, exist_ok=True)
+    _write_json(
+        activity_dir / "activity.json",
+        {
+            "activityId": activity_id,
+            "activityName": f"Tokyo - {_WORKOUT_NAME[workout]}",
+            "activityTypeDTO": {"typeId": 1, "typeKey": "running", "parentTypeId": 17},
+            "summaryDTO": {
+                "startTimeLocal": start_local.strftime("%Y-%m-%dT%H:%M:%S.0"),
+                "startTimeGMT": start_gmt.strftime("%Y-%m-%dT%H:%M:%S.0"),
+                "distance": round(distance, 1),
+                "duration": duration,
+                "movingDuration": duration,
+                "elapsedDuration": duration,
+                "averageSpeed": round(distance / duration, 3),
+                "averageHR": round(float(hr.mean())),
+                "maxHR": int(hr.max()),
+                "minHR": int(hr.min()),
+                "averageRunCadence": round(
+                    float(metrics["directDoubleCadence"].mean()), 1
+                ),
+                "averagePower": round(float(metrics["directPower"].mean())),
+                "elevationGain": round(
+                    float(elevation_step[elevation_step > 0].sum()), 1
+                ),
+                "elevationLoss": round(
+                    float(-elevation_step[elevation_step < 0].sum()), 1
+                ),
+                "calories": round(distance / 1000 * weight_kg * 1.0),
+                "trainingEffect": aerobic_te,
+                "anaerobicTrainingEffect": anaerobic_te,
+                "trainingEffectLabel": _TRAINING_EFFECT_LABEL[workout],
+            },
+            "locationName": "Tokyo, Japan",
+        },
+    )
+    _write_json(
+        activity_dir / "activity_details.json",
+        _activity_details(activity_id, metrics, start_ms),
+    )
+    _write_json(
+        activity_dir / "splits.json",
+        {"lapDTOs": _laps(workout, metrics, labels, start_gmt, sample_interval_s)},
+    )
+    _write_json(activity_dir / "hr_zones.json", _hr_zones(hr, sample_interval_s))
+    temp_f = temperature_c * 9 / 5 + 32
+    humidity = int(np.clip(rng.normal(65, 12), 25, 98))
+    _write_json(
+        activity_dir / "weather.json",
+        {
+            "temp": round(temp_f),
+            "apparentTemp": round(temp_f + (humidity - 60) / 10),
+            "dewPoint": round(temp_f - (100 - humidity) / 2.8),
+            "relativeHumidity": humidity,
+            "windSpeed": int(rng.integers(0, 25)),
+            "windDirectionCompassPoint": str(
+                rng.choice(["N", "NE", "E", "SE", "S", "SW", "W", "NW"])
+            ),
+        },
+    )
+    model, date_begin = _GEAR[index % len(_GEAR)]
+    _write_json(
+        activity_dir / "gear.json",
+        [
+            {
+                "uuid": f"synthetic-gear-{index % len(_GEAR)}",
+                "gearTypeName": "Running Shoes",
+                "customMakeModel": model,
+                "dateBegin": date_begin,
+                "dateEnd": None,
+                "running": True,
+            }
+        ],
+    )
+    _write_json(
+        activity_dir / "vo2_max.json",
+        {
+            "generic": {
+                "calendarDate": day.isoformat(),
+                "vo2MaxPreciseValue": round(vo2, 1),
+                "vo2MaxValue": round(vo2),
+                "fitnessAge": None,
+            }
+        },
+    )
+    _write_json(
+        activity_dir / "lactate_threshold.json",
+        {
+            "speed_and_heart_rate": {
+                "calendarDate": day.isoformat(),
+                # Garmin reports this speed in 0.1 m/s units.
+                "speed": round(lt_speed / 10, 4),
+                "heartRate": round(MAX_HR * 0.9),
+            },
+            "power": {
+                "calendarDate": day.isoformat(),
+                "functionalThresholdPower": ftp,
+                "powerToWeight": round(ftp / weight_kg, 2),
+                "weight": round(weight_kg, 1),
+            },
+        },
+    )
+    return SyntheticActivity(
+        activity_id=activity_id,
+        date=day.isoformat(),
+        workout=workout,
+        duration_s=int(duration),
+        distance_m=round(distance, 1),
+    )
+
+
+def _write_daily(
+    raw_dir: Path,
+    start: date,
+    end: date,
+    run_days: dict[date, str],
+    seed: int,
+) -> None:
+    """Write one wellness and one weight file per day in ``[start, end]``."""
+    wellness_dir = raw_dir / "wellness"
+    weight_dir = raw_dir / "weight"
+    wellness_dir.mkdir(parents=True, exist_ok=True)
+    weight_dir.mkdir(parents=True, exist_ok=True)
+    n_days = (end - start).days + 1
+    # A third entropy word keeps this stream apart from the per-activity ones.
+    rng = np.random.default_rng([seed, 0, 1])
+    weight = 66 - 2 * np.linspace(0, 1, n_days) + np.cumsum(rng.normal(0, 0.05, n_days))
+    fatigue = 0.0
+    for offset in range(n_days):
+        day = start + timedelta(days=offset)
+        progress = offset / max(n_days - 1, 1)
+        workout = run_days.get(day - timedelta(days=1))
+        fatigue = 0.6 * fatigue + {"long": 3.0, "intervals": 2.5, "tempo": 2.0}.get(
+            workout or "", 0.5 if workout else 0.0
+        )
+        hrv = 62 + 8 * progress - 2.5 * fatigue + rng.normal(0, 4)
+        readiness = int(np.clip(75 - 6 * fatigue + rng.normal(0, 8), 5, 100))
+        sleep_s = int(np.clip(rng.normal(7 * 3600, 2400), 4 * 3600, 10 * 3600))
+        _write_json(
+            wellness_dir / f"{day.isoformat()}.json",
+            {
+                "stats": {
+                    "restingHeartRate": round(
+                        49 - 4 * progress + 1.2 * fatigue + rng.normal(0, 1.5)
+                    ),
+                    "bodyBatteryHighestValue": int(
+                        np.clip(readiness + 15 + rng.normal(0, 5), 20, 100)
+                    ),
+                    "bodyBatteryLowestValue": int(np.clip(rng.normal(22, 8), 5, 60)),
+                    "averageStressLevel": int(np.clip(rng.normal(30, 8), 10, 80)),
+                },
+                "hrv": {
+                    "hrvSummary": {
+                        "lastNightAvg": round(hrv),
+                        "status": "BALANCED" if hrv > 52 else "UNBALANCED",
+                        "baseline": {
+                            "lowUpper": round(52 + 6 * progress),
+                            "balancedUpper": round(72 + 6 * progress),
+                        },
+                    }
+                },
+                "sleep": {
+                    "dailySleepDTO": {
+                        "sleepTimeSeconds": sleep_s,
+                        "sleepScores": {
+                            "overall": {
+                                "value": int(
+                                    np.clip(sleep_s / 360 + rng.normal(0, 5), 30, 100)
+                                )
+                            }
+                        },
+                    }
+                },
+                "training_readiness": [{"score": readiness}],
+            },
+        )
+        weight_g = float(weight[offset] * 1000)
+        body_fat = round(14 - 2 * progress + rng.normal(0, 0.4), 1)
+        _write_json(
+            weight_dir / f"{day.isoformat()}.json",
+            {
+                "dateWeightList": [
+                    {
+                        "calendarDate": day.isoformat(),
+                        "weight": round(weight_g),
+                        "bmi": round(weight_g / 1000 / 1.72**2, 1),
+                        "bodyFat": body_fat,
+                        "bodyWater": round(60 - body_fat / 4, 1),
+                        "boneMass": round(weight_g * 0.045),
+                        "muscleMass": round(weight_g * (1 - body_fat / 100) * 0.52),
+                        "sourceType": "INDEX_SCALE",
+                    }
+                ]
+            },
+        )
+
+
+def generate_dataset(
+    data_dir: Path,
+    n_activities: int | None = None,
+    years: float | None = None,
+    seed: int = 0,
+    end_date: date = DEFAULT_END_DATE,
+    sample_interval_s: int = 1,
+) -> SyntheticDataset:
+    """Write a deterministic synthetic raw dataset under ``data_dir/raw``.
+
+    Args:
+        data_dir: Root data directory (same layout as ``GARMIN_DATA_DIR``).
+        n_activities: Number of runs. Derived from ``years`` when omitted.
+        years: Span of training to generate (five runs per week). Ignored when
+            ``n_activities`` is given.
+        seed: Random seed; identical arguments produce identical files.
+        end_date: Last day of the dataset.
+        sample_interval_s: Seconds between activity_details samples (1 = 1 Hz).
+
+    Returns:
+        Summary of the generated activities and daily-file date range.
+
+    Raises:
+        ValueError: If neither ``n_activities`` nor ``years`` is given, or the
+            count / interval is not positive.
+    """
+    if n_activities is None:
+        if years is None:
+            raise ValueError("Either n_activities or years is required")
+        n_activities = round(years * 52 * len(WEEKLY_PATTERN))
+    if n_activities <= 0 or sample_interval_s <= 0:
+        raise ValueError("n_activities and sample_interval_s must be positive")
+
+    raw_dir = Path(data_dir) / "raw"
+    schedule = _schedule(n_activities, end_date)
+    activities = [
+        _write_activity(
+            raw_dir,
+            index,
+            ACTIVITY_ID_BASE + index,
+            day,
+            workout,
+            index / max(n_activities - 1, 1),
+            seed,
+            sample_interval_s,
+        )
+        for index, (day, workout) in enumerate(schedule)
+    ]
+
+    # Weight files start a week early so the first activity has a 7-day median.
+    first_day = schedule[0][0] - timedelta(days=7)
+    last_day = max(end_date, schedule[-1][0])
+    _write_daily(raw_dir, first_day, last_day, dict(schedule), seed)
+    return SyntheticDataset(
+        data_dir=Path(data_dir),
+        activities=activities,
+        start_date=first_day.isoformat(),
+        end_date=last_day.isoformat(),
+    )
+
+
+def main() -> None:
+    """Generate a synthetic dataset from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("data_dir", type=Path)
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--activities", type=int)
+    group.add_argument("--years", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sample-interval", type=int, default=1)
+    args = parser.parse_args()
+
+    dataset = generate_dataset(
+        args.data_dir,
+        n_activities=args.activities,
+        years=args.years,
+        seed=args.seed,
+        sample_interval_s=args.sample_interval,
+    )
+    print(
+        f"✓ {len(dataset.activities):,} activities "
+        f"({dataset.start_date} .. {dataset.end_date}) written to {args.data_dir}"
+    )
+
+
+if __name__ == "__main__":
+    main()
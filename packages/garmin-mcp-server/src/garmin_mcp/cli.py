@@ -5,7 +5,9 @@ by ``ToolDef.cli_name`` (e.g. ``hr-efficiency``). Each command validates its
 arguments via the ToolDef's Pydantic params model, invokes the handler against a
 ``GarminDBReader``, and prints ``json.dumps(result, default=str)`` to stdout.
 
-Entry point: ``garmin-db`` (see pyproject ``[project.scripts]``).
+Entry point: ``garmin-db`` (see pyproject ``[project.scripts]``), which goes
+through :mod:`garmin_mcp.cli_client` so calls are served by the opt-in daemon
+(``garmin-db daemon start``, :mod:`garmin_mcp.cli_daemon`) when it is running.
 """
 
 from __future__ import annotations
@@ -20,6 +22,7 @@ from typing import Annotated, Any
 import typer
 from pydantic.fields import FieldInfo
 
+from garmin_mcp import cli_daemon
 from garmin_mcp.database.connection import get_db_path
 from garmin_mcp.database.db_reader import GarminDBReader
 from garmin_mcp.tools import ALL_DEFS
@@ -143,5 +146,35 @@ def _build_groups(defs: list[ToolDef]) -> None:
 _build_groups(ALL_DEFS)
 
 
+daemon_app = typer.Typer(
+    help="Persistent daemon that serves garmin-db calls without a cold start.",
+    no_args_is_help=True,
+)
+app.add_typer(daemon_app, name="daemon")
+
+
+@daemon_app.command("start")
+def daemon_start(
+    idle_timeout: Annotated[
+        float, typer.Option(help="Exit after this many idle seconds.")
+    ] = cli_daemon.DEFAULT_IDLE_TIMEOUT,
+) -> None:
+    """Start the daemon in the background (no-op when already running)."""
+    status = cli_daemon.start_daemon(idle_timeout)
+    typer.echo(json.dumps(status))
+
+
+@daemon_app.command("stop")
+def daemon_stop() -> None:
+    """Stop the running daemon."""
+    typer.echo(json.dumps({"stopped": cli_daemon.stop_daemon()}))
+
+
+@daemon_app.command("status")
+def daemon_status() -> None:
+    """Print the running daemon's status (``null`` when not running)."""
+    typer.echo(json.dumps(cli_daemon.daemon_status()))
+
+
 if __name__ == "__main__":  # pragma: no cover
     app()
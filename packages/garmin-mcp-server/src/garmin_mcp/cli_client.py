@@ -0,0 +1,154 @@
+"""``garmin-db`` entry point: route through the CLI daemon when one is running.
+
+Importing :mod:`garmin_mcp.cli` pulls in the whole tool registry (and DuckDB,
+pandas, pydantic) before a single argument is parsed, so every ``garmin-db``
+invocation pays a cold start. This module is the installed entry point and
+imports only the standard library: when a daemon started with ``garmin-db
+daemon start`` (:mod:`garmin_mcp.cli_daemon`) listens on :func:`socket_path`,
+the argv is sent over its Unix socket and the daemon's stdout / stderr / exit
+code are replayed here. Otherwise (no daemon, ``GARMIN_DB_NO_DAEMON`` set, or
+a ``daemon`` subcommand) the Typer app runs in-process exactly as before.
+
+Wire format is the worker's JSON-line protocol (:mod:`garmin_mcp.worker`):
+
+- request : ``{"id": int, "op": "cli", "args": {"argv": [...], "cwd": str}}``
+- response: header ``{"id": int, "ok": true, "exit_code": int, "stderr": str,
+  "text_bytes": int}`` followed by ``text_bytes`` bytes of stdout and a
+  newline; ``{"ok": false, "error": str}`` on failure, with ``"retry": true``
+  when the daemon refused the request without running it (code change).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, BinaryIO
+
+# Set to any non-empty value to always run in-process.
+NO_DAEMON_ENV = "GARMIN_DB_NO_DAEMON"
+# Explicit socket path (default: derived from the install and data dir).
+SOCKET_ENV = "GARMIN_DB_DAEMON_SOCKET"
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+class DaemonUnavailableError(Exception):
+    """The daemon is not running or refused the request without running it."""
+
+
+def socket_path() -> Path:
+    """Unix socket path of the daemon serving this install and data dir.
+
+    The name is keyed on the package location and the data / result dir
+    environment so a daemon never answers for a different checkout or
+    database. ``GARMIN_DB_DAEMON_SOCKET`` overrides it.
+    """
+    explicit = os.environ.get(SOCKET_ENV)
+    if explicit:
+        return Path(explicit)
+    key = "\0".join(
+        [
+            str(_PACKAGE_DIR),
+            os.environ.get("GARMIN_DATA_DIR", ""),
+            os.environ.get("GARMIN_RESULT_DIR", ""),
+        ]
+    )
+    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(runtime_dir) / f"garmin-db-{os.getuid()}-{digest}.sock"
+
+
+def read_response(stream: BinaryIO) -> dict[str, Any]:
+    """Read one framed response (header line plus optional ``text``).
+
+    Raises:
+        ConnectionError: If the stream ends before a complete response.
+    """
+    header = stream.readline()
+    if not header:
+        raise ConnectionError("daemon closed the connection")
+    resp: dict[str, Any] = json.loads(header)
+    text_bytes = resp.pop("text_bytes", None)
+    if text_bytes is not None:
+        body = stream.read(text_bytes + 1)
+        if len(body) != text_bytes + 1:
+            raise ConnectionError("truncated daemon response")
+        resp["text"] = body[:-1].decode("utf-8")
+    return resp
+
+
+def request(
+    req: dict[str, Any],
+    path: Path | None = None,
+    timeout: float | None = None,
+) -> dict[str, Any]:
+    """Send one request to the daemon and return its response.
+
+    Raises:
+        DaemonUnavailableError: If nothing listens on the socket.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(path or socket_path()))
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise DaemonUnavailableError(str(e)) from e
+        sock.sendall(json.dumps({"id": 1, **req}).encode() + b"\n")
+        with sock.makefile("rb") as stream:
+            return read_response(stream)
+    finally:
+        sock.close()
+
+
+def run_via_daemon(argv: list[str], path: Path | None = None) -> int:
+    """Run ``garmin-db argv`` in the daemon and replay its output.
+
+    Returns:
+        The command's exit code.
+
+    Raises:
+        DaemonUnavailableError: If the command was not run by a daemon.
+    """
+    try:
+        resp = request(
+            {"op": "cli", "args": {"argv": argv, "cwd": os.getcwd()}}, path=path
+        )
+    except ConnectionError as e:
+        # Sent but unanswered: the command may have run, so do not re-run it.
+        sys.stderr.write(f"garmin-db daemon error: {e!r}\n")
+        return 1
+    if not resp.get("ok"):
+        if resp.get("retry"):
+            raise DaemonUnavailableError(resp.get("error", "daemon restarting"))
+        sys.stderr.write(f"garmin-db daemon error: {resp.get('error')}\n")
+        return 1
+    sys.stdout.write(resp.get("text", ""))
+    sys.stderr.write(resp.get("stderr", ""))
+    return int(resp.get("exit_code", 0))
+
+
+def main() -> None:
+    """``garmin-db`` entry point."""
+    argv = sys.argv[1:]
+    if not os.environ.get(NO_DAEMON_ENV) and argv[:1] != ["daemon"]:
+        try:
+            code = run_via_daemon(argv)
+        except DaemonUnavailableError:
+            pass
+        else:
+            sys.stdout.flush()
+            sys.exit(code)
+
+    from garmin_mcp.cli import app
+
+    app()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,353 @@
+"""Persistent ``garmin-db`` daemon on a local Unix socket.
+
+Shell scripts and hooks that call ``garmin-db`` in a loop otherwise pay a cold
+start per call (interpreter, tool registry, DuckDB / pandas imports). The daemon
+keeps one process with the Typer app already built; the stdlib-only entry point
+(:mod:`garmin_mcp.cli_client`) forwards each argv here and replays the output,
+so a call costs one socket round-trip.
+
+The daemon is opt-in (``garmin-db daemon start``) and speaks the worker's
+JSON-line protocol (:mod:`garmin_mcp.worker`). Requests are served one at a
+time; a connection may send several. Ops:
+
+- ``cli``      -- run ``args.argv`` through the Typer app in ``args.cwd``,
+  capturing stdout (framed ``text``), stderr and the exit code.
+- ``status``   -- pid, socket, start time, idle timeout and requests served.
+- ``shutdown`` -- reply, then exit.
+- anything else (``schema`` / ``call`` / ``batch`` / ``info``) -- delegated to
+  :func:`garmin_mcp.worker.handle`.
+
+Lifecycle:
+
+- the daemon exits after ``idle_timeout`` seconds without a connection;
+- before serving a connection it compares a fingerprint of the package's
+  ``.py`` files (re-checked at most every ``CODE_CHECK_INTERVAL`` seconds);
+  on a change the request is refused with ``retry`` (the client then runs it
+  in-process) and the daemon re-execs itself on the new code.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import traceback
+from collections.abc import Callable
+from datetime import UTC, datetime
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from garmin_mcp.cli_client import DaemonUnavailableError, request
+from garmin_mcp.cli_client import socket_path as default_socket_path
+from garmin_mcp.database.connection import get_db_path
+from garmin_mcp.database.db_reader import GarminDBReader
+from garmin_mcp.worker import _write_response, handle
+
+# Seconds without a connection before the daemon exits.
+DEFAULT_IDLE_TIMEOUT = 900.0
+# Minimum seconds between two code fingerprint checks.
+CODE_CHECK_INTERVAL = 1.0
+# Socket I/O timeout per connection (tool execution is not bounded).
+CONNECTION_TIMEOUT = 30.0
+# Seconds ``start_daemon`` waits for a fresh daemon to answer.
+START_TIMEOUT = 15.0
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def code_fingerprint(root: Path = _PACKAGE_DIR) -> str:
+    """Digest of every ``.py`` path and mtime under ``root``."""
+    digest = hashlib.sha1()
+    for path in sorted(root.rglob("*.py")):
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        digest.update(f"{path}:{mtime}\n".encode())
+    return digest.hexdigest()
+
+
+@cache
+def _cli_main() -> Callable[..., Any]:
+    """``main`` of the ``garmin-db`` click command, built once per process."""
+    import typer
+
+    from garmin_mcp.cli import app
+
+    return typer.main.get_command(app).main
+
+
+def run_cli(argv: list[str], cwd: str | None = None) -> dict[str, Any]:
+    """Run ``garmin-db argv`` in this process, capturing its output.
+
+    Returns:
+        ``{"ok": True, "exit_code", "stderr", "text"}`` where ``text`` is the
+        captured stdout.
+    """
+    if cwd:
+        os.chdir(cwd)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            _cli_main()(args=argv, prog_name="garmin-db")
+            exit_code = 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                exit_code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+    return {
+        "ok": True,
+        "exit_code": exit_code,
+        "stderr": stderr.getvalue(),
+        "text": stdout.getvalue(),
+    }
+
+
+class CLIDaemon:
+    """Serve ``garmin-db`` requests on a Unix socket until idle or stale.
+
+    Args:
+        path: Socket path to bind.
+        idle_timeout: Seconds without a connection before :meth:`serve` returns.
+        fingerprint: Code fingerprint function (checked for staleness).
+        clock: Monotonic clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        *,
+        fingerprint: Callable[[], str] = code_fingerprint,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.path = path
+        self.idle_timeout = idle_timeout
+        self._fingerprint = fingerprint
+        self._clock = clock
+        self._code = fingerprint()
+        self._checked_at = clock()
+        self._reader: GarminDBReader | None = None
+        self._started_at = datetime.now(UTC).isoformat()
+        self._served = 0
+        self._shutdown = False
+
+    def _bind(self) -> socket.socket:
+        """Bind the socket, replacing a stale file left by a dead daemon."""
+        if self.path.exists():
+            try:
+                request({"op": "status"}, path=self.path, timeout=1.0)
+            except (DaemonUnavailableError, OSError):
+                self.path.unlink()
+            else:
+                raise RuntimeError(f"daemon already running on {self.path}")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(self.path))
+        os.chmod(self.path, 0o600)
+        listener.listen()
+        return listener
+
+    def _code_changed(self) -> bool:
+        now = self._clock()
+        if now - self._checked_at < CODE_CHECK_INTERVAL:
+            return False
+        self._checked_at = now
+        return self._fingerprint() != self._code
+
+    def _handle(self, req: dict[str, Any]) -> dict[str, Any]:
+        op = req.get("op")
+        if op == "cli":
+            args = req.get("args") or {}
+            try:
+                resp = run_cli(list(args.get("argv", [])), args.get("cwd"))
+            except Exception as e:
+                resp = {"ok": False, "error": repr(e)}
+        elif op == "status":
+            resp = {
+                "ok": True,
+                "data": {
+                    "pid": os.getpid(),
+                    "socket": str(self.path),
+                    "started_at": self._started_at,
+                    "idle_timeout": self.idle_timeout,
+                    "served": self._served,
+                },
+            }
+        elif op == "shutdown":
+            self._shutdown = True
+            resp = {"ok": True, "data": {"pid": os.getpid()}}
+        else:
+            if self._reader is None:
+                self._reader = GarminDBReader(str(get_db_path()))
+            return handle(req, self._reader)
+        if "id" in req:
+            resp["id"] = req["id"]
+        return resp
+
+    def _serve_connection(self, conn: socket.socket) -> None:
+        conn.settimeout(CONNECTION_TIMEOUT)
+        with conn.makefile("rb") as stream, conn.makefile("wb") as out:
+            for line in stream:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    req = json.loads(line)
+                except json.JSONDecodeError as e:
+                    resp: dict[str, Any] = {"ok": False, "error": repr(e)}
+                else:
+                    resp = self._handle(req)
+                    self._served += 1
+                _write_response(resp, out)
+                if self._shutdown:
+                    return
+
+    @staticmethod
+    def _refuse(conn: socket.socket, reason: str) -> None:
+        """Answer without running anything so the client runs in-process."""
+        conn.settimeout(1.0)
+        with conn, conn.makefile("rb") as stream, conn.makefile("wb") as out:
+            # Consume the request so closing does not reset the connection.
+            with contextlib.suppress(OSError):
+                stream.readline()
+            _write_response({"ok": False, "retry": True, "error": reason}, out)
+
+    def serve(self) -> str:
+        """Serve until idle, shut down or stale.
+
+        Returns:
+            ``"idle"``, ``"shutdown"`` or ``"code_changed"``.
+        """
+        listener = self._bind()
+        reason = "idle"
+        try:
+            listener.settimeout(self.idle_timeout)
+            while True:
+                try:
+                    conn, _ = listener.accept()
+                except TimeoutError:
+                    break
+                if self._code_changed():
+                    self._refuse(conn, "daemon restarting (code changed)")
+                    reason = "code_changed"
+                    break
+                with conn:
+                    try:
+                        self._serve_connection(conn)
+                    except OSError:
+                        pass
+                if self._shutdown:
+                    reason = "shutdown"
+                    break
+        finally:
+            # Unlink first so no new client connects, then turn away any that
+            # already queued.
+            self.path.unlink(missing_ok=True)
+            listener.setblocking(False)
+            while True:
+                try:
+                    conn, _ = listener.accept()
+                except OSError:
+                    break
+                conn.setblocking(True)
+                with contextlib.suppress(OSError):
+                    self._refuse(conn, f"daemon exiting ({reason})")
+            listener.close()
+        return reason
+
+
+def daemon_status(path: Path | None = None) -> dict[str, Any] | None:
+    """``status`` data of the running daemon, or None when none answers."""
+    try:
+        resp = request({"op": "status"}, path=path, timeout=2.0)
+    except (DaemonUnavailableError, OSError):
+        return None
+    return resp.get("data") if resp.get("ok") else None
+
+
+def start_daemon(
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT, path: Path | None = None
+) -> dict[str, Any]:
+    """Spawn a detached daemon (unless one runs) and wait until it answers.
+
+    Returns:
+        The daemon's ``status`` data.
+
+    Raises:
+        RuntimeError: If the daemon does not come up within ``START_TIMEOUT``.
+    """
+    path = path or default_socket_path()
+    status = daemon_status(path)
+    if status is not None:
+        return status
+    log_path = path.with_suffix(".log")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "ab") as log:
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "garmin_mcp.cli_daemon",
+                "--socket",
+                str(path),
+                "--idle-timeout",
+                str(idle_timeout),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        status = daemon_status(path)
+        if status is not None:
+            return status
+        time.sleep(0.05)
+    raise RuntimeError(f"daemon did not start; see {log_path}")
+
+
+def stop_daemon(path: Path | None = None) -> bool:
+    """Ask the running daemon to exit. Returns False when none was running."""
+    try:
+        request({"op": "shutdown"}, path=path, timeout=5.0)
+    except (DaemonUnavailableError, OSError):
+        return False
+    return True
+
+
+def main() -> None:
+    """Run the daemon; re-exec on the new code when the package changes."""
+    parser = argparse.ArgumentParser(prog="python -m garmin_mcp.cli_daemon")
+    parser.add_argument("--socket", type=Path, default=None)
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+    ns = parser.parse_args()
+
+    daemon = CLIDaemon(ns.socket or default_socket_path(), ns.idle_timeout)
+    # Build the Typer app before the first request instead of on it.
+    _cli_main()
+    if daemon.serve() == "code_changed":
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execv(
+            sys.executable,
+            [sys.executable, "-m", "garmin_mcp.cli_daemon", *sys.argv[1:]],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,9 +13,13 @@ Usage:
     # Write access
     with get_write_connection(db_path) as conn:
         conn.execute("INSERT INTO ...")
+
+Cursors opened with :func:`open_cursor` are tracked per parent connection, so
+:func:`interrupt_connection` stops a query running on any of them.
 """
 
 import logging
+import threading
 import time
 from collections.abc import Generator
 from contextlib import contextmanager
@@ -23,8 +27,14 @@ from pathlib import Path
 
 import duckdb
 
+from garmin_mcp.utils.instrumentation import track_connection
+
 logger = logging.getLogger(__name__)
 
+# id(parent connection) -> cursors currently open on it via open_cursor().
+_live_cursors: dict[int, list[duckdb.DuckDBPyConnection]] = {}
+_live_cursors_lock = threading.Lock()
+
 
 def _resolve_db_path(db_path: str | Path | None = None) -> Path:
     """Resolve database path from argument or config.
@@ -103,7 +113,8 @@ def get_connection(
 
     Creates a new connection per call and closes it when done.
     This is the standard pattern for DuckDB which handles its own
-    internal connection pooling.
+    internal connection pooling. Inside an instrumented tool call the
+    connection is counted and its queries are timed (``track_connection``).
 
     Args:
         db_path: Path to database file. If None, uses config default.
@@ -111,12 +122,14 @@ def get_connection(
         backoff: Base delay in seconds for linear backoff.
 
     Yields:
-        Read-only DuckDB connection.
+        Read-only DuckDB connection (a measuring proxy while instrumentation
+        tracks a tool call).
     """
     path = _resolve_db_path(db_path)
     conn = _connect_with_retry(path, read_only=True, retries=retries, backoff=backoff)
     try:
-        yield conn
+        with track_connection(conn) as tracked:
+            yield tracked
     finally:
         conn.close()
 
@@ -179,3 +192,50 @@ def db_path_from_connection(conn: duckdb.DuckDBPyConnection) -> str | None:
     """
     rows = conn.execute("PRAGMA database_list").fetchall()
     return rows[0][2] if rows and rows[0][2] else None
+
+
+@contextmanager
+def open_cursor(
+    conn: duckdb.DuckDBPyConnection,
+) -> Generator[duckdb.DuckDBPyConnection, None, None]:
+    """Open a cursor on ``conn``, closed on exit.
+
+    A cursor is a separate DuckDB connection: ``conn.interrupt()`` does not
+    stop a query running on it. The cursor is registered while open so that
+    :func:`interrupt_connection` on ``conn`` reaches it.
+
+    Args:
+        conn: Parent connection (or cursor).
+
+    Yields:
+        Cursor on ``conn``.
+    """
+    cursor = conn.cursor()
+    with _live_cursors_lock:
+        _live_cursors.setdefault(id(conn), []).append(cursor)
+    try:
+        yield cursor
+    finally:
+        with _live_cursors_lock:
+            siblings = _live_cursors[id(conn)]
+            siblings.remove(cursor)
+            if not siblings:
+                del _live_cursors[id(conn)]
+        cursor.close()
+
+
+def interrupt_connection(conn: duckdb.DuckDBPyConnection) -> None:
+    """Interrupt the query on ``conn`` and on every cursor opened from it.
+
+    Covers cursors of cursors (``open_cursor`` on a cursor), so a reader built
+    with ``GarminDBReader.from_connection`` is stopped wherever its specialized
+    readers run their queries.
+
+    Args:
+        conn: Connection passed to :func:`open_cursor` by the running code.
+    """
+    conn.interrupt()
+    with _live_cursors_lock:
+        cursors = list(_live_cursors.get(id(conn), ()))
+    for cursor in cursors:
+        interrupt_connection(cursor)
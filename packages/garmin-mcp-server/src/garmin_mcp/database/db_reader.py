@@ -35,6 +35,7 @@ from garmin_mcp.rag.queries.form_anomaly_detector import (
     FormAnomalyDetector,
     generate_recommendations,
 )
+from garmin_mcp.utils.instrumentation import track_connection
 
 # Per-activity memo for the shared material-event scan (#809), keyed by
 # ``(db_path, activity_id)``. Running the form-anomaly detector over a raw
@@ -44,6 +45,13 @@ from garmin_mcp.rag.queries.form_anomaly_detector import (
 # re-fetch staleness is acceptable because raw re-fetch is rare.
 _MATERIAL_EVENT_MEMO: dict[tuple[Path, int], tuple[int, int, str | None]] = {}
 
+# Injury-risk windows: durability trend and form-anomaly baseline look back 90
+# days, the recent form-anomaly window is the trailing 14 days (inclusive).
+_INJURY_RISK_BASELINE_DAYS = 90
+_INJURY_RISK_RECENT_DAYS = 14
+# Default length of ``get_injury_risk_series`` (12 weeks ending on end_date).
+_INJURY_RISK_SERIES_DEFAULT_DAYS = 84
+
 
 class GarminDBReader:
     """
@@ -66,33 +74,34 @@ class GarminDBReader:
         Args:
             db_path: Optional path to DuckDB database file.
                     If None, uses default path from garmin_mcp.utils.paths.
-            conn: Optional already-open connection to reuse for the centralized
-                    ``execute_read_query`` reads (single-connection mode). When
-                    provided, ``execute_read_query`` runs against it directly
-                    instead of opening a new connection per call. Prefer
-                    :meth:`from_connection` to build a reader in this mode.
+            conn: Optional already-open connection to reuse for every read
+                    (single-connection mode). When provided,
+                    ``execute_read_query`` runs against it directly and the
+                    specialized readers take cursors on it instead of opening a
+                    new connection per call. Prefer :meth:`from_connection` to
+                    build a reader in this mode.
         """
         # Optional externally-owned connection (not closed by this reader).
         self._external_conn = conn
 
         # Initialize all specialized readers
-        self.metadata = MetadataReader(db_path)
-        self.splits = SplitsReader(db_path)
-        self.time_series = TimeSeriesReader(db_path)
-        self.export = ExportReader(db_path)
+        self.metadata = MetadataReader(db_path, conn)
+        self.splits = SplitsReader(db_path, conn)
+        self.time_series = TimeSeriesReader(db_path, conn)
+        self.export = ExportReader(db_path, conn)
 
         # Specialized readers (split from AggregateReader)
-        self.form = FormReader(db_path)
-        self.physiology = PhysiologyReader(db_path)
-        self.performance = PerformanceReader(db_path)
-        self.race = RaceReader(db_path)
-        self.training_load = TrainingLoadReader(db_path)
-        self.durability = DurabilityReader(db_path)
-        self.fitness_curve = FitnessCurveReader(db_path)
-        self.strength_sessions = StrengthSessionsReader(db_path)
-        self.hiking_sessions = HikingSessionsReader(db_path)
-        self.trends_narration = TrendNarrationReader(db_path)
-        self.utility = UtilityReader(db_path)
+        self.form = FormReader(db_path, conn)
+        self.physiology = PhysiologyReader(db_path, conn)
+        self.performance = PerformanceReader(db_path, conn)
+        self.race = RaceReader(db_path, conn)
+        self.training_load = TrainingLoadReader(db_path, conn)
+        self.durability = DurabilityReader(db_path, conn)
+        self.fitness_curve = FitnessCurveReader(db_path, conn)
+        self.strength_sessions = StrengthSessionsReader(db_path, conn)
+        self.hiking_sessions = HikingSessionsReader(db_path, conn)
+        self.trends_narration = TrendNarrationReader(db_path, conn)
+        self.utility = UtilityReader(db_path, conn)
 
         # Expose db_path for handlers and scripts
         self.db_path = self.metadata.db_path
@@ -102,8 +111,9 @@ class GarminDBReader:
         """Build a reader that reuses an already-open request connection.
 
         The centralized ``execute_read_query`` runs against ``conn`` directly
-        (no second connection is opened per call), so a caller that opened one
-        connection per request gets true single-connection reads. ``db_path``
+        and the specialized readers use cursors on it (no second connection is
+        opened per call), so a caller that opened one connection per request
+        gets true single-connection reads. ``db_path``
         is still resolved from ``conn`` so any reader path that needs the file
         (e.g. a delegated model reopening it read-only) points at the same
         database. The connection is owned by the caller and never closed here.
@@ -124,7 +134,8 @@ class GarminDBReader:
         Centralizes DuckDB connection management so callers don't need
         to import duckdb or manage connections directly. When the reader was
         built with an external connection (``from_connection``), that shared
-        connection is reused instead of opening a new one.
+        connection is reused instead of opening a new one. Either way the
+        query is measured while instrumentation tracks a tool call.
 
         Args:
             sql: SQL query string
@@ -134,7 +145,9 @@ class GarminDBReader:
             List of result tuples
         """
         if self._external_conn is not None:
-            return self._external_conn.execute(sql, params).fetchall()
+            with track_connection(self._external_conn) as conn:
+                rows: list[tuple[Any, ...]] = conn.execute(sql, params).fetchall()
+                return rows
         with self.metadata._get_connection() as conn:
             result: list[tuple[Any, ...]] = conn.execute(sql, params).fetchall()
             return result
@@ -155,10 +168,11 @@ class GarminDBReader:
             Tuple of (results, column_names)
         """
         if self._external_conn is not None:
-            result = self._external_conn.execute(sql, params)
-            columns = [desc[0] for desc in result.description]
-            rows = result.fetchall()
-            return rows, columns
+            with track_connection(self._external_conn) as conn:
+                result = conn.execute(sql, params)
+                columns = [desc[0] for desc in result.description]
+                rows = result.fetchall()
+                return rows, columns
         with self.metadata._get_connection() as conn:
             result = conn.execute(sql, params)
             columns = [desc[0] for desc in result.description]
@@ -713,6 +727,65 @@ class GarminDBReader:
             return compute_wellness_baseline_deviation([], window_days=window_days)
 
         # Today plus the trailing window (window_days days before it).
+        rows = self._wellness_rows_until(date)[-(window_days + 1) :]
+        return compute_wellness_baseline_deviation(rows, window_days=window_days)
+
+    def get_wellness_baseline_series(
+        self,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        window_days: int = 30,
+    ) -> dict[str, Any]:
+        """Personal-baseline deviation for every day of a date range.
+
+        Every day equals ``get_wellness_baseline_deviation(day, window_days)``,
+        but ``daily_wellness`` is read once and the trailing mean / SD of all
+        three metrics is computed for the whole range in one vectorized pass.
+
+        Args:
+            start_date: First ``YYYY-MM-DD`` day. Defaults to the earliest
+                ``daily_wellness`` date.
+            end_date: Last ``YYYY-MM-DD`` day. Defaults to the latest
+                ``daily_wellness`` date.
+            window_days: Trailing window length in days for the band (today
+                excluded). Default 30.
+
+        Returns:
+            ``{"start_date", "end_date", "days": [...]}`` where each day is a
+            ``get_wellness_baseline_deviation`` result (its ``date`` is the
+            latest wellness row on or before that calendar day), ordered oldest
+            -> newest. Bounds are ``None`` and ``days`` empty when there is no
+            wellness data or ``start_date > end_date``.
+        """
+        from datetime import date as date_cls
+        from datetime import timedelta
+
+        from garmin_mcp.analysis.wellness_baseline import (
+            compute_wellness_baseline_series,
+        )
+
+        bounds = self.execute_read_query(
+            "SELECT MIN(date), MAX(date) FROM daily_wellness", ()
+        )
+        first, last = bounds[0] if bounds else (None, None)
+        start_date = start_date or (str(first) if first is not None else None)
+        end_date = end_date or (str(last) if last is not None else None)
+        if start_date is None or end_date is None:
+            return {"start_date": None, "end_date": None, "days": []}
+
+        start = date_cls.fromisoformat(start_date)
+        end = date_cls.fromisoformat(end_date)
+        if start > end:
+            return {"start_date": None, "end_date": None, "days": []}
+        days = [str(start + timedelta(days=i)) for i in range((end - start).days + 1)]
+
+        deviations = compute_wellness_baseline_series(
+            self._wellness_rows_until(end_date), days, window_days=window_days
+        )
+        return {"start_date": days[0], "end_date": days[-1], "days": deviations}
+
+    def _wellness_rows_until(self, date: str) -> list[dict[str, Any]]:
+        """``daily_wellness`` baseline columns up to ``date``, oldest first."""
         raw = self.execute_read_query(
             """
             SELECT date, hrv_overnight_ms, training_readiness, resting_hr
@@ -722,16 +795,15 @@ class GarminDBReader:
             """,
             (date,),
         )
-        rows = [
+        return [
             {
                 "date": str(d),
                 "hrv_overnight_ms": hrv_ms,
                 "training_readiness": readiness,
                 "resting_hr": resting_hr,
             }
-            for d, hrv_ms, readiness, resting_hr in raw[-(window_days + 1) :]
+            for d, hrv_ms, readiness, resting_hr in raw
         ]
-        return compute_wellness_baseline_deviation(rows, window_days=window_days)
 
     # ========== Splits Methods ==========
 
@@ -1030,6 +1102,24 @@ class GarminDBReader:
         """
         return self.training_load.get_load_trend(lookback_weeks, end_date)
 
+    def get_acwr_series(
+        self, start_date: str | None = None, end_date: str | None = None
+    ) -> dict[str, Any]:
+        """Get the daily ACWR for every day in ``[start_date, end_date]``.
+
+        Args:
+            start_date: ``YYYY-MM-DD`` first day (defaults to the first
+                ``activity_date``).
+            end_date: ``YYYY-MM-DD`` last day (defaults to the latest
+                ``activity_date``).
+
+        Returns:
+            Dict with ``start_date``, ``end_date``, a ``days`` array (date,
+            acute_load_7d, chronic_load_28d_weekly, acwr, status) and
+            ``load_metric``.
+        """
+        return self.training_load.get_acwr_series(start_date, end_date)
+
     # ========== Durability Methods ==========
 
     def get_activity_durability(self, activity_id: int) -> dict[str, Any] | None:
@@ -1107,15 +1197,15 @@ class GarminDBReader:
         )
 
         ref = date_cls.fromisoformat(date)
-        durability_start = str(ref - timedelta(days=90))
+        durability_start = str(ref - timedelta(days=_INJURY_RISK_BASELINE_DAYS))
         durability_trend = self._safe_call(
             lambda: self.get_durability_trend(durability_start, date)
         )
 
         form_anomaly = self._form_anomaly_signal(
-            recent_start=str(ref - timedelta(days=13)),
+            recent_start=str(ref - timedelta(days=_INJURY_RISK_RECENT_DAYS - 1)),
             end_date=date,
-            baseline_start=str(ref - timedelta(days=90)),
+            baseline_start=str(ref - timedelta(days=_INJURY_RISK_BASELINE_DAYS)),
         )
 
         return compute_injury_risk(
@@ -1125,6 +1215,140 @@ class GarminDBReader:
             form_anomaly=form_anomaly,
         )
 
+    def get_injury_risk_series(
+        self, start_date: str | None = None, end_date: str | None = None
+    ) -> dict[str, Any]:
+        """Get the daily composite injury-risk score over a date range.
+
+        Every day equals ``get_injury_risk(day)``, but the range is walked once:
+        ACWR comes from the windowed ``get_acwr_series`` query, wellness rows are
+        read once and sliced per day, each long run's decoupling and each run's
+        form-anomaly events are computed once, and the durability trend is only
+        re-fitted when a run enters or leaves the 90-day window.
+
+        Args:
+            start_date: First ``YYYY-MM-DD`` day. Defaults to 12 weeks (84 days)
+                before ``end_date``.
+            end_date: Last ``YYYY-MM-DD`` day. Defaults to the latest
+                ``activity_date``.
+
+        Returns:
+            ``{"start_date", "end_date", "days": [...]}`` where each day is
+            ``{"date", **get_injury_risk(date)}`` (``score`` / ``band`` /
+            ``factors`` / ``available_inputs``, or ``insufficient_data``),
+            ordered oldest -> newest. Bounds are ``None`` and ``days`` empty when
+            there are no activities or ``start_date > end_date``.
+        """
+        from datetime import date as date_cls
+        from datetime import timedelta
+
+        from garmin_mcp.analysis.injury_risk import compute_injury_risk
+
+        if end_date is None:
+            latest = self.execute_read_query(
+                "SELECT MAX(activity_date) FROM activities", ()
+            )
+            if latest and latest[0][0] is not None:
+                end_date = str(latest[0][0])
+        if end_date is None:
+            return {"start_date": None, "end_date": None, "days": []}
+
+        end = date_cls.fromisoformat(end_date)
+        start = (
+            date_cls.fromisoformat(start_date)
+            if start_date is not None
+            else end - timedelta(days=_INJURY_RISK_SERIES_DEFAULT_DAYS - 1)
+        )
+        if start > end:
+            return {"start_date": None, "end_date": None, "days": []}
+        days = [str(start + timedelta(days=i)) for i in range((end - start).days + 1)]
+
+        acwr_series = self._safe_call(lambda: self.get_acwr_series(days[0], days[-1]))
+        acwr_by_day = {day["date"]: day for day in (acwr_series or {}).get("days", [])}
+        wellness = self._wellness_deviation_series(days)
+        try:
+            durability: list[dict[str, Any] | None] = (
+                self.durability.get_rolling_trends(days, _INJURY_RISK_BASELINE_DAYS)
+            )
+        except Exception:
+            durability = [None] * len(days)
+        form_anomaly = self._form_anomaly_series(days)
+
+        results = []
+        for i, day in enumerate(days):
+            risk = compute_injury_risk(
+                acwr=acwr_by_day.get(day),
+                durability_trend=(
+                    {"trend": durability[i]} if durability[i] is not None else None
+                ),
+                wellness_deviation=wellness[i],
+                form_anomaly=form_anomaly[i],
+            )
+            results.append({"date": day, **risk})
+        return {"start_date": days[0], "end_date": days[-1], "days": results}
+
+    def _wellness_deviation_series(
+        self, days: list[str], window_days: int = 30
+    ) -> list[dict[str, Any] | None]:
+        """``get_wellness_baseline_deviation(day)`` for every day, one read."""
+        from garmin_mcp.analysis.wellness_baseline import (
+            compute_wellness_baseline_series,
+        )
+
+        try:
+            deviations: list[dict[str, Any] | None] = list(
+                compute_wellness_baseline_series(
+                    self._wellness_rows_until(days[-1]), days, window_days=window_days
+                )
+            )
+            return deviations
+        except Exception:
+            return [None] * len(days)
+
+    def _form_anomaly_series(self, days: list[str]) -> list[dict[str, Any] | None]:
+        """``_form_anomaly_signal`` for the window ending on every day.
+
+        One ``_material_event_scan`` covers the whole range plus the first
+        day's baseline; each day then pools the runs inside its own trailing
+        window.
+        """
+        from bisect import bisect_left, bisect_right
+        from datetime import date as date_cls
+        from datetime import timedelta
+
+        first = date_cls.fromisoformat(days[0])
+        try:
+            scan = self._material_event_scan(
+                str(first - timedelta(days=_INJURY_RISK_BASELINE_DAYS)), days[-1]
+            )
+        except Exception:
+            scan = None
+        if scan is None:
+            return [None] * len(days)
+
+        # The scan is newest-first; bisect needs ascending dates.
+        ascending = scan[::-1]
+        scan_dates = [item["activity_date"] for item in ascending]
+        signals: list[dict[str, Any] | None] = []
+        for day in days:
+            ref = date_cls.fromisoformat(day)
+            lo = bisect_left(
+                scan_dates, str(ref - timedelta(days=_INJURY_RISK_BASELINE_DAYS))
+            )
+            hi = bisect_right(scan_dates, day)
+            window = ascending[lo:hi][::-1]
+            signals.append(
+                self._pool_form_events(
+                    window,
+                    recent_start=str(
+                        ref - timedelta(days=_INJURY_RISK_RECENT_DAYS - 1)
+                    ),
+                )
+                if window
+                else None
+            )
+        return signals
+
     @staticmethod
     def _safe_call(fn: Any) -> dict[str, Any] | None:
         """Call ``fn`` returning its dict result, or ``None`` on any failure."""
@@ -1256,32 +1480,40 @@ class GarminDBReader:
             scan = self._material_event_scan(baseline_start, end_date)
             if scan is None:
                 return None
-
-            recent_events = baseline_events = 0
-            recent_hours = baseline_hours = 0.0
-            for item in scan:
-                if item["activity_date"] >= recent_start:
-                    recent_events += item["events"]
-                    recent_hours += item["hours"]
-                else:
-                    baseline_events += item["events"]
-                    baseline_hours += item["hours"]
-
-            recent_rate = recent_events / recent_hours if recent_hours > 0 else 0.0
-            baseline_rate = (
-                baseline_events / baseline_hours if baseline_hours > 0 else 0.0
-            )
-            return {
-                "recent_rate": recent_rate,
-                "baseline_rate": baseline_rate,
-                "recent_events": recent_events,
-                "baseline_events": baseline_events,
-                "recent_hours": round(recent_hours, 4),
-                "baseline_hours": round(baseline_hours, 4),
-            }
+            return self._pool_form_events(scan, recent_start)
         except Exception:
             return None
 
+    @staticmethod
+    def _pool_form_events(
+        scan: list[dict[str, Any]], recent_start: str
+    ) -> dict[str, Any]:
+        """Pool scanned runs into recent / baseline event rates (events/hour).
+
+        Runs dated ``>= recent_start`` form the recent window, the rest the
+        baseline. See ``_form_anomaly_signal`` for the returned keys.
+        """
+        recent_events = baseline_events = 0
+        recent_hours = baseline_hours = 0.0
+        for item in scan:
+            if item["activity_date"] >= recent_start:
+                recent_events += item["events"]
+                recent_hours += item["hours"]
+            else:
+                baseline_events += item["events"]
+                baseline_hours += item["hours"]
+
+        recent_rate = recent_events / recent_hours if recent_hours > 0 else 0.0
+        baseline_rate = baseline_events / baseline_hours if baseline_hours > 0 else 0.0
+        return {
+            "recent_rate": recent_rate,
+            "baseline_rate": baseline_rate,
+            "recent_events": recent_events,
+            "baseline_events": baseline_events,
+            "recent_hours": round(recent_hours, 4),
+            "baseline_hours": round(baseline_hours, 4),
+        }
+
     def get_recent_form_anomaly_flags(
         self, weeks: int = 2, max_activities: int = 12
     ) -> dict[str, Any]:
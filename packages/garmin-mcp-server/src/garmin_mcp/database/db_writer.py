@@ -7,11 +7,61 @@ Provides write operations to DuckDB for inserting performance data.
 import json
 import logging
 from datetime import UTC, datetime
+from pathlib import Path
 
-from garmin_mcp.database.connection import get_db_path, get_write_connection
+import duckdb
+import pandas as pd
+
+from garmin_mcp.database.connection import (
+    get_connection,
+    get_db_path,
+    get_write_connection,
+)
+from garmin_mcp.database.time_series_layout import time_series_metrics_ddl
 
 logger = logging.getLogger(__name__)
 
+# Schema fingerprints of databases fully initialized by this process:
+# resolved DB path -> (schema_version, catalog hash). A writer constructed on a
+# database whose fingerprint still matches skips all DDL and migrations.
+_SCHEMA_READY: dict[str, tuple[int, str]] = {}
+
+# One read: applied schema version plus a hash of every column, index and
+# sequence name in the catalog (a dropped / altered table changes the hash).
+_SCHEMA_FINGERPRINT_SQL = """
+    SELECT
+        (SELECT COALESCE(MAX(version), 0) FROM schema_version),
+        md5(concat_ws('|',
+            (SELECT string_agg(
+                table_name || '.' || column_name || ':' || data_type, ','
+                ORDER BY table_name, column_name)
+             FROM information_schema.columns WHERE table_schema = 'main'),
+            (SELECT string_agg(index_name, ',' ORDER BY index_name)
+             FROM duckdb_indexes()),
+            (SELECT string_agg(sequence_name, ',' ORDER BY sequence_name)
+             FROM duckdb_sequences())
+        ))
+"""
+
+
+def _schema_fingerprint(db_path: Path) -> tuple[int, str] | None:
+    """Read ``(schema_version, catalog hash)`` without taking the write lock.
+
+    Returns None when the file does not exist or cannot be read right now
+    (no ``schema_version`` yet, held by a writer, ...); the caller then runs
+    the full initialization.
+    """
+    if not db_path.is_file():
+        return None
+    try:
+        with get_connection(db_path, retries=0) as conn:
+            row = conn.execute(_SCHEMA_FINGERPRINT_SQL).fetchone()
+    except duckdb.Error:
+        return None
+    if row is None or row[1] is None:
+        return None
+    return int(row[0]), str(row[1])
+
 
 def _next_run_id_on(conn) -> int:  # type: ignore[no-untyped-def]
     """Return the next section-analysis ``run_id`` on an open connection (#776).
@@ -151,15 +201,97 @@ def _wellness_row(date: str, wellness_data: dict) -> dict | None:
     return row
 
 
+def _upsert_rows_by_date(
+    conn: duckdb.DuckDBPyConnection,
+    table: str,
+    id_column: str,
+    sequence: str,
+    rows: list[dict],
+) -> None:
+    """Date-level upsert of ``rows`` into ``table`` in one transaction.
+
+    The rows are staged in a temp table; existing rows for the staged dates
+    are deleted and the stage copied over with one ``INSERT ... SELECT``,
+    drawing surrogate ids from ``sequence`` in date order. The tables carry
+    both a PRIMARY KEY and a UNIQUE date index, so ``ON CONFLICT`` cannot
+    infer a single conflict target; delete + insert is the upsert.
+
+    If an id collides (rows inserted with explicit ids behind the sequence's
+    back) or the sequence is missing, it is recreated above the table's
+    highest id and the upsert retried once.
+    """
+    columns = list(rows[0])
+    column_list = ", ".join(columns)
+    frame = pd.DataFrame(rows, columns=columns, dtype=object)
+
+    for attempt in range(2):
+        conn.begin()
+        try:
+            conn.execute(
+                f"CREATE OR REPLACE TEMP TABLE {table}_stage AS "
+                f"SELECT {column_list} FROM {table} LIMIT 0"
+            )
+            conn.register("_upsert_frame", frame)
+            try:
+                conn.execute(
+                    f"INSERT INTO {table}_stage SELECT {column_list} FROM _upsert_frame"
+                )
+            finally:
+                conn.unregister("_upsert_frame")
+            conn.execute(
+                f"DELETE FROM {table} WHERE date IN (SELECT date FROM {table}_stage)"
+            )
+            conn.execute(
+                f"INSERT INTO {table} ({id_column}, {column_list}) "
+                f"SELECT nextval('{sequence}'), {column_list} "
+                f"FROM {table}_stage ORDER BY date"
+            )
+            conn.execute(f"DROP TABLE {table}_stage")
+            conn.commit()
+            return
+        except (duckdb.ConstraintException, duckdb.CatalogException):
+            conn.rollback()
+            if attempt:
+                raise
+        except Exception:
+            conn.rollback()
+            raise
+
+        max_row = conn.execute(
+            f"SELECT COALESCE(MAX({id_column}), 0) FROM {table}"
+        ).fetchone()
+        max_id = int(max_row[0]) if max_row else 0
+        conn.execute(f"DROP SEQUENCE IF EXISTS {sequence}")
+        conn.execute(f"CREATE SEQUENCE {sequence} START {max_id + 1}")
+        logger.warning(f"Resynchronized {sequence} to start at {max_id + 1}")
+
+
 class GarminDBWriter:
     """Write operations to DuckDB for Garmin performance data."""
 
     def __init__(self, db_path: str | None = None):
-        """Initialize DuckDB writer with database path."""
+        """Initialize DuckDB writer with database path.
+
+        The first writer on a database in this process creates the base schema
+        and applies pending migrations, then memoizes the schema fingerprint.
+        Later writers only re-read the fingerprint (read-only connection) and
+        skip all DDL while it still matches.
+        """
         self.db_path = get_db_path(db_path)
+        key = str(self.db_path.resolve())
+        ready = _SCHEMA_READY.get(key)
+        if ready is not None and _schema_fingerprint(self.db_path) == ready:
+            return
+
         self._ensure_tables()
         self._run_migrations()
 
+        from garmin_mcp.database.migrations.registry import MIGRATIONS
+
+        fingerprint = _schema_fingerprint(self.db_path)
+        if fingerprint is not None and fingerprint[0] == MIGRATIONS[-1][0]:
+            _SCHEMA_READY[key] = fingerprint
+
     def _ensure_tables(self):
         """Create the base DuckDB schema (the 17 core tables).
 
@@ -200,6 +332,10 @@ class GarminDBWriter:
         - 2026-06-19 (#342): Moved athlete-centric table DDL out of this method;
           it is now owned solely by migrations/add_athlete_tables.py to remove
           duplicate DDL.
+        - 2026-10-18: time_series_metrics uses the layout from
+          database/time_series_layout.py (DOUBLE metrics, no PK / ART
+          indexes); existing indexed tables are rewritten by
+          migrations/compact_time_series_metrics.py.
 
         Note: ``CREATE TABLE IF NOT EXISTS`` keeps this method idempotent, so
         re-instantiating ``GarminDBWriter`` on an existing database is a no-op.
@@ -478,6 +614,8 @@ class GarminDBWriter:
                     speed_range_min FLOAT,
                     speed_range_max FLOAT,
 
+                    population_hash VARCHAR,
+
                     UNIQUE(user_id, condition_group, metric, period_start, period_end)
                 )
             """)
@@ -577,40 +715,9 @@ class GarminDBWriter:
                 )
             """)
 
-            # Create time_series_metrics table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS time_series_metrics (
-                    activity_id BIGINT NOT NULL,
-                    seq_no INTEGER NOT NULL,
-                    timestamp_s INTEGER NOT NULL,
-                    sum_moving_duration DOUBLE,
-                    sum_duration DOUBLE,
-                    sum_elapsed_duration DOUBLE,
-                    sum_distance DOUBLE,
-                    sum_accumulated_power DOUBLE,
-                    heart_rate DOUBLE,
-                    speed DOUBLE,
-                    grade_adjusted_speed DOUBLE,
-                    cadence DOUBLE,
-                    cadence_single_foot DOUBLE,
-                    cadence_total DOUBLE,
-                    power DOUBLE,
-                    ground_contact_time DOUBLE,
-                    vertical_oscillation DOUBLE,
-                    vertical_ratio DOUBLE,
-                    stride_length DOUBLE,
-                    vertical_speed DOUBLE,
-                    elevation DOUBLE,
-                    air_temperature DOUBLE,
-                    latitude DOUBLE,
-                    longitude DOUBLE,
-                    available_stamina DOUBLE,
-                    potential_stamina DOUBLE,
-                    body_battery DOUBLE,
-                    performance_condition DOUBLE,
-                    PRIMARY KEY (activity_id, seq_no)
-                )
-            """)
+            # Create time_series_metrics table (no PK / ART indexes, layout
+            # defined in database/time_series_layout.py)
+            conn.execute(time_series_metrics_ddl())
 
             # Create strength_sessions table (mirrors
             # migrations/add_strength_sessions.py; strength training is stored
@@ -656,16 +763,6 @@ class GarminDBWriter:
                 )
             """)
 
-            # Create indexes for time_series_metrics
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_time_series_activity "
-                "ON time_series_metrics(activity_id)"
-            )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_time_series_timestamp "
-                "ON time_series_metrics(activity_id, timestamp_s)"
-            )
-
             # Create sequence for form_evaluations if it doesn't exist
             try:
                 conn.execute("SELECT nextval('form_evaluations_seq')")
@@ -771,6 +868,10 @@ class GarminDBWriter:
         Returns:
             True if successful
         """
+        from garmin_mcp.database.inserters.section_analysis_terms import (
+            refresh_section_analysis_terms,
+        )
+
         try:
             with get_write_connection(self.db_path) as conn:
                 # Start transaction
@@ -835,6 +936,10 @@ class GarminDBWriter:
                         ],
                     )
 
+                    # Index the new row's non-empty top-level keys so keyword
+                    # searches (InsightExtractor) never scan analysis_data.
+                    refresh_section_analysis_terms(conn, [next_analysis_id])
+
                     # Commit transaction
                     conn.commit()
                     logger.info(
@@ -892,37 +997,12 @@ class GarminDBWriter:
                 return False
 
             with get_write_connection(self.db_path) as conn:
-                # The table has two unique constraints (measurement_id PK and the
-                # unique date index), so DuckDB cannot infer a single conflict
-                # target for ON CONFLICT. Delete any existing row for this date
-                # first, then insert — making the operation a date-level upsert.
-                conn.execute(
-                    "DELETE FROM body_composition WHERE date = ?", [row["date"]]
-                )
-
-                max_id_result = conn.execute(
-                    "SELECT COALESCE(MAX(measurement_id), 0) FROM body_composition"
-                ).fetchone()
-                next_measurement_id = max_id_result[0] + 1 if max_id_result else 1
-
-                conn.execute(
-                    """
-                    INSERT INTO body_composition
-                    (measurement_id, date, weight_kg, body_fat_percentage, muscle_mass_kg,
-                     bone_mass_kg, bmi, hydration_percentage, measurement_source)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    [
-                        next_measurement_id,
-                        row["date"],
-                        row["weight_kg"],
-                        row["body_fat_percentage"],
-                        row["muscle_mass_kg"],
-                        row["bone_mass_kg"],
-                        row["bmi"],
-                        row["hydration_percentage"],
-                        row["measurement_source"],
-                    ],
+                _upsert_rows_by_date(
+                    conn,
+                    "body_composition",
+                    "measurement_id",
+                    "seq_body_composition_id",
+                    [row],
                 )
 
             logger.info(f"Inserted body composition data for {date}")
@@ -931,6 +1011,65 @@ class GarminDBWriter:
             logger.error(f"Error inserting body composition data: {e}")
             return False
 
+    def _upsert_batch_by_date(
+        self, table: str, id_column: str, sequence: str, rows: list[dict]
+    ) -> int:
+        """Upsert ``rows`` in one transaction, falling back to one per day.
+
+        A failing row rolls the whole batch back, so after a failed batch
+        every row is upserted in its own transaction; rows that still fail
+        are logged and skipped, and the rest of the window is kept.
+
+        Returns:
+            Number of rows written.
+        """
+        if not rows:
+            return 0
+        try:
+            with get_write_connection(self.db_path) as conn:
+                _upsert_rows_by_date(conn, table, id_column, sequence, rows)
+            return len(rows)
+        except Exception as e:
+            logger.warning(
+                f"Batch upsert into {table} failed ({e}); retrying "
+                f"{len(rows)} days one by one"
+            )
+
+        written = 0
+        for row in rows:
+            try:
+                with get_write_connection(self.db_path) as conn:
+                    _upsert_rows_by_date(conn, table, id_column, sequence, [row])
+                written += 1
+            except Exception as e:
+                logger.error(f"Error upserting {table} for {row['date']}: {e}")
+        return written
+
+    def insert_body_composition_batch(self, weight_by_date: dict[str, dict]) -> int:
+        """Upsert body composition for many days in one transaction.
+
+        Days without a weigh-in (``_body_comp_row`` returns None) are skipped.
+        If the transaction fails, each day is retried on its own (see
+        :meth:`_upsert_batch_by_date`).
+
+        Args:
+            weight_by_date: ``{YYYY-MM-DD: raw weight data dict}``.
+
+        Returns:
+            Number of days written.
+        """
+        rows = [
+            row
+            for date, weight_data in sorted(weight_by_date.items())
+            if (row := _body_comp_row(date, weight_data)) is not None
+        ]
+        written = self._upsert_batch_by_date(
+            "body_composition", "measurement_id", "seq_body_composition_id", rows
+        )
+        if written:
+            logger.info(f"Inserted body composition data for {written} days")
+        return written
+
     def insert_daily_wellness(self, date: str, wellness_data: dict) -> bool:
         """Insert (date-level upsert) daily wellness data.
 
@@ -955,38 +1094,12 @@ class GarminDBWriter:
                 return False
 
             with get_write_connection(self.db_path) as conn:
-                conn.execute("DELETE FROM daily_wellness WHERE date = ?", [row["date"]])
-
-                max_id_result = conn.execute(
-                    "SELECT COALESCE(MAX(wellness_id), 0) FROM daily_wellness"
-                ).fetchone()
-                next_wellness_id = max_id_result[0] + 1 if max_id_result else 1
-
-                conn.execute(
-                    """
-                    INSERT INTO daily_wellness
-                    (wellness_id, date, resting_hr, hrv_overnight_ms, hrv_status,
-                     hrv_baseline_low, hrv_baseline_high, sleep_seconds, sleep_score,
-                     training_readiness, body_battery_high, body_battery_low,
-                     stress_avg, source)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    [
-                        next_wellness_id,
-                        row["date"],
-                        row["resting_hr"],
-                        row["hrv_overnight_ms"],
-                        row["hrv_status"],
-                        row["hrv_baseline_low"],
-                        row["hrv_baseline_high"],
-                        row["sleep_seconds"],
-                        row["sleep_score"],
-                        row["training_readiness"],
-                        row["body_battery_high"],
-                        row["body_battery_low"],
-                        row["stress_avg"],
-                        row["source"],
-                    ],
+                _upsert_rows_by_date(
+                    conn,
+                    "daily_wellness",
+                    "wellness_id",
+                    "seq_daily_wellness_id",
+                    [row],
                 )
 
             logger.info(f"Inserted daily wellness data for {date}")
@@ -994,3 +1107,29 @@ class GarminDBWriter:
         except Exception as e:
             logger.error(f"Error inserting daily wellness data: {e}")
             return False
+
+    def insert_daily_wellness_batch(self, wellness_by_date: dict[str, dict]) -> int:
+        """Upsert daily wellness for many days in one transaction.
+
+        Days without any wellness metric (``_wellness_row`` returns None) are
+        skipped. If the transaction fails, each day is retried on its own (see
+        :meth:`_upsert_batch_by_date`).
+
+        Args:
+            wellness_by_date: ``{YYYY-MM-DD: merged wellness dict}`` as
+                returned by :func:`collect_wellness_data`.
+
+        Returns:
+            Number of days written.
+        """
+        rows = [
+            row
+            for date, wellness_data in sorted(wellness_by_date.items())
+            if (row := _wellness_row(date, wellness_data)) is not None
+        ]
+        written = self._upsert_batch_by_date(
+            "daily_wellness", "wellness_id", "seq_daily_wellness_id", rows
+        )
+        if written:
+            logger.info(f"Inserted daily wellness data for {written} days")
+        return written
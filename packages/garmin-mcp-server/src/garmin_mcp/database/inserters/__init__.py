@@ -2,15 +2,27 @@
 
 from garmin_mcp.database.inserters.activities import insert_activities
 from garmin_mcp.database.inserters.body_composition import insert_body_composition_data
+from garmin_mcp.database.inserters.daily_load import refresh_daily_load
 from garmin_mcp.database.inserters.form_efficiency import insert_form_efficiency
 from garmin_mcp.database.inserters.heart_rate_zones import insert_heart_rate_zones
 from garmin_mcp.database.inserters.hr_efficiency import insert_hr_efficiency
 from garmin_mcp.database.inserters.lactate_threshold import insert_lactate_threshold
 from garmin_mcp.database.inserters.performance_trends import insert_performance_trends
 from garmin_mcp.database.inserters.section_analyses import insert_section_analysis
-from garmin_mcp.database.inserters.splits import insert_splits
+from garmin_mcp.database.inserters.section_analysis_terms import (
+    refresh_section_analysis_terms,
+)
+from garmin_mcp.database.inserters.split_phase_stats import refresh_split_phase_stats
+from garmin_mcp.database.inserters.splits import insert_splits, insert_splits_batch
 from garmin_mcp.database.inserters.time_series_metrics import insert_time_series_metrics
+from garmin_mcp.database.inserters.time_series_offsets import (
+    insert_time_series_offsets,
+)
+from garmin_mcp.database.inserters.time_series_rollups import (
+    insert_time_series_rollups,
+)
 from garmin_mcp.database.inserters.vo2_max import insert_vo2_max
+from garmin_mcp.database.inserters.workout_features import refresh_workout_features
 
 __all__ = [
     "insert_activities",
@@ -22,6 +34,13 @@ __all__ = [
     "insert_performance_trends",
     "insert_section_analysis",
     "insert_splits",
+    "insert_splits_batch",
     "insert_time_series_metrics",
+    "insert_time_series_offsets",
+    "insert_time_series_rollups",
     "insert_vo2_max",
+    "refresh_daily_load",
+    "refresh_section_analysis_terms",
+    "refresh_split_phase_stats",
+    "refresh_workout_features",
 ]
@@ -7,6 +7,9 @@ Most fields are populated by other inserters; this inserter only handles:
 - Activity metadata (name, timestamps, location) from activity.json
 - Weather data (temperature, humidity, wind) from weather.json
 - Gear data (name, type) from gear.json
+
+After the row is written, the ``daily_load`` ledger is refreshed from the
+activity's day onward and its watermark is moved by the row's hash change.
 """
 
 import json
@@ -16,6 +19,11 @@ from pathlib import Path
 
 import duckdb
 
+from garmin_mcp.database.inserters.daily_load import (
+    activities_fingerprint,
+    activity_digest,
+    refresh_daily_load,
+)
 from garmin_mcp.validation.validators import validate_activity
 
 logger = logging.getLogger(__name__)
@@ -195,6 +203,15 @@ def insert_activities(
             }
         )
 
+        # An UPSERT may move the activity to another day: the ledger has to be
+        # refreshed from the earlier of the old and the new date.
+        previous = conn.execute(
+            "SELECT activity_date FROM activities WHERE activity_id = ?",
+            [activity_id],
+        ).fetchone()
+        replaced_digest = activity_digest(conn, activity_id)
+        fingerprint_before = activities_fingerprint(conn)
+
         _insert_with_connection(
             conn,
             activity_id,
@@ -218,6 +235,16 @@ def insert_activities(
             base_weight_kg,
         )
 
+        refresh_since = datetime.strptime(date, "%Y-%m-%d").date()
+        if previous is not None and previous[0] is not None:
+            refresh_since = min(refresh_since, previous[0])
+        refresh_daily_load(
+            conn,
+            since=refresh_since,
+            digest_delta=replaced_digest ^ activity_digest(conn, activity_id),
+            fingerprint_before=fingerprint_before,
+        )
+
         return True
 
     except Exception as e:
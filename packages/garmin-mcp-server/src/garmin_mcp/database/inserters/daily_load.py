@@ -0,0 +1,234 @@
+"""
+DailyLoad - Maintain the per-day training-load ledger behind ACWR
+
+``TrainingLoadReader`` used to re-aggregate ``activities`` by date on every
+call. ``daily_load`` keeps one row per calendar day, densely from the first to
+the last ``activity_date`` (rest days included with zero load):
+
+- ``activity_count``: activities on that day
+- ``load_km``: sum of ``total_distance_km`` (the v1 load metric)
+- ``longest_run_sec``: ``max(total_time_seconds)`` (NULL on rest days)
+- ``load_7d_km`` / ``load_28d_km``: rolling load sums over the 7 / 28 days
+  ending on that day (inclusive), i.e. the ACWR acute load and chronic total
+
+so an ACWR point lookup is a single-row read. The ledger is derived data:
+``insert_activities`` refreshes it from the inserted day onward, the
+regeneration deletion strategy rebuilds it after deleting activities, and
+migration ``add_daily_load`` backfills it.
+
+``daily_load_state`` holds the ledger's watermark:
+
+- ``activity_count`` / ``max_rowid``: ``count(*)`` and ``max(rowid)`` of
+  ``activities`` when the ledger was last brought up to date. Readers compare
+  them with ``activities`` on every call, which costs no more than reading
+  table metadata.
+- ``activities_digest``: the XOR of a hash of every activity's
+  ``(activity_id, activity_date, total_distance_km, total_time_seconds)``.
+  Only a full rebuild computes it over the whole table; an incremental refresh
+  applies the changed row's hash delta.
+
+An incremental refresh advances the watermark only when it matched
+``activities`` before the write, so a row added or deleted outside these paths
+keeps the ledger marked stale (readers then aggregate ``activities``) until the
+next rebuild. In-place edits of existing rows (``UPDATE``) keep both count and
+rowid and are not detected; regeneration rebuilds the ledger after them.
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+
+import duckdb
+
+logger = logging.getLogger(__name__)
+
+# Trailing window lengths (days, inclusive of the day itself).
+ACUTE_WINDOW_DAYS = 7
+CHRONIC_WINDOW_DAYS = 28
+
+# Per-activity hash of the columns the ledger is derived from, and the digest
+# of the whole table (order independent, 0 when empty).
+ROW_DIGEST_SQL = (
+    "hash(activity_id, activity_date, total_distance_km, total_time_seconds)"
+)
+ACTIVITIES_DIGEST_SQL = f"SELECT COALESCE(bit_xor({ROW_DIGEST_SQL}), 0) FROM activities"
+
+# Freshness key the reader checks on every call (rowids are never reused, so a
+# delete followed by an insert still moves it).
+ACTIVITIES_FINGERPRINT_SQL = "SELECT count(*), max(rowid) FROM activities"
+
+Fingerprint = tuple[int, int | None]
+
+_INSERT_SQL = f"""
+    INSERT INTO daily_load
+    WITH per_day AS (
+        SELECT
+            activity_date AS load_date,
+            count(*) AS activity_count,
+            coalesce(sum(total_distance_km), 0.0) AS load_km,
+            max(total_time_seconds) AS longest_run_sec
+        FROM activities
+        WHERE activity_date BETWEEN $lo::DATE - {CHRONIC_WINDOW_DAYS - 1}
+            AND $hi::DATE
+        GROUP BY activity_date
+    ),
+    days AS (
+        SELECT CAST(d AS DATE) AS load_date
+        FROM generate_series(
+            $lo::DATE - {CHRONIC_WINDOW_DAYS - 1}, $hi::DATE, INTERVAL 1 DAY
+        ) AS t(d)
+    ),
+    ledger AS (
+        SELECT
+            days.load_date,
+            coalesce(per_day.activity_count, 0) AS activity_count,
+            coalesce(per_day.load_km, 0.0) AS load_km,
+            per_day.longest_run_sec,
+            sum(coalesce(per_day.load_km, 0.0)) OVER (
+                ORDER BY days.load_date
+                ROWS BETWEEN {ACUTE_WINDOW_DAYS - 1} PRECEDING AND CURRENT ROW
+            ) AS load_7d_km,
+            sum(coalesce(per_day.load_km, 0.0)) OVER (
+                ORDER BY days.load_date
+                ROWS BETWEEN {CHRONIC_WINDOW_DAYS - 1} PRECEDING AND CURRENT ROW
+            ) AS load_28d_km
+        FROM days
+        LEFT JOIN per_day ON per_day.load_date = days.load_date
+    )
+    SELECT * FROM ledger
+    WHERE load_date >= $lo::DATE
+    ORDER BY load_date
+"""
+
+
+def _as_date(value: date | str) -> date:
+    """Normalize a DuckDB DATE / ``YYYY-MM-DD`` string to ``date``."""
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value), "%Y-%m-%d").date()
+
+
+def activity_digest(conn: duckdb.DuckDBPyConnection, activity_id: int) -> int:
+    """Ledger hash of one ``activities`` row (0 when the row does not exist)."""
+    row = conn.execute(
+        f"SELECT {ROW_DIGEST_SQL} FROM activities WHERE activity_id = ?",
+        [activity_id],
+    ).fetchone()
+    return int(row[0]) if row else 0
+
+
+def activities_fingerprint(conn: duckdb.DuckDBPyConnection) -> Fingerprint:
+    """``(count(*), max(rowid))`` of ``activities`` (the reader's freshness key)."""
+    row = conn.execute(ACTIVITIES_FINGERPRINT_SQL).fetchone()
+    if row is None:
+        return (0, None)
+    return (int(row[0]), None if row[1] is None else int(row[1]))
+
+
+def _has_state_table(conn: duckdb.DuckDBPyConnection) -> bool:
+    row = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables "
+        "WHERE table_name = 'daily_load_state'"
+    ).fetchone()
+    return row is not None and row[0] > 0
+
+
+def _record_watermark(
+    conn: duckdb.DuckDBPyConnection,
+    digest_delta: int | None,
+    fingerprint_before: Fingerprint | None = None,
+) -> None:
+    """Store the ledger watermark (``None`` delta: full rebuild).
+
+    On an incremental refresh the watermark only advances when the stored
+    fingerprint equals ``fingerprint_before`` (the ledger was current before
+    the write); otherwise it is left behind, so readers keep aggregating
+    ``activities``. Skipped while migrations have not created
+    ``daily_load_state`` yet.
+    """
+    if not _has_state_table(conn):
+        return
+    if digest_delta is None:
+        row = conn.execute(ACTIVITIES_DIGEST_SQL).fetchone()
+        digest = int(row[0]) if row else 0
+    else:
+        stored = conn.execute(
+            "SELECT activities_digest, activity_count, max_rowid FROM daily_load_state"
+        ).fetchone()
+        if stored is None or fingerprint_before != (stored[1], stored[2]):
+            return
+        digest = int(stored[0]) ^ digest_delta
+    count, max_rowid = activities_fingerprint(conn)
+    conn.execute("DELETE FROM daily_load_state")
+    conn.execute(
+        "INSERT INTO daily_load_state "
+        "(activities_digest, activity_count, max_rowid, refreshed_at) "
+        "VALUES (?, ?, ?, now())",
+        [digest, count, max_rowid],
+    )
+
+
+def refresh_daily_load(
+    conn: duckdb.DuckDBPyConnection,
+    since: date | str | None = None,
+    digest_delta: int = 0,
+    fingerprint_before: Fingerprint | None = None,
+) -> int:
+    """Recompute the ledger rows from ``since`` through the last activity day.
+
+    A day's rolling sums only look backward, so a change on ``since`` affects
+    that day and every later one; earlier rows are left untouched. The start
+    is pulled back to the day after the current ledger end when ``since`` lies
+    beyond it, so the ledger stays dense.
+
+    Args:
+        conn: DuckDB connection (write access).
+        since: First day whose loads may have changed. ``None`` rebuilds the
+            whole ledger.
+        digest_delta: XOR of the changed activity's :func:`activity_digest`
+            before and after the write, applied to the stored digest on an
+            incremental refresh (a full rebuild stores the digest of
+            ``activities`` instead).
+        fingerprint_before: :func:`activities_fingerprint` taken before the
+            write. The watermark advances only when it matches the stored
+            one; ``None`` leaves the watermark as it is.
+
+    Returns:
+        Number of ledger rows written.
+    """
+    first, last = conn.execute(
+        "SELECT min(activity_date), max(activity_date) FROM activities"
+    ).fetchone() or (None, None)
+    ledger_end_row = conn.execute("SELECT max(load_date) FROM daily_load").fetchone()
+    ledger_end = ledger_end_row[0] if ledger_end_row else None
+
+    if since is None or ledger_end is None:
+        conn.execute("DELETE FROM daily_load")
+        lo = _as_date(first) if first is not None else None
+        _record_watermark(conn, None)
+    else:
+        lo = min(_as_date(since), _as_date(ledger_end) + timedelta(days=1))
+        conn.execute("DELETE FROM daily_load WHERE load_date >= ?", [lo])
+        _record_watermark(conn, digest_delta, fingerprint_before)
+        if first is not None:
+            lo = max(lo, _as_date(first))
+
+    if lo is None or last is None or lo > _as_date(last):
+        return 0
+
+    hi = _as_date(last)
+    conn.execute(_INSERT_SQL, {"lo": lo, "hi": hi})
+    return (hi - lo).days + 1
+
+
+def rebuild_all_daily_load(conn: duckdb.DuckDBPyConnection) -> int:
+    """Rebuild the whole ledger from ``activities`` (migration backfill).
+
+    Args:
+        conn: DuckDB connection (write access).
+
+    Returns:
+        Total number of ledger rows written.
+    """
+    total = refresh_daily_load(conn)
+    logger.info("Rebuilt %d daily_load rows", total)
+    return total
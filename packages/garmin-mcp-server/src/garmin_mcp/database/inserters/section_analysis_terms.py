@@ -0,0 +1,87 @@
+"""
+SectionAnalysisTerms - Maintain the keyword index over section_analyses
+
+``InsightExtractor`` searches analyses by top-level keys of ``analysis_data``
+(``key_strengths``, ``improvement_areas``, ``evaluation``, ...) that hold a
+non-empty value. Doing that with ``json_extract`` parses every stored JSON
+document on every search. ``section_analysis_terms`` is the inverted index:
+one row per (term, analysis) where ``term`` is a top-level key whose value is
+not ``null`` / ``[]`` / ``{}`` / ``""`` (exactly the legacy predicate), with
+the analysis' ``activity_id`` / ``activity_date`` / ``section_type`` copied
+alongside so a search page is picked from the index alone.
+
+The index is derived data: ``GarminDBWriter.insert_section_analysis`` indexes
+each appended row in the same transaction, and migration
+``add_section_analysis_terms`` backfills it.
+"""
+
+import logging
+
+import duckdb
+
+logger = logging.getLogger(__name__)
+
+_INSERT_SQL = """
+    INSERT INTO section_analysis_terms (
+        term, analysis_id, activity_id, activity_date, section_type
+    )
+    SELECT k.term, s.analysis_id, s.activity_id, s.activity_date, s.section_type
+    FROM (
+        SELECT analysis_id, activity_id, activity_date, section_type, analysis_data
+        FROM section_analyses
+        WHERE json_valid(analysis_data)
+            AND json_type(analysis_data) = 'OBJECT'
+            {analyses_filter}
+    ) s,
+        unnest(json_keys(s.analysis_data)) AS k(term)
+    WHERE CAST(
+        json_extract(s.analysis_data, '$."' || k.term || '"') AS VARCHAR
+    ) NOT IN ('null', '[]', '{{}}', '""')
+"""
+
+
+def refresh_section_analysis_terms(
+    conn: duckdb.DuckDBPyConnection,
+    analysis_ids: list[int] | None = None,
+) -> int:
+    """Recompute the index rows of ``analysis_ids`` from ``section_analyses``.
+
+    Args:
+        conn: DuckDB connection (write access).
+        analysis_ids: Analyses to (re)index. ``None`` rebuilds the whole index.
+
+    Returns:
+        Number of index rows written.
+    """
+    if analysis_ids is None:
+        conn.execute("DELETE FROM section_analysis_terms")
+        sql = _INSERT_SQL.format(analyses_filter="")
+        params: list[int] = []
+    else:
+        if not analysis_ids:
+            return 0
+        placeholders = ",".join("?" * len(analysis_ids))
+        conn.execute(
+            "DELETE FROM section_analysis_terms "
+            f"WHERE analysis_id IN ({placeholders})",
+            analysis_ids,
+        )
+        sql = _INSERT_SQL.format(analyses_filter=f"AND analysis_id IN ({placeholders})")
+        params = list(analysis_ids)
+
+    row = conn.execute(sql, params).fetchone()
+    return int(row[0]) if row else 0
+
+
+def rebuild_all_section_analysis_terms(conn: duckdb.DuckDBPyConnection) -> int:
+    """Rebuild the whole keyword index (migration backfill).
+
+    Args:
+        conn: DuckDB connection (write access).
+
+    Returns:
+        Total number of index rows written.
+    """
+    total = refresh_section_analysis_terms(conn)
+    logger.info("Rebuilt %d section_analysis_terms rows", total)
+    return total
@@ -0,0 +1,145 @@
+"""
+SplitPhaseStats - Materialize per-activity split statistics
+
+The ``statistics_only`` split readers (``get_splits_pace_hr``,
+``get_splits_form_metrics``, ``get_splits_elevation``,
+``get_splits_comprehensive``) and the prefetch elevation summary used to
+aggregate the ``splits`` rows of an activity on every call. ``split_phase_stats``
+stores those aggregates once per activity and phase:
+
+- ``phase = 'all'``: every split of the activity
+- ``phase = <role_phase>``: the splits of one ``role_phase`` (warmup, run,
+  recovery, cooldown); splits without a role phase only count towards ``'all'``
+
+For each column in :data:`STAT_COLUMNS` the row holds
+``<column>_{mean,median,std,min,max}``, plus ``split_count``, the elevation
+sums and the largest per-split elevation change. The table is derived data:
+``save_data`` refreshes the ingested activity's rows, the regeneration deletion
+strategy deletes them with the activity's splits, and migration
+``add_split_phase_stats`` backfills it.
+"""
+
+import logging
+
+import duckdb
+
+logger = logging.getLogger(__name__)
+
+# splits columns aggregated per phase (the readers' statistics fields).
+STAT_COLUMNS = (
+    "pace_seconds_per_km",
+    "heart_rate",
+    "ground_contact_time",
+    "vertical_oscillation",
+    "vertical_ratio",
+    "power",
+    "stride_length",
+    "cadence",
+    "elevation_gain",
+    "elevation_loss",
+    "max_heart_rate",
+    "max_cadence",
+)
+# (column suffix, aggregate) pairs, in the readers' statistics order.
+STAT_AGGREGATES = (
+    ("mean", "AVG"),
+    ("median", "MEDIAN"),
+    ("std", "STDDEV"),
+    ("min", "MIN"),
+    ("max", "MAX"),
+)
+# Per-activity totals that are not column statistics.
+_EXTRA_COLUMNS = (
+    ("elevation_gain_sum", "SUM(elevation_gain)"),
+    ("elevation_loss_sum", "SUM(elevation_loss)"),
+    ("elevation_change_max", "MAX(elevation_gain + elevation_loss)"),
+)
+
+
+def stat_column_names() -> list[str]:
+    """Names of the ``<column>_<stat>`` columns, in table order."""
+    return [
+        f"{column}_{suffix}" for column in STAT_COLUMNS for suffix, _ in STAT_AGGREGATES
+    ]
+
+
+def _aggregate_sql(phase_expr: str, splits_filter: str) -> str:
+    aggregates = [
+        f"{func}({column})" for column in STAT_COLUMNS for _, func in STAT_AGGREGATES
+    ]
+    aggregates += [expr for _, expr in _EXTRA_COLUMNS]
+    return f"""
+        SELECT activity_id, {phase_expr}, COUNT(*), {", ".join(aggregates)}
+        FROM splits
+        {splits_filter}
+        GROUP BY ALL
+    """
+
+
+def refresh_split_phase_stats(
+    conn: duckdb.DuckDBPyConnection,
+    activity_ids: list[int] | None = None,
+) -> int:
+    """Recompute the phase statistics of ``activity_ids`` from ``splits``.
+
+    Existing rows of the activities are replaced, so activities whose splits
+    were deleted lose their rows too.
+
+    Args:
+        conn: DuckDB connection (write access).
+        activity_ids: Activities to refresh. ``None`` rebuilds every row.
+
+    Returns:
+        Number of rows written.
+    """
+    if activity_ids is None:
+        conn.execute("DELETE FROM split_phase_stats")
+        where = ""
+        params: list[int] = []
+    else:
+        if not activity_ids:
+            return 0
+        placeholders = ",".join("?" * len(activity_ids))
+        conn.execute(
+            f"DELETE FROM split_phase_stats WHERE activity_id IN ({placeholders})",
+            activity_ids,
+        )
+        where = f"activity_id IN ({placeholders})"
+        params = list(activity_ids)
+
+    all_rows = _aggregate_sql("'all'", f"WHERE {where}" if where else "")
+    phase_rows = _aggregate_sql(
+        "role_phase",
+        f"WHERE role_phase IS NOT NULL{f' AND {where}' if where else ''}",
+    )
+    columns = [
+        "activity_id",
+        "phase",
+        "split_count",
+        *stat_column_names(),
+        *(name for name, _ in _EXTRA_COLUMNS),
+    ]
+    row = conn.execute(
+        f"""
+        INSERT INTO split_phase_stats ({", ".join(columns)})
+        {all_rows}
+        UNION ALL
+        {phase_rows}
+        """,
+        [*params, *params],
+    ).fetchone()
+    return int(row[0]) if row else 0
+
+
+def rebuild_all_split_phase_stats(conn: duckdb.DuckDBPyConnection) -> int:
+    """Rebuild every phase statistics row from ``splits`` (migration backfill).
+
+    Args:
+        conn: DuckDB connection (write access).
+
+    Returns:
+        Total number of rows written.
+    """
+    total = refresh_split_phase_stats(conn)
+    logger.info("Rebuilt %d split_phase_stats rows", total)
+    return total
@@ -11,13 +11,25 @@ Helper logic has been extracted to splits_helpers/ package:
 - CadencePowerCalculator: Cadence and power metrics
 - EnvironmentalCalculator: Environmental conditions
 - SplitsExtractor: Raw data extraction
+- SplitsColumnBuffer: Columnar rows for insert_splits_batch
+
+insert_splits writes one activity split by split (ingest). insert_splits_batch
+loads many activities with one INSERT per batch (regeneration).
 """
 
+import json
 import logging
+from collections.abc import Mapping
+from pathlib import Path
 
 import duckdb
 from pydantic import ValidationError
 
+from garmin_mcp.database.inserters.splits_helpers.columnar import (
+    SPLIT_COLUMNS,
+    SplitsColumnBuffer,
+    invalid_split_mask,
+)
 from garmin_mcp.database.inserters.splits_helpers.extractor import SplitsExtractor
 from garmin_mcp.database.inserters.splits_helpers.phase_mapping import PhaseMapper
 from garmin_mcp.validation.validators import validate_split
@@ -69,6 +81,81 @@ def insert_splits(
         return False
 
 
+def insert_splits_batch(
+    conn: duckdb.DuckDBPyConnection,
+    raw_splits_files: Mapping[int, str | Path | None],
+) -> dict[int, bool]:
+    """
+    Insert the splits of many activities with one bulk INSERT.
+
+    Every activity's lapDTOs are read into a SplitsColumnBuffer, the derived
+    columns and the SplitRecord constraints are evaluated over the whole
+    batch, the activities' existing splits are deleted, and the valid rows
+    are inserted from one registered frame. Invalid splits are skipped (and
+    logged) exactly as in insert_splits.
+
+    Args:
+        conn: DuckDB connection (the caller owns the transaction)
+        raw_splits_files: ``{activity_id: path to raw splits.json}``
+
+    Returns:
+        ``{activity_id: success}``; False for a missing file or one without
+        lapDTOs (that activity's existing splits are left untouched).
+    """
+    buffer = SplitsColumnBuffer()
+    loaded: dict[int, bool] = {}
+    for activity_id, raw_splits_file in raw_splits_files.items():
+        path = Path(raw_splits_file) if raw_splits_file else None
+        if path is None or not path.exists():
+            logger.error(f"Splits file not found for activity {activity_id}")
+            loaded[activity_id] = False
+            continue
+        try:
+            with open(path, encoding="utf-8") as f:
+                lap_dtos = json.load(f).get("lapDTOs", [])
+        except (OSError, ValueError) as e:
+            logger.error(f"Error reading splits for activity {activity_id}: {e}")
+            loaded[activity_id] = False
+            continue
+        loaded[activity_id] = buffer.add(activity_id, lap_dtos) > 0
+        if not loaded[activity_id]:
+            logger.error(f"No lapDTOs found for activity {activity_id}")
+
+    activity_ids = [activity_id for activity_id, ok in loaded.items() if ok]
+    if not activity_ids:
+        return loaded
+
+    frame = buffer.to_frame()
+    invalid = invalid_split_mask(frame)
+    for activity_id, split_index in frame.loc[
+        invalid, ["activity_id", "split_index"]
+    ].itertuples(index=False):
+        logger.warning(
+            "Skipping invalid split for activity %s split_number=%s",
+            activity_id,
+            split_index,
+        )
+
+    placeholders = ",".join("?" * len(activity_ids))
+    conn.execute(
+        f"DELETE FROM splits WHERE activity_id IN ({placeholders})", activity_ids
+    )
+    column_list = ", ".join(SPLIT_COLUMNS)
+    conn.register("_splits_batch", frame[~invalid])
+    try:
+        conn.execute(
+            f"INSERT INTO splits ({column_list}) "
+            f"SELECT {column_list} FROM _splits_batch"
+        )
+    finally:
+        conn.unregister("_splits_batch")
+
+    logger.info(
+        f"Inserted {int((~invalid).sum())} splits for {len(activity_ids)} activities"
+    )
+    return loaded
+
+
 def _insert_splits_with_connection(
     conn: duckdb.DuckDBPyConnection, activity_id: int, split_metrics: list[dict]
 ) -> None:
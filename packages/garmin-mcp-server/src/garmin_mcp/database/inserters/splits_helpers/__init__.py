@@ -8,11 +8,13 @@ This package contains specialized calculators extracted from splits.py:
 - CadencePowerCalculator: Cadence rating and power efficiency
 - EnvironmentalCalculator: Environmental conditions and impact
 - SplitsExtractor: Raw splits.json data extraction
+- SplitsColumnBuffer: Columnar split rows for multi-activity bulk inserts
 """
 
 from garmin_mcp.database.inserters.splits_helpers.cadence_power import (
     CadencePowerCalculator,
 )
+from garmin_mcp.database.inserters.splits_helpers.columnar import SplitsColumnBuffer
 from garmin_mcp.database.inserters.splits_helpers.environmental import (
     EnvironmentalCalculator,
 )
@@ -28,4 +30,5 @@ __all__ = [
     "CadencePowerCalculator",
     "EnvironmentalCalculator",
     "SplitsExtractor",
+    "SplitsColumnBuffer",
 ]
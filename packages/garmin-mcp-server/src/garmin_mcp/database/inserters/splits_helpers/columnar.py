@@ -0,0 +1,253 @@
+"""Columnar split rows for bulk insertion of many activities."""
+
+import logging
+import typing
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from garmin_mcp.database.inserters.splits_helpers.phase_mapping import PhaseMapper
+from garmin_mcp.database.inserters.splits_helpers.terrain import TerrainClassifier
+from garmin_mcp.validation.models import SplitRecord
+
+logger = logging.getLogger(__name__)
+
+# splits column <- lapDTO key, copied as-is (missing -> NULL).
+_RAW_NUMERIC_COLUMNS = (
+    ("duration_seconds", "duration"),
+    ("heart_rate", "averageHR"),
+    ("cadence", "averageRunCadence"),
+    ("power", "averagePower"),
+    ("ground_contact_time", "groundContactTime"),
+    ("vertical_oscillation", "verticalOscillation"),
+    ("vertical_ratio", "verticalRatio"),
+    ("stride_length", "strideLength"),
+    ("max_heart_rate", "maxHR"),
+    ("max_cadence", "maxRunCadence"),
+    ("max_power", "maxPower"),
+    ("normalized_power", "normalizedPower"),
+    ("average_speed", "averageSpeed"),
+    ("grade_adjusted_speed", "avgGradeAdjustedSpeed"),
+)
+
+# Columns of the frame, in splits insertion order.
+SPLIT_COLUMNS = (
+    "activity_id",
+    "split_index",
+    "distance",
+    "duration_seconds",
+    "start_time_gmt",
+    "start_time_s",
+    "end_time_s",
+    "intensity_type",
+    "role_phase",
+    "pace_str",
+    "pace_seconds_per_km",
+    "heart_rate",
+    "cadence",
+    "power",
+    "ground_contact_time",
+    "vertical_oscillation",
+    "vertical_ratio",
+    "elevation_gain",
+    "elevation_loss",
+    "terrain_type",
+    "stride_length",
+    "max_heart_rate",
+    "max_cadence",
+    "max_power",
+    "normalized_power",
+    "average_speed",
+    "grade_adjusted_speed",
+)
+
+
+def _float_column(laps: list[dict], key: str, default: Any = None) -> np.ndarray:
+    """One lapDTO key as a float array (None -> NaN)."""
+    return np.array([lap.get(key, default) for lap in laps], dtype=float)
+
+
+def _truthy(values: np.ndarray) -> np.ndarray:
+    """Element-wise Python truthiness of a float array (NaN / 0 are falsy)."""
+    truthy: np.ndarray = ~np.isnan(values) & (values != 0)
+    return truthy
+
+
+class SplitsColumnBuffer:
+    """Accumulate the splits of many activities as columns.
+
+    :meth:`add` reads one activity's ``lapDTOs`` into per-column arrays;
+    :meth:`to_frame` derives the calculated columns (pace, pace_str,
+    role_phase, terrain_type, estimated intensity_type) for every buffered
+    split at once. The values match ``SplitsExtractor.extract_splits_from_raw``
+    followed by the per-split insert.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[dict[str, np.ndarray]] = []
+
+    def __len__(self) -> int:
+        return sum(len(chunk["activity_id"]) for chunk in self._chunks)
+
+    def add(self, activity_id: int, lap_dtos: list[dict]) -> int:
+        """Buffer the laps of one activity (laps without ``lapIndex`` skipped).
+
+        Returns:
+            Number of splits buffered.
+        """
+        laps = [lap for lap in lap_dtos if lap.get("lapIndex") is not None]
+        n = len(laps)
+        if not n:
+            return 0
+
+        chunk: dict[str, np.ndarray] = {
+            "activity_id": np.full(n, activity_id, dtype=np.int64),
+            "split_index": np.array([lap["lapIndex"] for lap in laps]),
+            "start_time_gmt": np.array(
+                [lap.get("startTimeGMT") for lap in laps], dtype=object
+            ),
+            "intensity_type": np.array(
+                [lap.get("intensityType") for lap in laps], dtype=object
+            ),
+            "distance_m": _float_column(laps, "distance", 0),
+            "elevation_gain": _float_column(laps, "elevationGain", 0),
+            "elevation_loss": _float_column(laps, "elevationLoss", 0),
+        }
+        for column, key in _RAW_NUMERIC_COLUMNS:
+            chunk[column] = _float_column(laps, key)
+
+        # Time range: cumulative rounded durations within the activity; a
+        # split without a duration has no end and does not advance the clock.
+        duration = chunk["duration_seconds"]
+        has_duration = _truthy(duration)
+        step = np.where(has_duration, np.round(np.nan_to_num(duration)), 0)
+        ends = np.cumsum(step)
+        chunk["start_time_s"] = ends - step
+        chunk["end_time_s"] = np.where(has_duration, ends, np.nan)
+
+        self._chunks.append(chunk)
+        return n
+
+    def to_frame(self) -> pd.DataFrame:
+        """All buffered splits as a frame with :data:`SPLIT_COLUMNS`.
+
+        NaN is read as NULL when the frame is registered with DuckDB.
+        """
+        if not self._chunks:
+            return pd.DataFrame(columns=list(SPLIT_COLUMNS))
+        columns = {
+            key: np.concatenate([chunk[key] for chunk in self._chunks])
+            for key in self._chunks[0]
+        }
+
+        distance_m = columns.pop("distance_m")
+        distance_km = np.where(_truthy(distance_m), distance_m / 1000.0, np.nan)
+        duration = columns["duration_seconds"]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            pace = np.where(
+                (distance_km > 0) & _truthy(duration), duration / distance_km, np.nan
+            )
+        columns["distance"] = distance_km
+        columns["pace_seconds_per_km"] = pace
+        columns["pace_str"] = _format_pace(pace)
+        columns["role_phase"] = PhaseMapper.map_intensity_to_phase_array(
+            columns["intensity_type"]
+        )
+        # A null elevation counts as flat ground, like a missing key.
+        columns["terrain_type"] = TerrainClassifier.classify_terrain_array(
+            np.nan_to_num(columns["elevation_gain"]),
+            np.nan_to_num(columns["elevation_loss"]),
+        )
+        columns["intensity_type"] = _estimate_missing_intensity(
+            columns["activity_id"],
+            columns["intensity_type"],
+            columns["heart_rate"],
+            pace,
+        )
+        return pd.DataFrame({name: columns[name] for name in SPLIT_COLUMNS})
+
+
+def _format_pace(pace: np.ndarray) -> np.ndarray:
+    """``M:SS`` pace strings (None where the pace is missing or zero)."""
+    result = np.full(len(pace), None, dtype=object)
+    has_pace = _truthy(pace)
+    if has_pace.any():
+        valid = pace[has_pace]
+        minutes = pd.Series(np.floor_divide(valid, 60).astype(np.int64)).astype(str)
+        seconds = pd.Series(np.mod(valid, 60).astype(np.int64)).astype(str)
+        result[has_pace] = (minutes + ":" + seconds.str.zfill(2)).to_numpy()
+    return result
+
+
+def _estimate_missing_intensity(
+    activity_ids: np.ndarray,
+    intensity_types: np.ndarray,
+    heart_rate: np.ndarray,
+    pace: np.ndarray,
+) -> np.ndarray:
+    """Fill NULL intensity types with ``PhaseMapper.estimate_intensity_type``.
+
+    The estimate depends on the order and averages of an activity's splits, so
+    it runs per activity, and only for activities with a NULL type.
+    """
+    missing = np.array([value is None for value in intensity_types], dtype=bool)
+    if not missing.any():
+        return intensity_types
+    result = intensity_types.copy()
+    for activity_id in np.unique(activity_ids[missing]):
+        rows = np.flatnonzero(activity_ids == activity_id)
+        splits = [
+            {
+                "avg_heart_rate": None if np.isnan(heart_rate[i]) else heart_rate[i],
+                "pace_seconds_per_km": None if np.isnan(pace[i]) else pace[i],
+            }
+            for i in rows
+        ]
+        estimated = np.array(PhaseMapper.estimate_intensity_type(splits), dtype=object)
+        fill = missing[rows]
+        result[rows[fill]] = estimated[fill]
+        logger.info(
+            "Estimated intensity_type for activity %s (found NULL values)",
+            activity_id,
+        )
+    return result
+
+
+def _field_bounds() -> list[tuple[str, float | None, float | None, bool]]:
+    """``(column, ge, le, integral)`` for every constrained SplitRecord field."""
+    bounds = []
+    for name, field in SplitRecord.model_fields.items():
+        if name == "activity_id":
+            continue
+        ge = le = None
+        for meta in field.metadata:
+            ge = getattr(meta, "ge", ge)
+            le = getattr(meta, "le", le)
+        integral = int in typing.get_args(field.annotation) or field.annotation is int
+        bounds.append((name, ge, le, integral))
+    return bounds
+
+
+def invalid_split_mask(frame: pd.DataFrame) -> pd.Series:
+    """Rows violating the ``SplitRecord`` physical constraints.
+
+    The vectorized equivalent of calling ``validate_split`` per row, with the
+    bounds read from the model: NULL values pass, bounds are inclusive, and
+    integer fields reject fractional values.
+    """
+    invalid = pd.Series(False, index=frame.index)
+    for column, ge, le, integral in _field_bounds():
+        if column not in frame:
+            continue
+        values = frame[column].to_numpy(dtype=float)
+        present = ~np.isnan(values)
+        bad = np.zeros(len(values), dtype=bool)
+        if ge is not None:
+            bad |= present & (values < ge)
+        if le is not None:
+            bad |= present & (values > le)
+        if integral:
+            bad |= present & (values != np.floor(values))
+        invalid |= bad
+    return invalid
@@ -1,5 +1,22 @@
 """Intensity type to phase mapping and estimation."""
 
+from collections.abc import Sequence
+
+import numpy as np
+
+_PHASE_BY_INTENSITY = {
+    "WARMUP": "warmup",
+    "INTERVAL": "run",
+    "ACTIVE": "run",
+    "RECOVERY": "recovery",
+    "COOLDOWN": "cooldown",
+}
+
+
+def _is_none(values: np.ndarray) -> np.ndarray:
+    """Element-wise ``is None`` of an object array."""
+    return np.array([value is None for value in values], dtype=bool)
+
 
 class PhaseMapper:
     """Map Garmin intensity types to training phases."""
@@ -18,18 +35,34 @@ class PhaseMapper:
         if not intensity_type:
             return None
 
-        intensity_upper = intensity_type.upper()
-
-        if intensity_upper == "WARMUP":
-            return "warmup"
-        elif intensity_upper in ("INTERVAL", "ACTIVE"):
-            return "run"
-        elif intensity_upper == "RECOVERY":
-            return "recovery"
-        elif intensity_upper == "COOLDOWN":
-            return "cooldown"
-        else:
-            return None
+        return _PHASE_BY_INTENSITY.get(intensity_type.upper())
+
+    @staticmethod
+    def map_intensity_to_phase_array(
+        intensity_types: Sequence[str | None] | np.ndarray,
+    ) -> np.ndarray:
+        """
+        Vectorized :meth:`map_intensity_to_phase` over a column of splits.
+
+        Each distinct intensity type is mapped once.
+
+        Args:
+            intensity_types: Garmin intensityType per split (None allowed)
+
+        Returns:
+            Object array of role_phase strings (None where unmapped)
+        """
+        values = np.asarray(intensity_types, dtype=object)
+        if not len(values):
+            return values
+        distinct, inverse = np.unique(values.astype(str), return_inverse=True)
+        phases = np.array(
+            [_PHASE_BY_INTENSITY.get(value.upper()) for value in distinct],
+            dtype=object,
+        )
+        result = phases[inverse]
+        result[_is_none(values)] = None
+        return result
 
     @staticmethod
     def estimate_intensity_type(splits: list[dict]) -> list[str]:
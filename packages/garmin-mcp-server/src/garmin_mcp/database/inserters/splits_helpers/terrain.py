@@ -1,5 +1,12 @@
 """Terrain classification from elevation data."""
 
+import numpy as np
+import numpy.typing as npt
+
+# (upper bound of |gain| + |loss| in meters, terrain type), ascending.
+_TERRAIN_BANDS = ((5, "平坦"), (15, "起伏"), (30, "丘陵"))
+_STEEPEST_TERRAIN = "山岳"
+
 
 class TerrainClassifier:
     """Classify terrain type based on elevation changes."""
@@ -18,11 +25,30 @@ class TerrainClassifier:
         """
         total_elevation_change = abs(elevation_gain) + abs(elevation_loss)
 
-        if total_elevation_change < 5:
-            return "平坦"
-        elif total_elevation_change < 15:
-            return "起伏"
-        elif total_elevation_change < 30:
-            return "丘陵"
-        else:
-            return "山岳"
+        for upper, terrain in _TERRAIN_BANDS:
+            if total_elevation_change < upper:
+                return terrain
+        return _STEEPEST_TERRAIN
+
+    @staticmethod
+    def classify_terrain_array(
+        elevation_gain: npt.ArrayLike, elevation_loss: npt.ArrayLike
+    ) -> np.ndarray:
+        """
+        Vectorized :meth:`classify_terrain` over arrays of splits.
+
+        Args:
+            elevation_gain: Elevation gains in meters
+            elevation_loss: Elevation losses in meters (same length)
+
+        Returns:
+            Object array of terrain types
+        """
+        total = np.abs(np.asarray(elevation_gain, dtype=float)) + np.abs(
+            np.asarray(elevation_loss, dtype=float)
+        )
+        return np.select(
+            [total < upper for upper, _ in _TERRAIN_BANDS],
+            [terrain for _, terrain in _TERRAIN_BANDS],
+            default=_STEEPEST_TERRAIN,
+        ).astype(object)
@@ -2,22 +2,170 @@
 TimeSeriesMetricsInserter - Insert time series metrics from activity_details.json to DuckDB
 
 Inserts second-by-second time series data (26 metrics × 1000-2000 seconds) into
-time_series_metrics table for efficient querying and token-optimized access.
+time_series_metrics table for efficient querying and token-optimized access,
+then refreshes the activity's 10 s / 60 s buckets in time_series_rollups and
+its row in the time_series_offsets catalog.
+
+``activityDetailMetrics`` is streamed (``garmin_mcp.utils.json_stream``) in
+chunks of ``STREAM_CHUNK_ROWS`` data points: each chunk is copied into a
+preallocated float64 block, sliced into column arrays and inserted with one
+``INSERT ... SELECT`` into a temp staging table. Peak memory therefore depends
+on the chunk size, not on the activity length (ultra runs / long hikes have
+tens of thousands of points). The stored series is only replaced once the
+whole array has parsed, so a truncated or corrupt file leaves it untouched.
 """
 
+import itertools
 import json
 import logging
 from pathlib import Path
+from typing import Any
 
 import duckdb
+import numpy as np
+import pandas as pd
+
+from garmin_mcp.database.inserters.time_series_offsets import (
+    insert_time_series_offsets,
+)
+from garmin_mcp.database.inserters.time_series_rollups import (
+    insert_time_series_rollups,
+)
+from garmin_mcp.database.time_series_layout import time_series_insert_select_sql
+from garmin_mcp.utils.json_stream import iter_top_level_array, load_top_level_fields
 
 logger = logging.getLogger(__name__)
 
+# Data points decoded and inserted per chunk.
+STREAM_CHUNK_ROWS = 4096
+
+# Column order and API key mapping
+COLUMN_SPEC: tuple[tuple[str, str], ...] = (
+    ("sumMovingDuration", "sum_moving_duration"),
+    ("sumDuration", "sum_duration"),
+    ("sumElapsedDuration", "sum_elapsed_duration"),
+    ("sumDistance", "sum_distance"),
+    ("sumAccumulatedPower", "sum_accumulated_power"),
+    ("directHeartRate", "heart_rate"),
+    ("directSpeed", "speed"),
+    ("directGradeAdjustedSpeed", "grade_adjusted_speed"),
+    ("directDoubleCadence", "cadence"),  # Both feet cadence (corrected from raw data)
+    ("directPower", "power"),
+    ("directGroundContactTime", "ground_contact_time"),
+    ("directVerticalOscillation", "vertical_oscillation"),
+    ("directVerticalRatio", "vertical_ratio"),
+    ("directStrideLength", "stride_length"),
+    ("directVerticalSpeed", "vertical_speed"),
+    ("directElevation", "elevation"),
+    ("directAirTemperature", "air_temperature"),
+    ("directLatitude", "latitude"),
+    ("directLongitude", "longitude"),
+    ("directAvailableStamina", "available_stamina"),
+    ("directPotentialStamina", "potential_stamina"),
+    ("directBodyBattery", "body_battery"),
+    ("directPerformanceCondition", "performance_condition"),
+)
+
+_CHUNK_RELATION = "time_series_chunk"
+_STAGE_TABLE = "time_series_metrics_stage"
+
+
+class _ChunkWriter:
+    """Copies data-point chunks into column arrays and stages them.
+
+    Args:
+        activity_id: Activity ID
+        conn: DuckDB connection (holding the ``_STAGE_TABLE`` temp table)
+        sum_duration_index: ``metricsIndex`` of ``sumDuration``
+        metric_indices: ``metricsIndex`` per ``COLUMN_SPEC`` entry (None when
+            the descriptor is absent)
+        chunk_rows: Capacity of the preallocated block
+    """
+
+    def __init__(
+        self,
+        activity_id: int,
+        conn: duckdb.DuckDBPyConnection,
+        sum_duration_index: int,
+        metric_indices: list[int | None],
+        chunk_rows: int,
+    ) -> None:
+        self.activity_id = activity_id
+        self.conn = conn
+        self.sum_duration_index = sum_duration_index
+        self.metric_indices = metric_indices
+        self.width = (
+            max([sum_duration_index, *(i for i in metric_indices if i is not None)]) + 1
+        )
+        self.block = np.empty((chunk_rows, self.width), dtype=np.float64)
+        self.insert_sql = time_series_insert_select_sql(
+            [column for _, column in COLUMN_SPEC], _CHUNK_RELATION, _STAGE_TABLE
+        )
+        self.next_seq_no = 0
+        self.rows_written = 0
+
+    def write(self, chunk: list[Any]) -> None:
+        """Stage one chunk of ``activityDetailMetrics`` items.
+
+        ``seq_no`` is the item's position in the whole array (skipped items
+        still consume their number). Items without a ``metrics`` list or with
+        a null ``sumDuration`` are skipped.
+        """
+        n = len(chunk)
+        block = self.block[:n]
+        block.fill(np.nan)
+        has_metrics = np.zeros(n, dtype=bool)
+        for i, data_point in enumerate(chunk):
+            metrics = (
+                data_point.get("metrics") if isinstance(data_point, dict) else None
+            )
+            if not metrics or not isinstance(metrics, list):
+                continue
+            has_metrics[i] = True
+            values = metrics[: self.width]
+            # NOTE: Garmin API factor inconsistency - All metricDescriptors have
+            # 'factor' values, but raw metric values are already in SI units
+            # (sumDistance in meters, directSpeed in m/s, sumDuration in
+            # seconds). The factor is for UI display only, so raw values are
+            # stored as-is.
+            block[i, : len(values)] = [np.nan if v is None else v for v in values]
+
+        seq_nos = np.arange(self.next_seq_no, self.next_seq_no + n, dtype=np.int64)
+        self.next_seq_no += n
+
+        sum_duration = block[:, self.sum_duration_index]
+        keep = has_metrics & ~np.isnan(sum_duration)
+        kept = int(keep.sum())
+        if not kept:
+            return
+
+        rows = block[keep]
+        columns: dict[str, Any] = {
+            "activity_id": np.full(kept, self.activity_id, dtype=np.int64),
+            "seq_no": seq_nos[keep],
+            # sumDuration is already in seconds (despite factor=1000.0);
+            # truncate like int().
+            "timestamp_s": np.trunc(sum_duration[keep]).astype(np.int64),
+        }
+        for (_, column), index in zip(COLUMN_SPEC, self.metric_indices, strict=True):
+            columns[column] = (
+                rows[:, index] if index is not None else np.full(kept, np.nan)
+            )
+
+        # NaN is read as NULL from the registered frame.
+        self.conn.register(_CHUNK_RELATION, pd.DataFrame(columns))
+        try:
+            self.conn.execute(self.insert_sql)
+        finally:
+            self.conn.unregister(_CHUNK_RELATION)
+        self.rows_written += kept
+
 
 def insert_time_series_metrics(
     activity_details_file: str,
     activity_id: int,
     conn: duckdb.DuckDBPyConnection,
+    chunk_rows: int = STREAM_CHUNK_ROWS,
 ) -> bool:
     """
     Insert time series metrics from activity_details.json to DuckDB.
@@ -26,184 +174,95 @@ def insert_time_series_metrics(
         activity_details_file: Path to raw/activity/{activity_id}/activity_details.json
         activity_id: Activity ID
         conn: DuckDB connection
+        chunk_rows: Data points decoded and inserted per chunk
 
     Returns:
         True if successful, False otherwise
 
     Process:
-        1. Load activity_details.json
-        2. Parse metricDescriptors for name->index mapping
-        3. Extract activityDetailMetrics array
-        4. Convert each data point:
-           - Extract seq_no from enumerate() index (0-indexed)
+        1. Decode only metricDescriptors for name->index mapping
+        2. Stream activityDetailMetrics in chunks of ``chunk_rows`` items
+        3. Convert each data point:
+           - Extract seq_no from its position in the array (0-indexed)
            - Extract timestamp_s from sumDuration
-           - Apply unit conversions (factors)
            - Map metric names to normalized column names
-        5. Batch insert (~1000-2000 rows/activity)
-        6. Handle duplicates (DELETE before INSERT)
+        4. Stage each chunk with one INSERT ... SELECT in seq_no order
+           (database/time_series_layout.py) into a temp table
+        5. Once the whole array has parsed, replace the activity's rows
+           (DELETE, then copy the stage into time_series_metrics)
+        6. Rebuild the activity's time_series_rollups buckets and
+           time_series_offsets catalog row
     """
     try:
-        # Load activity_details.json
         activity_details_path = Path(activity_details_file)
         if not activity_details_path.exists():
             logger.error(f"Activity details file not found: {activity_details_file}")
             return False
 
-        with open(activity_details_path, encoding="utf-8") as f:
-            activity_details = json.load(f)
+        header = load_top_level_fields(activity_details_path, {"metricDescriptors"})
 
         # Validate required fields
-        metric_descriptors = activity_details.get("metricDescriptors")
-        activity_detail_metrics = activity_details.get("activityDetailMetrics")
-
+        metric_descriptors = header.get("metricDescriptors")
         if not metric_descriptors or not isinstance(metric_descriptors, list):
             logger.error(
                 "Missing or invalid metricDescriptors in activity_details.json"
             )
             return False
 
-        if not activity_detail_metrics or not isinstance(activity_detail_metrics, list):
-            logger.error(
-                "Missing or invalid activityDetailMetrics in activity_details.json"
-            )
-            return False
-
-        # Build metric descriptor mapping: key -> (index, factor)
-        metric_map = {}
+        # Build metric descriptor mapping: key -> index
+        metric_map: dict[str, int] = {}
         for descriptor in metric_descriptors:
             key = descriptor.get("key")
             index = descriptor.get("metricsIndex")
-            factor = descriptor.get("unit", {}).get("factor", 1.0)
             if key is not None and index is not None:
-                metric_map[key] = {"index": index, "factor": factor}
-
-        # Define column order and API key mapping
-        column_spec = [
-            ("sumMovingDuration", "sum_moving_duration"),
-            ("sumDuration", "sum_duration"),
-            ("sumElapsedDuration", "sum_elapsed_duration"),
-            ("sumDistance", "sum_distance"),
-            ("sumAccumulatedPower", "sum_accumulated_power"),
-            ("directHeartRate", "heart_rate"),
-            ("directSpeed", "speed"),
-            ("directGradeAdjustedSpeed", "grade_adjusted_speed"),
-            (
-                "directDoubleCadence",
-                "cadence",
-            ),  # Both feet cadence (corrected from raw data)
-            ("directPower", "power"),
-            ("directGroundContactTime", "ground_contact_time"),
-            ("directVerticalOscillation", "vertical_oscillation"),
-            ("directVerticalRatio", "vertical_ratio"),
-            ("directStrideLength", "stride_length"),
-            ("directVerticalSpeed", "vertical_speed"),
-            ("directElevation", "elevation"),
-            ("directAirTemperature", "air_temperature"),
-            ("directLatitude", "latitude"),
-            ("directLongitude", "longitude"),
-            ("directAvailableStamina", "available_stamina"),
-            ("directPotentialStamina", "potential_stamina"),
-            ("directBodyBattery", "body_battery"),
-            ("directPerformanceCondition", "performance_condition"),
-        ]
-
-        # Delete existing data for this activity (for re-insertion)
-        conn.execute(
-            "DELETE FROM time_series_metrics WHERE activity_id = ?", [activity_id]
-        )
+                metric_map[key] = index
 
-        # Find sumDuration index
-        sum_duration_info = metric_map.get("sumDuration")
-        if not sum_duration_info:
+        sum_duration_index = metric_map.get("sumDuration")
+        if sum_duration_index is None:
             logger.error("sumDuration metric not found in metricDescriptors")
             return False
 
-        sum_duration_index = sum_duration_info["index"]
-
-        # Pre-compute metric extraction info (index, factor) for each column
-        metric_extract_info: list[tuple[int, float] | None] = []
-        for api_key, _ in column_spec:
-            metric_info = metric_map.get(api_key)
-            if metric_info:
-                metric_extract_info.append(
-                    (metric_info["index"], metric_info["factor"])
-                )
-            else:
-                metric_extract_info.append(None)
-
-        # Prepare batch insert data (direct tuple building for performance)
-        value_tuples = []
-        for seq_no, data_point in enumerate(activity_detail_metrics):
-            metrics = data_point.get("metrics")
-            if not metrics or not isinstance(metrics, list):
-                continue
+        chunks = iter_top_level_array(
+            activity_details_path, "activityDetailMetrics", chunk_rows
+        )
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
+            logger.error(
+                "Missing or invalid activityDetailMetrics in activity_details.json"
+            )
+            return False
 
-            # Calculate timestamp_s from sumDuration
-            # NOTE: Garmin API inconsistency - sumDuration values are already in seconds
-            # despite factor=1000.0 (which would indicate milliseconds). Verified across
-            # multiple activities that raw values match activity duration in seconds.
-            sum_duration_value = metrics[sum_duration_index]
-            if sum_duration_value is None:
-                continue
+        conn.execute(
+            f"CREATE OR REPLACE TEMP TABLE {_STAGE_TABLE} AS "
+            "SELECT * FROM time_series_metrics LIMIT 0"
+        )
+        try:
+            writer = _ChunkWriter(
+                activity_id,
+                conn,
+                sum_duration_index,
+                [metric_map.get(api_key) for api_key, _ in COLUMN_SPEC],
+                chunk_rows,
+            )
+            for chunk in itertools.chain([first_chunk], chunks):
+                writer.write(chunk)
+
+            # Every chunk parsed: replace the stored series (re-insertion).
+            conn.execute(
+                "DELETE FROM time_series_metrics WHERE activity_id = ?", [activity_id]
+            )
+            conn.execute(
+                f"INSERT INTO time_series_metrics "
+                f"SELECT * FROM {_STAGE_TABLE} ORDER BY seq_no"
+            )
+        finally:
+            conn.execute(f"DROP TABLE IF EXISTS {_STAGE_TABLE}")
 
-            timestamp_s = int(
-                sum_duration_value
-            )  # Already in seconds, don't apply factor
-
-            # Build row tuple directly (avoid dict overhead)
-            # Order: activity_id, seq_no, timestamp_s, ...metrics
-            row_values: list[int | float | None] = [activity_id, seq_no, timestamp_s]
-
-            for _col_idx, extract_info in enumerate(metric_extract_info):
-                if extract_info is None:
-                    row_values.append(None)
-                    continue
-
-                index, factor = extract_info
-
-                # Get raw value
-                if index >= len(metrics):
-                    row_values.append(None)
-                    continue
-
-                raw_value = metrics[index]
-                if raw_value is None:
-                    row_values.append(None)
-                    continue
-
-                # Apply unit conversion
-                # NOTE: Garmin API factor inconsistency - All metricDescriptors have 'factor' values,
-                # but empirical testing shows that raw metric values are already in correct SI units.
-                # The 'factor' field appears to be for UI display purposes only.
-                #
-                # Evidence (activity 20721683500, record 1000):
-                # - sumDistance: factor=100.0, but raw 2552.4 is already meters (not centimeters)
-                # - directElevation: factor=100.0, but raw 4.8 is already meters (not centimeters)
-                # - directSpeed: factor=0.1, but raw 2.52 is already m/s (not 10× m/s)
-                # - sumDuration: factor=1000.0, but raw values are already seconds (not milliseconds)
-                #
-                # Therefore, we use raw values as-is without applying factor conversion.
-                converted_value = float(raw_value)
-
-                row_values.append(converted_value)
-
-            value_tuples.append(tuple(row_values))
-
-        # Batch insert
-        if value_tuples:
-            # Build INSERT statement
-            columns = ["activity_id", "seq_no", "timestamp_s"] + [
-                col_name for _, col_name in column_spec
-            ]
-            placeholders = ", ".join(["?" for _ in columns])
-            column_names = ", ".join(columns)
-            insert_sql = f"INSERT INTO time_series_metrics ({column_names}) VALUES ({placeholders})"
-
-            # Execute batch insert
-            conn.executemany(insert_sql, value_tuples)
+        insert_time_series_rollups(activity_id, conn)
+        insert_time_series_offsets(activity_id, conn)
 
         logger.info(
-            f"Successfully inserted {len(value_tuples)} time series metrics for activity {activity_id}"
+            f"Successfully inserted {writer.rows_written} time series metrics for activity {activity_id}"
         )
         return True
 
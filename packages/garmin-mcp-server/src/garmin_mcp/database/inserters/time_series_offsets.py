@@ -0,0 +1,125 @@
+"""
+TimeSeriesOffsets - Maintain the per-activity catalog of time_series_metrics
+
+One row per activity describes where and what its raw 1 Hz rows are:
+
+- ``first_row`` / ``last_row``: ``rowid`` range of the activity's rows
+- ``first_row_group`` / ``last_row_group``: the DuckDB row groups that range
+  spans (``rowid // ROW_GROUP_SIZE``)
+- ``sample_count``: number of raw rows
+- ``min_timestamp_s`` / ``max_timestamp_s``: time extent of the activity
+
+Existence and extent checks ("is this activity in DuckDB?", "how long is
+it?") become a lookup on this small table instead of a scan of
+``time_series_metrics``.
+
+Row positions are only recorded by the full rebuild (migration backfill and
+``garmin_mcp.scripts.cluster_time_series``), from committed rows: inside the ingest
+transaction ``rowid`` is transaction-local, and DuckDB renumbers it when a
+checkpoint vacuums deleted rows. The per-activity refresh therefore leaves
+them NULL, and readers must keep filtering on ``activity_id`` and only use the
+positions as a layout measure.
+
+The catalog is derived data: ``insert_time_series_metrics`` refreshes the row
+of the activity it just wrote, and migration ``add_time_series_offsets``
+backfills the whole table.
+"""
+
+import logging
+
+import duckdb
+
+logger = logging.getLogger(__name__)
+
+# DuckDB's default row group size (rows per row group).
+ROW_GROUP_SIZE = 122_880
+
+
+def _offsets_select_sql(where_sql: str, with_positions: bool) -> str:
+    """Build the per-activity catalog SELECT for the rows matched by ``where_sql``.
+
+    ``with_positions=False`` writes NULL row positions (see module docstring).
+    """
+    if with_positions:
+        positions = f"""
+            MIN(rowid) AS first_row,
+            MAX(rowid) AS last_row,
+            MIN(rowid) // {ROW_GROUP_SIZE} AS first_row_group,
+            MAX(rowid) // {ROW_GROUP_SIZE} AS last_row_group,"""
+    else:
+        positions = """
+            NULL AS first_row,
+            NULL AS last_row,
+            NULL AS first_row_group,
+            NULL AS last_row_group,"""
+    return f"""
+        SELECT
+            activity_id,{positions}
+            COUNT(*) AS sample_count,
+            MIN(timestamp_s) AS min_timestamp_s,
+            MAX(timestamp_s) AS max_timestamp_s
+        FROM time_series_metrics
+        {where_sql}
+        GROUP BY activity_id
+        ORDER BY activity_id
+    """
+
+
+def live_time_series_offsets_sql() -> str:
+    """The catalog rows a full rebuild would write now, as a read-only SELECT.
+
+    Lets callers inspect the current layout without touching
+    ``time_series_offsets`` (e.g. the clustering job's dry run).
+    """
+    return _offsets_select_sql("", with_positions=True)
+
+
+def insert_time_series_offsets(
+    activity_id: int,
+    conn: duckdb.DuckDBPyConnection,
+) -> bool:
+    """Refresh the catalog row of one activity from its raw rows.
+
+    Row positions are left NULL until the next full rebuild.
+
+    Args:
+        activity_id: Activity ID whose ``time_series_metrics`` rows are current.
+        conn: DuckDB connection (write access).
+
+    Returns:
+        True if the activity has raw rows (and therefore a catalog row).
+    """
+    conn.execute("DELETE FROM time_series_offsets WHERE activity_id = ?", [activity_id])
+    conn.execute(
+        "INSERT INTO time_series_offsets "
+        + _offsets_select_sql("WHERE activity_id = ?", with_positions=False),
+        [activity_id],
+    )
+    row = conn.execute(
+        "SELECT COUNT(*) FROM time_series_offsets WHERE activity_id = ?",
+        [activity_id],
+    ).fetchone()
+    return row is not None and row[0] > 0
+
+
+def rebuild_all_time_series_offsets(conn: duckdb.DuckDBPyConnection) -> int:
+    """Rebuild the catalog for every activity (backfill / after clustering).
+
+    Records row positions, so call it outside any transaction that wrote
+    ``time_series_metrics`` rows.
+
+    Args:
+        conn: DuckDB connection (write access).
+
+    Returns:
+        Number of activities in the catalog.
+    """
+    conn.execute("DELETE FROM time_series_offsets")
+    conn.execute(
+        "INSERT INTO time_series_offsets "
+        + _offsets_select_sql("", with_positions=True)
+    )
+    row = conn.execute("SELECT COUNT(*) FROM time_series_offsets").fetchone()
+    total = int(row[0]) if row else 0
+    logger.info("Rebuilt time_series_offsets for %d activities", total)
+    return total
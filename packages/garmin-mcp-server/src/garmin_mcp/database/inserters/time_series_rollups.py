@@ -0,0 +1,157 @@
+"""
+TimeSeriesRollups - Materialize 10 s / 60 s aggregates of time_series_metrics
+
+Every trend that only needs coarse resolution (range statistics, the web
+time-series chart) can read these buckets instead of the raw 1 Hz rows. Each
+row aggregates every metric over one ``[bucket_start_s, bucket_start_s +
+resolution_s)`` window of a single activity:
+
+- ``sample_count``: raw rows in the bucket (shared by every metric)
+- ``<metric>_n``: non-null values of the metric
+- ``<metric>_mean`` / ``<metric>_min`` / ``<metric>_max``
+- ``<metric>_m2``: sum of squared deviations from the bucket mean, so that
+  variance over any union of buckets can be recombined exactly (Chan et al.
+  parallel variance) without reading the raw rows again.
+
+Rollups are derived data: ``insert_time_series_metrics`` refreshes them for the
+activity it just wrote, and migration ``add_time_series_rollups`` backfills the
+whole table.
+"""
+
+import logging
+
+import duckdb
+
+logger = logging.getLogger(__name__)
+
+# Bucket widths in seconds, finest first. Raw rows are resolution 1.
+ROLLUP_RESOLUTIONS_S: tuple[int, ...] = (10, 60)
+
+# time_series_metrics columns written by insert_time_series_metrics. Legacy
+# cadence variants (cadence_single_foot / cadence_total) are never populated
+# and are not rolled up; queries for them fall back to the raw table.
+ROLLUP_METRICS: tuple[str, ...] = (
+    "sum_moving_duration",
+    "sum_duration",
+    "sum_elapsed_duration",
+    "sum_distance",
+    "sum_accumulated_power",
+    "heart_rate",
+    "speed",
+    "grade_adjusted_speed",
+    "cadence",
+    "power",
+    "ground_contact_time",
+    "vertical_oscillation",
+    "vertical_ratio",
+    "stride_length",
+    "vertical_speed",
+    "elevation",
+    "air_temperature",
+    "latitude",
+    "longitude",
+    "available_stamina",
+    "potential_stamina",
+    "body_battery",
+    "performance_condition",
+)
+
+
+# Per-metric aggregate columns, as ``<metric>_<stat>``.
+ROLLUP_STATS: tuple[str, ...] = ("n", "mean", "min", "max", "m2")
+
+
+def rollup_column(metric: str, stat: str) -> str:
+    """Column of ``time_series_rollups`` holding ``stat`` for ``metric``."""
+    return f"{metric}_{stat}"
+
+
+def time_series_rollups_ddl() -> str:
+    """``CREATE TABLE IF NOT EXISTS`` statement for ``time_series_rollups``."""
+    column_defs = [
+        "activity_id BIGINT NOT NULL",
+        "resolution_s INTEGER NOT NULL",
+        "bucket_start_s INTEGER NOT NULL",
+        "sample_count INTEGER NOT NULL",
+    ]
+    for metric in ROLLUP_METRICS:
+        column_defs.append(f"{rollup_column(metric, 'n')} INTEGER NOT NULL DEFAULT 0")
+        column_defs.extend(
+            f"{rollup_column(metric, stat)} DOUBLE" for stat in ROLLUP_STATS[1:]
+        )
+    columns_sql = ",\n    ".join(column_defs)
+    return f"CREATE TABLE IF NOT EXISTS time_series_rollups (\n    {columns_sql}\n)"
+
+
+def _rollup_select_sql(where_sql: str) -> str:
+    """Build the aggregation SELECT for the rows matched by ``where_sql``.
+
+    Raw rows are grouped per activity, resolution and bucket in a single scan
+    over ``time_series_metrics``; every metric is aggregated in the same row.
+    """
+    aggregates = ",\n            ".join(
+        f"count({metric}) AS {rollup_column(metric, 'n')}, "
+        f"avg({metric}) AS {rollup_column(metric, 'mean')}, "
+        f"min({metric}) AS {rollup_column(metric, 'min')}, "
+        f"max({metric}) AS {rollup_column(metric, 'max')}, "
+        f"coalesce(var_pop({metric}) * count({metric}), 0.0) "
+        f"AS {rollup_column(metric, 'm2')}"
+        for metric in ROLLUP_METRICS
+    )
+    resolutions = ", ".join(f"({r})" for r in ROLLUP_RESOLUTIONS_S)
+    return f"""
+        SELECT
+            activity_id,
+            r.resolution_s,
+            (timestamp_s // r.resolution_s) * r.resolution_s AS bucket_start_s,
+            count(*) AS sample_count,
+            {aggregates}
+        FROM time_series_metrics
+        CROSS JOIN (VALUES {resolutions}) AS r(resolution_s)
+        {where_sql}
+        GROUP BY activity_id, r.resolution_s, bucket_start_s
+        ORDER BY activity_id, r.resolution_s, bucket_start_s
+    """
+
+
+def insert_time_series_rollups(
+    activity_id: int,
+    conn: duckdb.DuckDBPyConnection,
+) -> int:
+    """Rebuild the rollup buckets of one activity from its raw rows.
+
+    Args:
+        activity_id: Activity ID whose ``time_series_metrics`` rows are current.
+        conn: DuckDB connection (write access).
+
+    Returns:
+        Number of rollup rows written (0 when the activity has no raw rows).
+    """
+    conn.execute("DELETE FROM time_series_rollups WHERE activity_id = ?", [activity_id])
+    conn.execute(
+        "INSERT INTO time_series_rollups "
+        + _rollup_select_sql("WHERE activity_id = ?"),
+        [activity_id],
+    )
+    row = conn.execute(
+        "SELECT COUNT(*) FROM time_series_rollups WHERE activity_id = ?",
+        [activity_id],
+    ).fetchone()
+    return int(row[0]) if row else 0
+
+
+def rebuild_all_time_series_rollups(conn: duckdb.DuckDBPyConnection) -> int:
+    """Rebuild every activity's rollup buckets (migration backfill).
+
+    Args:
+        conn: DuckDB connection (write access).
+
+    Returns:
+        Total number of rollup rows written.
+    """
+    conn.execute("DELETE FROM time_series_rollups")
+    conn.execute("INSERT INTO time_series_rollups " + _rollup_select_sql(""))
+    row = conn.execute("SELECT COUNT(*) FROM time_series_rollups").fetchone()
+    total = int(row[0]) if row else 0
+    logger.info("Rebuilt %d time_series_rollups rows", total)
+    return total
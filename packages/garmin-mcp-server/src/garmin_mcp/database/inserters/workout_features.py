@@ -0,0 +1,114 @@
+"""
+WorkoutFeatures - Maintain the per-activity feature rows behind similar-workout search
+
+``WorkoutComparator.find_similar_workouts`` used to filter ``activities`` with a
+SQL range query and then look up each candidate's training type and
+temperature one activity at a time. ``workout_features`` keeps one row per
+activity with every attribute the similarity search ranks on:
+
+- ``avg_pace`` / ``distance_km`` / ``avg_heart_rate`` / ``temperature_c``:
+  copied from ``activities``
+- ``elevation_gain_m``: sum of the splits' ``elevation_gain``
+- ``main_set_pace``: mean split pace over ``ACTIVE`` / ``INTERVAL`` splits
+  (NULL for runs without a structured main set)
+- ``training_type``: ``hr_efficiency.training_type`` (``'unknown'`` if absent)
+
+Rows hold raw values; the in-memory index in
+``garmin_mcp.rag.queries.similarity_index`` normalizes them. ``revision`` is
+drawn from a sequence on every write so the index can pick up changed rows
+incrementally. The table is derived data: ``save_data`` refreshes the ingested
+activity's row, the regeneration deletion strategy deletes it with its
+activity, and migration ``add_workout_features`` backfills it.
+"""
+
+import logging
+
+import duckdb
+
+logger = logging.getLogger(__name__)
+
+_UPSERT_SQL = """
+    INSERT INTO workout_features (
+        activity_id, activity_date, activity_name, avg_pace, distance_km,
+        avg_heart_rate, temperature_c, elevation_gain_m, training_type,
+        main_set_pace, revision
+    )
+    SELECT
+        a.activity_id,
+        a.activity_date,
+        a.activity_name,
+        a.avg_pace_seconds_per_km,
+        a.total_distance_km,
+        a.avg_heart_rate,
+        a.temp_celsius,
+        s.elevation_gain_m,
+        coalesce(h.training_type, 'unknown'),
+        s.main_set_pace,
+        nextval('workout_features_revision_seq')
+    FROM activities a
+    LEFT JOIN hr_efficiency h ON h.activity_id = a.activity_id
+    LEFT JOIN (
+        SELECT
+            activity_id,
+            sum(elevation_gain) AS elevation_gain_m,
+            avg(pace_seconds_per_km) FILTER (
+                WHERE intensity_type IN ('ACTIVE', 'INTERVAL')
+            ) AS main_set_pace
+        FROM splits
+        {splits_filter}
+        GROUP BY activity_id
+    ) s ON s.activity_id = a.activity_id
+    {activities_filter}
+"""
+
+
+def refresh_workout_features(
+    conn: duckdb.DuckDBPyConnection,
+    activity_ids: list[int] | None = None,
+) -> int:
+    """Recompute the feature rows of ``activity_ids`` from the source tables.
+
+    Rows of activities that no longer exist are removed, so a refresh after a
+    deletion is also correct.
+
+    Args:
+        conn: DuckDB connection (write access).
+        activity_ids: Activities to refresh. ``None`` rebuilds every row.
+
+    Returns:
+        Number of feature rows written.
+    """
+    if activity_ids is None:
+        conn.execute("DELETE FROM workout_features")
+        sql = _UPSERT_SQL.format(splits_filter="", activities_filter="")
+        params: list[int] = []
+    else:
+        if not activity_ids:
+            return 0
+        placeholders = ",".join("?" * len(activity_ids))
+        conn.execute(
+            f"DELETE FROM workout_features WHERE activity_id IN ({placeholders})",
+            activity_ids,
+        )
+        sql = _UPSERT_SQL.format(
+            splits_filter=f"WHERE activity_id IN ({placeholders})",
+            activities_filter=f"WHERE a.activity_id IN ({placeholders})",
+        )
+        params = [*activity_ids, *activity_ids]
+
+    row = conn.execute(sql, params).fetchone()
+    return int(row[0]) if row else 0
+
+
+def rebuild_all_workout_features(conn: duckdb.DuckDBPyConnection) -> int:
+    """Rebuild every feature row from the source tables (migration backfill).
+
+    Args:
+        conn: DuckDB connection (write access).
+
+    Returns:
+        Total number of feature rows written.
+    """
+    total = refresh_workout_features(conn)
+    logger.info("Rebuilt %d workout_features rows", total)
+    return total
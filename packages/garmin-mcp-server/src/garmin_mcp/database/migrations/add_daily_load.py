@@ -0,0 +1,47 @@
+"""Migration: Add the ``daily_load`` training-load ledger and backfill it.
+
+``TrainingLoadReader`` re-aggregated ``activities`` by date on every ACWR and
+load-trend call, and every historical view repeated the 28-day scan. This
+table keeps one row per calendar day (dense between the first and the last
+``activity_date``) with the day's load, its longest run and the 7- / 28-day
+rolling load sums, so an ACWR point lookup reads a single row. It is written
+by ``insert_activities`` for new data and backfilled here from every activity
+already stored.
+
+The table has no PRIMARY KEY: rows are replaced from the changed day onward
+(DELETE then INSERT) in ``load_date`` order, so zone maps prune point reads.
+
+Idempotent: ``CREATE TABLE IF NOT EXISTS`` plus a full rebuild of the derived
+rows (skipped when ``activities`` does not exist yet). DDL for this table is
+owned exclusively by the migration (not ``_ensure_tables()``) to keep a single
+source of truth (issue #342).
+"""
+
+import duckdb
+
+from garmin_mcp.database.inserters.daily_load import rebuild_all_daily_load
+
+
+def _table_exists(conn: duckdb.DuckDBPyConnection, table_name: str) -> bool:
+    """Check if a table exists in the database."""
+    result = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
+        [table_name],
+    ).fetchone()
+    return result is not None and result[0] > 0
+
+
+def add_daily_load(conn: duckdb.DuckDBPyConnection) -> None:
+    """Create ``daily_load`` and backfill it from ``activities``."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS daily_load (
+            load_date DATE NOT NULL,
+            activity_count INTEGER NOT NULL,
+            load_km DOUBLE NOT NULL,
+            longest_run_sec INTEGER,
+            load_7d_km DOUBLE NOT NULL,
+            load_28d_km DOUBLE NOT NULL
+        )
+    """)
+    if _table_exists(conn, "activities"):
+        rebuild_all_daily_load(conn)
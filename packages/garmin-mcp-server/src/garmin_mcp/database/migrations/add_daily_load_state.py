@@ -0,0 +1,43 @@
+"""Migration: Add the ``daily_load_state`` ledger watermark.
+
+``TrainingLoadReader`` decided whether the ``daily_load`` ledger was current by
+comparing the number of dated activities with the ledger's activity counts,
+repeated in every helper of a call. That missed distance, duration and date
+edits made outside ``insert_activities``. This one-row table stores the
+``count(*)`` / ``max(rowid)`` of ``activities`` the ledger was last brought up
+to date with, plus the digest of the columns it was computed from (see
+``inserters.daily_load``); readers compare the cheap fingerprint once per
+call.
+
+Idempotent: ``CREATE TABLE IF NOT EXISTS`` plus a full ledger rebuild, which
+also stores the watermark (skipped when ``activities`` or ``daily_load`` does
+not exist yet). DDL for this table is owned exclusively by the migration (not
+``_ensure_tables()``) to keep a single source of truth (issue #342).
+"""
+
+import duckdb
+
+from garmin_mcp.database.inserters.daily_load import rebuild_all_daily_load
+
+
+def _table_exists(conn: duckdb.DuckDBPyConnection, table_name: str) -> bool:
+    """Check if a table exists in the database."""
+    result = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
+        [table_name],
+    ).fetchone()
+    return result is not None and result[0] > 0
+
+
+def add_daily_load_state(conn: duckdb.DuckDBPyConnection) -> None:
+    """Create ``daily_load_state`` and rebuild the ledger to stamp it."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS daily_load_state (
+            activities_digest UBIGINT NOT NULL,
+            activity_count BIGINT NOT NULL,
+            max_rowid BIGINT,
+            refreshed_at TIMESTAMP NOT NULL
+        )
+    """)
+    if _table_exists(conn, "activities") and _table_exists(conn, "daily_load"):
+        rebuild_all_daily_load(conn)
@@ -0,0 +1,41 @@
+"""Migration: add ``population_hash`` to form_baseline_history.
+
+Each baseline row records a digest of the split population its window was
+fitted on (:func:`garmin_mcp.form_baseline.incremental.window_population_hashes`).
+The incremental trainer compares it against the current population and only
+refits windows whose splits changed since the last fit.
+
+Existing rows keep ``NULL``. That reads as "population unknown", so each legacy
+window is refitted once, the next time the incremental trainer sees it.
+
+Idempotent: the column is only added when missing.
+"""
+
+import duckdb
+
+
+def _table_exists(conn: duckdb.DuckDBPyConnection, table_name: str) -> bool:
+    """Check if a table exists in the database."""
+    result = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
+        [table_name],
+    ).fetchone()
+    return result is not None and result[0] > 0
+
+
+def add_form_baseline_population_hash(conn: duckdb.DuckDBPyConnection) -> None:
+    """Add the nullable ``population_hash`` column to form_baseline_history.
+
+    Args:
+        conn: Open DuckDB connection.
+    """
+    if not _table_exists(conn, "form_baseline_history"):
+        return
+    columns = [
+        row[1]
+        for row in conn.execute("PRAGMA table_info(form_baseline_history)").fetchall()
+    ]
+    if "population_hash" not in columns:
+        conn.execute(
+            "ALTER TABLE form_baseline_history ADD COLUMN population_hash VARCHAR"
+        )
@@ -0,0 +1,51 @@
+"""Migration: Add the ``section_analysis_terms`` keyword index and backfill it.
+
+``InsightExtractor`` found analyses with a given keyword (a top-level key of
+``analysis_data`` holding a non-empty value) by running ``json_extract`` over
+every stored analysis, which grows with years of history. This table is the
+inverted index ``term -> (analysis_id, activity_id, activity_date,
+section_type)``, so a keyword search is an index lookup that is paginated
+before any ``analysis_data`` is read. ``GarminDBWriter.insert_section_analysis``
+indexes new rows in the same transaction; this migration backfills the rows
+already stored.
+
+Idempotent: ``CREATE ... IF NOT EXISTS`` plus a full rebuild of the derived
+rows (skipped when ``section_analyses`` does not exist yet). DDL for this
+table is owned exclusively by the migration (not ``_ensure_tables()``) to keep
+a single source of truth (issue #342).
+"""
+
+import duckdb
+
+from garmin_mcp.database.inserters.section_analysis_terms import (
+    rebuild_all_section_analysis_terms,
+)
+
+
+def _table_exists(conn: duckdb.DuckDBPyConnection, table_name: str) -> bool:
+    """Check if a table exists in the database."""
+    result = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
+        [table_name],
+    ).fetchone()
+    return result is not None and result[0] > 0
+
+
+def add_section_analysis_terms(conn: duckdb.DuckDBPyConnection) -> None:
+    """Create ``section_analysis_terms`` and backfill it from the analyses."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS section_analysis_terms (
+            term VARCHAR NOT NULL,
+            analysis_id BIGINT NOT NULL,
+            activity_id BIGINT NOT NULL,
+            activity_date DATE NOT NULL,
+            section_type VARCHAR NOT NULL,
+            PRIMARY KEY (term, analysis_id)
+        )
+    """)
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_section_analysis_terms_activity "
+        "ON section_analysis_terms(activity_id)"
+    )
+    if _table_exists(conn, "section_analyses"):
+        rebuild_all_section_analysis_terms(conn)
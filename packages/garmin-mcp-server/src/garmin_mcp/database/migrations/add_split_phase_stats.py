@@ -0,0 +1,51 @@
+"""Migration: Add the ``split_phase_stats`` table and backfill it.
+
+``statistics_only`` split queries and the prefetch elevation summary ran
+AVG / MEDIAN / STDDEV / MIN / MAX over an activity's ``splits`` rows on every
+call. This table stores those aggregates once per ``(activity_id, phase)``
+(``'all'`` plus one row per ``role_phase``), so the readers do a single-row
+lookup. It is written by ``save_data`` for new data and backfilled here from
+every split already stored.
+
+Idempotent: ``CREATE ... IF NOT EXISTS`` plus a full rebuild of the derived
+rows (skipped when ``splits`` does not exist yet). DDL for this table is owned
+exclusively by the migration (not ``_ensure_tables()``) to keep a single
+source of truth (issue #342).
+"""
+
+import duckdb
+
+from garmin_mcp.database.inserters.split_phase_stats import (
+    rebuild_all_split_phase_stats,
+    stat_column_names,
+)
+
+
+def _table_exists(conn: duckdb.DuckDBPyConnection, table_name: str) -> bool:
+    """Check if a table exists in the database."""
+    result = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
+        [table_name],
+    ).fetchone()
+    return result is not None and result[0] > 0
+
+
+def add_split_phase_stats(conn: duckdb.DuckDBPyConnection) -> None:
+    """Create ``split_phase_stats`` and backfill it from ``splits``."""
+    stat_columns = ",\n            ".join(
+        f"{name} DOUBLE" for name in stat_column_names()
+    )
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS split_phase_stats (
+            activity_id BIGINT NOT NULL,
+            phase VARCHAR NOT NULL,
+            split_count INTEGER NOT NULL,
+            {stat_columns},
+            elevation_gain_sum DOUBLE,
+            elevation_loss_sum DOUBLE,
+            elevation_change_max DOUBLE,
+            PRIMARY KEY (activity_id, phase)
+        )
+    """)
+    if _table_exists(conn, "splits"):
+        rebuild_all_split_phase_stats(conn)
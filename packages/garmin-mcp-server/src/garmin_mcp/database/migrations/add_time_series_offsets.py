@@ -0,0 +1,52 @@
+"""Migration: Add the ``time_series_offsets`` catalog and backfill it.
+
+Checking whether an activity's time series is stored (the RAG time-series
+tools do this before every query) ran ``COUNT(*)`` over
+``time_series_metrics``. This table keeps one row per activity with its
+``rowid`` / row-group range, sample count and min/max ``timestamp_s``. It is
+written by ``insert_time_series_metrics`` for new data (row positions left
+NULL until the next full rebuild) and backfilled here from every row already
+stored. ``garmin_mcp.scripts.cluster_time_series`` measures the same ranges to
+decide when the raw table needs to be rewritten in activity order.
+
+The table has no PRIMARY KEY: rows are replaced per activity (DELETE then
+INSERT), like ``time_series_rollups``.
+
+Idempotent: ``CREATE TABLE IF NOT EXISTS`` plus a full rebuild of the derived
+rows (skipped when ``time_series_metrics`` does not exist yet). DDL for this
+table is owned exclusively by the migration (not ``_ensure_tables()``) to keep
+a single source of truth (issue #342).
+"""
+
+import duckdb
+
+from garmin_mcp.database.inserters.time_series_offsets import (
+    rebuild_all_time_series_offsets,
+)
+
+
+def _table_exists(conn: duckdb.DuckDBPyConnection, table_name: str) -> bool:
+    """Check if a table exists in the database."""
+    result = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
+        [table_name],
+    ).fetchone()
+    return result is not None and result[0] > 0
+
+
+def add_time_series_offsets(conn: duckdb.DuckDBPyConnection) -> None:
+    """Create ``time_series_offsets`` and backfill it from raw rows."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS time_series_offsets (
+            activity_id BIGINT NOT NULL,
+            first_row BIGINT,
+            last_row BIGINT,
+            first_row_group INTEGER,
+            last_row_group INTEGER,
+            sample_count INTEGER NOT NULL,
+            min_timestamp_s INTEGER,
+            max_timestamp_s INTEGER
+        )
+    """)
+    if _table_exists(conn, "time_series_metrics"):
+        rebuild_all_time_series_offsets(conn)
@@ -0,0 +1,44 @@
+"""Migration: Add the ``time_series_rollups`` table and backfill it.
+
+Range statistics and the web time-series chart only need coarse resolution,
+yet every call scanned the raw 1 Hz ``time_series_metrics`` rows. This table
+materializes 10 s and 60 s buckets per activity, one row per bucket with the
+sample count and, for every metric, the value count, mean, min, max and the
+``m2`` sum of squared deviations (``<metric>_{n,mean,min,max,m2}``), written by
+``insert_time_series_metrics`` for new data and backfilled here from every row
+already stored. This is the only backfill an upgrade runs: migration
+``compact_time_series_metrics`` (v23) rewrites the raw table with its values
+unchanged and reuses these rollups.
+
+The table has no PRIMARY KEY: rows are replaced per activity (DELETE then
+INSERT) and written in ``(activity_id, resolution_s, bucket_start_s)`` order,
+so DuckDB's zone maps prune single-activity reads without an ART index.
+
+Idempotent: ``CREATE TABLE IF NOT EXISTS`` plus a full rebuild of the derived
+rows (skipped when ``time_series_metrics`` does not exist yet). DDL for this
+table is owned exclusively by the migration (not ``_ensure_tables()``) to keep
+a single source of truth (issue #342).
+"""
+
+import duckdb
+
+from garmin_mcp.database.inserters.time_series_rollups import (
+    rebuild_all_time_series_rollups,
+    time_series_rollups_ddl,
+)
+
+
+def _table_exists(conn: duckdb.DuckDBPyConnection, table_name: str) -> bool:
+    """Check if a table exists in the database."""
+    result = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
+        [table_name],
+    ).fetchone()
+    return result is not None and result[0] > 0
+
+
+def add_time_series_rollups(conn: duckdb.DuckDBPyConnection) -> None:
+    """Create ``time_series_rollups`` and backfill it from raw rows."""
+    conn.execute(time_series_rollups_ddl())
+    if _table_exists(conn, "time_series_metrics"):
+        rebuild_all_time_series_rollups(conn)
@@ -0,0 +1,42 @@
+"""Migration: Add surrogate-key sequences for ``daily_wellness`` / ``body_composition``.
+
+Both tables are upserted by date, and the writer used to allocate each new
+``wellness_id`` / ``measurement_id`` with a ``SELECT MAX(...)`` scan per day.
+Range ingests now upsert a whole window in one ``INSERT ... SELECT`` and draw
+ids from ``seq_daily_wellness_id`` / ``seq_body_composition_id`` via
+``nextval``, mirroring the ``seq_sync_runs_id`` pattern.
+
+Idempotent: ``CREATE SEQUENCE IF NOT EXISTS`` is a no-op when the sequence
+already exists. Each sequence starts above the highest id already stored so
+allocated values never collide with existing rows (a table that does not exist
+yet starts at 1).
+"""
+
+import duckdb
+
+# (sequence, table, id column)
+ID_SEQUENCES: tuple[tuple[str, str, str], ...] = (
+    ("seq_daily_wellness_id", "daily_wellness", "wellness_id"),
+    ("seq_body_composition_id", "body_composition", "measurement_id"),
+)
+
+
+def _table_exists(conn: duckdb.DuckDBPyConnection, table_name: str) -> bool:
+    """Check if a table exists in the database."""
+    result = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
+        [table_name],
+    ).fetchone()
+    return result is not None and result[0] > 0
+
+
+def add_wellness_id_sequences(conn: duckdb.DuckDBPyConnection) -> None:
+    """Create the id sequences, each starting above its table's max id."""
+    for sequence, table, column in ID_SEQUENCES:
+        start = 1
+        if _table_exists(conn, table):
+            row = conn.execute(
+                f"SELECT COALESCE(MAX({column}), 0) FROM {table}"
+            ).fetchone()
+            start = int(row[0]) + 1 if row else 1
+        conn.execute(f"CREATE SEQUENCE IF NOT EXISTS {sequence} START {start}")
@@ -0,0 +1,59 @@
+"""Migration: Add the ``workout_features`` similarity table and backfill it.
+
+``WorkoutComparator.find_similar_workouts`` ranked candidates with a SQL
+range filter plus one ``hr_efficiency`` / weather lookup per candidate. This
+table keeps one row per activity with every attribute similar-workout search
+ranks on (pace, distance, HR, temperature, elevation gain, training type,
+main-set pace), so the in-memory k-NN index in
+``garmin_mcp.rag.queries.similarity_index`` loads the whole history with one
+scan. It is written by ``save_data`` for new data and backfilled here from
+every activity already stored.
+
+``revision`` is filled from ``workout_features_revision_seq`` on every write;
+the index re-reads only rows whose revision is newer than the ones it holds.
+
+Idempotent: ``CREATE ... IF NOT EXISTS`` plus a full rebuild of the derived
+rows (skipped when ``activities`` does not exist yet). DDL for this table is
+owned exclusively by the migration (not ``_ensure_tables()``) to keep a single
+source of truth (issue #342).
+"""
+
+import duckdb
+
+from garmin_mcp.database.inserters.workout_features import (
+    rebuild_all_workout_features,
+)
+
+
+def _table_exists(conn: duckdb.DuckDBPyConnection, table_name: str) -> bool:
+    """Check if a table exists in the database."""
+    result = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
+        [table_name],
+    ).fetchone()
+    return result is not None and result[0] > 0
+
+
+def add_workout_features(conn: duckdb.DuckDBPyConnection) -> None:
+    """Create ``workout_features`` and backfill it from the source tables."""
+    conn.execute("CREATE SEQUENCE IF NOT EXISTS workout_features_revision_seq")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS workout_features (
+            activity_id BIGINT PRIMARY KEY,
+            activity_date DATE NOT NULL,
+            activity_name VARCHAR,
+            avg_pace DOUBLE,
+            distance_km DOUBLE,
+            avg_heart_rate DOUBLE,
+            temperature_c DOUBLE,
+            elevation_gain_m DOUBLE,
+            training_type VARCHAR NOT NULL,
+            main_set_pace DOUBLE,
+            revision BIGINT NOT NULL
+        )
+    """)
+    if all(
+        _table_exists(conn, table)
+        for table in ("activities", "splits", "hr_efficiency")
+    ):
+        rebuild_all_workout_features(conn)
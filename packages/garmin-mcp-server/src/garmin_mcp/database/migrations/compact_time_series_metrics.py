@@ -0,0 +1,77 @@
+"""Migration: Rewrite ``time_series_metrics`` without its PK and ART indexes.
+
+The legacy table kept its DOUBLE metrics behind a ``(activity_id, seq_no)``
+PRIMARY KEY plus two ART indexes (``idx_time_series_activity``,
+``idx_time_series_timestamp``), which dominated database size and slowed
+inserts and regeneration. The layout in ``database/time_series_layout.py``
+keeps the same DOUBLE columns and drops the indexes.
+
+The rewrite copies every row in ``(activity_id, seq_no)`` order into a new
+table, so each activity occupies contiguous row groups and zone maps prune
+per-activity reads, then drops the legacy table (and with it the PK and
+indexes) and renames the copy into place. Values are copied unchanged, so
+``time_series_rollups`` stays valid and is not rebuilt.
+
+Idempotent: a table without PK / indexes (fresh databases get it from
+``_ensure_tables()``) is left untouched.
+"""
+
+import logging
+
+import duckdb
+
+from garmin_mcp.database.time_series_layout import (
+    TIME_SERIES_METRICS,
+    time_series_metrics_ddl,
+)
+
+logger = logging.getLogger(__name__)
+
+_COMPACT_TABLE = "time_series_metrics_compact"
+
+
+def _column_names(conn: duckdb.DuckDBPyConnection, table_name: str) -> set[str]:
+    """Column names of ``table_name`` (empty when the table does not exist)."""
+    rows = conn.execute(
+        "SELECT column_name FROM information_schema.columns WHERE table_name = ?",
+        [table_name],
+    ).fetchall()
+    return {row[0] for row in rows}
+
+
+def _is_indexed(conn: duckdb.DuckDBPyConnection) -> bool:
+    """Whether ``time_series_metrics`` still has its PRIMARY KEY or an index."""
+    row = conn.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM duckdb_constraints()
+             WHERE table_name = 'time_series_metrics'
+               AND constraint_type = 'PRIMARY KEY')
+            + (SELECT COUNT(*) FROM duckdb_indexes()
+               WHERE table_name = 'time_series_metrics')
+    """).fetchone()
+    return row is not None and row[0] > 0
+
+
+def compact_time_series_metrics(conn: duckdb.DuckDBPyConnection) -> None:
+    """Rewrite an indexed legacy ``time_series_metrics`` in activity order."""
+    columns = _column_names(conn, "time_series_metrics")
+    if not columns or not _is_indexed(conn):
+        return
+
+    conn.execute(f"DROP TABLE IF EXISTS {_COMPACT_TABLE}")
+    conn.execute(time_series_metrics_ddl(_COMPACT_TABLE))
+
+    values = [metric if metric in columns else "NULL" for metric in TIME_SERIES_METRICS]
+    conn.execute(f"""
+        INSERT INTO {_COMPACT_TABLE}
+            (activity_id, seq_no, timestamp_s, {", ".join(TIME_SERIES_METRICS)})
+        SELECT activity_id, seq_no, timestamp_s, {", ".join(values)}
+        FROM time_series_metrics
+        ORDER BY activity_id, seq_no
+    """)
+
+    conn.execute("DROP INDEX IF EXISTS idx_time_series_activity")
+    conn.execute("DROP INDEX IF EXISTS idx_time_series_timestamp")
+    conn.execute("DROP TABLE time_series_metrics")
+    conn.execute(f"ALTER TABLE {_COMPACT_TABLE} RENAME TO time_series_metrics")
+    logger.info("Rewrote time_series_metrics without PK / ART indexes")
@@ -198,6 +198,78 @@ def _wrap_add_athlete_profile_versions(conn: duckdb.DuckDBPyConnection) -> None:
     add_athlete_profile_versions(conn)
 
 
+def _wrap_add_time_series_rollups(conn: duckdb.DuckDBPyConnection) -> None:
+    """Wrap the time_series_rollups table migration on an existing connection."""
+    from .add_time_series_rollups import add_time_series_rollups
+
+    add_time_series_rollups(conn)
+
+
+def _wrap_compact_time_series_metrics(conn: duckdb.DuckDBPyConnection) -> None:
+    """Wrap the compact time_series_metrics layout rewrite."""
+    from .compact_time_series_metrics import compact_time_series_metrics
+
+    compact_time_series_metrics(conn)
+
+
+def _wrap_add_time_series_offsets(conn: duckdb.DuckDBPyConnection) -> None:
+    """Wrap the time_series_offsets catalog migration on an existing connection."""
+    from .add_time_series_offsets import add_time_series_offsets
+
+    add_time_series_offsets(conn)
+
+
+def _wrap_add_daily_load(conn: duckdb.DuckDBPyConnection) -> None:
+    """Wrap the daily_load ledger migration on an existing connection."""
+    from .add_daily_load import add_daily_load
+
+    add_daily_load(conn)
+
+
+def _wrap_add_workout_features(conn: duckdb.DuckDBPyConnection) -> None:
+    """Wrap the workout_features similarity-table migration."""
+    from .add_workout_features import add_workout_features
+
+    add_workout_features(conn)
+
+
+def _wrap_add_section_analysis_terms(conn: duckdb.DuckDBPyConnection) -> None:
+    """Wrap the section_analysis_terms keyword-index migration."""
+    from .add_section_analysis_terms import add_section_analysis_terms
+
+    add_section_analysis_terms(conn)
+
+
+def _wrap_add_wellness_id_sequences(conn: duckdb.DuckDBPyConnection) -> None:
+    """Wrap the daily_wellness / body_composition id-sequence migration."""
+    from .add_wellness_id_sequences import add_wellness_id_sequences
+
+    add_wellness_id_sequences(conn)
+
+
+def _wrap_add_form_baseline_population_hash(
+    conn: duckdb.DuckDBPyConnection,
+) -> None:
+    """Wrap the form_baseline_history population_hash migration."""
+    from .add_form_baseline_population_hash import add_form_baseline_population_hash
+
+    add_form_baseline_population_hash(conn)
+
+
+def _wrap_add_split_phase_stats(conn: duckdb.DuckDBPyConnection) -> None:
+    """Wrap the split_phase_stats creation + backfill migration."""
+    from .add_split_phase_stats import add_split_phase_stats
+
+    add_split_phase_stats(conn)
+
+
+def _wrap_add_daily_load_state(conn: duckdb.DuckDBPyConnection) -> None:
+    """Wrap the daily_load_state creation migration."""
+    from .add_daily_load_state import add_daily_load_state
+
+    add_daily_load_state(conn)
+
+
 def _wrap_plan_versioning(conn: duckdb.DuckDBPyConnection) -> None:
     """Wrap plan versioning migration to run on an existing connection."""
     from .add_plan_versioning import _column_exists, _table_exists
@@ -261,4 +333,18 @@ MIGRATIONS: list[tuple[int, str, Callable[[duckdb.DuckDBPyConnection], None]]] =
     (19, "add_pace_consistency_full", _wrap_add_pace_consistency_full),
     (20, "add_hiking_sessions", _wrap_add_hiking_sessions),
     (21, "add_athlete_profile_versions", _wrap_add_athlete_profile_versions),
+    (22, "add_time_series_rollups", _wrap_add_time_series_rollups),
+    (23, "compact_time_series_metrics", _wrap_compact_time_series_metrics),
+    (24, "add_time_series_offsets", _wrap_add_time_series_offsets),
+    (25, "add_daily_load", _wrap_add_daily_load),
+    (26, "add_workout_features", _wrap_add_workout_features),
+    (27, "add_section_analysis_terms", _wrap_add_section_analysis_terms),
+    (28, "add_wellness_id_sequences", _wrap_add_wellness_id_sequences),
+    (
+        29,
+        "add_form_baseline_population_hash",
+        _wrap_add_form_baseline_population_hash,
+    ),
+    (30, "add_split_phase_stats", _wrap_add_split_phase_stats),
+    (31, "add_daily_load_state", _wrap_add_daily_load_state),
 ]
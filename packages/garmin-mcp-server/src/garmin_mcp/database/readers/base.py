@@ -10,7 +10,8 @@ from contextlib import contextmanager
 
 import duckdb
 
-from garmin_mcp.database.connection import get_connection, get_db_path
+from garmin_mcp.database.connection import get_connection, get_db_path, open_cursor
+from garmin_mcp.utils.instrumentation import track_connection
 
 logger = logging.getLogger(__name__)
 
@@ -18,14 +19,22 @@ logger = logging.getLogger(__name__)
 class BaseDBReader:
     """Base class for DuckDB readers with connection management."""
 
-    def __init__(self, db_path: str | None = None):
+    def __init__(
+        self,
+        db_path: str | None = None,
+        conn: duckdb.DuckDBPyConnection | None = None,
+    ):
         """Initialize DuckDB reader with database path.
 
         Args:
             db_path: Optional path to DuckDB database file.
                     If None, uses default path from config.
+            conn: Optional already-open connection shared by the caller. When
+                    set, ``_get_connection`` hands out a cursor on it instead of
+                    opening the database file again.
         """
         self.db_path = get_db_path(db_path)
+        self._shared_conn = conn
         if not self.db_path.exists():
             logger.warning(f"Database not found: {self.db_path}")
 
@@ -33,12 +42,25 @@ class BaseDBReader:
     def _get_connection(self) -> Generator[duckdb.DuckDBPyConnection, None, None]:
         """Get read-only DuckDB connection as context manager.
 
+        With a shared connection the block gets its own cursor on it (cheap,
+        independent of other cursors and safe to use from another thread),
+        closed on exit and reachable by ``interrupt_connection`` on the shared
+        connection; otherwise a fresh read-only connection.
+
         Yields:
-            Read-only DuckDB connection
+            Read-only DuckDB connection (a measuring proxy while instrumentation
+            tracks a tool call)
 
         Example:
             >>> with self._get_connection() as conn:
             ...     result = conn.execute("SELECT * FROM activities").fetchone()
         """
+        if self._shared_conn is not None:
+            with (
+                open_cursor(self._shared_conn) as cursor,
+                track_connection(cursor) as tracked,
+            ):
+                yield tracked
+            return
         with get_connection(self.db_path) as conn:
             yield conn
@@ -38,7 +38,8 @@ fades are computed independently within that activity and may individually be
 from __future__ import annotations
 
 import logging
-from datetime import date, datetime
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
 from typing import Any
 
 import numpy as np
@@ -306,6 +307,82 @@ class DurabilityReader(BaseDBReader):
         trend.update(self._build_durability_ranking(activities))
         return {"activities": activities, "trend": trend}
 
+    def get_rolling_trends(
+        self,
+        days: list[str],
+        window_days: int = 90,
+        min_distance_km: float = 10.0,
+    ) -> list[dict[str, Any] | None]:
+        """Durability trend of the trailing window ending on each of ``days``.
+
+        Element ``i`` equals ``get_durability_trend(days[i] - window_days,
+        days[i], min_distance_km)["trend"]``, but every long run's decoupling is
+        computed once for the whole range and a trend is only rebuilt when the
+        set of runs inside the sliding window changes.
+
+        Args:
+            days: ``YYYY-MM-DD`` window end days, ascending.
+            window_days: Days before each end day the window starts (inclusive).
+            min_distance_km: Minimum distance to qualify as a long run.
+
+        Returns:
+            One ``trend`` dict per day (see :meth:`get_durability_trend`), or
+            ``None`` for a day whose window contains a run that could not be
+            analysed (where :meth:`get_durability_trend` would raise).
+        """
+        if not days:
+            return []
+
+        first = datetime.strptime(days[0], "%Y-%m-%d").date()
+        runs = self._long_runs(
+            (first - timedelta(days=window_days)).strftime("%Y-%m-%d"),
+            days[-1],
+            min_distance_km,
+        )
+        run_dates = [run_date for _, run_date in runs]
+
+        per_run: list[dict[str, Any] | None] = []
+        failed: list[int] = []
+        for index, (activity_id, _) in enumerate(runs):
+            try:
+                per_run.append(self.get_activity_durability(activity_id))
+            except Exception:
+                logger.debug("Durability failed for activity %s", activity_id)
+                per_run.append(None)
+                failed.append(index)
+
+        trends: dict[tuple[int, int], dict[str, Any] | None] = {}
+        results: list[dict[str, Any] | None] = []
+        for day in days:
+            window_start = datetime.strptime(day, "%Y-%m-%d").date() - timedelta(
+                days=window_days
+            )
+            lo = bisect_left(run_dates, window_start.strftime("%Y-%m-%d"))
+            hi = bisect_right(run_dates, day)
+            if (lo, hi) not in trends:
+                trends[(lo, hi)] = self._window_trend(per_run, failed, lo, hi)
+            results.append(trends[(lo, hi)])
+        return results
+
+    def _window_trend(
+        self,
+        per_run: list[dict[str, Any] | None],
+        failed: list[int],
+        lo: int,
+        hi: int,
+    ) -> dict[str, Any] | None:
+        """Trend over ``per_run[lo:hi]`` (``None`` when a run in it failed)."""
+        if any(lo <= index < hi for index in failed):
+            return None
+        activities = [a for a in per_run[lo:hi] if a is not None]
+        activities.sort(key=lambda a: a["activity_date"])
+        try:
+            trend = self._build_trend(activities)
+            trend.update(self._build_durability_ranking(activities))
+        except Exception:
+            return None
+        return trend
+
     def _build_durability_ranking(
         self, activities: list[dict[str, Any]]
     ) -> dict[str, Any]:
@@ -656,10 +733,19 @@ class DurabilityReader(BaseDBReader):
         self, start_date: str, end_date: str, min_distance_km: float
     ) -> list[int]:
         """Return qualifying long-run activity IDs in the window (date ascending)."""
+        return [
+            activity_id
+            for activity_id, _ in self._long_runs(start_date, end_date, min_distance_km)
+        ]
+
+    def _long_runs(
+        self, start_date: str, end_date: str, min_distance_km: float
+    ) -> list[tuple[int, str]]:
+        """Return qualifying ``(activity_id, YYYY-MM-DD)`` pairs, date ascending."""
         with self._get_connection() as conn:
             rows = conn.execute(
                 """
-                SELECT activity_id
+                SELECT activity_id, strftime(activity_date, '%Y-%m-%d')
                 FROM activities
                 WHERE activity_date BETWEEN ? AND ?
                   AND total_distance_km >= ?
@@ -667,7 +753,7 @@ class DurabilityReader(BaseDBReader):
                 """,
                 [start_date, end_date, min_distance_km],
             ).fetchall()
-        return [int(row[0]) for row in rows]
+        return [(int(row[0]), str(row[1])) for row in rows]
 
     def _activity_date(self, activity_id: int) -> str | None:
         """Return the activity's date as a ``YYYY-MM-DD`` string (or None)."""
@@ -7,6 +7,8 @@ Handles all splits table queries with optional statistics-only mode.
 import logging
 from typing import Any
 
+import duckdb
+
 from garmin_mcp.database.readers import splits_query_builder as qb
 from garmin_mcp.database.readers.base import BaseDBReader
 
@@ -16,6 +18,30 @@ logger = logging.getLogger(__name__)
 class SplitsReader(BaseDBReader):
     """Reader for splits data queries."""
 
+    @staticmethod
+    def _fetch_statistics(
+        conn: duckdb.DuckDBPyConnection,
+        fields: tuple[qb.SplitField, ...],
+        activity_id: int,
+    ) -> tuple[Any, ...] | None:
+        """Statistics row of an activity, materialized when available.
+
+        Reads the ``split_phase_stats`` row written at ingest; falls back to
+        aggregating ``splits`` when the table or the row is missing (database
+        not migrated, or splits written outside ``save_data``).
+        """
+        try:
+            result = conn.execute(
+                qb.build_phase_stats_sql(fields), [activity_id]
+            ).fetchone()
+        except duckdb.CatalogException:
+            result = None
+        if result is None:
+            result = conn.execute(
+                qb.build_statistics_sql(fields), [activity_id]
+            ).fetchone()
+        return result
+
     def get_splits_pace_hr(
         self, activity_id: int, statistics_only: bool = False
     ) -> dict[str, list[dict]] | dict[str, Any]:
@@ -37,8 +63,9 @@ class SplitsReader(BaseDBReader):
         try:
             with self._get_connection() as conn:
                 if statistics_only:
-                    sql = qb.build_statistics_sql(qb.PACE_HR_FIELDS)
-                    result = conn.execute(sql, [activity_id]).fetchone()
+                    result = self._fetch_statistics(
+                        conn, qb.PACE_HR_FIELDS, activity_id
+                    )
                     return qb.parse_statistics_result(
                         result, qb.PACE_HR_FIELDS, activity_id
                     )
@@ -74,8 +101,7 @@ class SplitsReader(BaseDBReader):
         try:
             with self._get_connection() as conn:
                 if statistics_only:
-                    sql = qb.build_statistics_sql(qb.FORM_FIELDS)
-                    result = conn.execute(sql, [activity_id]).fetchone()
+                    result = self._fetch_statistics(conn, qb.FORM_FIELDS, activity_id)
                     return qb.parse_statistics_result(
                         result, qb.FORM_FIELDS, activity_id
                     )
@@ -111,8 +137,9 @@ class SplitsReader(BaseDBReader):
         try:
             with self._get_connection() as conn:
                 if statistics_only:
-                    sql = qb.build_statistics_sql(qb.ELEVATION_FIELDS)
-                    result = conn.execute(sql, [activity_id]).fetchone()
+                    result = self._fetch_statistics(
+                        conn, qb.ELEVATION_FIELDS, activity_id
+                    )
                     return qb.parse_statistics_result(
                         result, qb.ELEVATION_FIELDS, activity_id
                     )
@@ -151,8 +178,9 @@ class SplitsReader(BaseDBReader):
         try:
             with self._get_connection() as conn:
                 if statistics_only:
-                    sql = qb.build_statistics_sql(qb.COMPREHENSIVE_STAT_FIELDS)
-                    result = conn.execute(sql, [activity_id]).fetchone()
+                    result = self._fetch_statistics(
+                        conn, qb.COMPREHENSIVE_STAT_FIELDS, activity_id
+                    )
                     return qb.parse_statistics_result(
                         result, qb.COMPREHENSIVE_STAT_FIELDS, activity_id
                     )
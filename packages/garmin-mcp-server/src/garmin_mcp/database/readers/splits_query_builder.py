@@ -173,6 +173,29 @@ def build_statistics_sql(fields: tuple[SplitField, ...]) -> str:
                         """
 
 
+def build_phase_stats_sql(fields: tuple[SplitField, ...]) -> str:
+    """Generate SQL reading materialized statistics from ``split_phase_stats``.
+
+    Selects the same values as :func:`build_statistics_sql`, in the same
+    order, from the activity's ``phase = 'all'`` row.
+
+    Args:
+        fields: Tuple of SplitField definitions.
+
+    Returns:
+        SQL query string selecting ``<column>_<stat>`` for each field.
+    """
+    columns = ",\n                            ".join(
+        f"{field.db_column}_{key}" for field in fields for key in STAT_KEYS
+    )
+    return f"""
+                        SELECT
+                            {columns}
+                        FROM split_phase_stats
+                        WHERE activity_id = ? AND phase = 'all'
+                        """
+
+
 def parse_statistics_result(
     result: tuple[Any, ...] | None, fields: tuple[SplitField, ...], activity_id: int
 ) -> dict[str, Any]:
@@ -2,16 +2,60 @@
 Time series reader for second-by-second activity data.
 
 Handles queries to time_series_metrics table with support for
-statistics-only mode and SQL-based anomaly detection.
+statistics-only mode and SQL-based anomaly detection. Range statistics are
+served from the 10 s / 60 s ``time_series_rollups`` buckets when available
+(see :func:`select_time_series_resolution`), reading raw rows only for the
+partial buckets at the range edges.
 """
 
 import logging
 from typing import Any
 
+import duckdb
+
+from garmin_mcp.database.inserters.time_series_rollups import (
+    ROLLUP_METRICS,
+    ROLLUP_RESOLUTIONS_S,
+    rollup_column,
+)
 from garmin_mcp.database.readers.base import BaseDBReader
 
 logger = logging.getLogger(__name__)
 
+# Resolution (seconds) of the raw time_series_metrics rows.
+RAW_RESOLUTION_S = 1
+
+
+def select_time_series_resolution(range_s: int, max_points: int = 1) -> int:
+    """Pick the coarsest resolution that satisfies a range and point budget.
+
+    A rollup resolution qualifies when the range spans at least
+    ``max_points`` full buckets, i.e. the coarse series still has enough
+    points to fill the budget (statistics pass ``max_points=1``: one full
+    bucket is enough, the edges are read raw).
+
+    Args:
+        range_s: Length of the requested time range in seconds.
+        max_points: Minimum number of buckets the range must contain.
+
+    Returns:
+        A value from ``ROLLUP_RESOLUTIONS_S``, or ``RAW_RESOLUTION_S`` when no
+        rollup is fine enough.
+    """
+    for resolution_s in sorted(ROLLUP_RESOLUTIONS_S, reverse=True):
+        if range_s // resolution_s >= max(max_points, 1):
+            return resolution_s
+    return RAW_RESOLUTION_S
+
+
+def has_time_series_rollups(conn: duckdb.DuckDBPyConnection) -> bool:
+    """Whether the ``time_series_rollups`` table exists on this connection."""
+    row = conn.execute(
+        "SELECT COUNT(*) FROM duckdb_tables() "
+        "WHERE table_name = 'time_series_rollups'"
+    ).fetchone()
+    return row is not None and row[0] > 0
+
 
 class TimeSeriesReader(BaseDBReader):
     """Reader for time series metrics and anomaly detection."""
@@ -53,6 +97,12 @@ class TimeSeriesReader(BaseDBReader):
         """
         try:
             with self._get_connection() as conn:
+                rollup_result = self._statistics_from_rollups(
+                    conn, activity_id, start_time_s, end_time_s, metrics
+                )
+                if rollup_result is not None:
+                    return rollup_result
+
                 # Build SQL for statistics calculation
                 stats_selects = []
                 for metric in metrics:
@@ -135,6 +185,145 @@ class TimeSeriesReader(BaseDBReader):
                 "error": f"Error querying time series statistics: {e}",
             }
 
+    def _statistics_from_rollups(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        activity_id: int,
+        start_time_s: int,
+        end_time_s: int,
+        metrics: list[str],
+    ) -> dict[str, Any] | None:
+        """Range statistics recombined from rollup buckets.
+
+        Full buckets inside ``[start_time_s, end_time_s)`` come from
+        ``time_series_rollups`` at the resolution picked by
+        :func:`select_time_series_resolution`; the partial buckets at either
+        edge are aggregated from raw rows. Partial aggregates ``(n, mean, m2,
+        min, max)`` are merged with the parallel-variance formula, so the
+        result equals the raw-scan statistics (sample standard deviation).
+
+        Returns:
+            The ``get_time_series_statistics`` payload, or ``None`` when the
+            rollups cannot serve the request (table missing, a metric without
+            rollups, range shorter than one bucket, or no buckets stored for
+            the activity) and the caller must scan raw rows.
+        """
+        if not metrics or not set(metrics) <= set(ROLLUP_METRICS):
+            return None
+        resolution_s = select_time_series_resolution(end_time_s - start_time_s)
+        if resolution_s == RAW_RESOLUTION_S or not has_time_series_rollups(conn):
+            return None
+
+        # Full buckets: [inner_start, inner_end). Edges: raw rows outside it.
+        inner_start = -(-start_time_s // resolution_s) * resolution_s
+        inner_end = (end_time_s // resolution_s) * resolution_s
+
+        metric_names = list(dict.fromkeys(metrics))
+        # Bucket columns and edge aggregates line up as (n, mean, m2, min, max).
+        bucket_parts = ", ".join(
+            rollup_column(m, stat)
+            for m in metric_names
+            for stat in ("n", "mean", "m2", "min", "max")
+        )
+        edge_parts = ", ".join(
+            f"count({m}) AS {m}_n, avg({m}) AS {m}_mean, "
+            f"coalesce(var_pop({m}) * count({m}), 0.0) AS {m}_m2, "
+            f"min({m}) AS {m}_min, max({m}) AS {m}_max"
+            for m in metric_names
+        )
+        totals = ", ".join(
+            f"sum({m}_n) AS {m}_n, "
+            f"sum({m}_n * {m}_mean) / nullif(sum({m}_n), 0) AS {m}_mean, "
+            f"min({m}_min) AS {m}_min, max({m}_max) AS {m}_max"
+            for m in metric_names
+        )
+        spread = ", ".join(
+            f"sum(p.{m}_m2) + sum(p.{m}_n * (p.{m}_mean - t.{m}_mean) ^ 2) "
+            f"AS {m}_ss"
+            for m in metric_names
+        )
+        merged = ", ".join(
+            f"t.{m}_mean, "
+            f"CASE WHEN t.{m}_n > 1 THEN sqrt(s.{m}_ss / (t.{m}_n - 1)) END, "
+            f"t.{m}_min, t.{m}_max"
+            for m in metric_names
+        )
+        # Safe to interpolate: every metric was validated against ROLLUP_METRICS.
+        query = f"""
+            WITH parts AS (
+                SELECT
+                    sample_count AS rollup_count,
+                    0 AS edge_count,
+                    {bucket_parts}
+                FROM time_series_rollups
+                WHERE activity_id = ?
+                  AND resolution_s = ?
+                  AND bucket_start_s >= ?
+                  AND bucket_start_s < ?
+                UNION ALL
+                SELECT
+                    0 AS rollup_count,
+                    count(*) AS edge_count,
+                    {edge_parts}
+                FROM time_series_metrics
+                WHERE activity_id = ?
+                  AND ((timestamp_s >= ? AND timestamp_s < ?)
+                    OR (timestamp_s >= ? AND timestamp_s < ?))
+            ),
+            totals AS (
+                SELECT
+                    sum(rollup_count) AS rollup_count,
+                    sum(rollup_count + edge_count) AS data_points,
+                    {totals}
+                FROM parts
+            ),
+            spread AS (
+                SELECT {spread}
+                FROM parts p
+                CROSS JOIN totals t
+            )
+            SELECT t.rollup_count, t.data_points, {merged}
+            FROM totals t
+            CROSS JOIN spread s
+        """
+        row = conn.execute(
+            query,
+            [
+                activity_id,
+                resolution_s,
+                inner_start,
+                inner_end,
+                activity_id,
+                start_time_s,
+                inner_start,
+                inner_end,
+                end_time_s,
+            ],
+        ).fetchone()
+        if row is None or not row[0]:
+            # No buckets stored for this activity: let the raw scan decide.
+            return None
+
+        statistics = {}
+        for i, metric in enumerate(metric_names):
+            avg, std, min_value, max_value = row[2 + 4 * i : 6 + 4 * i]
+            statistics[metric] = {
+                "avg": float(avg) if avg is not None else 0.0,
+                "std": float(std) if std is not None else 0.0,
+                "min": float(min_value) if min_value is not None else 0.0,
+                "max": float(max_value) if max_value is not None else 0.0,
+            }
+
+        return {
+            "activity_id": activity_id,
+            "time_range": {
+                "start_time_s": start_time_s,
+                "end_time_s": end_time_s,
+            },
+            "statistics": statistics,
+            "data_points": int(row[1]),
+        }
+
     def get_time_series_raw(
         self,
         activity_id: int,
@@ -14,6 +14,14 @@ ACWR = acute (last-7-day load sum) / chronic (last-28-day load sum / 4 = weekly
 average). Status thresholds: <0.8 ``undertraining`` / 0.8-1.3 ``optimal`` /
 1.3-1.5 ``caution`` / >1.5 ``high_risk``; chronic == 0 -> ``insufficient_data``
 with ``acwr = None``.
+
+Daily loads are read from the ``daily_load`` ledger (one row per day with the
+7- / 28-day rolling sums precomputed, maintained by ``insert_activities``), so
+a point ACWR is a single-row read. Each public call compares the ledger's
+watermark (``daily_load_state``) with ``count(*)`` / ``max(rowid)`` of
+``activities`` once; when the ledger is missing or behind (rows added or
+deleted outside the inserter), the same per-day values are aggregated from
+``activities`` instead.
 """
 
 from __future__ import annotations
@@ -22,6 +30,9 @@ import logging
 from datetime import date, datetime, timedelta
 from typing import Any
 
+import duckdb
+
+from garmin_mcp.database.inserters.daily_load import activities_fingerprint
 from garmin_mcp.database.readers.base import BaseDBReader
 from garmin_mcp.utils.week import get_week_start_day, week_start
 
@@ -51,6 +62,51 @@ def _classify(acwr: float | None) -> str:
     return "high_risk"
 
 
+# Per-day (load_date, load_km, longest_run_sec) relations: the maintained
+# ledger, or the same aggregate computed on the fly from ``activities``.
+_LEDGER_DAYS_SQL = "SELECT load_date, load_km, longest_run_sec FROM daily_load"
+_ACTIVITY_DAYS_SQL = """
+    SELECT
+        activity_date AS load_date,
+        COALESCE(sum(total_distance_km), 0.0) AS load_km,
+        max(total_time_seconds) AS longest_run_sec
+    FROM activities
+    GROUP BY activity_date
+"""
+
+
+def _as_date(value: Any) -> date:
+    """Normalize a DuckDB DATE / ``YYYY-MM-DD`` string to ``date``."""
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value), "%Y-%m-%d").date()
+
+
+def _ledger_in_sync(conn: duckdb.DuckDBPyConnection) -> bool:
+    """Whether the ledger watermark matches the fingerprint of ``activities``."""
+    exists = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables "
+        "WHERE table_name = 'daily_load_state'"
+    ).fetchone()
+    if exists is None or exists[0] == 0:
+        return False
+    stored = conn.execute(
+        "SELECT activity_count, max_rowid FROM daily_load_state"
+    ).fetchone()
+    return stored is not None and tuple(stored) == activities_fingerprint(conn)
+
+
+def _daily_source_sql(conn: duckdb.DuckDBPyConnection) -> str:
+    """Per-day load relation to read on ``conn`` (ledger when in sync).
+
+    Resolved once per public reader call and handed to the helpers.
+    """
+    if _ledger_in_sync(conn):
+        return _LEDGER_DAYS_SQL
+    logger.debug("daily_load ledger unavailable; aggregating activities")
+    return _ACTIVITY_DAYS_SQL
+
+
 def _acwr_from_loads(acute_7d: float, chronic_28d_total: float) -> float | None:
     """Compute ACWR from a 7-day acute sum and a 28-day chronic total.
 
@@ -100,13 +156,23 @@ class TrainingLoadReader(BaseDBReader):
                 "load_metric": LOAD_METRIC,
             }
 
-        # 28-day window ending on resolved_end (inclusive): 28 days total.
-        chronic_start = resolved_end - timedelta(days=27)
-        acute_start = resolved_end - timedelta(days=6)
+        with self._get_connection() as conn:
+            source = _daily_source_sql(conn)
+        rolling = (
+            self._ledger_rolling_sums(resolved_end)
+            if source == _LEDGER_DAYS_SQL
+            else None
+        )
+        if rolling is not None:
+            acute_total, chronic_total = rolling
+        else:
+            # 28-day window ending on resolved_end (inclusive): 28 days total.
+            chronic_start = resolved_end - timedelta(days=27)
+            acute_start = resolved_end - timedelta(days=6)
 
-        daily = self._daily_loads(chronic_start, resolved_end)
-        chronic_total = sum(daily.values())
-        acute_total = sum(km for day, km in daily.items() if day >= acute_start)
+            daily = self._daily_loads(chronic_start, resolved_end, source)
+            chronic_total = sum(daily.values())
+            acute_total = sum(km for day, km in daily.items() if day >= acute_start)
 
         acwr = _acwr_from_loads(acute_total, chronic_total)
 
@@ -157,6 +223,7 @@ class TrainingLoadReader(BaseDBReader):
 
         with self._get_connection() as conn:
             start_day = get_week_start_day(conn)
+            source = _daily_source_sql(conn)
 
         # Newest bucket starts on the week-start day of resolved_end; older
         # buckets step back 7 days each.
@@ -167,10 +234,12 @@ class TrainingLoadReader(BaseDBReader):
         # Pull every daily load once: from 27 days before the oldest bucket's
         # last day (for that bucket's chronic window) through resolved_end.
         history_start = oldest_week_start - timedelta(days=27)
-        daily = self._daily_loads(history_start, resolved_end)
+        daily = self._daily_loads(history_start, resolved_end, source)
         # Long-run axis (Issue #927): only the buckets themselves need it, so
         # this window starts at the oldest bucket (no chronic prelude).
-        daily_longest = self._daily_longest_run_sec(oldest_week_start, resolved_end)
+        daily_longest = self._daily_longest_run_sec(
+            oldest_week_start, resolved_end, source
+        )
 
         weeks: list[dict[str, Any]] = []
         # Iterate oldest -> newest so the array reads chronologically.
@@ -207,6 +276,119 @@ class TrainingLoadReader(BaseDBReader):
 
         return {"weeks": weeks, "load_metric": LOAD_METRIC}
 
+    def get_acwr_series(
+        self, start_date: str | None = None, end_date: str | None = None
+    ) -> dict[str, Any]:
+        """Return the daily ACWR for every day in ``[start_date, end_date]``.
+
+        Each day uses the same rolling windows as :meth:`get_acwr`; the whole
+        series is computed with window functions in one query over the per-day
+        loads (no per-day round trips).
+
+        Args:
+            start_date: ``YYYY-MM-DD`` first day. Defaults to the first
+                ``activity_date`` (the whole history).
+            end_date: ``YYYY-MM-DD`` last day. Defaults to the latest
+                ``activity_date``.
+
+        Returns:
+            Dict with keys:
+            - ``start_date`` / ``end_date``: ``YYYY-MM-DD`` | None
+            - ``days``: list of {date, acute_load_7d, chronic_load_28d_weekly,
+              acwr (float | None), status} ordered oldest -> newest
+            - ``load_metric``: ``"distance_km"``
+        """
+        resolved_end = self._resolve_end_date(end_date)
+        with self._get_connection() as conn:
+            source = _daily_source_sql(conn)
+            if start_date is not None:
+                resolved_start: date | None = _as_date(start_date)
+            else:
+                row = conn.execute(f"SELECT min(load_date) FROM ({source})").fetchone()
+                resolved_start = _as_date(row[0]) if row and row[0] else None
+
+            if (
+                resolved_start is None
+                or resolved_end is None
+                or resolved_start > resolved_end
+            ):
+                return {
+                    "start_date": None,
+                    "end_date": None,
+                    "days": [],
+                    "load_metric": LOAD_METRIC,
+                }
+
+            rows = conn.execute(
+                f"""
+                WITH days AS (
+                    SELECT CAST(d AS DATE) AS load_date
+                    FROM generate_series(
+                        $start::DATE - 27, $end::DATE, INTERVAL 1 DAY
+                    ) AS t(d)
+                ),
+                rolled AS (
+                    SELECT
+                        days.load_date,
+                        sum(COALESCE(src.load_km, 0.0)) OVER w7 AS acute,
+                        sum(COALESCE(src.load_km, 0.0)) OVER w28 AS chronic
+                    FROM days
+                    LEFT JOIN ({source}) AS src
+                        ON src.load_date = days.load_date
+                    WINDOW
+                        w7 AS (
+                            ORDER BY days.load_date
+                            ROWS BETWEEN 6 PRECEDING AND CURRENT ROW
+                        ),
+                        w28 AS (
+                            ORDER BY days.load_date
+                            ROWS BETWEEN 27 PRECEDING AND CURRENT ROW
+                        )
+                )
+                SELECT load_date, acute, chronic
+                FROM rolled
+                WHERE load_date >= $start::DATE
+                ORDER BY load_date
+                """,
+                {"start": resolved_start, "end": resolved_end},
+            ).fetchall()
+
+        days: list[dict[str, Any]] = []
+        for load_date, acute_total, chronic_total in rows:
+            acwr = _acwr_from_loads(float(acute_total), float(chronic_total))
+            days.append(
+                {
+                    "date": _as_date(load_date).strftime("%Y-%m-%d"),
+                    "acute_load_7d": round(float(acute_total), 2),
+                    "chronic_load_28d_weekly": round(float(chronic_total) / 4.0, 2),
+                    "acwr": round(acwr, 2) if acwr is not None else None,
+                    "status": _classify(acwr),
+                }
+            )
+
+        return {
+            "start_date": resolved_start.strftime("%Y-%m-%d"),
+            "end_date": resolved_end.strftime("%Y-%m-%d"),
+            "days": days,
+            "load_metric": LOAD_METRIC,
+        }
+
+    def _ledger_rolling_sums(self, day: date) -> tuple[float, float] | None:
+        """Precomputed ``(7-day, 28-day)`` load sums for ``day`` from the ledger.
+
+        Only called once the ledger is known to be in sync. ``None`` when it has
+        no row for ``day`` (the day lies outside the first..last activity
+        range); callers then sum the daily loads of the window themselves.
+        """
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT load_7d_km, load_28d_km FROM daily_load WHERE load_date = ?",
+                [day],
+            ).fetchone()
+        if row is None:
+            return None
+        return float(row[0]), float(row[1])
+
     def _resolve_end_date(self, end_date: str | None) -> date | None:
         """Return the reference end date as a ``date``.
 
@@ -222,40 +404,31 @@ class TrainingLoadReader(BaseDBReader):
             return None
         latest = row[0]
         # DuckDB returns datetime.date for a DATE column.
-        return (
-            latest
-            if isinstance(latest, date)
-            else datetime.strptime(str(latest), "%Y-%m-%d").date()
-        )
+        return _as_date(latest)
 
-    def _daily_loads(self, start: date, end: date) -> dict[date, float]:
+    def _daily_loads(self, start: date, end: date, source: str) -> dict[date, float]:
         """Sum ``total_distance_km`` per day in ``[start, end]`` (single query).
 
-        Days with no activity are simply absent from the mapping (treated as 0
-        load by callers). HR-independent: never reads ``avg_heart_rate``.
+        Days with no activity are absent from the mapping or carry 0 (ledger
+        rest days); callers treat both as 0 load. HR-independent: never reads
+        ``avg_heart_rate``. ``source`` is the per-day relation chosen by
+        :func:`_daily_source_sql`.
         """
         with self._get_connection() as conn:
             rows = conn.execute(
-                """
-                SELECT activity_date, COALESCE(sum(total_distance_km), 0.0)
-                FROM activities
-                WHERE activity_date BETWEEN ? AND ?
-                GROUP BY activity_date
+                f"""
+                SELECT load_date, load_km
+                FROM ({source})
+                WHERE load_date BETWEEN ? AND ?
                 """,
                 [start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")],
             ).fetchall()
 
-        loads: dict[date, float] = {}
-        for activity_date, total_km in rows:
-            day = (
-                activity_date
-                if isinstance(activity_date, date)
-                else datetime.strptime(str(activity_date), "%Y-%m-%d").date()
-            )
-            loads[day] = float(total_km or 0.0)
-        return loads
+        return {_as_date(load_date): float(km or 0.0) for load_date, km in rows}
 
-    def _daily_longest_run_sec(self, start: date, end: date) -> dict[date, int]:
+    def _daily_longest_run_sec(
+        self, start: date, end: date, source: str
+    ) -> dict[date, int]:
         """Longest run duration (seconds) per day in ``[start, end]``.
 
         ``max(total_time_seconds)`` per ``activity_date`` (single query). Days
@@ -264,23 +437,13 @@ class TrainingLoadReader(BaseDBReader):
         """
         with self._get_connection() as conn:
             rows = conn.execute(
-                """
-                SELECT activity_date, max(total_time_seconds)
-                FROM activities
-                WHERE activity_date BETWEEN ? AND ?
-                GROUP BY activity_date
+                f"""
+                SELECT load_date, longest_run_sec
+                FROM ({source})
+                WHERE load_date BETWEEN ? AND ?
+                  AND longest_run_sec IS NOT NULL
                 """,
                 [start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")],
             ).fetchall()
 
-        longest: dict[date, int] = {}
-        for activity_date, max_seconds in rows:
-            if max_seconds is None:
-                continue
-            day = (
-                activity_date
-                if isinstance(activity_date, date)
-                else datetime.strptime(str(activity_date), "%Y-%m-%d").date()
-            )
-            longest[day] = int(max_seconds)
-        return longest
+        return {_as_date(load_date): int(seconds) for load_date, seconds in rows}
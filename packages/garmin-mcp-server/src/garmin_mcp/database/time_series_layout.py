@@ -0,0 +1,112 @@
+"""
+Physical storage layout of the time_series_metrics table.
+
+Every metric is a ``DOUBLE`` column under its own name, so readers get the
+stored values back unchanged (no fixed-point rounding, no decode on read).
+DuckDB compresses the 1 Hz columns with ALP / bit-packing on its own.
+
+The table has no PRIMARY KEY or secondary indexes: rows are written per
+activity in ``seq_no`` order (DELETE then INSERT), so each activity occupies
+contiguous row groups and DuckDB's zone maps prune ``activity_id`` /
+``timestamp_s`` filters without ART indexes.
+
+This module is the single source of the layout: ``GarminDBWriter`` creates the
+table from :func:`time_series_metrics_ddl`, migration
+``compact_time_series_metrics`` rewrites legacy indexed tables into it, and
+``insert_time_series_metrics`` streams chunks through
+:func:`time_series_insert_select_sql`.
+"""
+
+from collections.abc import Sequence
+
+# Metric columns in table order.
+TIME_SERIES_METRICS: tuple[str, ...] = (
+    "sum_moving_duration",
+    "sum_duration",
+    "sum_elapsed_duration",
+    "sum_distance",
+    "sum_accumulated_power",
+    "heart_rate",
+    "speed",
+    "grade_adjusted_speed",
+    "cadence",
+    "cadence_single_foot",
+    "cadence_total",
+    "power",
+    "ground_contact_time",
+    "vertical_oscillation",
+    "vertical_ratio",
+    "stride_length",
+    "vertical_speed",
+    "elevation",
+    "air_temperature",
+    "latitude",
+    "longitude",
+    "available_stamina",
+    "potential_stamina",
+    "body_battery",
+    "performance_condition",
+)
+
+
+def time_series_metrics_ddl(table_name: str = "time_series_metrics") -> str:
+    """``CREATE TABLE IF NOT EXISTS`` statement for the layout.
+
+    Args:
+        table_name: Table to create (the migration builds a temporary copy
+            before swapping it in).
+
+    Returns:
+        DDL string.
+    """
+    column_defs = [
+        "activity_id BIGINT NOT NULL",
+        "seq_no INTEGER NOT NULL",
+        "timestamp_s INTEGER NOT NULL",
+    ] + [f"{metric} DOUBLE" for metric in TIME_SERIES_METRICS]
+    columns_sql = ",\n    ".join(column_defs)
+    return f"CREATE TABLE IF NOT EXISTS {table_name} (\n    {columns_sql}\n)"
+
+
+def time_series_insert_sql(metrics: Sequence[str]) -> str:
+    """Parameterized INSERT taking DOUBLE values for ``metrics``.
+
+    Placeholders are ``activity_id, seq_no, timestamp_s`` followed by one
+    value per metric (in the given order).
+
+    Args:
+        metrics: Metric names (members of ``TIME_SERIES_METRICS``).
+
+    Returns:
+        INSERT statement for ``time_series_metrics``.
+    """
+    columns = ["activity_id", "seq_no", "timestamp_s", *metrics]
+    return (
+        f"INSERT INTO time_series_metrics ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)})"
+    )
+
+
+def time_series_insert_select_sql(
+    metrics: Sequence[str], source: str, table_name: str = "time_series_metrics"
+) -> str:
+    """INSERT ... SELECT from a relation holding DOUBLE metric columns.
+
+    ``source`` must expose ``activity_id, seq_no, timestamp_s`` plus one
+    column per metric named after the metric; rows are inserted in
+    ``seq_no`` order.
+
+    Args:
+        metrics: Metric names (members of ``TIME_SERIES_METRICS``).
+        source: Table / registered relation to read from.
+        table_name: Table to insert into (the inserter stages an activity
+            in a temp table with the same layout first).
+
+    Returns:
+        INSERT statement for ``table_name``.
+    """
+    columns = ", ".join(["activity_id", "seq_no", "timestamp_s", *metrics])
+    return (
+        f"INSERT INTO {table_name} ({columns}) "
+        f"SELECT {columns} FROM {source} ORDER BY seq_no"
+    )
@@ -0,0 +1,399 @@
+"""Incremental form-baseline retraining.
+
+:func:`~garmin_mcp.form_baseline.trainer.train_form_baselines` refits one
+window from scratch. Month-end windows overlap by a month, and a window's splits
+rarely change once its month is over, so refitting on every trigger repeats the
+same Huber / RANSAC fits on identical data. This module refits only what
+changed:
+
+- :func:`window_population_hashes` digests each window's split population in
+  one grouped query. Every ``form_baseline_history`` row records the digest it
+  was fitted on (``population_hash``). A window is stale when the four form
+  metrics are not all stored with the current digest.
+- The samples of all stale windows are loaded with one query over their
+  combined date span, and each window is sliced from that cache. Robust fits
+  need the samples themselves: Huber / RANSAC have no additive sufficient
+  statistics.
+- Stale windows are fitted on a thread pool. All results are written in one
+  write transaction (single writer).
+
+:func:`retrain_form_baselines` is the entry point.
+``ensure_form_baselines_for_date`` (prefetch), running ingest
+(:func:`refresh_form_baselines_for_dates`) and ``backfill_baseline_history
+--incremental`` all call it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import duckdb
+import pandas as pd
+
+from garmin_mcp.form_baseline.power_efficiency_model import PowerEfficiencyModel
+from garmin_mcp.form_baseline.split_filter import running_split_params
+from garmin_mcp.form_baseline.trainer import (
+    FORM_METRICS,
+    GCTPowerModel,
+    LinearModel,
+    _fit_form_models,
+    _fit_power_model,
+    _load_form_samples,
+    _load_power_samples,
+    _power_window_bounds,
+    _upsert_form_model,
+    _upsert_power_model,
+    _window_bounds,
+)
+
+logger = logging.getLogger(__name__)
+
+# Threads fitting stale windows concurrently.
+FIT_WORKERS = 4
+
+# Every column either model reads, plus the row identity. A change to any of
+# them changes the digest, so a window is never left fitted on stale data.
+_POPULATION_COLUMNS = (
+    "a.activity_id",
+    "a.activity_date",
+    "a.base_weight_kg",
+    "s.pace_seconds_per_km",
+    "s.ground_contact_time",
+    "s.vertical_oscillation",
+    "s.vertical_ratio",
+    "s.stride_length",
+    "s.cadence",
+    "s.distance",
+    "s.grade_adjusted_speed",
+    "s.power",
+    "s.role_phase",
+)
+
+
+@dataclass
+class _WindowFit:
+    """Models fitted for one window (``form`` is None when insufficient)."""
+
+    period_start: str
+    period_end: str
+    form: dict[str, GCTPowerModel | LinearModel] | None
+    power: tuple[PowerEfficiencyModel, int] | None
+    power_start: str
+
+
+def _hash_range(period_end: str, window_months: int) -> tuple[str, str]:
+    """Date range covering both the form and the power window of a period."""
+    form_start, end = _window_bounds(period_end, window_months)
+    power_start, _ = _power_window_bounds(period_end, window_months)
+    return min(form_start, power_start), end
+
+
+def window_population_hashes(
+    conn: duckdb.DuckDBPyConnection,
+    period_ends: Iterable[str],
+    window_months: int = 2,
+) -> dict[str, str]:
+    """Digest the split population of each window in one grouped query.
+
+    The digest covers every split (with its activity) dated inside the union
+    of the window's form and power ranges. It is order-independent and also
+    depends on the running-split thresholds.
+
+    Args:
+        conn: DuckDB connection.
+        period_ends: Window end dates (``YYYY-MM-DD``).
+        window_months: Window length in months.
+
+    Returns:
+        ``{period_end: digest}`` for each distinct period end.
+    """
+    ranges = {
+        end: start
+        for start, end in (_hash_range(pe, window_months) for pe in period_ends)
+    }
+    if not ranges:
+        return {}
+    rows = conn.execute(
+        f"""
+        SELECT
+            CAST(w.period_end AS VARCHAR),
+            COUNT(s.activity_id),
+            COALESCE(SUM(hash({", ".join(_POPULATION_COLUMNS)})::HUGEINT), 0)
+        FROM (
+            SELECT unnest(?::DATE[]) AS range_start, unnest(?::DATE[]) AS period_end
+        ) w
+        LEFT JOIN activities a
+            ON a.activity_date BETWEEN w.range_start AND w.period_end
+        LEFT JOIN splits s ON s.activity_id = a.activity_id
+        GROUP BY w.period_end
+        """,
+        [list(ranges.values()), list(ranges)],
+    ).fetchall()
+    thresholds = ",".join(str(p) for p in running_split_params())
+    return {
+        period_end: hashlib.sha1(f"{count}:{total}:{thresholds}".encode()).hexdigest()[
+            :16
+        ]
+        for period_end, count, total in rows
+    }
+
+
+def _stored_population_hashes(
+    conn: duckdb.DuckDBPyConnection,
+    windows: dict[str, tuple[str, str]],
+    user_id: str,
+    condition_group: str,
+) -> dict[str, str]:
+    """Digest each window was last fitted on.
+
+    A window is listed only when all :data:`FORM_METRICS` rows exist and carry
+    the same non-null ``population_hash``.
+    """
+    placeholders = ", ".join("?" * len(FORM_METRICS))
+    rows = conn.execute(
+        f"""
+        SELECT
+            CAST(w.period_end AS VARCHAR),
+            COUNT(DISTINCT h.metric),
+            COUNT(*) = COUNT(h.population_hash),
+            MIN(h.population_hash),
+            MAX(h.population_hash)
+        FROM (
+            SELECT unnest(?::DATE[]) AS period_start, unnest(?::DATE[]) AS period_end
+        ) w
+        JOIN form_baseline_history h
+            ON h.period_start = w.period_start AND h.period_end = w.period_end
+        WHERE h.user_id = ?
+          AND h.condition_group = ?
+          AND h.metric IN ({placeholders})
+        GROUP BY w.period_end
+        """,
+        [
+            [start for start, _ in windows.values()],
+            list(windows),
+            user_id,
+            condition_group,
+            *FORM_METRICS,
+        ],
+    ).fetchall()
+    return {
+        period_end: low
+        for period_end, n_metrics, all_hashed, low, high in rows
+        if n_metrics == len(FORM_METRICS) and all_hashed and low == high
+    }
+
+
+def _slice(cache: pd.DataFrame, start: str, end: str) -> pd.DataFrame:
+    """Rows of a sample cache whose ``activity_date`` is in ``[start, end]``."""
+    dates = cache["activity_date"]
+    return cache[(dates >= start) & (dates <= end)]
+
+
+def _fit_window(
+    period_start: str,
+    period_end: str,
+    form_samples: pd.DataFrame,
+    power_start: str,
+    power_samples: pd.DataFrame,
+    min_samples: int,
+) -> _WindowFit:
+    """Fit one window. Fit errors count as insufficient data, as in the trainer."""
+    try:
+        form = _fit_form_models(form_samples, min_samples)
+    except Exception:
+        logger.exception("form baseline fit failed for window ending %s", period_end)
+        form = None
+    power = None
+    if form is not None:
+        try:
+            power = _fit_power_model(power_samples)
+        except Exception:
+            logger.exception("power baseline fit failed for %s", period_end)
+    return _WindowFit(period_start, period_end, form, power, power_start)
+
+
+def retrain_form_baselines(
+    period_ends: Iterable[str],
+    db_path: str | None = None,
+    user_id: str = "default",
+    condition_group: str = "flat_road",
+    window_months: int = 2,
+    min_samples: int = 50,
+    *,
+    force: bool = False,
+    max_workers: int = FIT_WORKERS,
+) -> dict[str, list[str]]:
+    """Refit the windows ending at ``period_ends`` whose population changed.
+
+    Args:
+        period_ends: Window end dates (``YYYY-MM-DD``).
+        db_path: Database path. If None, uses GARMIN_DATA_DIR resolution.
+        user_id: User identifier.
+        condition_group: Condition group (e.g., 'flat_road').
+        window_months: Window length in months.
+        min_samples: Minimum samples per window, before and after outlier
+            removal.
+        force: Refit every window even when its population is unchanged.
+        max_workers: Threads fitting windows concurrently.
+
+    Returns:
+        ``{"generated": [...], "skipped": [...], "insufficient": [...]}``
+        keyed by period_end, in input order. ``skipped`` windows already hold
+        all four form metrics fitted on the current population.
+    """
+    from garmin_mcp.database.connection import get_connection, get_write_connection
+
+    windows: dict[str, tuple[str, str]] = {}
+    for period_end in period_ends:
+        start, end = _window_bounds(period_end, window_months)
+        windows.setdefault(end, (start, end))
+
+    result: dict[str, list[str]] = {"generated": [], "skipped": [], "insufficient": []}
+    if not windows:
+        return result
+
+    with get_connection(db_path) as conn:
+        current = window_population_hashes(conn, windows, window_months)
+        stored = (
+            {}
+            if force
+            else _stored_population_hashes(conn, windows, user_id, condition_group)
+        )
+        stale = [pe for pe in windows if stored.get(pe) != current[pe]]
+        power_starts = {pe: _power_window_bounds(pe, window_months)[0] for pe in stale}
+        if stale:
+            # One load per model over the combined span of every stale window.
+            form_cache = _load_form_samples(
+                conn, min(windows[pe][0] for pe in stale), max(stale)
+            )
+            power_cache = _load_power_samples(
+                conn, min(power_starts.values()), max(stale)
+            )
+
+    fits: dict[str, _WindowFit] = {}
+    if stale:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(stale))) as pool:
+            futures = [
+                pool.submit(
+                    _fit_window,
+                    windows[pe][0],
+                    pe,
+                    _slice(form_cache, windows[pe][0], pe),
+                    power_starts[pe],
+                    _slice(power_cache, power_starts[pe], pe),
+                    min_samples,
+                )
+                for pe in stale
+            ]
+            for future in futures:
+                fit = future.result()
+                fits[fit.period_end] = fit
+
+    trained = [fit for fit in fits.values() if fit.form is not None]
+    if trained:
+        with get_write_connection(db_path) as conn:
+            conn.begin()
+            try:
+                for fit in trained:
+                    _write_window(
+                        conn, fit, current[fit.period_end], user_id, condition_group
+                    )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    for period_end in windows:
+        window = fits.get(period_end)
+        if window is None:
+            result["skipped"].append(period_end)
+        elif window.form is None:
+            result["insufficient"].append(period_end)
+        else:
+            result["generated"].append(period_end)
+    return result
+
+
+def _write_window(
+    conn: duckdb.DuckDBPyConnection,
+    fit: _WindowFit,
+    population_hash: str,
+    user_id: str,
+    condition_group: str,
+) -> None:
+    """Upsert the form (and, when fitted, power) rows of one window."""
+    assert fit.form is not None
+    for metric in FORM_METRICS:
+        _upsert_form_model(
+            conn,
+            user_id,
+            condition_group,
+            metric,
+            fit.form[metric],
+            fit.period_start,
+            fit.period_end,
+            population_hash,
+        )
+    if fit.power is not None:
+        model, n_samples = fit.power
+        _upsert_power_model(
+            conn,
+            user_id,
+            condition_group,
+            model,
+            n_samples,
+            fit.power_start,
+            fit.period_end,
+            population_hash,
+        )
+
+
+def refresh_form_baselines_for_dates(
+    dates: Iterable[str],
+    db_path: str | None = None,
+    user_id: str = "default",
+    condition_group: str = "flat_road",
+    window_months: int = 2,
+) -> dict[str, list[str]]:
+    """Refit the stored windows that cover any of ``dates`` if their splits changed.
+
+    Called after ingest with the dates of the new activities. Only windows that
+    already have baselines are considered; creating missing ones is left to
+    ``ensure_form_baselines_for_date`` and the batch scripts.
+
+    Returns:
+        The :func:`retrain_form_baselines` buckets for the covering windows.
+    """
+    from garmin_mcp.database.connection import get_connection
+
+    days = sorted(set(dates))
+    if not days:
+        return {"generated": [], "skipped": [], "insufficient": []}
+
+    with get_connection(db_path) as conn:
+        rows = conn.execute(
+            """
+            SELECT DISTINCT CAST(period_end AS VARCHAR)
+            FROM form_baseline_history
+            WHERE user_id = ? AND condition_group = ? AND period_end >= ?
+            ORDER BY 1
+            """,
+            [user_id, condition_group, days[0]],
+        ).fetchall()
+
+    covering = []
+    for (period_end,) in rows:
+        start, end = _hash_range(period_end, window_months)
+        if any(start <= day <= end for day in days):
+            covering.append(period_end)
+    return retrain_form_baselines(
+        covering,
+        db_path=db_path,
+        user_id=user_id,
+        condition_group=condition_group,
+        window_months=window_months,
+    )
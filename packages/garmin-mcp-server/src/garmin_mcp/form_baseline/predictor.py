@@ -1,8 +1,13 @@
 """Form baseline predictor module.
 
 Predicts expected form metrics (GCT, VO, VR) from pace using trained models.
+:func:`predict_expectations_batch` predicts for an array of paces (e.g. every
+split of one or many activities) in one NumPy pass.
 """
 
+import numpy as np
+import numpy.typing as npt
+
 from .trainer import GCTPowerModel, LinearModel
 
 
@@ -68,3 +73,43 @@ def predict_expectations(
         result["cadence_exp"] = cadence_model.predict(speed_mps)
 
     return result
+
+
+def predict_expectations_batch(
+    models: dict[str, GCTPowerModel | LinearModel],
+    pace_s_per_km: npt.ArrayLike,
+) -> dict[str, np.ndarray]:
+    """Vectorized :func:`predict_expectations` over an array of paces.
+
+    Args:
+        models: Dictionary of trained models (gct, vo, vr, optional cadence)
+        pace_s_per_km: Paces in seconds per kilometer (any array-like)
+
+    Returns:
+        The keys of :func:`predict_expectations`, each an array with one value
+        per input pace.
+    """
+    pace = np.asarray(pace_s_per_km, dtype=float)
+    speed_mps = 1000.0 / pace
+
+    gct_model = models["gct"]
+    assert isinstance(gct_model, GCTPowerModel)
+    vo_model = models["vo"]
+    assert isinstance(vo_model, LinearModel)
+    vr_model = models["vr"]
+    assert isinstance(vr_model, LinearModel)
+
+    result = {
+        "pace": pace,
+        "speed_mps": speed_mps,
+        "gct_ms_exp": gct_model.predict_inverse_batch(speed_mps),
+        "vo_cm_exp": vo_model.predict_batch(speed_mps),
+        "vr_pct_exp": vr_model.predict_batch(speed_mps),
+    }
+
+    cadence_model = models.get("cadence")
+    if cadence_model is not None:
+        assert isinstance(cadence_model, LinearModel)
+        result["cadence_exp"] = cadence_model.predict_batch(speed_mps)
+
+    return result
@@ -11,12 +11,20 @@ Uses asymmetric penalty: lower-than-expected values (= more efficient) receive
 reduced penalties, while higher-than-expected values (= less efficient) receive
 full penalties. A consistency adjustment rewards balanced improvement across all
 three metrics and penalizes divergent patterns.
+
+The ``*_batch`` variants score arrays of observations (e.g. every split of one
+or many activities against the same baseline) in one NumPy pass and match the
+scalar functions element for element.
 """
 
 import math
+from collections.abc import Mapping
 from typing import Any
 
-from .predictor import predict_expectations
+import numpy as np
+import numpy.typing as npt
+
+from .predictor import predict_expectations, predict_expectations_batch
 from .trainer import GCTPowerModel, LinearModel
 
 # Penalty factors by direction.
@@ -49,6 +57,16 @@ PENALTY_PER_SIGMA = 20.0
 # available (old baselines persisted without a usable rmse).
 PENALTY_PER_PCT = 10.0
 
+# Star-rating bands: (penalty upper bound, score, category). A penalty below
+# the bound earns the band; anything from the last bound upward is 1 star.
+_STAR_BANDS: tuple[tuple[float, float, str], ...] = (
+    (10.0, 5.0, "excellent"),
+    (20.0, 4.0, "good"),
+    (40.0, 3.0, "average"),
+    (60.0, 2.0, "below_average"),
+)
+_POOR_BAND = (1.0, "poor")
+
 
 def _sigma_pct(
     metric: str,
@@ -326,34 +344,186 @@ def compute_star_rating(
         >>> print(rating['score'])
         5.0
     """
-    # Unicode stars: U+2605 (filled) U+2606 (empty)
-    filled_star = "\u2605"  # ★
-    empty_star = "\u2606"  # ☆
-
-    # Determine rating based on penalty only (direction is encoded in penalty)
-    if penalty < 10.0:
-        star_rating = filled_star * 5
-        score = 5.0
-        category = "excellent"
-    elif penalty < 20.0:
-        star_rating = filled_star * 4 + empty_star
-        score = 4.0
-        category = "good"
-    elif penalty < 40.0:
-        star_rating = filled_star * 3 + empty_star * 2
-        score = 3.0
-        category = "average"
-    elif penalty < 60.0:
-        star_rating = filled_star * 2 + empty_star * 3
-        score = 2.0
-        category = "below_average"
-    else:
-        star_rating = filled_star + empty_star * 4
-        score = 1.0
-        category = "poor"
+    score, category = _POOR_BAND
+    for upper, band_score, band_category in _STAR_BANDS:
+        if penalty < upper:
+            score, category = band_score, band_category
+            break
 
     return {
-        "star_rating": star_rating,
+        "star_rating": _star_string(score),
         "score": score,
         "category": category,
     }
+
+
+def _star_string(score: float) -> str:
+    """``score`` filled stars (U+2605) padded with empty stars (U+2606) to 5."""
+    filled = int(score)
+    return "\u2605" * filled + "\u2606" * (5 - filled)
+
+
+def _sigma_pct_batch(
+    metric: str,
+    model: GCTPowerModel | LinearModel,
+    expected: np.ndarray,
+) -> np.ndarray:
+    """Vectorized :func:`_sigma_pct`; NaN where the scalar returns None."""
+    unavailable = np.full(expected.shape, np.nan)
+    rmse = model.rmse
+    if not rmse or rmse <= 0.0:
+        return unavailable
+
+    if metric == "gct" and isinstance(model, GCTPowerModel):
+        if not model.d:
+            return unavailable
+        return np.full(expected.shape, 100.0 * (math.exp(rmse / abs(model.d)) - 1.0))
+
+    with np.errstate(divide="ignore"):
+        return np.where(expected != 0.0, 100.0 * rmse / np.abs(expected), np.nan)
+
+
+def _compute_penalty_batch(
+    metric: str,
+    delta_pct: np.ndarray,
+    sigma_pct: np.ndarray,
+) -> np.ndarray:
+    """Vectorized :func:`_compute_penalty`; a NaN sigma uses the legacy formula."""
+    is_improvement = delta_pct > 0 if metric == "cadence" else delta_pct < 0
+    factor = np.where(
+        is_improvement, IMPROVEMENT_FACTOR[metric], DEGRADATION_FACTOR[metric]
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        magnitude = np.where(
+            sigma_pct > 0.0,
+            np.abs(delta_pct / sigma_pct) * PENALTY_PER_SIGMA,
+            np.abs(delta_pct) * PENALTY_PER_PCT,
+        )
+    penalty: np.ndarray = np.clip(magnitude * factor, 0.0, 100.0)
+    return penalty
+
+
+def _compute_consistency_adjustment_batch(
+    gct_delta_pct: np.ndarray,
+    vo_delta_pct: np.ndarray,
+    vr_delta_pct: np.ndarray,
+) -> np.ndarray:
+    """Vectorized :func:`_compute_consistency_adjustment`."""
+    deltas = np.stack([gct_delta_pct, vo_delta_pct, vr_delta_pct])
+    spread = deltas.max(axis=0) - deltas.min(axis=0)
+    bonus = np.minimum(
+        5.0, np.abs(gct_delta_pct + vo_delta_pct + vr_delta_pct) / 3.0 * 0.5
+    )
+    return np.select(
+        [(deltas <= 0).all(axis=0), spread > 15.0, spread > 10.0, spread > 5.0],
+        [bonus, -10.0, -5.0, -2.0],
+        default=0.0,
+    )
+
+
+def score_observations_batch(
+    models: dict[str, GCTPowerModel | LinearModel],
+    obs: Mapping[str, npt.ArrayLike],
+) -> dict[str, np.ndarray]:
+    """Vectorized :func:`score_observation` over arrays of observations.
+
+    Args:
+        models: Dictionary of trained models (gct, vo, vr, optional cadence)
+        obs: Equal-length arrays keyed like :func:`score_observation`'s
+            ``obs``: ``pace_s_per_km``, ``gct_ms``, ``vo_cm``, ``vr_pct`` and
+            optionally ``cadence`` (NaN marks a missing cadence).
+
+    Returns:
+        The keys of :func:`score_observation`, each an array with one value per
+        observation. ``*_sigma_pct`` is NaN where the scalar path returns None.
+        Cadence keys are present when a cadence model and ``obs["cadence"]``
+        are; rows without a cadence value get NaN and ``False``.
+    """
+    expectations = predict_expectations_batch(models, obs["pace_s_per_km"])
+    gct_actual = np.asarray(obs["gct_ms"], dtype=float)
+    vo_actual = np.asarray(obs["vo_cm"], dtype=float)
+    vr_actual = np.asarray(obs["vr_pct"], dtype=float)
+
+    gct_exp = expectations["gct_ms_exp"]
+    vo_exp = expectations["vo_cm_exp"]
+    vr_exp = expectations["vr_pct_exp"]
+    gct_delta_pct = ((gct_actual - gct_exp) / gct_exp) * 100.0
+    vo_delta_cm = vo_actual - vo_exp
+    vo_delta_pct = (vo_delta_cm / vo_exp) * 100.0
+    vr_delta_pct = ((vr_actual - vr_exp) / vr_exp) * 100.0
+
+    gct_sigma_pct = _sigma_pct_batch("gct", models["gct"], gct_exp)
+    vo_sigma_pct = _sigma_pct_batch("vo", models["vo"], vo_exp)
+    vr_sigma_pct = _sigma_pct_batch("vr", models["vr"], vr_exp)
+
+    gct_penalty = _compute_penalty_batch("gct", gct_delta_pct, gct_sigma_pct)
+    vo_penalty = _compute_penalty_batch("vo", vo_delta_pct, vo_sigma_pct)
+    vr_penalty = _compute_penalty_batch("vr", vr_delta_pct, vr_sigma_pct)
+
+    avg_penalty = (gct_penalty + vo_penalty + vr_penalty) / 3.0
+    adjustment = _compute_consistency_adjustment_batch(
+        gct_delta_pct, vo_delta_pct, vr_delta_pct
+    )
+
+    result = {
+        **expectations,
+        "gct_ms_actual": gct_actual,
+        "vo_cm_actual": vo_actual,
+        "vr_pct_actual": vr_actual,
+        "gct_delta_pct": gct_delta_pct,
+        "gct_sigma_pct": gct_sigma_pct,
+        "gct_penalty": gct_penalty,
+        "vo_delta_cm": vo_delta_cm,
+        "vo_delta_pct": vo_delta_pct,
+        "vo_sigma_pct": vo_sigma_pct,
+        "vo_penalty": vo_penalty,
+        "vr_delta_pct": vr_delta_pct,
+        "vr_sigma_pct": vr_sigma_pct,
+        "vr_penalty": vr_penalty,
+        "score": np.clip(100.0 - avg_penalty + adjustment, 0.0, 100.0),
+        "gct_needs_improvement": gct_penalty > 20.0,
+        "vo_needs_improvement": vo_penalty > 20.0,
+        "vr_needs_improvement": vr_penalty > 20.0,
+    }
+
+    # Cadence stays independent of the overall score (see score_observation).
+    cadence_exp = expectations.get("cadence_exp")
+    if cadence_exp is not None and obs.get("cadence") is not None:
+        cadence_actual = np.asarray(obs["cadence"], dtype=float)
+        cadence_delta_pct = ((cadence_actual - cadence_exp) / cadence_exp) * 100.0
+        cadence_sigma_pct = _sigma_pct_batch("cadence", models["cadence"], cadence_exp)
+        cadence_penalty = np.where(
+            np.isnan(cadence_actual),
+            np.nan,
+            _compute_penalty_batch("cadence", cadence_delta_pct, cadence_sigma_pct),
+        )
+        result["cadence_actual"] = cadence_actual
+        result["cadence_delta_pct"] = cadence_delta_pct
+        result["cadence_sigma_pct"] = cadence_sigma_pct
+        result["cadence_penalty"] = cadence_penalty
+        result["cadence_needs_improvement"] = cadence_penalty > 20.0
+
+    return result
+
+
+def compute_star_ratings_batch(penalty: npt.ArrayLike) -> dict[str, np.ndarray]:
+    """Vectorized :func:`compute_star_rating` over an array of penalties.
+
+    Returns:
+        ``star_rating`` (str array), ``score`` (float array) and ``category``
+        (str array), one entry per penalty.
+    """
+    bounds = np.array([upper for upper, _, _ in _STAR_BANDS])
+    scores = np.array([score for _, score, _ in _STAR_BANDS] + [_POOR_BAND[0]])
+    categories = np.array(
+        [category for _, _, category in _STAR_BANDS] + [_POOR_BAND[1]]
+    )
+    stars = np.array([_star_string(score) for score in scores])
+    # side="right": a penalty equal to a bound falls into the next band, as in
+    # the scalar ``penalty < upper`` test. NaN sorts last (1 star) in both.
+    band = np.searchsorted(bounds, np.asarray(penalty, dtype=float), side="right")
+    return {
+        "star_rating": stars[band],
+        "score": scores[band],
+        "category": categories[band],
+    }
@@ -4,10 +4,13 @@ from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from typing import Any, Literal
 
+import duckdb
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from sklearn.linear_model import HuberRegressor, RANSACRegressor
 
+from garmin_mcp.form_baseline.power_efficiency_model import PowerEfficiencyModel
 from garmin_mcp.form_baseline.split_filter import (
     running_split_params,
     running_split_sql,
@@ -54,6 +57,18 @@ class GCTPowerModel:
         """
         return float(np.exp((np.log(speed_mps) - self.alpha) / self.d))
 
+    def predict_batch(self, gct_ms: npt.ArrayLike) -> np.ndarray:
+        """Vectorized :meth:`predict` (speed in m/s per GCT value)."""
+        gct = np.asarray(gct_ms, dtype=float)
+        speeds: np.ndarray = np.exp(self.alpha + self.d * np.log(gct))
+        return speeds
+
+    def predict_inverse_batch(self, speed_mps: npt.ArrayLike) -> np.ndarray:
+        """Vectorized :meth:`predict_inverse` (expected GCT in ms per speed)."""
+        speeds = np.asarray(speed_mps, dtype=float)
+        gct: np.ndarray = np.exp((np.log(speeds) - self.alpha) / self.d)
+        return gct
+
 
 @dataclass
 class LinearModel:
@@ -89,6 +104,13 @@ class LinearModel:
             return self.a
         return self.a + self.b * speed_mps
 
+    def predict_batch(self, speed_mps: npt.ArrayLike) -> np.ndarray:
+        """Vectorized :meth:`predict` over an array of speeds."""
+        speeds = np.asarray(speed_mps, dtype=float)
+        if self.degenerate:
+            return np.full(speeds.shape, self.a)
+        return self.a + self.b * speeds
+
 
 def fit_gct_power(df: pd.DataFrame, fallback_ransac: bool = True) -> GCTPowerModel:
     """
@@ -239,12 +261,292 @@ def _linear_model_type(model: LinearModel) -> str:
     return "linear_flat" if model.degenerate else "linear"
 
 
+# Form metrics persisted per window. Power is best-effort and tracked apart.
+FORM_METRICS: tuple[str, ...] = ("gct", "vo", "vr", "cadence")
+
+_FORM_MODEL_UPSERT_SQL = """
+    INSERT INTO form_baseline_history (
+        history_id, user_id, condition_group, metric, model_type,
+        coef_alpha, coef_d, coef_a, coef_b,
+        period_start, period_end,
+        n_samples, rmse, speed_range_min, speed_range_max, population_hash
+    ) VALUES (nextval('form_baseline_history_seq'), ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (user_id, condition_group, metric, period_start, period_end)
+    DO UPDATE SET
+        model_type = EXCLUDED.model_type,
+        coef_alpha = EXCLUDED.coef_alpha,
+        coef_d = EXCLUDED.coef_d,
+        coef_a = EXCLUDED.coef_a,
+        coef_b = EXCLUDED.coef_b,
+        n_samples = EXCLUDED.n_samples,
+        rmse = EXCLUDED.rmse,
+        speed_range_min = EXCLUDED.speed_range_min,
+        speed_range_max = EXCLUDED.speed_range_max,
+        population_hash = EXCLUDED.population_hash,
+        trained_at = now()
+"""
+
+_POWER_MODEL_UPSERT_SQL = """
+    INSERT INTO form_baseline_history (
+        history_id,
+        user_id,
+        condition_group,
+        metric,
+        model_type,
+        period_start,
+        period_end,
+        n_samples,
+        power_a,
+        power_b,
+        power_rmse,
+        population_hash
+    ) VALUES (nextval('form_baseline_history_seq'), ?, ?, 'power', 'linear', ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (user_id, condition_group, metric, period_start, period_end)
+    DO UPDATE SET
+        model_type = EXCLUDED.model_type,
+        n_samples = EXCLUDED.n_samples,
+        power_a = EXCLUDED.power_a,
+        power_b = EXCLUDED.power_b,
+        power_rmse = EXCLUDED.power_rmse,
+        population_hash = EXCLUDED.population_hash
+"""
+
+
+def _parse_end_date(end_date: str | None) -> datetime:
+    """``end_date`` as a datetime (today when None)."""
+    if end_date is None:
+        return datetime.now()
+    return datetime.strptime(end_date, "%Y-%m-%d")
+
+
+def _window_bounds(end_date: str | None, window_months: int) -> tuple[str, str]:
+    """(period_start, period_end) of the form-metric window ending ``end_date``.
+
+    The window spans ``window_months`` calendar months inclusive of both ends
+    (e.g. 2026-02-01 .. 2026-03-31 for a 2-month window ending 2026-03-31).
+    """
+    from dateutil.relativedelta import relativedelta
+
+    end_dt = _parse_end_date(end_date)
+    start_dt = end_dt - relativedelta(months=window_months) + relativedelta(days=1)
+    return start_dt.strftime("%Y-%m-%d"), end_dt.strftime("%Y-%m-%d")
+
+
+def _power_window_bounds(end_date: str | None, window_months: int) -> tuple[str, str]:
+    """(period_start, period_end) of the power window (30-day months)."""
+    end_dt = _parse_end_date(end_date)
+    start_dt = end_dt - timedelta(days=window_months * 30)
+    return start_dt.strftime("%Y-%m-%d"), end_dt.strftime("%Y-%m-%d")
+
+
+def _load_form_samples(
+    conn: duckdb.DuckDBPyConnection, period_start: str, period_end: str
+) -> pd.DataFrame:
+    """Running splits with form metrics whose activity falls in the range.
+
+    Rows carry ``activity_date`` (ISO string) so one load can be sliced into
+    several windows, and are ordered so a slice matches a direct window load.
+    """
+    # The running-split predicate (walk breaks + GPS fragments) is shared with
+    # the evaluation side so the models are applied to the same population
+    # they were fitted on (#878); it drops 5-11 m manual-lap fragments whose
+    # pace is a measurement artifact and would otherwise invert the cadence
+    # slope (#873).
+    query = f"""
+        SELECT
+            CAST(a.activity_date AS VARCHAR) AS activity_date,
+            s.pace_seconds_per_km,
+            s.ground_contact_time,
+            s.vertical_oscillation,
+            s.vertical_ratio,
+            s.stride_length,
+            s.cadence
+        FROM splits s
+        JOIN activities a ON s.activity_id = a.activity_id
+        WHERE s.ground_contact_time IS NOT NULL
+          AND s.vertical_oscillation IS NOT NULL
+          AND s.vertical_ratio IS NOT NULL
+          AND a.activity_date >= ?
+          AND a.activity_date <= ?
+          AND {running_split_sql("s")}
+        ORDER BY a.activity_date, s.activity_id, 2, 3, 4, 5, 6, 7
+    """
+    return conn.execute(query, [period_start, period_end, *running_split_params()]).df()
+
+
+def _load_power_samples(
+    conn: duckdb.DuckDBPyConnection, period_start: str, period_end: str
+) -> pd.DataFrame:
+    """Run-phase splits with power and body weight in the range."""
+    return conn.execute(
+        """
+        SELECT
+            CAST(a.activity_date AS VARCHAR) AS activity_date,
+            s.grade_adjusted_speed AS speed_mps,
+            s.power AS power_w,
+            a.base_weight_kg
+        FROM splits s
+        JOIN activities a ON s.activity_id = a.activity_id
+        WHERE a.activity_date >= ?
+          AND a.activity_date <= ?
+          AND s.power IS NOT NULL
+          AND a.base_weight_kg IS NOT NULL
+          AND s.grade_adjusted_speed IS NOT NULL
+          AND s.role_phase = 'run'
+          AND s.grade_adjusted_speed > 1.5
+          AND s.grade_adjusted_speed < 7.0
+        ORDER BY a.activity_date, s.activity_id, 2, 3, 4
+        """,
+        [period_start, period_end],
+    ).df()
+
+
+def _fit_form_models(
+    df: pd.DataFrame, min_samples: int
+) -> dict[str, GCTPowerModel | LinearModel] | None:
+    """Clean one window's samples and fit the GCT/VO/VR/cadence models.
+
+    Args:
+        df: Rows from :func:`_load_form_samples` for the window.
+        min_samples: Minimum rows required before and after outlier removal.
+
+    Returns:
+        ``{metric: model}`` for :data:`FORM_METRICS`, or None when the window
+        has too few samples.
+
+    Raises:
+        ValueError: If a model cannot be fitted (e.g. non-monotonic GCT).
+    """
+    from garmin_mcp.form_baseline import utils
+
+    if len(df) < min_samples:
+        return None
+
+    df_clean = df.copy()
+    df_clean = utils.drop_outliers(df_clean, "ground_contact_time", (150.0, 350.0))
+    df_clean = utils.drop_outliers(df_clean, "vertical_oscillation", (5.0, 20.0))
+    df_clean = utils.drop_outliers(df_clean, "vertical_ratio", (4.0, 15.0))
+    df_clean = utils.drop_outliers(df_clean, "cadence", (140.0, 210.0))
+
+    if len(df_clean) < min_samples:
+        return None
+
+    # Add derived columns
+    df_clean["speed_mps"] = df_clean["pace_seconds_per_km"].apply(utils.to_speed)
+    df_clean["gct_ms"] = df_clean["ground_contact_time"]
+    df_clean["vo_value"] = df_clean["vertical_oscillation"]
+    df_clean["vr_value"] = df_clean["vertical_ratio"]
+    df_clean["cadence_value"] = df_clean["cadence"]
+
+    return {
+        "gct": fit_gct_power(df_clean),
+        "vo": fit_linear(df_clean, "vo"),
+        "vr": fit_linear(df_clean, "vr"),
+        "cadence": fit_linear(df_clean, "cadence"),
+    }
+
+
+def _fit_power_model(df: pd.DataFrame) -> tuple[PowerEfficiencyModel, int] | None:
+    """Fit the power efficiency model on rows from :func:`_load_power_samples`.
+
+    Returns:
+        ``(model, n_samples)``, or None with fewer than 10 usable rows.
+
+    Raises:
+        ValueError: If the model cannot be fitted (e.g. zero variance).
+    """
+    if len(df) < 10:
+        return None
+
+    # Convert to power_wkg and speeds
+    power_wkg_values = []
+    speeds = []
+    for speed_mps, power_w, base_weight_kg in df[
+        ["speed_mps", "power_w", "base_weight_kg"]
+    ].itertuples(index=False):
+        if pd.isna(power_w) or pd.isna(base_weight_kg) or base_weight_kg <= 0:
+            continue
+        power_wkg_values.append(float(power_w) / float(base_weight_kg))
+        speeds.append(float(speed_mps))
+
+    if len(power_wkg_values) < 10:
+        return None
+
+    model = PowerEfficiencyModel()
+    model.fit(power_wkg_values, speeds)
+    return model, len(power_wkg_values)
+
+
+def _upsert_form_model(
+    conn: duckdb.DuckDBPyConnection,
+    user_id: str,
+    condition_group: str,
+    metric: str,
+    model: GCTPowerModel | LinearModel,
+    period_start: str,
+    period_end: str,
+    population_hash: str | None,
+) -> None:
+    """Insert or replace one form-metric row of ``form_baseline_history``."""
+    if isinstance(model, GCTPowerModel):
+        model_type = "power"
+        coefs: list[float | None] = [model.alpha, model.d, None, None]
+    else:
+        model_type = _linear_model_type(model)
+        coefs = [None, None, model.a, model.b]
+    conn.execute(
+        _FORM_MODEL_UPSERT_SQL,
+        [
+            user_id,
+            condition_group,
+            metric,
+            model_type,
+            *coefs,
+            period_start,
+            period_end,
+            model.n_samples,
+            model.rmse,
+            model.speed_range[0],
+            model.speed_range[1],
+            population_hash,
+        ],
+    )
+
+
+def _upsert_power_model(
+    conn: duckdb.DuckDBPyConnection,
+    user_id: str,
+    condition_group: str,
+    model: PowerEfficiencyModel,
+    n_samples: int,
+    period_start: str,
+    period_end: str,
+    population_hash: str | None,
+) -> None:
+    """Insert or replace the power row of ``form_baseline_history``."""
+    conn.execute(
+        _POWER_MODEL_UPSERT_SQL,
+        [
+            user_id,
+            condition_group,
+            period_start,
+            period_end,
+            n_samples,
+            model.power_a,
+            model.power_b,
+            model.power_rmse,
+            population_hash,
+        ],
+    )
+
+
 def train_power_efficiency_baseline(
     user_id: str = "default",
     condition_group: str = "flat_road",
     end_date: str | None = None,
     window_months: int = 2,
     db_path: str | None = None,
+    population_hash: str | None = None,
 ) -> dict | None:
     """Train power efficiency baseline model.
 
@@ -256,6 +558,8 @@ def train_power_efficiency_baseline(
         end_date: End date (YYYY-MM-DD). If None, uses today
         window_months: Training window in months (default: 2)
         db_path: Database path. If None, uses GARMIN_DATA_DIR
+        population_hash: Split-population digest stored with the row (see
+            :mod:`garmin_mcp.form_baseline.incremental`)
 
     Returns:
         Dict with trained model or None if insufficient data
@@ -271,116 +575,43 @@ def train_power_efficiency_baseline(
     Raises:
         None - Returns None on errors instead of raising
     """
-    from datetime import datetime, timedelta
-
-    from garmin_mcp.form_baseline.power_efficiency_model import PowerEfficiencyModel
-
     # Get database path
     if db_path is None:
         from garmin_mcp.utils.paths import get_default_db_path
 
         db_path = get_default_db_path()
 
-    # Parse end_date
-    if end_date is None:
-        end_dt = datetime.now()
-    else:
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-
-    start_dt = end_dt - timedelta(days=window_months * 30)
-    period_start = start_dt.strftime("%Y-%m-%d")
-    period_end = end_dt.strftime("%Y-%m-%d")
+    period_start, period_end = _power_window_bounds(end_date, window_months)
 
     # Connect to database
     from garmin_mcp.database.connection import get_write_connection
 
     try:
         with get_write_connection(db_path) as conn:
-            # Query data
-            query = """
-                SELECT
-                    s.grade_adjusted_speed AS speed_mps,
-                    s.power AS power_w,
-                    a.base_weight_kg
-                FROM splits s
-                JOIN activities a ON s.activity_id = a.activity_id
-                WHERE a.activity_date >= ?
-                  AND a.activity_date <= ?
-                  AND s.power IS NOT NULL
-                  AND a.base_weight_kg IS NOT NULL
-                  AND s.grade_adjusted_speed IS NOT NULL
-                  AND s.role_phase = 'run'
-                  AND s.grade_adjusted_speed > 1.5
-                  AND s.grade_adjusted_speed < 7.0
-            """
-
-            result = conn.execute(query, [period_start, period_end]).fetchall()
-
-            if len(result) < 10:
+            fitted = _fit_power_model(
+                _load_power_samples(conn, period_start, period_end)
+            )
+            if fitted is None:
                 # Insufficient data
                 return None
-
-            # Convert to power_wkg and speeds
-            power_wkg_values = []
-            speeds = []
-
-            for row in result:
-                speed_mps, power_w, base_weight_kg = row
-                if power_w is None or base_weight_kg is None or base_weight_kg <= 0:
-                    continue
-                power_wkg = power_w / base_weight_kg
-                power_wkg_values.append(power_wkg)
-                speeds.append(speed_mps)
-
-            if len(power_wkg_values) < 10:
-                # Insufficient valid data
-                return None
-
-            # Fit model
-            model = PowerEfficiencyModel()
-            model.fit(power_wkg_values, speeds)
-
-            # Insert into form_baseline_history with UPSERT
-            conn.execute(
-                """
-                INSERT INTO form_baseline_history (
-                    history_id,
-                    user_id,
-                    condition_group,
-                    metric,
-                    model_type,
-                    period_start,
-                    period_end,
-                    n_samples,
-                    power_a,
-                    power_b,
-                    power_rmse
-                ) VALUES (nextval('form_baseline_history_seq'), ?, ?, 'power', 'linear', ?, ?, ?, ?, ?, ?)
-                ON CONFLICT (user_id, condition_group, metric, period_start, period_end)
-                DO UPDATE SET
-                    model_type = EXCLUDED.model_type,
-                    n_samples = EXCLUDED.n_samples,
-                    power_a = EXCLUDED.power_a,
-                    power_b = EXCLUDED.power_b,
-                    power_rmse = EXCLUDED.power_rmse
-                """,
-                [
-                    user_id,
-                    condition_group,
-                    period_start,
-                    period_end,
-                    len(power_wkg_values),
-                    model.power_a,
-                    model.power_b,
-                    model.power_rmse,
-                ],
+            model, n_samples = fitted
+
+            _upsert_power_model(
+                conn,
+                user_id,
+                condition_group,
+                model,
+                n_samples,
+                period_start,
+                period_end,
+                population_hash,
             )
 
             return {
                 "power_a": model.power_a,
                 "power_b": model.power_b,
                 "power_rmse": model.power_rmse,
-                "n_samples": len(power_wkg_values),
+                "n_samples": n_samples,
                 "period_start": period_start,
                 "period_end": period_end,
             }
@@ -407,11 +638,14 @@ def train_form_baselines(
     This is the single source of truth for batch form-baseline training. The
     ``train_form_baselines_weekly`` / ``train_form_baselines_monthly`` CLIs
     delegate here via ``_form_baseline_training.train_and_store_baseline``.
+    :mod:`garmin_mcp.form_baseline.incremental` shares its load / fit / upsert
+    helpers to refit many windows at once.
 
     GCT/VO/VR/cadence are always trained together from the same cleaned window.
     Power is best-effort: it depends on ``role_phase = 'run'`` splits with a
     non-null ``base_weight_kg``, so it can be legitimately absent for older
-    periods that lack those columns (this is not treated as a failure).
+    periods that lack those columns (this is not treated as a failure). Every
+    row records the window's ``population_hash``.
 
     Args:
         user_id: User identifier
@@ -438,9 +672,7 @@ def train_form_baselines(
     Raises:
         None - Returns None on errors instead of raising
     """
-    from dateutil.relativedelta import relativedelta
-
-    from garmin_mcp.form_baseline import utils
+    from garmin_mcp.form_baseline.incremental import window_population_hashes
 
     # Get database path
     if db_path is None:
@@ -448,243 +680,34 @@ def train_form_baselines(
 
         db_path = get_default_db_path()
 
-    # Parse end_date
-    if end_date is None:
-        end_dt = datetime.now()
-    else:
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-
-    # Calculate period_start: 2 months before (60 days)
-    start_dt = end_dt - relativedelta(months=window_months) + relativedelta(days=1)
-    period_start = start_dt.strftime("%Y-%m-%d")
-    period_end = end_dt.strftime("%Y-%m-%d")
+    period_start, period_end = _window_bounds(end_date, window_months)
 
     # Connect to database
     from garmin_mcp.database.connection import get_write_connection
 
     try:
         with get_write_connection(db_path) as conn:
-            # Query with date filter for 2-month window. The running-split
-            # predicate (walk breaks + GPS fragments) is shared with the
-            # evaluation side so the models are applied to the same population
-            # they were fitted on (#878); it drops 5-11 m manual-lap fragments
-            # whose pace is a measurement artifact and would otherwise invert
-            # the cadence slope (#873).
-            query = f"""
-            SELECT
-                s.pace_seconds_per_km,
-                s.ground_contact_time,
-                s.vertical_oscillation,
-                s.vertical_ratio,
-                s.stride_length,
-                s.cadence
-            FROM splits s
-            JOIN activities a ON s.activity_id = a.activity_id
-            WHERE s.ground_contact_time IS NOT NULL
-              AND s.vertical_oscillation IS NOT NULL
-              AND s.vertical_ratio IS NOT NULL
-              AND a.activity_date >= ?
-              AND a.activity_date <= ?
-              AND {running_split_sql("s")}
-        """
-
-            df = conn.execute(
-                query, [period_start, period_end, *running_split_params()]
-            ).df()
-
-            if len(df) < min_samples:
-                # Insufficient data
-                return None
-
-            # Preprocess data
-            df_clean = df.copy()
-            df_clean = utils.drop_outliers(
-                df_clean, "ground_contact_time", (150.0, 350.0)
+            models = _fit_form_models(
+                _load_form_samples(conn, period_start, period_end), min_samples
             )
-            df_clean = utils.drop_outliers(
-                df_clean, "vertical_oscillation", (5.0, 20.0)
-            )
-            df_clean = utils.drop_outliers(df_clean, "vertical_ratio", (4.0, 15.0))
-            df_clean = utils.drop_outliers(df_clean, "cadence", (140.0, 210.0))
-
-            if len(df_clean) < min_samples:
-                # Insufficient data after outlier removal
+            if models is None:
+                # Insufficient data (before or after outlier removal)
                 return None
 
-            # Add derived columns
-            df_clean["speed_mps"] = df_clean["pace_seconds_per_km"].apply(
-                utils.to_speed
-            )
-            df_clean["gct_ms"] = df_clean["ground_contact_time"]
-            df_clean["vo_value"] = df_clean["vertical_oscillation"]
-            df_clean["vr_value"] = df_clean["vertical_ratio"]
-            df_clean["cadence_value"] = df_clean["cadence"]
-
-            # Train GCT, VO, VR, cadence models
-            gct_model: GCTPowerModel = fit_gct_power(df_clean)
-            vo_model: LinearModel = fit_linear(df_clean, "vo")
-            vr_model: LinearModel = fit_linear(df_clean, "vr")
-            cadence_model: LinearModel = fit_linear(df_clean, "cadence")
-
-            # Insert GCT model
-            conn.execute(
-                """
-            INSERT INTO form_baseline_history (
-                history_id, user_id, condition_group, metric, model_type,
-                coef_alpha, coef_d, coef_a, coef_b,
-                period_start, period_end,
-                n_samples, rmse, speed_range_min, speed_range_max
-            ) VALUES (nextval('form_baseline_history_seq'), ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (user_id, condition_group, metric, period_start, period_end)
-            DO UPDATE SET
-                model_type = EXCLUDED.model_type,
-                coef_alpha = EXCLUDED.coef_alpha,
-                coef_d = EXCLUDED.coef_d,
-                coef_a = EXCLUDED.coef_a,
-                coef_b = EXCLUDED.coef_b,
-                n_samples = EXCLUDED.n_samples,
-                rmse = EXCLUDED.rmse,
-                speed_range_min = EXCLUDED.speed_range_min,
-                speed_range_max = EXCLUDED.speed_range_max,
-                trained_at = now()
-            """,
-                [
-                    user_id,
-                    condition_group,
-                    "gct",
-                    "power",
-                    gct_model.alpha,
-                    gct_model.d,
-                    None,
-                    None,
-                    period_start,
-                    period_end,
-                    gct_model.n_samples,
-                    gct_model.rmse,
-                    gct_model.speed_range[0],
-                    gct_model.speed_range[1],
-                ],
-            )
-
-            # Insert VO model
-            conn.execute(
-                """
-            INSERT INTO form_baseline_history (
-                history_id, user_id, condition_group, metric, model_type,
-                coef_alpha, coef_d, coef_a, coef_b,
-                period_start, period_end,
-                n_samples, rmse, speed_range_min, speed_range_max
-            ) VALUES (nextval('form_baseline_history_seq'), ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (user_id, condition_group, metric, period_start, period_end)
-            DO UPDATE SET
-                model_type = EXCLUDED.model_type,
-                coef_alpha = EXCLUDED.coef_alpha,
-                coef_d = EXCLUDED.coef_d,
-                coef_a = EXCLUDED.coef_a,
-                coef_b = EXCLUDED.coef_b,
-                n_samples = EXCLUDED.n_samples,
-                rmse = EXCLUDED.rmse,
-                speed_range_min = EXCLUDED.speed_range_min,
-                speed_range_max = EXCLUDED.speed_range_max,
-                trained_at = now()
-            """,
-                [
-                    user_id,
-                    condition_group,
-                    "vo",
-                    _linear_model_type(vo_model),
-                    None,
-                    None,
-                    vo_model.a,
-                    vo_model.b,
-                    period_start,
-                    period_end,
-                    vo_model.n_samples,
-                    vo_model.rmse,
-                    vo_model.speed_range[0],
-                    vo_model.speed_range[1],
-                ],
-            )
-
-            # Insert VR model
-            conn.execute(
-                """
-            INSERT INTO form_baseline_history (
-                history_id, user_id, condition_group, metric, model_type,
-                coef_alpha, coef_d, coef_a, coef_b,
-                period_start, period_end,
-                n_samples, rmse, speed_range_min, speed_range_max
-            ) VALUES (nextval('form_baseline_history_seq'), ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (user_id, condition_group, metric, period_start, period_end)
-            DO UPDATE SET
-                model_type = EXCLUDED.model_type,
-                coef_alpha = EXCLUDED.coef_alpha,
-                coef_d = EXCLUDED.coef_d,
-                coef_a = EXCLUDED.coef_a,
-                coef_b = EXCLUDED.coef_b,
-                n_samples = EXCLUDED.n_samples,
-                rmse = EXCLUDED.rmse,
-                speed_range_min = EXCLUDED.speed_range_min,
-                speed_range_max = EXCLUDED.speed_range_max,
-                trained_at = now()
-            """,
-                [
+            population_hash = window_population_hashes(
+                conn, [period_end], window_months
+            )[period_end]
+            for metric in FORM_METRICS:
+                _upsert_form_model(
+                    conn,
                     user_id,
                     condition_group,
-                    "vr",
-                    _linear_model_type(vr_model),
-                    None,
-                    None,
-                    vr_model.a,
-                    vr_model.b,
-                    period_start,
-                    period_end,
-                    vr_model.n_samples,
-                    vr_model.rmse,
-                    vr_model.speed_range[0],
-                    vr_model.speed_range[1],
-                ],
-            )
-
-            # Insert cadence model
-            conn.execute(
-                """
-            INSERT INTO form_baseline_history (
-                history_id, user_id, condition_group, metric, model_type,
-                coef_alpha, coef_d, coef_a, coef_b,
-                period_start, period_end,
-                n_samples, rmse, speed_range_min, speed_range_max
-            ) VALUES (nextval('form_baseline_history_seq'), ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (user_id, condition_group, metric, period_start, period_end)
-            DO UPDATE SET
-                model_type = EXCLUDED.model_type,
-                coef_alpha = EXCLUDED.coef_alpha,
-                coef_d = EXCLUDED.coef_d,
-                coef_a = EXCLUDED.coef_a,
-                coef_b = EXCLUDED.coef_b,
-                n_samples = EXCLUDED.n_samples,
-                rmse = EXCLUDED.rmse,
-                speed_range_min = EXCLUDED.speed_range_min,
-                speed_range_max = EXCLUDED.speed_range_max,
-                trained_at = now()
-            """,
-                [
-                    user_id,
-                    condition_group,
-                    "cadence",
-                    _linear_model_type(cadence_model),
-                    None,
-                    None,
-                    cadence_model.a,
-                    cadence_model.b,
+                    metric,
+                    models[metric],
                     period_start,
                     period_end,
-                    cadence_model.n_samples,
-                    cadence_model.rmse,
-                    cadence_model.speed_range[0],
-                    cadence_model.speed_range[1],
-                ],
-            )
+                    population_hash,
+                )
 
             # Train Power model
             power_result = train_power_efficiency_baseline(
@@ -693,36 +716,14 @@ def train_form_baselines(
                 end_date=period_end,
                 window_months=window_months,
                 db_path=db_path,
+                population_hash=population_hash,
             )
 
-            result = {
-                "gct": {
-                    "alpha": gct_model.alpha,
-                    "d": gct_model.d,
-                    "rmse": gct_model.rmse,
-                    "n_samples": gct_model.n_samples,
-                },
-                "vo": {
-                    "a": vo_model.a,
-                    "b": vo_model.b,
-                    "rmse": vo_model.rmse,
-                    "n_samples": vo_model.n_samples,
-                },
-                "vr": {
-                    "a": vr_model.a,
-                    "b": vr_model.b,
-                    "rmse": vr_model.rmse,
-                    "n_samples": vr_model.n_samples,
-                },
-                "cadence": {
-                    "a": cadence_model.a,
-                    "b": cadence_model.b,
-                    "rmse": cadence_model.rmse,
-                    "n_samples": cadence_model.n_samples,
-                },
-                "period_start": period_start,
-                "period_end": period_end,
+            result: dict[str, Any] = {
+                metric: _model_summary(models[metric]) for metric in FORM_METRICS
             }
+            result["period_start"] = period_start
+            result["period_end"] = period_end
 
             if power_result:
                 result["power"] = {
@@ -743,6 +744,23 @@ def train_form_baselines(
         return None
 
 
+def _model_summary(model: GCTPowerModel | LinearModel) -> dict[str, Any]:
+    """Coefficients / rmse / n_samples of a form model (result dict entry)."""
+    if isinstance(model, GCTPowerModel):
+        return {
+            "alpha": model.alpha,
+            "d": model.d,
+            "rmse": model.rmse,
+            "n_samples": model.n_samples,
+        }
+    return {
+        "a": model.a,
+        "b": model.b,
+        "rmse": model.rmse,
+        "n_samples": model.n_samples,
+    }
+
+
 def _month_end(d: date) -> date:
     """Return the last day of the month containing ``d`` (handles December)."""
     import calendar
@@ -770,11 +788,18 @@ def ensure_form_baselines_for_date(
     user_id: str = "default",
     condition_group: str = "flat_road",
 ) -> dict[str, list[str]]:
-    """Generate the form baseline for an activity's month + prior month if missing.
+    """Generate the form baseline for an activity's month + prior month if stale.
 
     Self-healing helper invoked from prefetch so that form-trend comparison is
     always available. Never raises: any error is swallowed and reflected in the
-    returned buckets. Each period is processed sequentially (single-writer).
+    returned buckets. Both periods go through
+    :func:`garmin_mcp.form_baseline.incremental.retrain_form_baselines`, so a
+    period is skipped only when all four form metrics (gct/vo/vr/cadence) are
+    stored with the window's current split ``population_hash``. A period with
+    only some metrics (e.g. gct created by an older batch run that predated
+    cadence support) or whose splits changed since its fit is re-trained.
+    power is best-effort and intentionally excluded from that check to avoid
+    re-training loops on periods where it is legitimately absent (#640).
 
     Args:
         activity_date: Activity date ("YYYY-MM-DD"). Determines target months.
@@ -786,7 +811,7 @@ def ensure_form_baselines_for_date(
         Dict with three buckets keyed by period_end ("YYYY-MM-DD"):
         ``{"generated": [...], "skipped": [...], "insufficient": [...]}``.
     """
-    from garmin_mcp.database.connection import get_connection
+    from garmin_mcp.form_baseline.incremental import retrain_form_baselines
 
     result: dict[str, list[str]] = {
         "generated": [],
@@ -799,50 +824,14 @@ def ensure_form_baselines_for_date(
     except Exception:
         return result
 
-    for period_end in period_ends:
-        # Existence check (read connection closed before any write).
-        # All four form metrics (gct/vo/vr/cadence) must be present; a period
-        # with only some metrics (e.g. gct created by an older batch run that
-        # predated cadence support) is treated as incomplete and re-trained.
-        # power is best-effort and intentionally excluded to avoid re-training
-        # loops on periods where it is legitimately absent (#640).
-        try:
-            with get_connection(db_path) as conn:
-                count_row = conn.execute(
-                    """
-                    SELECT COUNT(DISTINCT metric)
-                    FROM form_baseline_history
-                    WHERE period_end = ?
-                      AND metric IN ('gct', 'vo', 'vr', 'cadence')
-                      AND user_id = ?
-                      AND condition_group = ?
-                    """,
-                    [period_end, user_id, condition_group],
-                ).fetchone()
-            exists = count_row is not None and count_row[0] == 4
-        except Exception:
-            # If the existence check fails, skip this period defensively.
-            continue
-
-        if exists:
-            result["skipped"].append(period_end)
-            continue
-
-        # Missing -> train (train_form_baselines opens its own write connection).
-        try:
-            trained = train_form_baselines(
-                user_id=user_id,
-                condition_group=condition_group,
-                end_date=period_end,
-                window_months=2,
-                db_path=db_path,
-            )
-        except Exception:
-            trained = None
-
-        if trained is None:
-            result["insufficient"].append(period_end)
-        else:
-            result["generated"].append(period_end)
-
-    return result
+    try:
+        return retrain_form_baselines(
+            period_ends,
+            db_path=db_path,
+            user_id=user_id,
+            condition_group=condition_group,
+            window_months=2,
+        )
+    except Exception:
+        result["insufficient"] = period_ends
+        return result
@@ -2,6 +2,10 @@
 
 Thread-safe singleton pattern for Garmin API authentication.
 Credentials read from GARMIN_EMAIL and GARMIN_PASSWORD environment variables.
+
+Re-authentication after an expired session goes through
+:func:`reauthenticate`, which replaces the singleton only if it is still the
+instance the caller saw fail, so threads hitting the same 401 log in once.
 """
 
 import logging
@@ -42,46 +46,74 @@ def get_garmin_client() -> Garmin:
 
     with _lock:
         # Double-check after acquiring lock
-        if _client is not None:
-            return _client
-
-        email = os.getenv("GARMIN_EMAIL")
-        password = os.getenv("GARMIN_PASSWORD")
-
-        if not email or not password:
-            raise ValueError(
-                "Garmin credentials not found. "
-                "Set GARMIN_EMAIL and GARMIN_PASSWORD environment variables."
-            )
-
-        tokenstore = os.getenv("GARMINTOKENS", "~/.garth")
-        tokenstore_path = str(Path(tokenstore).expanduser().resolve())
-
-        client = Garmin(email, password)
-
-        try:
-            client.login(tokenstore_path)
-            logger.info(f"Garmin authentication via token cache ({tokenstore_path})")
-        except Exception as e:
-            logger.info(
-                f"Token login failed ({type(e).__name__}), "
-                f"authenticating with credentials as {email}"
-            )
-            client.login()
-            logger.info("Garmin credential authentication successful")
-
-        # Always save tokens (captures refreshed OAuth2 tokens too).
-        # garminconnect 0.3.x exposes the underlying auth client as
-        # ``Garmin.client`` (curl-cffi based); the legacy ``.garth`` attribute
-        # was removed. ``client.dump(path)`` persists the OAuth tokens.
-        client.client.dump(tokenstore_path)
-        logger.info(f"Garmin tokens saved to {tokenstore_path}")
-
-        _client = client
+        if _client is None:
+            _client = _login()
+        return _client
+
+
+def _login() -> Garmin:
+    """Authenticate a new client (caller holds ``_lock``)."""
+    email = os.getenv("GARMIN_EMAIL")
+    password = os.getenv("GARMIN_PASSWORD")
+
+    if not email or not password:
+        raise ValueError(
+            "Garmin credentials not found. "
+            "Set GARMIN_EMAIL and GARMIN_PASSWORD environment variables."
+        )
+
+    tokenstore = os.getenv("GARMINTOKENS", "~/.garth")
+    tokenstore_path = str(Path(tokenstore).expanduser().resolve())
+
+    client = Garmin(email, password)
+
+    try:
+        client.login(tokenstore_path)
+        logger.info(f"Garmin authentication via token cache ({tokenstore_path})")
+    except Exception as e:
+        logger.info(
+            f"Token login failed ({type(e).__name__}), "
+            f"authenticating with credentials as {email}"
+        )
+        client.login()
+        logger.info("Garmin credential authentication successful")
+
+    # Always save tokens (captures refreshed OAuth2 tokens too).
+    # garminconnect 0.3.x exposes the underlying auth client as
+    # ``Garmin.client`` (curl-cffi based); the legacy ``.garth`` attribute
+    # was removed. ``client.dump(path)`` persists the OAuth tokens.
+    client.client.dump(tokenstore_path)
+    logger.info(f"Garmin tokens saved to {tokenstore_path}")
+
+    return client
+
 
+def current_client() -> Garmin | None:
+    """Return the authenticated singleton without creating one."""
     return _client
 
 
+def reauthenticate(stale: Garmin | None) -> Garmin:
+    """Replace the expired client ``stale`` with a freshly authenticated one.
+
+    Serialized on the singleton lock: when several threads hit a 401 on the
+    same client, the first one logs in and the others find the singleton
+    already replaced and reuse the new client.
+
+    Args:
+        stale: The client the failed call used (``None`` if there was none).
+
+    Returns:
+        Authenticated Garmin client.
+    """
+    global _client
+    with _lock:
+        if _client is None or _client is stale:
+            _client = None
+            _client = _login()
+        return _client
+
+
 def reset_client() -> None:
     """Reset singleton client (for testing)."""
     global _client
@@ -0,0 +1,98 @@
+"""Collect cache-first per-day raw data over a date window.
+
+Shared by the wellness and weight range ingests. Both collectors read
+``{raw_dir}/{date}.json`` when it is cached and only call Garmin Connect on a
+miss, so the window is gathered in two passes:
+
+- days with a non-empty cache file are plain JSON reads and are loaded in
+  parallel threads;
+- the remaining days (no file, or an empty ``{}`` marker the collector may
+  re-fetch) run sequentially, sleeping ``throttle_seconds`` between actual
+  API calls to avoid rate limiting.
+
+The caller then writes all collected days in a single batch upsert.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+# Threads used to read cached day files.
+CACHE_READ_WORKERS = 8
+
+# A cache file no larger than this is the ``{}`` no-data marker.
+_EMPTY_MARKER_BYTES = 2
+
+DayCollector = Callable[[Path, str], dict[str, Any] | None]
+
+
+def _window_dates(start_date: str, end_date: str) -> list[str]:
+    """Every day in the inclusive window as ``YYYY-MM-DD``."""
+    start = date.fromisoformat(start_date)
+    end = date.fromisoformat(end_date)
+    return [
+        (start + timedelta(days=offset)).isoformat()
+        for offset in range((end - start).days + 1)
+    ]
+
+
+def collect_day_range(
+    raw_dir: Path,
+    start_date: str,
+    end_date: str,
+    collect: DayCollector,
+    throttle_seconds: float = 1.0,
+) -> tuple[list[str], dict[str, dict[str, Any]]]:
+    """Collect ``collect(raw_dir, date)`` for each day in the window.
+
+    Args:
+        raw_dir: Raw cache directory holding ``{date}.json`` files.
+        start_date: Inclusive window start (``YYYY-MM-DD``).
+        end_date: Inclusive window end (``YYYY-MM-DD``).
+        collect: Cache-first single-day collector.
+        throttle_seconds: Sleep between Garmin API calls (cache misses).
+
+    Returns:
+        ``(dates, data_by_date)``: every day of the window in order, and the
+        non-empty payloads keyed by date.
+    """
+    dates = _window_dates(start_date, end_date)
+    cached: list[str] = []
+    uncached: list[str] = []
+    for date_str in dates:
+        cache_file = raw_dir / f"{date_str}.json"
+        if cache_file.is_file() and cache_file.stat().st_size > _EMPTY_MARKER_BYTES:
+            cached.append(date_str)
+        else:
+            uncached.append(date_str)
+
+    collected: dict[str, dict[str, Any] | None] = {}
+    if cached:
+        workers = min(CACHE_READ_WORKERS, len(cached))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            payloads = executor.map(lambda d: collect(raw_dir, d), cached)
+            collected.update(zip(cached, payloads, strict=True))
+
+    pending_throttle = False
+    for date_str in uncached:
+        cache_hit = (raw_dir / f"{date_str}.json").exists()
+
+        # Throttle only between actual Garmin API calls (cache misses).
+        if pending_throttle and not cache_hit and throttle_seconds > 0:
+            time.sleep(throttle_seconds)
+
+        collected[date_str] = collect(raw_dir, date_str)
+        if not cache_hit:
+            pending_throttle = True
+
+    data_by_date: dict[str, dict[str, Any]] = {}
+    for date_str in dates:
+        payload = collected[date_str]
+        if payload:
+            data_by_date[date_str] = payload
+    return dates, data_by_date
@@ -41,6 +41,7 @@ def save_data(
     1. activities (parent table)
     2. splits, form_efficiency, heart_rate_zones, etc. (child tables)
     3. time_series_metrics (child table, optional)
+    4. workout_features, split_phase_stats (derived from the rows above)
 
     Single connection with explicit transaction batching.
 
@@ -130,6 +131,10 @@ def save_data(
             if should_insert_table("time_series_metrics", tables):
                 _insert_time_series(activity_id, conn, activity_dir)
 
+            # STEP 3: Refresh the derived similar-workout feature row and
+            # the split statistics
+            refresh_derived_rows([activity_id], conn)
+
             conn.execute("COMMIT")
 
         except Exception as e:
@@ -365,3 +370,53 @@ def _insert_time_series(activity_id: int, conn: Any, activity_dir: Path) -> None
             f"activity_details.json not found for activity {activity_id}, "
             "skipping time_series_metrics insertion"
         )
+
+
+def refresh_derived_rows(activity_ids: list[int], conn: Any) -> None:
+    """Refresh the workout_features and split_phase_stats rows of activities.
+
+    Runs at the end of ``save_data`` and after batched split regeneration,
+    inside the caller's transaction.
+    """
+    _refresh_workout_features(activity_ids, conn)
+    _refresh_split_phase_stats(activity_ids, conn)
+
+
+def _refresh_workout_features(activity_ids: list[int], conn: Any) -> None:
+    """Refresh the activities' workout_features rows (derived table).
+
+    Skipped when the table or one of its source tables does not exist yet
+    (database not migrated); a failing statement would abort the transaction.
+    """
+    from garmin_mcp.database.inserters.workout_features import (
+        refresh_workout_features,
+    )
+
+    row = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name IN "
+        "('workout_features', 'activities', 'splits', 'hr_efficiency')"
+    ).fetchone()
+    if row is None or row[0] != 4:
+        logger.debug("workout_features not available, skipping refresh")
+        return
+    refresh_workout_features(conn, activity_ids)
+
+
+def _refresh_split_phase_stats(activity_ids: list[int], conn: Any) -> None:
+    """Refresh the activities' split_phase_stats rows (derived table).
+
+    Skipped when the table or ``splits`` does not exist yet (database not
+    migrated); a failing statement would abort the transaction.
+    """
+    from garmin_mcp.database.inserters.split_phase_stats import (
+        refresh_split_phase_stats,
+    )
+
+    row = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name IN "
+        "('split_phase_stats', 'splits')"
+    ).fetchone()
+    if row is None or row[0] != 2:
+        logger.debug("split_phase_stats not available, skipping refresh")
+        return
+    refresh_split_phase_stats(conn, activity_ids)
@@ -8,18 +8,27 @@ Handles per-API file caching for Garmin Connect data:
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date as dt_date
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
 from typing import Any, Literal, cast
 
 from garmin_mcp.ingest.api_client import get_garmin_client
-from garmin_mcp.ingest.retry import call_with_retry
+from garmin_mcp.ingest.retry import RateLimiter, call_with_retry
 
 logger = logging.getLogger(__name__)
 
 FetchState = Literal["fetched", "cached", "marker", "failed"]
 
+# The four wellness endpoints are independent, so a cache-miss day fetches them
+# concurrently. All wellness fetches share one limiter that keeps call starts
+# at least WELLNESS_MIN_CALL_INTERVAL apart (no burst towards Garmin Connect).
+WELLNESS_FETCH_WORKERS = 4
+WELLNESS_MIN_CALL_INTERVAL = 0.1
+WELLNESS_RATE_LIMITER = RateLimiter(WELLNESS_MIN_CALL_INTERVAL)
+
 
 def _wellness_has_sleep(merged: dict[str, Any]) -> bool:
     """Return True when merged['sleep'] carries a real overnight sleep record.
@@ -739,7 +748,12 @@ def collect_body_composition_data(
 
 
 def collect_wellness_data(
-    wellness_raw_dir: Path, date: str, today: dt_date | None = None
+    wellness_raw_dir: Path,
+    date: str,
+    today: dt_date | None = None,
+    *,
+    max_workers: int = WELLNESS_FETCH_WORKERS,
+    rate_limiter: RateLimiter | None = None,
 ) -> dict[str, Any] | None:
     """Collect daily wellness data with a cache-first strategy.
 
@@ -757,14 +771,21 @@ def collect_wellness_data(
        least ``grace_days`` old relative to ``date`` (see
        ``_marker_is_authoritative``). A stale marker is re-fetched so a delayed
        Garmin sync can self-heal.
-    2. On a cache miss, call the four endpoints, merge their responses, and
-       cache the result. If every endpoint yields nothing, an empty marker is
-       written and ``None`` returned. API failures (exceptions) write no
-       marker, so the next run re-fetches.
+    2. On a cache miss, call the four endpoints (concurrently, on up to
+       ``max_workers`` threads, each call start gated by ``rate_limiter``),
+       merge their responses, and cache the result. If every endpoint yields
+       nothing, an empty marker is written and ``None`` returned. API failures
+       (exceptions) write no marker, so the next run re-fetches.
 
     Args:
         wellness_raw_dir: Wellness raw data directory.
         date: Date in ``YYYY-MM-DD`` format.
+        today: Current date for the current-day completeness gate (defaults
+            to :meth:`date.today`).
+        max_workers: Maximum endpoints fetched at the same time (``1`` is
+            sequential).
+        rate_limiter: Limiter spacing the endpoint calls (defaults to the
+            shared :data:`WELLNESS_RATE_LIMITER`).
 
     Returns:
         Merged wellness data dict (keys ``stats``, ``hrv``, ``sleep``,
@@ -794,23 +815,32 @@ def collect_wellness_data(
 
     logger.info(f"Fetching wellness data for {date} from Garmin Connect API")
     try:
-        client = get_garmin_client()
+        get_garmin_client()
+
+        limiter = rate_limiter if rate_limiter is not None else WELLNESS_RATE_LIMITER
+        endpoints: dict[str, str] = {
+            "stats": "get_stats",
+            "hrv": "get_hrv_data",
+            "sleep": "get_sleep_data",
+            "training_readiness": "get_training_readiness",
+        }
 
-        def _safe(call: Any) -> Any:
+        def _call(method: str, day: str) -> Any:
+            # Resolved per attempt: after a 401 the retry runs on the client
+            # that (one) thread re-authenticated, not on the expired one.
+            return getattr(get_garmin_client(), method)(day)
+
+        def _safe(method: str) -> Any:
             try:
-                return call()
+                return call_with_retry(limiter.limited(partial(_call, method)), date)
             except Exception as exc:  # noqa: BLE001
                 logger.warning(f"Wellness sub-fetch failed for {date}: {exc}")
                 return None
 
-        merged: dict[str, Any] = {
-            "stats": _safe(lambda: call_with_retry(client.get_stats, date)),
-            "hrv": _safe(lambda: call_with_retry(client.get_hrv_data, date)),
-            "sleep": _safe(lambda: call_with_retry(client.get_sleep_data, date)),
-            "training_readiness": _safe(
-                lambda: call_with_retry(client.get_training_readiness, date)
-            ),
-        }
+        workers = max(1, min(max_workers, len(endpoints)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_safe, endpoints.values()))
+        merged: dict[str, Any] = dict(zip(endpoints, results, strict=True))
 
         if is_current_day and not _wellness_has_sleep(merged):
             logger.info(
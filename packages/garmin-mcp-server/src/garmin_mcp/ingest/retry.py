@@ -11,19 +11,26 @@ Retry policy:
 
 - **429 / rate-limit** → exponential backoff (:func:`backoff_seconds`) with up to
   ``max_attempts`` total attempts, then the original exception is re-raised.
-- **401 / auth** → reset the singleton client and re-authenticate exactly once,
-  then retry the call one more time. A second auth failure propagates.
+- **401 / auth** → re-authenticate exactly once, then retry the call one more
+  time. A second auth failure propagates. The singleton is replaced only if it
+  is still the client the failed call used, so concurrent calls failing on the
+  same expired session log in once (:func:`reauthenticate`).
 - **Anything else** → re-raised immediately (no backoff, no sleep).
+
+:class:`RateLimiter` spaces the start of API calls issued concurrently from
+several threads (e.g. the wellness endpoint fan-out) so that parallel fetching
+does not turn into a request burst.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from collections.abc import Callable
 from typing import Any
 
-from garmin_mcp.ingest.api_client import get_garmin_client, reset_client
+from garmin_mcp.ingest.api_client import current_client, reauthenticate
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +107,55 @@ def jittered(throttle: float, jitter: float, rand: float) -> float:
     return low + (high - low) * rand
 
 
+class RateLimiter:
+    """Thread-safe minimum spacing between call starts.
+
+    Every :meth:`acquire` reserves the next free slot (at least
+    ``min_interval`` seconds after the previous one) under a lock and sleeps
+    outside it until the slot is reached, so threads sharing one limiter start
+    their calls in order and never closer together than ``min_interval``.
+
+    Args:
+        min_interval: Minimum seconds between two call starts (``<= 0``
+            disables spacing).
+        clock: Injectable monotonic clock (defaults to :func:`time.monotonic`).
+        sleep: Injectable sleep function (defaults to :func:`time.sleep`).
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        *,
+        clock: Callable[[], float] | None = None,
+        sleep: Callable[[float], None] | None = None,
+    ) -> None:
+        self.min_interval = min_interval
+        self._clock = clock if clock is not None else time.monotonic
+        self._sleep = sleep if sleep is not None else time.sleep
+        self._lock = threading.Lock()
+        self._next_slot = float("-inf")
+
+    def acquire(self) -> None:
+        """Block until this caller's slot is reached."""
+        if self.min_interval <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            self._sleep(slot - now)
+
+    def limited[T](self, fn: Callable[..., T]) -> Callable[..., T]:
+        """Wrap ``fn`` so that every invocation first acquires a slot."""
+
+        def _call(*args: Any, **kwargs: Any) -> T:
+            self.acquire()
+            return fn(*args, **kwargs)
+
+        return _call
+
+
 def call_with_retry[T](
     fn: Callable[..., T],
     *args: Any,
@@ -113,9 +169,12 @@ def call_with_retry[T](
     On a rate-limit (429) error the call is retried with exponential backoff
     (:func:`backoff_seconds`) up to ``max_attempts`` total attempts; once the
     budget is exhausted the original exception is re-raised. On an auth (401)
-    error the singleton Garmin client is reset and re-authenticated exactly
-    once, then the call is retried a single time. Any other exception is
-    re-raised immediately without sleeping.
+    error the singleton Garmin client is re-authenticated exactly once (unless
+    another thread already replaced the client this attempt used), then the
+    call is retried a single time. Any other exception is re-raised
+    immediately without sleeping. ``fn`` should resolve the client when called
+    (e.g. ``get_garmin_client().get_stats``) for the retry to use the new
+    session.
 
     Args:
         fn: The Garmin API callable to invoke.
@@ -137,6 +196,7 @@ def call_with_retry[T](
     rate_limit_attempt = 0
 
     while True:
+        client = current_client()
         try:
             return fn(*args, **kwargs)
         except Exception as exc:  # noqa: BLE001 - classify then re-raise
@@ -162,12 +222,8 @@ def call_with_retry[T](
                 do_sleep(delay)
                 continue
             if is_auth_error(exc) and not reauthed:
-                logger.warning(
-                    "call_with_retry: auth error, resetting client and "
-                    "re-authenticating"
-                )
+                logger.warning("call_with_retry: auth error, re-authenticating")
                 reauthed = True
-                reset_client()
-                get_garmin_client()
+                reauthenticate(client)
                 continue
             raise
@@ -10,6 +10,9 @@ are handled — unlike ``process_activity_by_date`` which raises on same-day
 duplicates).
 
 Garmin calls are throttled by sleeping ``throttle_seconds`` between activities.
+After ingest, stored form-baseline windows covering the new runs are refit when
+their split population changed
+(:func:`garmin_mcp.form_baseline.incremental.refresh_form_baselines_for_dates`).
 """
 
 from __future__ import annotations
@@ -49,6 +52,9 @@ def ingest_running_activities(
         typeKey whitelist; ``ingested`` counts runs newly fetched + saved;
         ``skipped_existing`` counts runs already present in ``activities``;
         ``activity_ids`` lists the newly ingested ids in discovery order.
+        When runs were ingested, ``form_baselines`` holds the refreshed
+        baseline windows (``generated`` / ``skipped`` / ``insufficient``) or
+        ``{"error": str}`` if the refresh failed.
     """
     resolved_path = str(get_db_path(db_path))
     # Ensure the schema (and activities table) exists before querying it.
@@ -61,6 +67,7 @@ def ingest_running_activities(
     ingested = 0
     skipped_existing = 0
     activity_ids: list[int] = []
+    ingested_dates: list[str] = []
 
     for activity in runs:
         activity_id = int(activity["activityId"])
@@ -76,13 +83,30 @@ def ingest_running_activities(
 
         ingested += 1
         activity_ids.append(activity_id)
+        ingested_dates.append(date)
 
-    return {
+    result: dict[str, Any] = {
         "discovered": len(runs),
         "ingested": ingested,
         "skipped_existing": skipped_existing,
         "activity_ids": activity_ids,
     }
+    if ingested_dates:
+        result["form_baselines"] = _refresh_form_baselines(
+            ingested_dates, resolved_path
+        )
+    return result
+
+
+def _refresh_form_baselines(dates: list[str], db_path: str) -> dict[str, Any]:
+    """Refit baseline windows covering ``dates``; failures never fail ingest."""
+    from garmin_mcp.form_baseline.incremental import refresh_form_baselines_for_dates
+
+    try:
+        return refresh_form_baselines_for_dates(dates, db_path=db_path)
+    except Exception as e:
+        logger.exception("form baseline refresh failed after running ingest")
+        return {"error": str(e)}
 
 
 def _is_running(activity: dict[str, Any]) -> bool:
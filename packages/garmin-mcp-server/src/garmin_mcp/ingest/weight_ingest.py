@@ -1,10 +1,11 @@
 """Weight (body composition) range ingest: fill missing days in a window.
 
-Iterates day-by-day over ``[start, end]`` and reuses the existing single-day,
+Collects every day of ``[start, end]`` with the existing single-day,
 cache-first collector :func:`collect_body_composition_data` (which reads
 ``raw/weight/{date}.json`` and only calls ``get_daily_weigh_ins`` on a cache
-miss). Each day with actual weight data is upserted into ``body_composition``
-via :meth:`GarminDBWriter.insert_body_composition` (issue #461).
+miss) via :func:`collect_day_range`, then upserts all days with actual weight
+data into ``body_composition`` in one transaction via
+:meth:`GarminDBWriter.insert_body_composition_batch` (issue #461).
 
 This is the catch-up primitive that backfills weight for arbitrary date ranges
 independently of activity ingest (which only fetches the day of each run).
@@ -13,12 +14,11 @@ independently of activity ingest (which only fetches the day of each run).
 from __future__ import annotations
 
 import logging
-import time
-from datetime import date, timedelta
 from typing import Any
 
 from garmin_mcp.database.connection import get_db_path
 from garmin_mcp.database.db_writer import GarminDBWriter
+from garmin_mcp.ingest.day_range import collect_day_range
 from garmin_mcp.ingest.raw_data_fetcher import collect_body_composition_data
 from garmin_mcp.utils.paths import get_weight_raw_dir
 
@@ -53,34 +53,15 @@ def ingest_weight_range(
     """
     resolved_path = str(get_db_path(db_path))
     writer = GarminDBWriter(db_path=resolved_path)
-    weight_raw_dir = get_weight_raw_dir()
 
-    start = date.fromisoformat(start_date)
-    end = date.fromisoformat(end_date)
-
-    dates: list[str] = []
-    with_data = 0
-    pending_throttle = False
-
-    current = start
-    while current <= end:
-        date_str = current.isoformat()
-        cache_hit = (weight_raw_dir / f"{date_str}.json").exists()
-
-        # Throttle only between actual Garmin API calls (cache misses).
-        if pending_throttle and not cache_hit and throttle_seconds > 0:
-            time.sleep(throttle_seconds)
-
-        raw_data = collect_body_composition_data(weight_raw_dir, date_str)
-
-        if raw_data and raw_data.get("dateWeightList"):
-            writer.insert_body_composition(date=date_str, weight_data=raw_data)
-            with_data += 1
-
-        dates.append(date_str)
-        if not cache_hit:
-            pending_throttle = True
-        current += timedelta(days=1)
+    dates, data_by_date = collect_day_range(
+        get_weight_raw_dir(),
+        start_date,
+        end_date,
+        collect_body_composition_data,
+        throttle_seconds=throttle_seconds,
+    )
+    with_data = writer.insert_body_composition_batch(data_by_date)
 
     logger.info(
         "ingest_weight_range %s..%s: %d days, %d with data",
@@ -1,11 +1,11 @@
 """Daily wellness range ingest: fill missing days in a window.
 
-Iterates day-by-day over ``[start, end]`` and reuses the single-day,
-cache-first collector :func:`collect_wellness_data` (which reads
+Collects every day of ``[start, end]`` with the single-day, cache-first
+collector :func:`collect_wellness_data` (which reads
 ``raw/wellness/{date}.json`` and only calls the four Garmin endpoints on a
-cache miss). Each day with actual wellness data is upserted into
-``daily_wellness`` via :meth:`GarminDBWriter.insert_daily_wellness` (issue
-#498).
+cache miss) via :func:`collect_day_range`, then upserts all days with actual
+wellness data into ``daily_wellness`` in one transaction via
+:meth:`GarminDBWriter.insert_daily_wellness_batch` (issue #498).
 
 This is the catch-up primitive that backfills RHR / HRV / sleep / training
 readiness / body battery / stress for arbitrary date ranges, independently of
@@ -15,12 +15,11 @@ activity ingest. It mirrors :mod:`garmin_mcp.ingest.weight_ingest`.
 from __future__ import annotations
 
 import logging
-import time
-from datetime import date, timedelta
 from typing import Any
 
 from garmin_mcp.database.connection import get_db_path
 from garmin_mcp.database.db_writer import GarminDBWriter
+from garmin_mcp.ingest.day_range import collect_day_range
 from garmin_mcp.ingest.raw_data_fetcher import collect_wellness_data
 from garmin_mcp.utils.paths import get_wellness_raw_dir
 
@@ -55,35 +54,15 @@ def ingest_wellness_range(
     """
     resolved_path = str(get_db_path(db_path))
     writer = GarminDBWriter(db_path=resolved_path)
-    wellness_raw_dir = get_wellness_raw_dir()
 
-    start = date.fromisoformat(start_date)
-    end = date.fromisoformat(end_date)
-
-    dates: list[str] = []
-    with_data = 0
-    pending_throttle = False
-
-    current = start
-    while current <= end:
-        date_str = current.isoformat()
-        cache_hit = (wellness_raw_dir / f"{date_str}.json").exists()
-
-        # Throttle only between actual Garmin API calls (cache misses).
-        if pending_throttle and not cache_hit and throttle_seconds > 0:
-            time.sleep(throttle_seconds)
-
-        raw_data = collect_wellness_data(wellness_raw_dir, date_str)
-
-        if raw_data and writer.insert_daily_wellness(
-            date=date_str, wellness_data=raw_data
-        ):
-            with_data += 1
-
-        dates.append(date_str)
-        if not cache_hit:
-            pending_throttle = True
-        current += timedelta(days=1)
+    dates, data_by_date = collect_day_range(
+        get_wellness_raw_dir(),
+        start_date,
+        end_date,
+        collect_wellness_data,
+        throttle_seconds=throttle_seconds,
+    )
+    with_data = writer.insert_daily_wellness_batch(data_by_date)
 
     logger.info(
         "ingest_wellness_range %s..%s: %d days, %d with data",
@@ -3,12 +3,23 @@
 This module provides functionality to load activity_details.json files from the
 data/raw/activity/{activity_id}/ directory and parse the metric descriptors and
 time series data.
+
+``load_activity_details`` materializes the whole file. Callers that only walk
+``activityDetailMetrics`` once should use ``load_metric_descriptors`` plus
+``iter_detail_metrics``, which stream the array in chunks so memory stays
+bounded for ultra-length activities.
 """
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+from garmin_mcp.utils.json_stream import iter_top_level_array, load_top_level_fields
+
+# Data points per chunk yielded by iter_detail_metrics.
+DETAIL_METRICS_CHUNK_SIZE = 4096
+
 
 class ActivityDetailsLoader:
     """Loads and parses Garmin activity_details.json files.
@@ -49,6 +60,53 @@ class ActivityDetailsLoader:
             FileNotFoundError: If the activity_details.json file doesn't exist.
             json.JSONDecodeError: If the JSON file is malformed.
         """
+        file_path = self._details_path(activity_id)
+        with open(file_path, encoding="utf-8") as f:
+            data: dict[str, Any] = json.load(f)
+            return data
+
+    def load_metric_descriptors(self, activity_id: int) -> list[dict[str, Any]]:
+        """Load only ``metricDescriptors`` (the metrics array is skipped).
+
+        Args:
+            activity_id: The Garmin activity ID.
+
+        Returns:
+            The ``metricDescriptors`` list.
+
+        Raises:
+            FileNotFoundError: If the activity_details.json file doesn't exist.
+            KeyError: If the file has no ``metricDescriptors``.
+            json.JSONDecodeError: If the JSON file is malformed.
+        """
+        fields = load_top_level_fields(
+            self._details_path(activity_id), {"metricDescriptors"}
+        )
+        descriptors: list[dict[str, Any]] = fields["metricDescriptors"]
+        return descriptors
+
+    def iter_detail_metrics(
+        self, activity_id: int, chunk_size: int = DETAIL_METRICS_CHUNK_SIZE
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Stream ``activityDetailMetrics`` in chunks of measurements.
+
+        Args:
+            activity_id: The Garmin activity ID.
+            chunk_size: Maximum measurements per yielded list.
+
+        Yields:
+            Lists of ``{"metrics": [...]}`` measurements in recording order.
+
+        Raises:
+            FileNotFoundError: If the activity_details.json file doesn't exist.
+            json.JSONDecodeError: If the JSON file is malformed.
+        """
+        yield from iter_top_level_array(
+            self._details_path(activity_id), "activityDetailMetrics", chunk_size
+        )
+
+    def _details_path(self, activity_id: int) -> Path:
+        """Path of raw/activity/{activity_id}/activity_details.json (must exist)."""
         # base_path from get_data_base_dir() already includes "data/"
         # For test fixtures, base_path is tmp_path which also includes "data/"
         file_path = (
@@ -63,10 +121,7 @@ class ActivityDetailsLoader:
             raise FileNotFoundError(
                 f"activity_details.json not found for activity {activity_id} at {file_path}"
             )
-
-        with open(file_path, encoding="utf-8") as f:
-            data: dict[str, Any] = json.load(f)
-            return data
+        return file_path
 
     def parse_metric_descriptors(
         self, metric_descriptors: list[dict[str, Any]]
@@ -3,12 +3,20 @@ Workout comparison tools for finding and analyzing similar past activities.
 
 This module provides tools to search for similar workouts based on pace and distance,
 calculate similarity scores, and generate performance comparison insights.
+
+Searches are served from the in-memory ``workout_features`` index
+(``similarity_index``) when the table is available, ranking the whole history
+in one vectorized pass; otherwise they fall back to the SQL range query.
 """
 
 import logging
 from typing import Any
 
 from garmin_mcp.database.db_reader import GarminDBReader
+from garmin_mcp.rag.queries.similarity_index import (
+    WorkoutSimilarityIndex,
+    get_index,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -123,6 +131,14 @@ class WorkoutComparator:
             logger.error(f"Error getting temperature for activity {activity_id}: {e}")
             return None
 
+    def _similarity_index(self) -> WorkoutSimilarityIndex | None:
+        """Synced ``workout_features`` index, or None when it is unavailable."""
+        try:
+            return get_index(self.db_reader.db_path, self.TRAINING_TYPE_SIMILARITY)
+        except Exception as e:
+            logger.debug(f"Similarity index unavailable, using SQL search: {e}")
+            return None
+
     def _execute_query(self, query: str, params: list[Any]):
         """Execute a database query and return all rows.
 
@@ -185,6 +201,19 @@ class WorkoutComparator:
                 ],
             }
         """
+        index = self._similarity_index()
+        if index is not None and index.row(activity_id) is not None:
+            return self._find_similar_indexed(
+                index,
+                activity_id,
+                pace_tolerance=pace_tolerance,
+                distance_tolerance=distance_tolerance,
+                activity_type_filter=activity_type_filter,
+                date_range=date_range,
+                limit=limit,
+                target_pace_override=target_pace_override,
+            )
+
         # Get target activity data
         target = self._get_target_activity(activity_id)
         if not target:
@@ -303,38 +332,12 @@ class WorkoutComparator:
                     candidate["activity_id"]
                 )
 
-                # Calculate similarity metrics
-                similarity_score = self._calculate_similarity_score(target, candidate)
-                pace_diff = candidate["avg_pace"] - target["avg_pace"]
-                hr_diff = (
-                    candidate["avg_heart_rate"] - target["avg_heart_rate"]
-                    if candidate["avg_heart_rate"] and target["avg_heart_rate"]
-                    else 0.0
-                )
-
-                # Calculate temperature difference
-                temp_diff = None
-                if (
-                    target["temperature"] is not None
-                    and candidate["temperature"] is not None
-                ):
-                    temp_diff = candidate["temperature"] - target["temperature"]
-
                 similar_activities.append(
-                    {
-                        "activity_id": candidate["activity_id"],
-                        "activity_date": candidate["activity_date"],
-                        "activity_name": candidate["activity_name"],
-                        "training_type": candidate["training_type"],
-                        "temperature": candidate["temperature"],
-                        "temperature_diff": temp_diff,
-                        "similarity_score": round(similarity_score, 1),
-                        "pace_diff": round(pace_diff, 1),
-                        "hr_diff": round(hr_diff, 1),
-                        "interpretation": self._generate_interpretation(
-                            pace_diff, hr_diff, temp_diff
-                        ),
-                    }
+                    self._similar_entry(
+                        target,
+                        candidate,
+                        self._calculate_similarity_score(target, candidate),
+                    )
                 )
 
             return {
@@ -349,6 +352,142 @@ class WorkoutComparator:
                 "similar_activities": [],
             }
 
+    def _find_similar_indexed(
+        self,
+        index: WorkoutSimilarityIndex,
+        activity_id: int,
+        *,
+        pace_tolerance: float,
+        distance_tolerance: float,
+        activity_type_filter: str | None,
+        date_range: tuple[str, str] | None,
+        limit: int,
+        target_pace_override: float | None,
+    ) -> dict[str, Any]:
+        """``find_similar_workouts`` served from the in-memory feature index."""
+        target_row = index.row(activity_id)
+        assert target_row is not None
+        target = self._comparison_fields(target_row)
+        target_pace = (
+            target_pace_override if target_pace_override else target["avg_pace"]
+        )
+        if target_pace is None:
+            return {"target_activity": target, "similar_activities": []}
+
+        matches = index.find_similar(
+            activity_id,
+            target_pace=target_pace,
+            pace_tolerance=pace_tolerance,
+            distance_tolerance=distance_tolerance,
+            use_main_set_pace=bool(target_pace_override),
+            name_filter=activity_type_filter,
+            date_range=date_range,
+            limit=limit,
+        )
+        return {
+            "target_activity": target,
+            "similar_activities": [
+                self._similar_entry(
+                    target, self._comparison_fields(match), match["similarity_score"]
+                )
+                for match in matches
+            ],
+        }
+
+    def find_nearest_workouts(
+        self, activity_ids: list[int], k: int = 10
+    ) -> dict[str, Any]:
+        """k nearest past workouts for several target activities at once.
+
+        Ranks the whole history by a weighted distance over normalized pace,
+        main-set pace, distance, elevation gain, HR and temperature plus the
+        training-type similarity matrix (see ``similarity_index``), for all
+        targets in one batch.
+
+        Args:
+            activity_ids: Target activity IDs
+            k: Neighbours to return per target
+
+        Returns:
+            {
+                "k": int,
+                "results": [
+                    {
+                        "activity_id": int,
+                        "neighbors": [
+                            {
+                                "activity_id": int,
+                                "activity_date": str,
+                                "activity_name": str,
+                                "training_type": str,
+                                "distance": float
+                            }
+                        ]
+                    }
+                ]
+            }
+            Targets missing from the index (or an unavailable index) get an
+            empty ``neighbors`` list.
+        """
+        index = self._similarity_index()
+        nearest = index.nearest(activity_ids, k) if index is not None else {}
+        return {
+            "k": k,
+            "results": [
+                {"activity_id": a, "neighbors": nearest.get(int(a), [])}
+                for a in activity_ids
+            ],
+        }
+
+    @staticmethod
+    def _comparison_fields(row: dict[str, Any]) -> dict[str, Any]:
+        """Map an index feature row onto the target/candidate dict shape."""
+        hr = row["avg_heart_rate"]
+        return {
+            "activity_id": row["activity_id"],
+            "activity_date": row["activity_date"],
+            "activity_name": row["activity_name"],
+            "avg_pace": row["avg_pace"],
+            "avg_heart_rate": int(hr) if hr is not None else None,
+            "distance_km": row["distance_km"],
+            "training_type": row["training_type"],
+            "temperature": row["temperature_c"],
+        }
+
+    def _similar_entry(
+        self,
+        target: dict[str, Any],
+        candidate: dict[str, Any],
+        similarity_score: float,
+    ) -> dict[str, Any]:
+        """Result entry for one candidate: score, diffs and interpretation."""
+        pace_diff = candidate["avg_pace"] - target["avg_pace"]
+        hr_diff = (
+            candidate["avg_heart_rate"] - target["avg_heart_rate"]
+            if candidate["avg_heart_rate"] and target["avg_heart_rate"]
+            else 0.0
+        )
+
+        # Calculate temperature difference
+        temp_diff = None
+        if target["temperature"] is not None and candidate["temperature"] is not None:
+            temp_diff = candidate["temperature"] - target["temperature"]
+
+        return {
+            "activity_id": candidate["activity_id"],
+            "activity_date": candidate["activity_date"],
+            "activity_name": candidate["activity_name"],
+            "training_type": candidate["training_type"],
+            "temperature": candidate["temperature"],
+            "temperature_diff": temp_diff,
+            "similarity_score": round(similarity_score, 1),
+            "pace_diff": round(pace_diff, 1),
+            "hr_diff": round(hr_diff, 1),
+            "interpretation": self._generate_interpretation(
+                pace_diff, hr_diff, temp_diff
+            ),
+        }
+
     def _get_target_activity(self, activity_id: int) -> dict[str, Any] | None:
         """Get target activity data from database.
 
@@ -12,6 +12,7 @@ Key features:
 - Recommendation generation
 """
 
+import itertools
 import statistics
 from pathlib import Path
 from typing import Any
@@ -512,17 +513,12 @@ class FormAnomalyDetector:
                 "directVerticalRatio",
             ]
 
-        # Load activity_details.json
-        activity_details = self.loader.load_activity_details(activity_id)
-
-        # Parse metric descriptors
+        # Parse metric descriptors (activity_details.json is streamed, not
+        # loaded whole: long hikes / ultras are hundreds of MB as objects)
         metric_map = self.loader.parse_metric_descriptors(
-            activity_details["metricDescriptors"]
+            self.loader.load_metric_descriptors(activity_id)
         )
 
-        # Extract time series for form metrics
-        metrics_data = activity_details["activityDetailMetrics"]
-
         # Initialize storage
         form_metrics: dict[str, list[float | None]] = {m: [] for m in metrics}
         elevation_series: list[float | None] = []
@@ -530,7 +526,10 @@ class FormAnomalyDetector:
         hr_series: list[float | None] = []
 
         # Extract all time series
-        for measurement in metrics_data:
+        measurements = itertools.chain.from_iterable(
+            self.loader.iter_detail_metrics(activity_id)
+        )
+        for measurement in measurements:
             values = measurement["metrics"]
 
             # Extract form metrics
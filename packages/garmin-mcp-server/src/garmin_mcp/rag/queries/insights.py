@@ -3,13 +3,49 @@
 This module provides the InsightExtractor class for searching and extracting
 insights from section analyses stored in DuckDB. Supports keyword-based search,
 pagination, and token limiting.
+
+Keyword matches are looked up in the ``section_analysis_terms`` inverted index
+(maintained by ``GarminDBWriter.insert_section_analysis``), so a search picks
+its page from the index and only parses the ``analysis_data`` of the rows it
+returns. Databases without the index, and keywords that are JSON paths rather
+than plain top-level keys, fall back to scanning ``analysis_data`` with
+``json_extract``.
 """
 
 import json
+import re
 from typing import Any
 
+import duckdb
+
 from garmin_mcp.database.db_reader import GarminDBReader
 
+# Keywords the term index can answer: plain top-level keys. Anything else
+# (e.g. ``evaluation.gct``) is a JSON path and goes through json_extract.
+_INDEXABLE_KEYWORD = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def _keyword_conditions(keywords: list[str]) -> str:
+    """OR of "keyword has a non-empty value" json_extract predicates."""
+    # Supports both array fields (key_strengths) and dict fields (efficiency).
+    conditions = [
+        f"(json_extract(analysis_data, '$.{keyword}') IS NOT NULL AND "
+        f"CAST(json_extract(analysis_data, '$.{keyword}') AS VARCHAR) NOT IN ('null', '[]', '{{}}', '\"\"'))"
+        for keyword in keywords
+    ]
+    return f"({' OR '.join(conditions)})"
+
+
+def _use_term_index(conn: duckdb.DuckDBPyConnection, keywords: list[str]) -> bool:
+    """Whether ``keywords`` can be answered from ``section_analysis_terms``."""
+    if not all(_INDEXABLE_KEYWORD.match(keyword) for keyword in keywords):
+        return False
+    row = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables "
+        "WHERE table_name = 'section_analysis_terms'"
+    ).fetchone()
+    return row is not None and row[0] > 0
+
 
 class InsightExtractor:
     """Extract insights from section analyses using keyword-based search.
@@ -69,42 +105,19 @@ class InsightExtractor:
         if not keywords:
             return []
 
-        # Build WHERE clause for keyword filtering
-        keyword_conditions = []
-        for keyword in keywords:
-            # Check if the keyword field exists and has a non-empty value.
-            # Supports both array fields (key_strengths) and dict fields (efficiency).
-            keyword_conditions.append(
-                f"(json_extract(analysis_data, '$.{keyword}') IS NOT NULL AND "
-                f"CAST(json_extract(analysis_data, '$.{keyword}') AS VARCHAR) NOT IN ('null', '[]', '{{}}', '\"\"'))"
-            )
-
-        where_clause = f"({' OR '.join(keyword_conditions)})"
-
-        # Add section type filter if specified
-        if section_types:
-            section_filter = ", ".join([f"'{st}'" for st in section_types])
-            where_clause += f" AND section_type IN ({section_filter})"
-
-        # Execute query
-        query = f"""
-            SELECT
-                activity_id,
-                activity_date,
-                section_type,
-                analysis_data
-            FROM section_analyses
-            WHERE {where_clause}
-            ORDER BY activity_date DESC, activity_id DESC, section_type
-            LIMIT {limit}
-            OFFSET {offset}
-        """
-
+        section_types = section_types or []
         try:
             from garmin_mcp.database.connection import get_connection
 
             with get_connection(self.db_reader.db_path) as conn:
-                results = conn.execute(query).fetchall()
+                if _use_term_index(conn, keywords):
+                    results = self._search_indexed(
+                        conn, keywords, section_types, limit, offset
+                    )
+                else:
+                    results = self._search_scan(
+                        conn, keywords, section_types, limit, offset
+                    )
         except Exception as e:
             import logging
 
@@ -161,19 +174,7 @@ class InsightExtractor:
         if not keywords:
             return {"insights": [], "total_tokens": 0, "truncated": False}
 
-        keyword_conditions = []
-        for keyword in keywords:
-            keyword_conditions.append(
-                f"(json_extract(analysis_data, '$.{keyword}') IS NOT NULL AND "
-                f"CAST(json_extract(analysis_data, '$.{keyword}') AS VARCHAR) NOT IN ('null', '[]', '{{}}', '\"\"'))"
-            )
-
-        where_clause = (
-            f"activity_id = {activity_id} AND ({' OR '.join(keyword_conditions)})"
-        )
-
-        # Execute query
-        query = f"""
+        query = """
             SELECT
                 activity_id,
                 activity_date,
@@ -181,14 +182,29 @@ class InsightExtractor:
                 analysis_data
             FROM section_analyses
             WHERE {where_clause}
-            ORDER BY section_type
+            ORDER BY section_type, analysis_id
         """
 
         try:
             from garmin_mcp.database.connection import get_connection
 
             with get_connection(self.db_reader.db_path) as conn:
-                results = conn.execute(query).fetchall()
+                if _use_term_index(conn, keywords):
+                    placeholders = ", ".join("?" * len(keywords))
+                    where_clause = (
+                        "analysis_id IN (SELECT analysis_id "
+                        "FROM section_analysis_terms "
+                        f"WHERE activity_id = ? AND term IN ({placeholders}))"
+                    )
+                    params: list[Any] = [activity_id, *keywords]
+                else:
+                    where_clause = (
+                        f"activity_id = ? AND {_keyword_conditions(keywords)}"
+                    )
+                    params = [activity_id]
+                results = conn.execute(
+                    query.format(where_clause=where_clause), params
+                ).fetchall()
         except Exception as e:
             import logging
 
@@ -237,6 +253,81 @@ class InsightExtractor:
             "truncated": truncated,
         }
 
+    def _search_indexed(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        keywords: list[str],
+        section_types: list[str],
+        limit: int,
+        offset: int,
+    ) -> list[tuple[Any, ...]]:
+        """Pick the page from ``section_analysis_terms``, then read its rows.
+
+        Terms whose analysis no longer exists are dropped before LIMIT /
+        OFFSET, so stale index rows never take a page slot.
+        """
+        term_placeholders = ", ".join("?" * len(keywords))
+        params: list[Any] = list(keywords)
+        section_filter = ""
+        if section_types:
+            section_filter = (
+                f"AND section_type IN ({', '.join('?' * len(section_types))})"
+            )
+            params.extend(section_types)
+        params.extend([limit, offset])
+
+        query = f"""
+            WITH hits AS (
+                SELECT DISTINCT analysis_id, activity_id, activity_date, section_type
+                FROM section_analysis_terms
+                WHERE term IN ({term_placeholders}) {section_filter}
+                    AND analysis_id IN (SELECT analysis_id FROM section_analyses)
+                ORDER BY activity_date DESC, activity_id DESC, section_type,
+                    analysis_id DESC
+                LIMIT ?
+                OFFSET ?
+            )
+            SELECT h.activity_id, h.activity_date, h.section_type, s.analysis_data
+            FROM hits h
+            JOIN section_analyses s ON s.analysis_id = h.analysis_id
+            ORDER BY h.activity_date DESC, h.activity_id DESC, h.section_type,
+                h.analysis_id DESC
+        """
+        return conn.execute(query, params).fetchall()
+
+    def _search_scan(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        keywords: list[str],
+        section_types: list[str],
+        limit: int,
+        offset: int,
+    ) -> list[tuple[Any, ...]]:
+        """Fallback search evaluating ``json_extract`` on every analysis."""
+        where_clause = _keyword_conditions(keywords)
+        params: list[Any] = []
+        if section_types:
+            where_clause += (
+                f" AND section_type IN ({', '.join('?' * len(section_types))})"
+            )
+            params.extend(section_types)
+        params.extend([limit, offset])
+
+        query = f"""
+            SELECT
+                activity_id,
+                activity_date,
+                section_type,
+                analysis_data
+            FROM section_analyses
+            WHERE {where_clause}
+            ORDER BY activity_date DESC, activity_id DESC, section_type,
+                analysis_id DESC
+            LIMIT ?
+            OFFSET ?
+        """
+        return conn.execute(query, params).fetchall()
+
     def _count_tokens(self, text: str) -> int:
         """Estimate token count for text.
 
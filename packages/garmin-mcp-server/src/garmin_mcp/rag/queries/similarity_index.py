@@ -0,0 +1,372 @@
+"""
+In-memory k-NN index over ``workout_features`` for similar-workout search.
+
+``WorkoutSimilarityIndex`` holds every activity's feature row as NumPy
+columns, so a similar-workout query ranks the whole history in one vectorized
+pass instead of a SQL range filter plus per-candidate lookups:
+
+- ``find_similar``: the ``find_similar_workouts`` contract (pace / distance
+  tolerance windows, name / date filters, pace-closeness order, 45/35/20
+  pace / distance / training-type score) evaluated as boolean masks
+- ``nearest``: k nearest neighbours of one or more target activities by a
+  weighted distance over z-scored numeric features plus the training-type
+  similarity matrix (targets x history in one broadcast)
+
+The index is kept per database in a module-level cache (``get_index``) and is
+synced on every lookup: rows whose ``revision`` is newer than the newest one
+held are upserted, and the index is reloaded only when rows were deleted.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Numeric feature columns (``workout_features`` column names), in matrix order.
+NUMERIC_FEATURES: tuple[str, ...] = (
+    "avg_pace",
+    "main_set_pace",
+    "distance_km",
+    "elevation_gain_m",
+    "avg_heart_rate",
+    "temperature_c",
+)
+
+# k-NN distance weights. Pace and distance dominate as in the comparator's
+# 45/35/20 score; training type keeps its 20% share.
+FEATURE_WEIGHTS: dict[str, float] = {
+    "avg_pace": 0.30,
+    "main_set_pace": 0.15,
+    "distance_km": 0.25,
+    "elevation_gain_m": 0.05,
+    "avg_heart_rate": 0.03,
+    "temperature_c": 0.02,
+}
+TRAINING_TYPE_WEIGHT = 0.20
+
+_SELECT_SQL = """
+    SELECT
+        activity_id, activity_date, activity_name, training_type, revision,
+        {numeric}
+    FROM workout_features
+"""
+
+
+class WorkoutSimilarityIndex:
+    """Column-oriented NumPy copy of ``workout_features``.
+
+    :meth:`sync` and the query methods hold the same re-entrant lock, so a
+    query never reads the column arrays while a sync is replacing them.
+
+    Args:
+        db_path: DuckDB database the index mirrors.
+        type_similarity: Symmetric training-type similarity matrix keyed by
+            sorted ``(type_a, type_b)`` tuples (unknown pairs score 0.3).
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        type_similarity: dict[tuple[str, str], float],
+    ) -> None:
+        self.db_path = str(db_path)
+        self._type_similarity = type_similarity
+        self._lock = threading.RLock()
+        self._clear()
+
+    def _clear(self) -> None:
+        self.activity_ids = np.empty(0, dtype=np.int64)
+        self.dates = np.empty(0, dtype="datetime64[D]")
+        self.names: list[str | None] = []
+        self.type_codes = np.empty(0, dtype=np.int64)
+        self.features = np.empty((0, len(NUMERIC_FEATURES)))
+        self._types: list[str] = []
+        self._type_code: dict[str, int] = {}
+        self._position: dict[int, int] = {}
+        self.revision = -1
+
+    def __len__(self) -> int:
+        return len(self.activity_ids)
+
+    # ------------------------------------------------------------------
+    # Synchronisation with workout_features
+    # ------------------------------------------------------------------
+
+    def sync(self) -> None:
+        """Bring the index up to date with ``workout_features``.
+
+        Reads ``count(*)`` / ``max(revision)`` first; only rows with a newer
+        revision are fetched. A row count that still differs afterwards means
+        rows were deleted, and the index is reloaded from scratch.
+        """
+        from garmin_mcp.database.connection import get_connection
+
+        with self._lock, get_connection(self.db_path) as conn:
+            count, max_revision = conn.execute(
+                "SELECT count(*), coalesce(max(revision), -1) FROM workout_features"
+            ).fetchone() or (0, -1)
+            if count == len(self) and max_revision == self.revision:
+                return
+
+            sql = _SELECT_SQL.format(numeric=", ".join(NUMERIC_FEATURES))
+            rows = conn.execute(sql + " WHERE revision > ?", [self.revision]).fetchall()
+            self._upsert(rows)
+            if len(self) != count:
+                logger.debug("workout_features rows deleted; reloading index")
+                self._clear()
+                self._upsert(conn.execute(sql).fetchall())
+
+    def _code(self, training_type: str) -> int:
+        key = (training_type or "unknown").lower()
+        if key not in self._type_code:
+            self._type_code[key] = len(self._types)
+            self._types.append(key)
+        return self._type_code[key]
+
+    def _upsert(self, rows: list[tuple[Any, ...]]) -> None:
+        if not rows:
+            return
+        ids = np.array([r[0] for r in rows], dtype=np.int64)
+        dates = np.array([str(r[1]) for r in rows], dtype="datetime64[D]")
+        codes = np.array([self._code(r[3]) for r in rows], dtype=np.int64)
+        features = np.array(
+            [[np.nan if v is None else float(v) for v in r[5:]] for r in rows],
+            dtype=float,
+        ).reshape(len(rows), len(NUMERIC_FEATURES))
+
+        existing = [self._position.get(int(i), -1) for i in ids]
+        new_mask = np.array([pos < 0 for pos in existing])
+        for row_idx, pos in enumerate(existing):
+            if pos >= 0:
+                self.dates[pos] = dates[row_idx]
+                self.names[pos] = rows[row_idx][2]
+                self.type_codes[pos] = codes[row_idx]
+                self.features[pos] = features[row_idx]
+
+        if new_mask.any():
+            start = len(self)
+            self.activity_ids = np.concatenate([self.activity_ids, ids[new_mask]])
+            self.dates = np.concatenate([self.dates, dates[new_mask]])
+            self.type_codes = np.concatenate([self.type_codes, codes[new_mask]])
+            self.features = np.vstack([self.features, features[new_mask]])
+            for offset, new_idx in enumerate(np.flatnonzero(new_mask).tolist()):
+                self.names.append(rows[new_idx][2])
+                self._position[int(ids[new_idx])] = start + offset
+
+        self.revision = max(self.revision, max(int(r[4]) for r in rows))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def row(self, activity_id: int) -> dict[str, Any] | None:
+        """Feature row of one activity (raw values, ``None`` for missing)."""
+        with self._lock:
+            pos = self._position.get(int(activity_id))
+            if pos is None:
+                return None
+            values = {
+                name: (None if np.isnan(v) else float(v))
+                for name, v in zip(NUMERIC_FEATURES, self.features[pos], strict=True)
+            }
+            return {
+                "activity_id": int(self.activity_ids[pos]),
+                "activity_date": str(self.dates[pos]),
+                "activity_name": self.names[pos],
+                "training_type": self._types[self.type_codes[pos]],
+                **values,
+            }
+
+    def _type_similarity_matrix(self) -> np.ndarray:
+        """``types x types`` similarity lookup built from the comparator matrix."""
+        n = len(self._types)
+        matrix = np.full((n, n), 0.3)
+        for i, a in enumerate(self._types):
+            for j, b in enumerate(self._types):
+                key = (a, b) if a <= b else (b, a)
+                matrix[i, j] = self._type_similarity.get(key, 0.3)
+        return matrix
+
+    def _column(self, name: str) -> np.ndarray:
+        return self.features[:, NUMERIC_FEATURES.index(name)]
+
+    def find_similar(
+        self,
+        activity_id: int,
+        *,
+        target_pace: float,
+        pace_tolerance: float,
+        distance_tolerance: float,
+        use_main_set_pace: bool = False,
+        name_filter: str | None = None,
+        date_range: tuple[str, str] | None = None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """Candidates within the tolerance windows, closest pace first.
+
+        Mirrors the SQL contract of ``find_similar_workouts``: the pace window
+        applies to ``main_set_pace`` when ``use_main_set_pace`` (activities
+        without a main set are excluded) and to ``avg_pace`` otherwise; results
+        are ordered by absolute pace difference, then newest first.
+
+        Returns:
+            Up to ``limit`` feature rows (see :meth:`row`) plus
+            ``similarity_score`` (0-100, unrounded).
+        """
+        with self._lock:
+            target = self.row(activity_id)
+            if target is None or not len(self):
+                return []
+
+            pace = self._column("main_set_pace" if use_main_set_pace else "avg_pace")
+            distance = self._column("distance_km")
+            target_distance = target["distance_km"]
+            if target_distance is None or target["avg_pace"] is None:
+                return []
+
+            with np.errstate(invalid="ignore"):
+                mask = (
+                    (self.activity_ids != activity_id)
+                    & (pace >= target_pace * (1 - pace_tolerance))
+                    & (pace <= target_pace * (1 + pace_tolerance))
+                    & (distance >= target_distance * (1 - distance_tolerance))
+                    & (distance <= target_distance * (1 + distance_tolerance))
+                    & ~np.isnan(self._column("avg_pace"))
+                )
+            if name_filter:
+                mask &= np.array([name_filter in (n or "") for n in self.names])
+            if date_range:
+                start, end = (np.datetime64(d, "D") for d in date_range)
+                mask &= (self.dates >= start) & (self.dates <= end)
+
+            candidates = np.flatnonzero(mask)
+            if not len(candidates):
+                return []
+            # lexsort: the last key is primary -> pace closeness, then newest date.
+            order = np.lexsort(
+                (
+                    -self.activity_ids[candidates],
+                    -self.dates[candidates].astype(np.int64),
+                    np.abs(pace[candidates] - target_pace),
+                )
+            )
+            top = candidates[order[:limit]]
+
+            scores = self._scores(target, top)
+            results = []
+            for pos, score in zip(top, scores, strict=True):
+                item = self.row(int(self.activity_ids[pos]))
+                assert item is not None
+                item["similarity_score"] = float(score)
+                results.append(item)
+            return results
+
+    def _scores(self, target: dict[str, Any], positions: np.ndarray) -> np.ndarray:
+        """Comparator score (pace 45% / distance 35% / type 20%), clamped."""
+        pace = self._column("avg_pace")[positions]
+        distance = self._column("distance_km")[positions]
+        pace_similarity = 1 - np.abs(pace - target["avg_pace"]) / target["avg_pace"]
+        distance_similarity = (
+            1 - np.abs(distance - target["distance_km"]) / target["distance_km"]
+        )
+        type_matrix = self._type_similarity_matrix()
+        type_similarity = type_matrix[
+            self._type_code[target["training_type"]], self.type_codes[positions]
+        ]
+        score = (
+            pace_similarity * 0.45 + distance_similarity * 0.35 + type_similarity * 0.20
+        ) * 100
+        clamped: np.ndarray = np.clip(score, 0.0, 100.0)
+        return clamped
+
+    def nearest(
+        self, activity_ids: list[int], k: int = 10
+    ) -> dict[int, list[dict[str, Any]]]:
+        """k nearest neighbours of each target by weighted feature distance.
+
+        Numeric features are z-scored over the whole history; a feature
+        missing on either side is left out of that pair's distance and the
+        remaining weights are rescaled. The training-type term is
+        ``1 - similarity`` from the comparator matrix.
+
+        Args:
+            activity_ids: Target activities (unknown ids map to ``[]``).
+            k: Neighbours per target.
+
+        Returns:
+            ``{target_id: [{activity_id, activity_date, activity_name,
+            training_type, distance}, ...]}`` ordered nearest first; a target
+            is never its own neighbour.
+        """
+        with self._lock:
+            results: dict[int, list[dict[str, Any]]] = {}
+            known = [a for a in activity_ids if int(a) in self._position]
+            for a in activity_ids:
+                results[int(a)] = []
+            if not known or len(self) < 2:
+                return results
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mean = np.nanmean(self.features, axis=0)
+                std = np.nanstd(self.features, axis=0)
+            std = np.where((std > 0) & np.isfinite(std), std, 1.0)
+            z = (self.features - mean) / std
+            weights = np.array([FEATURE_WEIGHTS[name] for name in NUMERIC_FEATURES])
+
+            targets = np.array([self._position[int(a)] for a in known])
+            diff = z[targets][:, None, :] - z[None, :, :]  # (T, N, F)
+            present = ~np.isnan(diff)
+            sq = np.where(present, diff * diff, 0.0)
+            used = (present * weights).sum(axis=2)
+            numeric = (sq * weights).sum(axis=2) * np.divide(
+                weights.sum(), used, out=np.zeros_like(used), where=used > 0
+            )
+            type_matrix = self._type_similarity_matrix()
+            type_term = 1.0 - type_matrix[self.type_codes[targets]][:, self.type_codes]
+            dist = np.sqrt(numeric + TRAINING_TYPE_WEIGHT * type_term)
+            dist[np.arange(len(targets)), targets] = np.inf
+
+            k = min(k, len(self) - 1)
+            top = np.argpartition(dist, k - 1, axis=1)[:, :k]
+            for row_idx, target_id in enumerate(known):
+                ranked = top[row_idx][np.argsort(dist[row_idx, top[row_idx]])]
+                results[int(target_id)] = [
+                    {
+                        "activity_id": int(self.activity_ids[pos]),
+                        "activity_date": str(self.dates[pos]),
+                        "activity_name": self.names[pos],
+                        "training_type": self._types[self.type_codes[pos]],
+                        "distance": round(float(dist[row_idx, pos]), 4),
+                    }
+                    for pos in ranked
+                ]
+            return results
+
+
+_INDEXES: dict[str, WorkoutSimilarityIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_index(
+    db_path: str | Path,
+    type_similarity: dict[tuple[str, str], float],
+) -> WorkoutSimilarityIndex:
+    """Return the synced, process-wide index for ``db_path``.
+
+    Raises:
+        duckdb.Error: If the database or ``workout_features`` is unavailable.
+    """
+    key = str(Path(db_path).resolve())
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = WorkoutSimilarityIndex(db_path, type_similarity)
+            _INDEXES[key] = index
+    index.sync()
+    return index
@@ -295,6 +295,9 @@ class TimeSeriesDetailExtractor:
     def _is_in_duckdb(self, activity_id: int) -> bool:
         """Check if activity data exists in DuckDB.
 
+        Looks the activity up in the ``time_series_offsets`` catalog; databases
+        that predate the catalog fall back to counting raw rows.
+
         Args:
             activity_id: Activity ID to check.
 
@@ -302,20 +305,31 @@ class TimeSeriesDetailExtractor:
             True if activity data exists in time_series_metrics table.
         """
         try:
+            import duckdb
+
             from garmin_mcp.database.connection import get_connection
             from garmin_mcp.database.db_reader import GarminDBReader
 
             db_reader = GarminDBReader()
             with get_connection(db_reader.db_path) as conn:
-                result = conn.execute(
-                    """
-                    SELECT COUNT(*)
-                    FROM time_series_metrics
-                    WHERE activity_id = ?
-                    LIMIT 1
-                    """,
-                    [activity_id],
-                ).fetchone()
+                try:
+                    result = conn.execute(
+                        """
+                        SELECT sample_count
+                        FROM time_series_offsets
+                        WHERE activity_id = ?
+                        """,
+                        [activity_id],
+                    ).fetchone()
+                except duckdb.CatalogException:
+                    result = conn.execute(
+                        """
+                        SELECT COUNT(*)
+                        FROM time_series_metrics
+                        WHERE activity_id = ?
+                        """,
+                        [activity_id],
+                    ).fetchone()
 
             return result[0] > 0 if result else False
         except Exception:
@@ -17,6 +17,9 @@ Examples:
 
     # Dry run to see what would be executed
     uv run python -m garmin_mcp.scripts.backfill_baseline_history.py --start-date 2023-01 --dry-run
+
+    # In-process: refit only months whose split population changed, 4 fit threads
+    uv run python -m garmin_mcp.scripts.backfill_baseline_history.py --start-date 2025-01 --incremental --workers 4
 """
 
 import argparse
@@ -24,6 +27,7 @@ import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from dateutil.relativedelta import relativedelta
 
@@ -140,6 +144,45 @@ def train_month(
         return False
 
 
+def month_end(year_month: str) -> str:
+    """Return the last day of a YYYY-MM month as YYYY-MM-DD."""
+    end: datetime = parse_year_month(year_month) + relativedelta(months=1, days=-1)
+    return end.strftime("%Y-%m-%d")
+
+
+def train_incremental(
+    months: list[str],
+    db_path: str,
+    condition_group: str,
+    min_samples: int,
+    workers: int,
+    force: bool,
+) -> dict[str, Any]:
+    """Train all months in-process, refitting only windows whose data changed.
+
+    Args:
+        months: Months in YYYY-MM format
+        db_path: Path to DuckDB database
+        condition_group: Condition group name
+        min_samples: Minimum number of samples required
+        workers: Threads fitting windows concurrently
+        force: Refit every month even when its split population is unchanged
+
+    Returns:
+        ``{"generated", "skipped", "insufficient"}`` lists of period ends
+    """
+    from garmin_mcp.form_baseline.incremental import retrain_form_baselines
+
+    return retrain_form_baselines(
+        [month_end(m) for m in months],
+        db_path=db_path,
+        condition_group=condition_group,
+        min_samples=min_samples,
+        max_workers=workers,
+        force=force,
+    )
+
+
 def main() -> int:
     """Main entry point for backfill script."""
     parser = argparse.ArgumentParser(
@@ -185,6 +228,22 @@ def main() -> int:
         action="store_true",
         help="Continue processing even if some months fail",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Train in-process, skipping months whose split population is unchanged",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Fit threads for --incremental (default: 4)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="With --incremental, refit every month",
+    )
 
     args = parser.parse_args()
 
@@ -230,6 +289,28 @@ def main() -> int:
         print("[DRY RUN MODE - No actual training will occur]")
     print()
 
+    if args.incremental and not args.dry_run:
+        try:
+            result = train_incremental(
+                months,
+                db_path=args.db_path,
+                condition_group=args.condition,
+                min_samples=args.min_samples,
+                workers=args.workers,
+                force=args.force,
+            )
+        except Exception as e:
+            print(f"✗ Incremental training failed: {e}", file=sys.stderr)
+            return 1
+        print("=" * 50)
+        print("Backfill Summary:")
+        print(f"  Total months: {len(months)}")
+        print(f"  Trained: {len(result['generated'])}")
+        print(f"  Unchanged: {len(result['skipped'])}")
+        print(f"  Insufficient data: {len(result['insufficient'])}")
+        print("=" * 50)
+        return 0
+
     # Train each month
     success_count = 0
     fail_count = 0
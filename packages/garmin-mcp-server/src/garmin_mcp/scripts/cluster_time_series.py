@@ -0,0 +1,186 @@
+"""Periodic clustering job for ``time_series_metrics``.
+
+The inserter replaces an activity's rows with DELETE + INSERT, so re-ingested
+and back-filled activities are appended at the end of the table in ingest
+order, and deleted rows leave gaps until a checkpoint vacuums them. Row-group
+zone maps on ``activity_id`` then overlap and per-activity reads touch more
+row groups than the activity actually occupies.
+
+This job measures the layout of the live table, and when any activity is
+scattered (its ``rowid`` range holds foreign rows)
+or the activities are out of ``activity_id`` order, rewrites the table in
+``(activity_id, seq_no)`` order and swaps it in. Either way it then rebuilds
+the ``time_series_offsets`` catalog. A clustered table is not rewritten unless
+``--force`` is given; ``--dry-run`` only reports and writes nothing.
+
+Run it from the same cron job / systemd timer as ``scheduled_sync`` (e.g.
+weekly); it holds the write lock for the duration of the rewrite.
+
+Usage::
+
+    uv run --directory packages/garmin-mcp-server \
+      python -m garmin_mcp.scripts.cluster_time_series
+
+    # Report fragmentation only (read-only)
+    uv run python -m garmin_mcp.scripts.cluster_time_series --dry-run
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+from typing import Any
+
+import duckdb
+
+from garmin_mcp.database.connection import (
+    get_connection,
+    get_db_path,
+    get_write_connection,
+)
+from garmin_mcp.database.inserters.time_series_offsets import (
+    live_time_series_offsets_sql,
+    rebuild_all_time_series_offsets,
+)
+from garmin_mcp.database.migrations.runner import ensure_schema_current
+from garmin_mcp.database.time_series_layout import (
+    TIME_SERIES_METRICS,
+    time_series_metrics_ddl,
+)
+
+logger = logging.getLogger(__name__)
+
+_CLUSTERED_TABLE = "time_series_metrics_clustered"
+
+
+def assess_time_series_clustering(conn: duckdb.DuckDBPyConnection) -> dict[str, Any]:
+    """Measure how clustered ``time_series_metrics`` is.
+
+    Reads the row positions from the live table; neither the table nor the
+    ``time_series_offsets`` catalog is written.
+
+    Args:
+        conn: DuckDB connection (read-only is enough).
+
+    Returns:
+        ``{"activities", "rows", "row_groups", "scattered_activities",
+        "out_of_order_activities", "needs_clustering"}``.
+    """
+    row = conn.execute(f"""
+        WITH offsets AS ({live_time_series_offsets_sql()}),
+        ordered AS (
+            SELECT
+                sample_count,
+                last_row - first_row + 1 > sample_count AS scattered,
+                first_row < LAG(last_row) OVER (ORDER BY activity_id)
+                    AS out_of_order,
+                last_row_group
+            FROM offsets
+        )
+        SELECT
+            COUNT(*),
+            COALESCE(SUM(sample_count), 0),
+            COALESCE(MAX(last_row_group) + 1, 0),
+            COUNT(*) FILTER (WHERE scattered),
+            COUNT(*) FILTER (WHERE out_of_order)
+        FROM ordered
+    """).fetchone()
+    assert row is not None
+    activities, rows, row_groups, scattered, out_of_order = (int(v) for v in row)
+    return {
+        "activities": activities,
+        "rows": rows,
+        "row_groups": row_groups,
+        "scattered_activities": scattered,
+        "out_of_order_activities": out_of_order,
+        "needs_clustering": scattered > 0 or out_of_order > 0,
+    }
+
+
+def cluster_time_series_metrics(
+    conn: duckdb.DuckDBPyConnection,
+    force: bool = False,
+) -> dict[str, Any]:
+    """Rewrite ``time_series_metrics`` in activity order when it is fragmented.
+
+    The stored columns are copied as-is into a fresh table built
+    from :func:`time_series_metrics_ddl`, so no value is re-encoded; rollups
+    are keyed by activity and stay valid.
+
+    Args:
+        conn: DuckDB connection (write access).
+        force: Rewrite even when the table is already clustered.
+
+    Returns:
+        The assessment from :func:`assess_time_series_clustering` taken before
+        the rewrite, plus ``"clustered"`` (whether the table was rewritten).
+    """
+    assessment = assess_time_series_clustering(conn)
+    if not (force or assessment["needs_clustering"]):
+        rebuild_all_time_series_offsets(conn)
+        return {**assessment, "clustered": False}
+
+    columns = ", ".join(["activity_id", "seq_no", "timestamp_s", *TIME_SERIES_METRICS])
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        conn.execute(f"DROP TABLE IF EXISTS {_CLUSTERED_TABLE}")
+        conn.execute(time_series_metrics_ddl(_CLUSTERED_TABLE))
+        conn.execute(f"""
+            INSERT INTO {_CLUSTERED_TABLE} ({columns})
+            SELECT {columns}
+            FROM time_series_metrics
+            ORDER BY activity_id, seq_no
+        """)
+        conn.execute("DROP TABLE time_series_metrics")
+        conn.execute(f"ALTER TABLE {_CLUSTERED_TABLE} RENAME TO time_series_metrics")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    # Reclaim the old table's blocks now rather than at the next checkpoint,
+    # then record the committed row positions.
+    conn.execute("CHECKPOINT")
+    rebuild_all_time_series_offsets(conn)
+    logger.info(
+        "Clustered time_series_metrics: %d rows, %d activities",
+        assessment["rows"],
+        assessment["activities"],
+    )
+    return {**assessment, "clustered": True}
+
+
+def main() -> int:
+    """CLI entrypoint. Prints the result JSON and returns 0."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite the table even when it is already clustered",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only report fragmentation (opens the database read-only)",
+    )
+    parser.add_argument(
+        "--db-path",
+        default=None,
+        help="Explicit DuckDB path (default: configured database).",
+    )
+    args = parser.parse_args()
+
+    db_path = str(get_db_path(args.db_path))
+    if args.dry_run:
+        with get_connection(db_path) as conn:
+            result = assess_time_series_clustering(conn)
+    else:
+        ensure_schema_current(db_path)
+        with get_write_connection(db_path) as conn:
+            result = cluster_time_series_metrics(conn, force=args.force)
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -59,12 +59,24 @@ Bundle keys form_evaluation..lactate_threshold are additive (Issue #235);
 existing keys above are never modified. vo2_max / lactate_threshold are
 training-type conditional (tempo/threshold -> LT only; vo2max/interval/speed
 -> vo2_max only; others -> both null; unknown type -> both included).
+
+Batched variant (bulk re-analysis of a season):
+    uv run python -m garmin_mcp.scripts.prefetch_activity_context ID1 ID2 ...
+
+``prefetch_activity_contexts`` runs each query once for the whole batch and
+caches bundles under ``result/cache/activity_context/`` keyed by a data
+version of the rows they were built from, so a second pass over the same
+activities skips the per-activity readers (form evaluation, baseline trend,
+similar workouts). Output is ``{"<activity_id>": bundle, ...}``.
 """
 
 import argparse
+import hashlib
 import json
 import logging
 import sys
+from pathlib import Path
+from typing import Any, NamedTuple
 
 import duckdb
 
@@ -74,6 +86,7 @@ from garmin_mcp.analysis.derivations import (
     map_phase_category,
 )
 from garmin_mcp.database.connection import get_connection, get_db_path
+from garmin_mcp.utils.paths import get_result_dir
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +101,84 @@ _VO2_TRAINING_TYPES = {"vo2max", "vo2_max", "interval", "speed"}
 # sensitivity stays in sync with per-split terrain labeling (see Issue #473).
 _SPLIT_UNDULATION_THRESHOLD = 15.0  # m, == TerrainClassifier 丘陵 cutoff
 
+# Bump when the bundle layout changes so cached bundles are rebuilt.
+CONTEXT_CACHE_SCHEMA = 1
+
+# Column lists of Queries 1-5, shared by the single-activity queries and their
+# batched (``WHERE activity_id IN (...)``) counterparts so both paths build the
+# bundle from identically shaped rows.
+_ACTIVITY_COLUMNS = """
+    start_time_local::DATE AS activity_date,
+    temp_celsius,
+    relative_humidity_percent,
+    wind_speed_kmh,
+    wind_direction,
+    avg_heart_rate,
+    avg_pace_seconds_per_km
+"""
+_HR_EFFICIENCY_COLUMNS = """
+    training_type,
+    primary_zone,
+    zone_distribution_rating,
+    hr_stability,
+    aerobic_efficiency,
+    training_quality,
+    zone2_focus,
+    zone4_threshold_work,
+    zone1_percentage,
+    zone2_percentage,
+    zone3_percentage,
+    zone4_percentage,
+    zone5_percentage
+"""
+_ELEVATION_COLUMNS = """
+    SUM(elevation_gain) AS total_gain,
+    SUM(elevation_loss) AS total_loss,
+    COUNT(*) AS split_count,
+    MAX(elevation_gain + elevation_loss) AS max_split_change,
+    MAX(elevation_gain) AS max_split_gain,
+    MAX(elevation_loss) AS max_split_loss
+"""
+# Same values, read from the materialized ``phase = 'all'`` row.
+_ELEVATION_STAT_COLUMNS = """
+    elevation_gain_sum,
+    elevation_loss_sum,
+    split_count,
+    elevation_change_max,
+    elevation_gain_max,
+    elevation_loss_max
+"""
+_FORM_SCORE_COLUMNS = """
+    gct_star_rating,
+    gct_score,
+    vo_star_rating,
+    vo_score,
+    vr_star_rating,
+    vr_score,
+    integrated_score,
+    overall_score,
+    overall_star_rating
+"""
+_PHASE_COLUMNS = """
+    pace_consistency,
+    hr_drift_percentage,
+    cadence_consistency,
+    fatigue_pattern,
+    warmup_avg_pace_str,
+    warmup_avg_hr,
+    warmup_splits,
+    run_avg_pace_str,
+    run_avg_hr,
+    run_splits,
+    recovery_avg_pace_str,
+    recovery_avg_hr,
+    recovery_splits,
+    cooldown_avg_pace_str,
+    cooldown_avg_hr,
+    cooldown_splits,
+    pace_consistency_full
+"""
+
 
 def _should_include_vo2_max(training_type: str | None) -> bool:
     """Decide whether vo2_max is relevant for the given training type.
@@ -186,6 +277,20 @@ def _build_phase_dict(row: tuple, has_recovery: bool) -> dict:
     return result
 
 
+class _ContextRows(NamedTuple):
+    """Rows of Queries 1-5 for one activity (None where the row is missing)."""
+
+    activity: tuple
+    hr_efficiency: tuple | None
+    elevation: tuple | None
+    form_scores: tuple | None
+    phase: tuple | None
+
+
+def _training_type(rows: _ContextRows) -> str | None:
+    return rows.hr_efficiency[0] if rows.hr_efficiency else None
+
+
 def prefetch_activity_context(activity_id: int) -> dict:
     """Fetch shared context for all analysis agents in a single DB read.
 
@@ -201,195 +306,96 @@ def prefetch_activity_context(activity_id: int) -> dict:
     with get_connection(db_path) as conn:
         # 1. Activity metadata + weather (from activities table)
         activity_row = conn.execute(
-            """
-            SELECT
-                start_time_local::DATE AS activity_date,
-                temp_celsius,
-                relative_humidity_percent,
-                wind_speed_kmh,
-                wind_direction,
-                avg_heart_rate,
-                avg_pace_seconds_per_km
-            FROM activities
-            WHERE activity_id = ?
-            """,
+            f"SELECT {_ACTIVITY_COLUMNS} FROM activities WHERE activity_id = ?",
             [activity_id],
         ).fetchone()
 
         if not activity_row:
             return {"error": f"Activity {activity_id} not found"}
 
-        activity_date = str(activity_row[0])
-        temp_c = activity_row[1]
-        humidity = activity_row[2]
-        wind_kmh = activity_row[3]
-        wind_direction = activity_row[4]
-        avg_heart_rate = activity_row[5]
-        avg_pace_s_per_km = activity_row[6]
-        wind_mps = round(wind_kmh / 3.6, 1) if wind_kmh else None
-
         # 2. HR efficiency (C1: expanded from training_type only)
         hr_row = conn.execute(
-            """
-            SELECT
-                training_type,
-                primary_zone,
-                zone_distribution_rating,
-                hr_stability,
-                aerobic_efficiency,
-                training_quality,
-                zone2_focus,
-                zone4_threshold_work,
-                zone1_percentage,
-                zone2_percentage,
-                zone3_percentage,
-                zone4_percentage,
-                zone5_percentage
-            FROM hr_efficiency
-            WHERE activity_id = ?
-            """,
+            f"SELECT {_HR_EFFICIENCY_COLUMNS} FROM hr_efficiency WHERE activity_id = ?",
             [activity_id],
         ).fetchone()
 
-        training_type = hr_row[0] if hr_row else None
-        zone_percentages = None
-        primary_zone = None
-        zone_distribution_rating = None
-        hr_stability = None
-        aerobic_efficiency = None
-        training_quality = None
-        zone2_focus = None
-        zone4_threshold_work = None
-
-        if hr_row:
-            zone_percentages = {
-                "zone1": hr_row[8],
-                "zone2": hr_row[9],
-                "zone3": hr_row[10],
-                "zone4": hr_row[11],
-                "zone5": hr_row[12],
-            }
-            primary_zone = hr_row[1]
-            zone_distribution_rating = hr_row[2]
-            hr_stability = hr_row[3]
-            aerobic_efficiency = hr_row[4]
-            training_quality = hr_row[5]
-            zone2_focus = hr_row[6]
-            zone4_threshold_work = hr_row[7]
-
-        # 3. Elevation statistics (from splits table)
-        elev_row = conn.execute(
-            """
-            SELECT
-                SUM(elevation_gain) AS total_gain,
-                SUM(elevation_loss) AS total_loss,
-                COUNT(*) AS split_count,
-                MAX(elevation_gain + elevation_loss) AS max_split_change,
-                MAX(elevation_gain) AS max_split_gain,
-                MAX(elevation_loss) AS max_split_loss
-            FROM splits
-            WHERE activity_id = ?
-            """,
-            [activity_id],
-        ).fetchone()
-
-        total_gain = elev_row[0] if elev_row and elev_row[0] else 0.0
-        total_loss = elev_row[1] if elev_row and elev_row[1] else 0.0
-        split_count = elev_row[2] if elev_row else 0
-        max_split_change = elev_row[3] if elev_row and elev_row[3] else 0.0
-        max_split_gain = elev_row[4] if elev_row and elev_row[4] else 0.0
-        max_split_loss = elev_row[5] if elev_row and elev_row[5] else 0.0
-        avg_gain_per_km = round(total_gain / split_count, 1) if split_count > 0 else 0.0
+        # 3. Elevation statistics (split_phase_stats, else the splits table)
+        elev_row = None
+        try:
+            elev_row = conn.execute(
+                f"SELECT {_ELEVATION_STAT_COLUMNS} FROM split_phase_stats "
+                "WHERE activity_id = ? AND phase = 'all'",
+                [activity_id],
+            ).fetchone()
+        except duckdb.CatalogException:
+            logger.debug("split_phase_stats not found; aggregating splits")
+        if elev_row is None:
+            elev_row = conn.execute(
+                f"SELECT {_ELEVATION_COLUMNS} FROM splits WHERE activity_id = ?",
+                [activity_id],
+            ).fetchone()
 
         # 4. Form evaluation scores (C2)
-        form_scores = None
+        form_row = None
         try:
             form_row = conn.execute(
-                """
-                SELECT
-                    gct_star_rating,
-                    gct_score,
-                    vo_star_rating,
-                    vo_score,
-                    vr_star_rating,
-                    vr_score,
-                    integrated_score,
-                    overall_score,
-                    overall_star_rating
-                FROM form_evaluations
-                WHERE activity_id = ?
-                """,
+                f"SELECT {_FORM_SCORE_COLUMNS} FROM form_evaluations "
+                "WHERE activity_id = ?",
                 [activity_id],
             ).fetchone()
-
-            if form_row:
-                form_scores = {
-                    "gct": {
-                        "star_rating": form_row[0],
-                        "score": form_row[1],
-                    },
-                    "vo": {
-                        "star_rating": form_row[2],
-                        "score": form_row[3],
-                    },
-                    "vr": {
-                        "star_rating": form_row[4],
-                        "score": form_row[5],
-                    },
-                    "integrated_score": form_row[6],
-                    "overall_score": form_row[7],
-                    "overall_star_rating": form_row[8],
-                }
         except duckdb.CatalogException:
             # Table may not exist.
             logger.debug("table not found; leaving form_scores as None")
 
         # 5. Phase structure (C3)
-        phase_structure = None
+        phase_row = None
         try:
             phase_row = conn.execute(
-                """
-                SELECT
-                    pace_consistency,
-                    hr_drift_percentage,
-                    cadence_consistency,
-                    fatigue_pattern,
-                    warmup_avg_pace_str,
-                    warmup_avg_hr,
-                    warmup_splits,
-                    run_avg_pace_str,
-                    run_avg_hr,
-                    run_splits,
-                    recovery_avg_pace_str,
-                    recovery_avg_hr,
-                    recovery_splits,
-                    cooldown_avg_pace_str,
-                    cooldown_avg_hr,
-                    cooldown_splits,
-                    pace_consistency_full
-                FROM performance_trends
-                WHERE activity_id = ?
-                """,
+                f"SELECT {_PHASE_COLUMNS} FROM performance_trends "
+                "WHERE activity_id = ?",
                 [activity_id],
             ).fetchone()
-
-            if phase_row:
-                has_recovery = phase_row[12] is not None  # recovery_splits
-                phase_structure = _build_phase_dict(phase_row, has_recovery)
         except duckdb.CatalogException:
             # Table may not exist.
             logger.debug("table not found; leaving phase_structure as None")
 
-    # ------------------------------------------------------------------
-    # Bundle expansion (S1, Issue #235): reuse existing readers/comparators
-    # so each section agent receives a complete analysis bundle without
-    # issuing redundant MCP calls. All keys below are additive — existing
-    # keys above are never modified (backward compatible).
-    # ------------------------------------------------------------------
+    rows = _ContextRows(activity_row, hr_row, elev_row, form_row, phase_row)
+    expansion = _expand_bundle(activity_id, rows, str(db_path))
+    return _build_bundle(activity_id, rows, expansion)
+
+
+def _expand_bundle(
+    activity_id: int,
+    rows: _ContextRows,
+    db_path_str: str,
+    prefetched: dict | None = None,
+    autogen_by_month: dict[str, dict] | None = None,
+) -> dict:
+    """Fetch the reader-backed bundle keys (S1 bundle expansion, Issue #235).
+
+    Reuses existing readers/comparators so each section agent receives a
+    complete analysis bundle without issuing redundant MCP calls.
+
+    Args:
+        activity_id: Garmin activity ID.
+        rows: Rows of Queries 1-5 (activity date / training type).
+        db_path_str: Database path for the readers.
+        prefetched: Values already fetched by the batched path
+            (``hr_zones_detail`` / ``vo2_max`` / ``lactate_threshold``); the
+            reader is skipped for every key present.
+        autogen_by_month: Batch-wide memo of ``ensure_form_baselines_for_date``
+            results keyed by ``YYYY-MM`` (the target months only depend on it).
+
+    Returns:
+        Dict with form_evaluation, hr_zones_detail, form_baseline_trend,
+        form_baseline_autogen, similar_workouts, vo2_max and lactate_threshold.
+    """
     from garmin_mcp.database.readers.form import FormReader
     from garmin_mcp.database.readers.physiology import PhysiologyReader
 
-    db_path_str = str(db_path)
+    prefetched = prefetched or {}
+    activity_date = str(rows.activity[0])
+    training_type = _training_type(rows)
     form_reader = FormReader(db_path_str)
     physiology_reader = PhysiologyReader(db_path_str)
 
@@ -397,7 +403,10 @@ def prefetch_activity_context(activity_id: int) -> dict:
     form_evaluation = form_reader.get_form_evaluations(activity_id)
 
     # Heart rate zone boundaries + time distribution
-    hr_zones_detail = physiology_reader.get_heart_rate_zones_detail(activity_id)
+    if "hr_zones_detail" in prefetched:
+        hr_zones_detail = prefetched["hr_zones_detail"]
+    else:
+        hr_zones_detail = physiology_reader.get_heart_rate_zones_detail(activity_id)
 
     # Self-healing (Issue #266): ensure the form baseline exists for the
     # activity's month (+ prior month) so the trend comparison below is
@@ -405,18 +414,24 @@ def prefetch_activity_context(activity_id: int) -> dict:
     # never blocks prefetch on failure.
     from garmin_mcp.form_baseline.trainer import ensure_form_baselines_for_date
 
+    month = activity_date[:7]
     form_baseline_autogen: dict
-    try:
-        form_baseline_autogen = ensure_form_baselines_for_date(
-            activity_date, db_path_str
-        )
-    except Exception as e:
-        form_baseline_autogen = {
-            "generated": [],
-            "skipped": [],
-            "insufficient": [],
-            "error": str(e),
-        }
+    if autogen_by_month is not None and month in autogen_by_month:
+        form_baseline_autogen = autogen_by_month[month]
+    else:
+        try:
+            form_baseline_autogen = ensure_form_baselines_for_date(
+                activity_date, db_path_str
+            )
+        except Exception as e:
+            form_baseline_autogen = {
+                "generated": [],
+                "skipped": [],
+                "insufficient": [],
+                "error": str(e),
+            }
+        if autogen_by_month is not None:
+            autogen_by_month[month] = form_baseline_autogen
 
     # Form baseline trend (current vs 1-month-prior coefficients). Uses the
     # reader extracted from physiology_handler so logic is shared, not duplicated.
@@ -425,16 +440,20 @@ def prefetch_activity_context(activity_id: int) -> dict:
     )
 
     # VO2 max / lactate threshold are training-type conditional.
-    vo2_max = (
-        physiology_reader.get_vo2_max_data(activity_id)
-        if _should_include_vo2_max(training_type)
-        else None
-    )
-    lactate_threshold = (
-        physiology_reader.get_lactate_threshold_data(activity_id)
-        if _should_include_lactate_threshold(training_type)
-        else None
-    )
+    vo2_max = None
+    if _should_include_vo2_max(training_type):
+        vo2_max = (
+            prefetched["vo2_max"]
+            if "vo2_max" in prefetched
+            else physiology_reader.get_vo2_max_data(activity_id)
+        )
+    lactate_threshold = None
+    if _should_include_lactate_threshold(training_type):
+        lactate_threshold = (
+            prefetched["lactate_threshold"]
+            if "lactate_threshold" in prefetched
+            else physiology_reader.get_lactate_threshold_data(activity_id)
+        )
 
     # Similar past workouts (own connection via WorkoutComparator). Called once,
     # outside the read transaction above. Key is always present (null on error).
@@ -447,6 +466,91 @@ def prefetch_activity_context(activity_id: int) -> dict:
     except Exception:
         similar_workouts = None
 
+    return {
+        "form_evaluation": form_evaluation,
+        "hr_zones_detail": hr_zones_detail,
+        "form_baseline_trend": form_baseline_trend,
+        "form_baseline_autogen": form_baseline_autogen,
+        "similar_workouts": similar_workouts,
+        "vo2_max": vo2_max,
+        "lactate_threshold": lactate_threshold,
+    }
+
+
+def _build_bundle(activity_id: int, rows: _ContextRows, expansion: dict) -> dict:
+    """Assemble the output bundle from Query 1-5 rows and the expansion keys."""
+    activity_row = rows.activity
+    activity_date = str(activity_row[0])
+    temp_c = activity_row[1]
+    humidity = activity_row[2]
+    wind_kmh = activity_row[3]
+    wind_direction = activity_row[4]
+    avg_heart_rate = activity_row[5]
+    avg_pace_s_per_km = activity_row[6]
+    wind_mps = round(wind_kmh / 3.6, 1) if wind_kmh else None
+
+    hr_row = rows.hr_efficiency
+    training_type = _training_type(rows)
+    zone_percentages = None
+    primary_zone = None
+    zone_distribution_rating = None
+    hr_stability = None
+    aerobic_efficiency = None
+    training_quality = None
+    zone2_focus = None
+    zone4_threshold_work = None
+
+    if hr_row:
+        zone_percentages = {
+            "zone1": hr_row[8],
+            "zone2": hr_row[9],
+            "zone3": hr_row[10],
+            "zone4": hr_row[11],
+            "zone5": hr_row[12],
+        }
+        primary_zone = hr_row[1]
+        zone_distribution_rating = hr_row[2]
+        hr_stability = hr_row[3]
+        aerobic_efficiency = hr_row[4]
+        training_quality = hr_row[5]
+        zone2_focus = hr_row[6]
+        zone4_threshold_work = hr_row[7]
+
+    elev_row = rows.elevation
+    total_gain = elev_row[0] if elev_row and elev_row[0] else 0.0
+    total_loss = elev_row[1] if elev_row and elev_row[1] else 0.0
+    split_count = elev_row[2] if elev_row else 0
+    max_split_change = elev_row[3] if elev_row and elev_row[3] else 0.0
+    max_split_gain = elev_row[4] if elev_row and elev_row[4] else 0.0
+    max_split_loss = elev_row[5] if elev_row and elev_row[5] else 0.0
+    avg_gain_per_km = round(total_gain / split_count, 1) if split_count > 0 else 0.0
+
+    form_scores = None
+    form_row = rows.form_scores
+    if form_row:
+        form_scores = {
+            "gct": {
+                "star_rating": form_row[0],
+                "score": form_row[1],
+            },
+            "vo": {
+                "star_rating": form_row[2],
+                "score": form_row[3],
+            },
+            "vr": {
+                "star_rating": form_row[4],
+                "score": form_row[5],
+            },
+            "integrated_score": form_row[6],
+            "overall_score": form_row[7],
+            "overall_star_rating": form_row[8],
+        }
+
+    phase_structure = None
+    if rows.phase:
+        has_recovery = rows.phase[12] is not None  # recovery_splits
+        phase_structure = _build_phase_dict(rows.phase, has_recovery)
+
     return {
         "activity_id": activity_id,
         "activity_date": activity_date,
@@ -481,34 +585,387 @@ def prefetch_activity_context(activity_id: int) -> dict:
         "next_run_target": compute_next_run_target(
             training_type,
             None,
-            vo2_max,
-            lactate_threshold,
+            expansion["vo2_max"],
+            expansion["lactate_threshold"],
             avg_heart_rate,
             avg_pace_s_per_km,
-            hr_zones_detail,
+            expansion["hr_zones_detail"],
         ),
         # --- S1 bundle expansion (Issue #235, additive) ---
-        "form_evaluation": form_evaluation,
-        "hr_zones_detail": hr_zones_detail,
-        "form_baseline_trend": form_baseline_trend,
-        "form_baseline_autogen": form_baseline_autogen,
-        "similar_workouts": similar_workouts,
-        "vo2_max": vo2_max,
-        "lactate_threshold": lactate_threshold,
+        **expansion,
     }
 
 
+# ----------------------------------------------------------------------
+# Batched prefetch: many activities per DB read + on-disk bundle cache
+# ----------------------------------------------------------------------
+
+
+def context_cache_dir() -> Path:
+    """Directory of cached bundles (one JSON file per activity)."""
+    return get_result_dir() / "cache" / "activity_context"
+
+
+def _fetch_rows_by_activity(
+    conn: duckdb.DuckDBPyConnection,
+    columns: str,
+    table: str,
+    activity_ids: list[int],
+    optional: bool = False,
+    group: bool = False,
+    where: str | None = None,
+) -> dict[int, tuple]:
+    """Batched ``SELECT activity_id, <columns>`` for every requested activity.
+
+    Missing activities are absent from the result. ``optional`` tables that do
+    not exist yield ``{}`` (same as the single-activity CatalogException path).
+    ``where`` is an extra SQL condition ANDed to the activity filter.
+    """
+    placeholders = ", ".join("?" for _ in activity_ids)
+    sql = (
+        f"SELECT activity_id, {columns} FROM {table} "
+        f"WHERE activity_id IN ({placeholders})"
+    )
+    if where:
+        sql += f" AND {where}"
+    if group:
+        sql += " GROUP BY activity_id"
+    try:
+        result = conn.execute(sql, activity_ids).fetchall()
+    except duckdb.CatalogException:
+        if not optional:
+            raise
+        logger.debug("%s not found; leaving its bundle keys as None", table)
+        return {}
+    rows: dict[int, tuple] = {}
+    for row in result:
+        rows.setdefault(row[0], tuple(row[1:]))
+    return rows
+
+
+def _fetch_hr_zones_details(
+    conn: duckdb.DuckDBPyConnection, activity_ids: list[int]
+) -> dict[int, dict]:
+    """Batched ``PhysiologyReader.get_heart_rate_zones_detail``."""
+    placeholders = ", ".join("?" for _ in activity_ids)
+    try:
+        result = conn.execute(
+            f"""
+            SELECT
+                activity_id,
+                zone_number,
+                zone_low_boundary,
+                zone_high_boundary,
+                time_in_zone_seconds,
+                zone_percentage
+            FROM heart_rate_zones
+            WHERE activity_id IN ({placeholders})
+            ORDER BY activity_id, zone_number
+            """,
+            activity_ids,
+        ).fetchall()
+    except duckdb.CatalogException:
+        return {}
+    details: dict[int, dict] = {}
+    for row in result:
+        details.setdefault(row[0], {"zones": []})["zones"].append(
+            {
+                "zone_number": row[1],
+                "low_boundary": row[2],
+                "high_boundary": row[3],
+                "time_in_zone_seconds": row[4],
+                "zone_percentage": row[5],
+            }
+        )
+    return details
+
+
+def _fetch_vo2_max_data(
+    conn: duckdb.DuckDBPyConnection, activity_ids: list[int]
+) -> dict[int, dict]:
+    """Batched ``PhysiologyReader.get_vo2_max_data``.
+
+    The activity's own row wins; otherwise an ASOF join picks the most recent
+    measurement on or before the activity date (the reader's fallback).
+    """
+    from garmin_mcp.database.readers.physiology import PhysiologyReader
+
+    placeholders = ", ".join("?" for _ in activity_ids)
+    try:
+        result = conn.execute(
+            f"""
+            WITH targets AS (
+                SELECT activity_id, start_time_local::DATE AS activity_date
+                FROM activities
+                WHERE activity_id IN ({placeholders})
+            ),
+            dated AS (
+                SELECT precise_value, value, date, category
+                FROM vo2_max
+                WHERE date IS NOT NULL
+            )
+            SELECT
+                t.activity_id,
+                own.activity_id IS NOT NULL,
+                own.precise_value,
+                own.value,
+                own.date,
+                prior.date IS NOT NULL,
+                prior.precise_value,
+                prior.value,
+                prior.date
+            FROM targets t
+            LEFT JOIN vo2_max own ON own.activity_id = t.activity_id
+            ASOF LEFT JOIN dated prior ON t.activity_date >= prior.date
+            """,
+            activity_ids,
+        ).fetchall()
+    except duckdb.CatalogException:
+        return {}
+    data: dict[int, dict] = {}
+    for row in result:
+        activity_id, has_own, has_prior = row[0], row[1], row[5]
+        if activity_id in data or not (has_own or has_prior):
+            continue
+        precise_value, value, date = row[2:5] if has_own else row[6:9]
+        data[activity_id] = {
+            "precise_value": precise_value,
+            "value": value,
+            "date": str(date) if date else None,
+            "category": PhysiologyReader._get_vo2_max_category(precise_value),
+        }
+    return data
+
+
+def _fetch_lactate_threshold_data(
+    conn: duckdb.DuckDBPyConnection, activity_ids: list[int]
+) -> dict[int, dict]:
+    """Batched ``PhysiologyReader.get_lactate_threshold_data``."""
+    rows = _fetch_rows_by_activity(
+        conn,
+        "heart_rate, speed_mps, date_hr, functional_threshold_power, "
+        "power_to_weight, weight, date_power",
+        "lactate_threshold",
+        activity_ids,
+        optional=True,
+    )
+    return {
+        activity_id: {
+            "heart_rate": row[0],
+            "speed_mps": row[1],
+            "date_hr": str(row[2]) if row[2] else None,
+            "functional_threshold_power": row[3],
+            "power_to_weight": row[4],
+            "weight": row[5],
+            "date_power": str(row[6]) if row[6] else None,
+        }
+        for activity_id, row in rows.items()
+    }
+
+
+def _global_data_version(conn: duckdb.DuckDBPyConnection) -> list:
+    """Database-wide inputs of every bundle.
+
+    ``similar_workouts`` ranks against all activities and the form baseline
+    trend reads ``form_baseline_history``, so any new activity or baseline
+    retraining invalidates every cached bundle. Content is tracked as well as
+    row counts: an order-independent hash of the ``activities`` columns the SQL
+    search ranks on (so a corrected distance or pace counts) and the
+    ``workout_features`` revision, which every feature-row write draws anew
+    (splits and training-type changes reach the index through it). Writing
+    section analyses touches none of these, so re-analysis runs keep hitting
+    the cache.
+    """
+    version: list = []
+    for sql in (
+        "SELECT COUNT(*), COALESCE(bit_xor(hash(activity_id, activity_date, "
+        "activity_name, avg_pace_seconds_per_km, total_distance_km, "
+        "avg_heart_rate, temp_celsius)), 0) FROM activities",
+        "SELECT COUNT(*), MAX(revision) FROM workout_features",
+        "SELECT COUNT(*), MAX(trained_at) FROM form_baseline_history",
+    ):
+        try:
+            row = conn.execute(sql).fetchone()
+        except duckdb.CatalogException:
+            row = None
+        version.append(list(row) if row else None)
+    return version
+
+
+def _data_version(*parts: Any) -> str:
+    """Stable digest of the rows a bundle was built from."""
+    payload = json.dumps(
+        [CONTEXT_CACHE_SCHEMA, *parts], default=str, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _read_cached_bundle(cache_dir: Path, activity_id: int, version: str) -> dict | None:
+    path = cache_dir / f"{activity_id}.json"
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("data_version") != version:
+        return None
+    bundle = cached.get("bundle")
+    return bundle if isinstance(bundle, dict) else None
+
+
+def _write_cached_bundle(
+    cache_dir: Path, activity_id: int, version: str, bundle: dict
+) -> None:
+    """Write one bundle atomically; a failed write only costs a cache miss."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path = cache_dir / f"{activity_id}.json"
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"data_version": version, "bundle": bundle}, f, ensure_ascii=False
+            )
+        tmp_path.replace(path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Could not cache bundle for %s: %s", activity_id, e)
+
+
+def prefetch_activity_contexts(
+    activity_ids: list[int],
+    use_cache: bool = True,
+    cache_dir: Path | None = None,
+) -> dict[int, dict]:
+    """Fetch the bundles of many activities with batched queries.
+
+    Queries 1-5 plus HR zones, VO2 max and lactate threshold run once per
+    table for the whole batch (``WHERE activity_id IN (...)``) instead of once
+    per activity. Their rows, together with a database-wide token, form each
+    bundle's data version; a bundle cached under the same version in
+    ``cache_dir`` is returned as-is, skipping the per-activity readers (form
+    evaluation, baseline trend, similar workouts) entirely.
+
+    Args:
+        activity_ids: Garmin activity IDs (duplicates are fetched once).
+        use_cache: Read and write the on-disk bundle cache.
+        cache_dir: Cache directory (default: :func:`context_cache_dir`).
+
+    Returns:
+        ``{activity_id: bundle}`` in request order; the bundle has the same
+        keys as :func:`prefetch_activity_context` (or ``{"error": ...}`` for
+        an unknown activity).
+    """
+    ids = list(dict.fromkeys(activity_ids))
+    if not ids:
+        return {}
+    db_path = get_db_path()
+    cache_path = cache_dir or context_cache_dir()
+
+    with get_connection(db_path) as conn:
+        activity_rows = _fetch_rows_by_activity(
+            conn, _ACTIVITY_COLUMNS, "activities", ids
+        )
+        hr_rows = _fetch_rows_by_activity(
+            conn, _HR_EFFICIENCY_COLUMNS, "hr_efficiency", ids
+        )
+        elev_rows = _fetch_rows_by_activity(
+            conn,
+            _ELEVATION_STAT_COLUMNS,
+            "split_phase_stats",
+            ids,
+            optional=True,
+            where="phase = 'all'",
+        )
+        unmaterialized = [i for i in ids if i not in elev_rows]
+        if unmaterialized:
+            elev_rows.update(
+                _fetch_rows_by_activity(
+                    conn, _ELEVATION_COLUMNS, "splits", unmaterialized, group=True
+                )
+            )
+        form_rows = _fetch_rows_by_activity(
+            conn,
+            f"{_FORM_SCORE_COLUMNS}, evaluated_at",
+            "form_evaluations",
+            ids,
+            optional=True,
+        )
+        phase_rows = _fetch_rows_by_activity(
+            conn, _PHASE_COLUMNS, "performance_trends", ids, optional=True
+        )
+        hr_zones = _fetch_hr_zones_details(conn, ids)
+        vo2_max = _fetch_vo2_max_data(conn, ids)
+        lactate_threshold = _fetch_lactate_threshold_data(conn, ids)
+        global_version = _global_data_version(conn)
+
+    db_path_str = str(db_path)
+    autogen_by_month: dict[str, dict] = {}
+    bundles: dict[int, dict] = {}
+    hits = 0
+    for activity_id in ids:
+        activity_row = activity_rows.get(activity_id)
+        if activity_row is None:
+            bundles[activity_id] = {"error": f"Activity {activity_id} not found"}
+            continue
+
+        form_row = form_rows.get(activity_id)
+        rows = _ContextRows(
+            activity_row,
+            hr_rows.get(activity_id),
+            # No splits -> same shape as the single-activity aggregate.
+            elev_rows.get(activity_id, (None, None, 0, None, None, None)),
+            form_row[:-1] if form_row else None,
+            phase_rows.get(activity_id),
+        )
+        prefetched = {
+            "hr_zones_detail": hr_zones.get(activity_id),
+            "vo2_max": vo2_max.get(activity_id),
+            "lactate_threshold": lactate_threshold.get(activity_id),
+        }
+        version = _data_version(global_version, rows, form_row, prefetched)
+
+        if use_cache:
+            cached = _read_cached_bundle(cache_path, activity_id, version)
+            if cached is not None:
+                bundles[activity_id] = cached
+                hits += 1
+                continue
+
+        expansion = _expand_bundle(
+            activity_id, rows, db_path_str, prefetched, autogen_by_month
+        )
+        bundle = _build_bundle(activity_id, rows, expansion)
+        if use_cache:
+            _write_cached_bundle(cache_path, activity_id, version, bundle)
+        bundles[activity_id] = bundle
+
+    logger.info("Prefetched %d activity contexts (%d from cache)", len(bundles), hits)
+    return bundles
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Pre-fetch shared activity context for analysis agents"
     )
-    parser.add_argument("activity_id", type=int, help="Garmin activity ID")
+    parser.add_argument(
+        "activity_ids", type=int, nargs="+", help="Garmin activity ID(s)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk bundle cache (multiple IDs only)",
+    )
     args = parser.parse_args()
 
-    result = prefetch_activity_context(args.activity_id)
-    print(json.dumps(result, ensure_ascii=False))
+    if len(args.activity_ids) == 1:
+        result = prefetch_activity_context(args.activity_ids[0])
+        print(json.dumps(result, ensure_ascii=False))
+        if "error" in result:
+            sys.exit(1)
+        return
 
-    if "error" in result:
+    bundles = prefetch_activity_contexts(args.activity_ids, use_cache=not args.no_cache)
+    print(json.dumps({str(k): v for k, v in bundles.items()}, ensure_ascii=False))
+    if any("error" in bundle for bundle in bundles.values()):
         sys.exit(1)
 
 
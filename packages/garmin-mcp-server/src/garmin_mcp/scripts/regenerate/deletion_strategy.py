@@ -9,9 +9,47 @@ from pathlib import Path
 import duckdb
 
 from garmin_mcp.database.connection import get_write_connection
+from garmin_mcp.database.inserters.daily_load import rebuild_all_daily_load
 
 logger = logging.getLogger(__name__)
 
+# Tables derived from another table's rows; deleted along with their source so
+# they never describe rows that no longer exist.
+_DERIVED_TABLES: dict[str, tuple[str, ...]] = {
+    "activities": ("workout_features",),
+    "section_analyses": ("section_analysis_terms",),
+    "splits": ("split_phase_stats",),
+    "time_series_metrics": ("time_series_rollups", "time_series_offsets"),
+}
+
+
+def _with_derived_tables(tables: list[str]) -> list[str]:
+    """Append the derived tables of every table in ``tables`` (deduplicated)."""
+    expanded = list(tables)
+    for table in tables:
+        for derived in _DERIVED_TABLES.get(table, ()):
+            if derived not in expanded:
+                expanded.append(derived)
+    return expanded
+
+
+def _rebuild_ledgers(conn: duckdb.DuckDBPyConnection, tables: list[str]) -> None:
+    """Rebuild date-keyed ledgers derived from deleted ``activities`` rows.
+
+    ``daily_load`` has no ``activity_id`` column to delete by; its rolling sums
+    are recomputed from the activities that remain instead.
+    """
+    if "activities" not in tables:
+        return
+    row = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables "
+        "WHERE table_name = 'daily_load'"
+    ).fetchone()
+    if row is None or row[0] == 0:
+        logger.debug("Table daily_load does not exist yet, skipping rebuild")
+        return
+    rebuild_all_daily_load(conn)
+
 
 def delete_activity_records(
     activity_ids: list[int],
@@ -22,14 +60,20 @@ def delete_activity_records(
     Delete existing records for specified activities from filtered tables.
 
     Deletion is atomic (uses transaction). body_composition is skipped
-    (no activity_id column).
+    (no activity_id column). Deleting time_series_metrics also deletes its
+    derived time_series_rollups / time_series_offsets rows, and deleting
+    section_analyses deletes their section_analysis_terms rows; deleting
+    activities deletes their workout_features rows and rebuilds the daily_load
+    ledger.
 
     Args:
         activity_ids: List of activity IDs to delete
         tables: List of table names to delete from
         db_path: Path to DuckDB database
     """
-    tables_to_delete = [t for t in tables if t != "body_composition"]
+    tables_to_delete = [
+        t for t in _with_derived_tables(tables) if t != "body_composition"
+    ]
 
     if not tables_to_delete:
         logger.debug("No tables to delete (body_composition only)")
@@ -59,6 +103,7 @@ def delete_activity_records(
                     else:
                         raise
 
+            _rebuild_ledgers(conn, tables_to_delete)
             conn.execute("COMMIT")
             logger.info(
                 f"Deleted records for {len(activity_ids)} activities "
@@ -82,13 +127,16 @@ def delete_table_all_records(
     Delete all records from specified tables (table-wide deletion).
 
     Used when regenerating entire tables without --activity-ids filter.
-    Gracefully handles missing tables.
+    Gracefully handles missing tables. Deleting activities also empties the
+    daily_load ledger.
 
     Args:
         tables: List of table names to delete all records from
         db_path: Path to DuckDB database
     """
-    tables_to_delete = [t for t in tables if t != "body_composition"]
+    tables_to_delete = [
+        t for t in _with_derived_tables(tables) if t != "body_composition"
+    ]
 
     if not tables_to_delete:
         logger.debug("No tables to delete (body_composition only)")
@@ -115,6 +163,7 @@ def delete_table_all_records(
                     )
                     continue
 
+            _rebuild_ledgers(conn, deleted_tables)
             conn.execute("COMMIT")
             logger.info(
                 f"Successfully deleted records from {len(deleted_tables)} tables"
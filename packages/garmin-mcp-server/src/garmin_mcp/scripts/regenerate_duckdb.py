@@ -47,12 +47,17 @@ class DuckDBRegenerator:
         delete_old_db: bool = False,
         tables: list[str] | None = None,
         force: bool = False,
+        batch_size: int | None = None,
     ):
         if delete_old_db and tables:
             raise ValueError(
                 "--delete-db cannot be used with --tables. "
                 "Database file deletion is only allowed for full regeneration (all tables)."
             )
+        if batch_size is not None and tables != ["splits"]:
+            raise ValueError("--batch-size is only supported with --tables splits.")
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("--batch-size must be at least 1.")
 
         self.raw_dir = Path(raw_dir) if raw_dir else get_raw_dir()
         self.activity_dir = self.raw_dir / "activity"
@@ -64,6 +69,7 @@ class DuckDBRegenerator:
         self.delete_old_db = delete_old_db
         self.tables = tables
         self.force = force
+        self.batch_size = batch_size
 
         if self.delete_old_db and self.db_path.exists():
             logger.warning(f"Deleting existing DuckDB: {self.db_path}")
@@ -262,6 +268,103 @@ class DuckDBRegenerator:
                 "elapsed_time": elapsed,
             }
 
+    def regenerate_splits_batched(
+        self, activities: list[tuple[int, str | None]]
+    ) -> list[dict[str, Any]]:
+        """Regenerate the splits of many activities with bulk inserts.
+
+        Activities are skipped or rejected by the same rules as
+        :meth:`regenerate_single_activity`. The rest are written
+        ``batch_size`` at a time, each batch in one transaction: one
+        ``insert_splits_batch`` call straight from the raw splits.json files,
+        then one refresh of the derived rows (workout_features,
+        split_phase_stats).
+
+        Returns:
+            Per-activity result dicts, in input order.
+        """
+        import time
+
+        from garmin_mcp.database.connection import get_write_connection
+        from garmin_mcp.database.inserters.splits import insert_splits_batch
+        from garmin_mcp.ingest.duckdb_saver import refresh_derived_rows
+
+        assert self.batch_size is not None
+        cached: set[int] = set()
+        if not self.delete_old_db and not self.force and self.db_path.exists():
+            ids = [activity_id for activity_id, _ in activities]
+            with get_connection(self.db_path) as conn:
+                cached = {
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT activity_id FROM activities "
+                        "WHERE activity_id IN (SELECT unnest(?::BIGINT[]))",
+                        [ids],
+                    ).fetchall()
+                }
+
+        results: dict[int, dict[str, Any]] = {}
+        pending: list[tuple[int, str | None]] = []
+        for activity_id, activity_date in activities:
+            base = {"activity_id": activity_id, "activity_date": activity_date}
+            if not self.check_raw_data_exists(activity_id):
+                logger.warning(f"Raw data not found for activity {activity_id}")
+                results[activity_id] = {
+                    **base,
+                    "status": "error",
+                    "error": "Raw data not found",
+                    "elapsed_time": 0.0,
+                }
+            elif activity_id in cached:
+                results[activity_id] = {
+                    **base,
+                    "status": "skipped",
+                    "reason": "existing_in_duckdb_no_force",
+                    "elapsed_time": 0.0,
+                }
+            else:
+                pending.append((activity_id, activity_date))
+
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start : start + self.batch_size]
+            started = time.time()
+            files = {
+                activity_id: self.activity_dir / str(activity_id) / "splits.json"
+                for activity_id, _ in batch
+            }
+            inserted: dict[int, bool] = {}
+            error = "Splits insertion failed"
+            try:
+                with get_write_connection(self.db_path) as conn:
+                    conn.begin()
+                    try:
+                        inserted = insert_splits_batch(conn, files)
+                        refresh_derived_rows(
+                            [aid for aid, ok in inserted.items() if ok], conn
+                        )
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        raise
+            except Exception as e:
+                logger.error(f"Error regenerating splits batch: {e}")
+                inserted, error = {}, str(e)
+            elapsed = (time.time() - started) / len(batch)
+            for activity_id, activity_date in batch:
+                outcome: dict[str, Any] = (
+                    {"status": "success", "tables": self.tables}
+                    if inserted.get(activity_id)
+                    else {"status": "error", "error": error}
+                )
+                results[activity_id] = {
+                    "activity_id": activity_id,
+                    "activity_date": activity_date,
+                    **outcome,
+                    "elapsed_time": elapsed,
+                }
+
+        return [results[activity_id] for activity_id, _ in activities]
+
     def regenerate_all(
         self,
         start_date: str | None = None,
@@ -338,11 +441,17 @@ class DuckDBRegenerator:
                 "   To update existing records, add --force flag to your command"
             )
 
-        for activity_id, activity_date in tqdm(
-            activities, desc="Regenerating DuckDB data"
-        ):
-            result = self.regenerate_single_activity(activity_id, activity_date)
+        if self.batch_size is not None:
+            results = self.regenerate_splits_batched(activities)
+        else:
+            results = [
+                self.regenerate_single_activity(activity_id, activity_date)
+                for activity_id, activity_date in tqdm(
+                    activities, desc="Regenerating DuckDB data"
+                )
+            ]
 
+        for result in results:
             if result["status"] == "success":
                 success_count += 1
             elif result["status"] == "skipped":
@@ -402,6 +511,15 @@ def main():
         action="store_true",
         help="Force update by deleting existing records before re-insertion",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help=(
+            "With --tables splits: bulk-insert the splits of N activities per "
+            "transaction instead of one activity at a time"
+        ),
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -423,6 +541,7 @@ def main():
             delete_old_db=args.delete_db,
             tables=args.tables,
             force=args.force,
+            batch_size=args.batch_size,
         )
     except ValueError as e:
         parser.error(str(e))
@@ -7,10 +7,14 @@ swappable :mod:`garmin_mcp.worker`, which the shim drives through a single
 
 Responsibilities:
 
-- ``list_tools`` -- domain tools from ``worker.rpc("schema")`` + the two
-  server-level tools (``get_server_info``, ``reload_server``).
-- ``call_tool``  -- ``get_server_info``/``reload_server`` handled inline; every
-  other tool is delegated to ``worker.rpc("call", name, args)``.
+- ``list_tools`` -- domain tools from ``worker.rpc("schema")`` + the three
+  server-level tools (``get_server_info``, ``reload_server``,
+  ``batch_tool_calls``).
+- ``call_tool``  -- ``get_server_info``/``reload_server`` handled inline,
+  ``batch_tool_calls`` forwarded as one ``worker.rpc("batch", args=...)``; every
+  other tool is delegated to ``worker.rpc("call", name, args)``. The worker
+  returns the final MCP text plus ``is_error``/``warnings`` header fields, so
+  the shim forwards the text as-is and logs from the header without re-parsing.
 - ``reload_server`` -- ``worker.restart()`` (fresh process = latest on-disk
   code) followed by ``notifications/tools/list_changed``. There is **no**
   ``os._exit`` / client-respawn dependency: the shim process stays alive, so the
@@ -28,7 +32,7 @@ import json
 import logging
 import signal
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, NamedTuple
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -43,16 +47,30 @@ logger = logging.getLogger(__name__)
 # worker is replaced).
 _STARTED_AT: str = datetime.now(UTC).isoformat()
 
-# The two server-level tools are owned by the shim, not the worker. They are
+# The server-level tools are owned by the shim, not the worker. They are
 # appended to the worker's domain-tool schema in ``list_tools``.
 _SERVER_TOOLS: list[Tool] = [
     Tool(
         name="get_server_info",
         description=(
             "Get diagnostic info about the running MCP server (shim started_at "
-            "plus worker DB diagnostics). Use to verify readiness."
+            "plus worker DB diagnostics, result-cache hit/miss counters and, when "
+            "GARMIN_MCP_INSTRUMENT=1, per-tool latency/SQL/payload statistics). "
+            "Use to verify readiness."
         ),
-        inputSchema={"type": "object", "properties": {}},
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "dump_instrumentation": {
+                    "type": "boolean",
+                    "description": (
+                        "Also write the instrumentation statistics to a local "
+                        "file (GARMIN_MCP_INSTRUMENT=1 only)."
+                    ),
+                    "default": False,
+                }
+            },
+        },
     ),
     Tool(
         name="reload_server",
@@ -65,6 +83,34 @@ _SERVER_TOOLS: list[Tool] = [
         ),
         inputSchema={"type": "object", "properties": {}},
     ),
+    Tool(
+        name="batch_tool_calls",
+        description=(
+            "Run several read tools in one request (one worker round-trip, one "
+            "shared DuckDB connection). Returns {results: [...]} in call order; "
+            "each item is {tool, ok, is_error, warnings, result} or {tool, ok: "
+            "false, error}, so one failing call does not fail the batch. Tools "
+            "that write data cannot be batched. Max 50 calls."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool calls: [{tool: name, args: {...}}, ...].",
+                    "items": {"type": "object"},
+                    "minItems": 1,
+                    "maxItems": 50,
+                },
+                "parallel": {
+                    "type": "boolean",
+                    "description": "Run the calls on parallel threads.",
+                    "default": False,
+                },
+            },
+            "required": ["calls"],
+        },
+    ),
 ]
 _SERVER_TOOL_NAMES = {t.name for t in _SERVER_TOOLS}
 
@@ -74,6 +120,19 @@ mcp: Server = Server("garmin-db")
 worker = WorkerClient()
 
 
+class _ToolOutcome(NamedTuple):
+    """Tool call content plus the status metadata used for logging.
+
+    ``is_error``/``warning_count`` are ``None`` when the reply carried no
+    envelope header (an older worker returning ``data``); ``call_tool`` then
+    falls back to parsing the text.
+    """
+
+    content: list[TextContent]
+    is_error: bool | None = None
+    warning_count: int | None = None
+
+
 def _extract_log_context(arguments: dict[str, Any]) -> str:
     """Extract activity_id or date from arguments for log context."""
     if "activity_id" in arguments:
@@ -84,7 +143,10 @@ def _extract_log_context(arguments: dict[str, Any]) -> str:
 
 
 def _detect_tool_error(result: list) -> bool:
-    """Check if any TextContent in result contains an error response."""
+    """Check if any TextContent in result contains an error response.
+
+    Fallback for replies without envelope metadata; parses the text.
+    """
     for item in result:
         if hasattr(item, "text"):
             try:
@@ -97,7 +159,10 @@ def _detect_tool_error(result: list) -> bool:
 
 
 def _count_warnings(result: list) -> int:
-    """Count warnings in tool result."""
+    """Count warnings in tool result.
+
+    Fallback for replies without envelope metadata; parses the text.
+    """
     for item in result:
         if hasattr(item, "text"):
             try:
@@ -111,10 +176,10 @@ def _count_warnings(result: list) -> int:
 
 @mcp.list_tools()
 async def list_tools() -> list[Tool]:
-    """List available tools: worker-provided domain tools + 2 server tools.
+    """List available tools: worker-provided domain tools + 3 server tools.
 
     The domain schema comes from the worker (so it always reflects the latest
-    on-disk registry); the two server tools are appended by the shim.
+    on-disk registry); the server tools are appended by the shim.
     """
     resp = await worker.rpc("schema")
     domain_tools: list[Tool] = []
@@ -139,10 +204,14 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
     start = time.monotonic()
     try:
-        result = await _dispatch_tool(name, arguments)
+        outcome = await _dispatch_tool(name, arguments)
+        result = outcome.content
         duration_ms = (time.monotonic() - start) * 1000
         ctx = _extract_log_context(arguments)
-        if _detect_tool_error(result):
+        is_error = outcome.is_error
+        if is_error is None:
+            is_error = _detect_tool_error(result)
+        if is_error:
             logger.warning(
                 "tool=%s %sduration_ms=%.1f status=tool_error",
                 name,
@@ -151,7 +220,9 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             )
         else:
             logger.info("tool=%s %sduration_ms=%.1f status=ok", name, ctx, duration_ms)
-        warning_count = _count_warnings(result)
+        warning_count = outcome.warning_count
+        if warning_count is None:
+            warning_count = _count_warnings(result)
         if warning_count > 0:
             logger.info("tool=%s %swarning_count=%d", name, ctx, warning_count)
         return result
@@ -174,39 +245,64 @@ def _serialize_result(payload: Any) -> str:
     return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str)
 
 
-async def _dispatch_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+async def _dispatch_tool(name: str, arguments: dict[str, Any]) -> _ToolOutcome:
     """Route a tool call: server tools inline, everything else to the worker.
 
-    Domain tools are delegated to ``worker.rpc("call", ...)``; the result (or a
-    structured error) is serialized into a single ``TextContent``. The shim does
-    not import the registry, so unknown names are surfaced by the worker as an
-    ``ok=False`` error rather than raised here.
+    Domain tools are delegated to ``worker.rpc("call", ...)`` and
+    ``batch_tool_calls`` to ``worker.rpc("batch", ...)``. A framed reply's
+    pre-serialized ``text`` becomes the single ``TextContent`` untouched, with
+    the header's ``is_error``/``warnings`` as metadata; a legacy ``data`` reply
+    (or a structured error) is serialized here. The shim does not import the
+    registry, so unknown names are surfaced by the worker as an ``ok=False``
+    error rather than raised here.
     """
     if name == "reload_server":
-        return await _handle_reload_server()
+        return _ToolOutcome(await _handle_reload_server(), False, 0)
     if name == "get_server_info":
-        return await _handle_get_server_info()
+        return _ToolOutcome(
+            await _handle_get_server_info(
+                bool(arguments.get("dump_instrumentation", False))
+            ),
+            False,
+            0,
+        )
 
-    resp = await worker.rpc("call", name, arguments)
-    if resp.get("ok"):
-        payload = resp.get("data")
+    if name == "batch_tool_calls":
+        resp = await worker.rpc("batch", args=arguments)
     else:
+        resp = await worker.rpc("call", name, arguments)
+    if not resp.get("ok"):
         payload = {"error": resp.get("error", "worker call failed")}
-    return [TextContent(type="text", text=_serialize_result(payload))]
+        return _ToolOutcome(
+            [TextContent(type="text", text=_serialize_result(payload))], True, 0
+        )
+    if "text" in resp:
+        return _ToolOutcome(
+            [TextContent(type="text", text=resp["text"])],
+            bool(resp.get("is_error", False)),
+            int(resp.get("warnings", 0)),
+        )
+    return _ToolOutcome(
+        [TextContent(type="text", text=_serialize_result(resp.get("data")))]
+    )
 
 
-async def _handle_get_server_info() -> list[TextContent]:
+async def _handle_get_server_info(
+    dump_instrumentation: bool = False,
+) -> list[TextContent]:
     """Compose shim identity (started_at) with worker DB diagnostics.
 
-    The worker reports DB diagnostics (``table_count``, ``last_ingest_date``) via
-    ``rpc("info")``; the shim adds its own ``started_at`` and a ``ready`` flag so
-    callers can confirm the worker answered.
+    The worker reports DB diagnostics (``table_count``, ``last_ingest_date``),
+    the result-cache counters and the per-tool instrumentation snapshot via
+    ``rpc("info")``; the shim adds its own ``started_at`` and a ``ready`` flag
+    so callers can confirm the worker answered. The snapshot is written to a
+    file (``instrumentation_dump``) only when ``dump_instrumentation`` is set.
     """
     info: dict[str, Any] = {
         "started_at": _STARTED_AT,
         "ready": False,
     }
-    resp = await worker.rpc("info")
+    resp = await worker.rpc("info", args={"dump_instrumentation": dump_instrumentation})
     if resp.get("ok"):
         worker_info = resp.get("data", {})
         info["ready"] = True
@@ -217,6 +313,9 @@ async def _handle_get_server_info() -> list[TextContent]:
         info["last_ingest_date"] = worker_info.get("last_ingest_date")
         if "db_error" in worker_info:
             info["db_error"] = worker_info["db_error"]
+        for key in ("result_cache", "instrumentation", "instrumentation_dump"):
+            if key in worker_info:
+                info[key] = worker_info[key]
     else:
         info["db_status"] = f"error: {resp.get('error')}"
         info["table_count"] = None
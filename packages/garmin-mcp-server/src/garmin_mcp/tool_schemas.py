@@ -2,9 +2,9 @@
 
 All handler-domain tools are now declared via the single-source registry
 (``garmin_mcp.tools.ALL_DEFS``) and built with ``build_mcp_tools``. This module
-no longer hand-declares any handler tool; it only retains the two server-level
-tools (``get_server_info``, ``reload_server``) that are handled directly in
-``server.py`` rather than by a domain handler.
+no longer hand-declares any handler tool; it only retains the server-level
+tools (``get_server_info``, ``reload_server``, ``batch_tool_calls``) that are
+handled directly in ``server.py`` rather than by a domain handler.
 
 ``get_tool_definitions()`` returns ``build_mcp_tools(ALL_DEFS)`` followed by the
 server tools, preserving the exact 41-tool order the MCP surface served before
@@ -24,7 +24,13 @@ _SERVER_TOOLS: list[dict] = [
         "description": "Get diagnostic info about the running MCP server (server_dir). Use to verify which directory the server is running from.",
         "inputSchema": {
             "type": "object",
-            "properties": {},
+            "properties": {
+                "dump_instrumentation": {
+                    "type": "boolean",
+                    "description": "Also write the instrumentation statistics to a local file (GARMIN_MCP_INSTRUMENT=1 only).",
+                    "default": False,
+                },
+            },
         },
     },
     {
@@ -35,6 +41,28 @@ _SERVER_TOOLS: list[dict] = [
             "properties": {},
         },
     },
+    {
+        "name": "batch_tool_calls",
+        "description": "Run several read tools in one request (one worker round-trip, one shared DuckDB connection). Returns {results: [...]} in call order; each item is {tool, ok, is_error, warnings, result} or {tool, ok: false, error}, so one failing call does not fail the batch. Tools that write data cannot be batched. Max 50 calls.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool calls: [{tool: name, args: {...}}, ...].",
+                    "items": {"type": "object"},
+                    "minItems": 1,
+                    "maxItems": 50,
+                },
+                "parallel": {
+                    "type": "boolean",
+                    "description": "Run the calls on parallel threads.",
+                    "default": False,
+                },
+            },
+            "required": ["calls"],
+        },
+    },
 ]
 
 
@@ -50,7 +78,7 @@ def get_tool_definitions() -> list[Tool]:
     """Return all MCP tool definitions as a list of Tool objects.
 
     All handler-domain tools come from the single-source registry
-    (``build_mcp_tools(ALL_DEFS)``); the two server-level tools are appended
+    (``build_mcp_tools(ALL_DEFS)``); the server-level tools are appended
     afterwards. Ordering is byte-for-byte identical to the pre-registry surface.
     """
     return build_mcp_tools(ALL_DEFS) + [_hand_schema_to_tool(s) for s in _SERVER_TOOLS]
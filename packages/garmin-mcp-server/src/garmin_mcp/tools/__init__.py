@@ -6,9 +6,10 @@ the per-domain modules (``physiology``, ``splits``, ...) for the declarations.
 
 ``ALL_DEFS`` aggregates every handler-domain tool in the exact order the legacy
 ``tool_schemas.get_tool_definitions()`` served them, so the live MCP surface
-stays byte-for-byte identical. The two server-level tools (``get_server_info``,
-``reload_server``) are intentionally *not* part of the registry: they are handled
-directly in ``server.py`` and appended to the MCP tool list afterwards.
+stays byte-for-byte identical. The server-level tools (``get_server_info``,
+``reload_server``, ``batch_tool_calls``) are intentionally *not* part of the
+registry: they are handled directly in ``server.py`` and appended to the MCP
+tool list afterwards.
 """
 
 from __future__ import annotations
@@ -326,6 +326,7 @@ ANALYSIS_TOOLS: list[ToolDef] = [
         handler=_insert_section_analysis_dict,
         cli_group="analysis",
         cli_name="insert-section",
+        writes_data=True,
     ),
     ToolDef(
         name="validate_section_json",
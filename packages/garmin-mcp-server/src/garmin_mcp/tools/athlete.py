@@ -248,6 +248,7 @@ ATHLETE_TOOLS: list[ToolDef] = [
         handler=_save_athlete_profile,
         cli_group="athlete",
         cli_name="save-profile",
+        writes_data=True,
     ),
     ToolDef(
         name="get_athlete_profile",
@@ -305,6 +306,7 @@ ATHLETE_TOOLS: list[ToolDef] = [
         handler=_save_weekly_review,
         cli_group="athlete",
         cli_name="save-review",
+        writes_data=True,
     ),
     ToolDef(
         name="get_weekly_review",
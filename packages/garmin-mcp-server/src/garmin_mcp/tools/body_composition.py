@@ -77,6 +77,7 @@ BODY_COMPOSITION_TOOLS: list[ToolDef] = [
         handler=_get_body_composition_trend,
         cli_group="physiology",
         cli_name="body-composition-trend",
+        cacheable=True,
     ),
     ToolDef(
         name="get_weight_economy_coupling",
@@ -100,6 +101,7 @@ BODY_COMPOSITION_TOOLS: list[ToolDef] = [
         handler=_get_weight_economy_coupling,
         cli_group="physiology",
         cli_name="weight-economy-coupling",
+        cacheable=True,
     ),
 ]
 
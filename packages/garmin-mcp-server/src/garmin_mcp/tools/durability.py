@@ -80,6 +80,7 @@ DURABILITY_TOOLS: list[ToolDef] = [
         handler=_get_activity_durability,
         cli_group="durability",
         cli_name="activity",
+        cacheable=True,
     ),
     ToolDef(
         name="get_durability_trend",
@@ -99,6 +100,7 @@ DURABILITY_TOOLS: list[ToolDef] = [
         handler=_get_durability_trend,
         cli_group="durability",
         cli_name="trend",
+        cacheable=True,
     ),
 ]
 
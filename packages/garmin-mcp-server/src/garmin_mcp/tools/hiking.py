@@ -90,6 +90,7 @@ HIKING_TOOLS: list[ToolDef] = [
         handler=_ingest_hiking_sessions,
         cli_group="hiking",
         cli_name="ingest",
+        writes_data=True,
     ),
     ToolDef(
         name="get_hiking_sessions",
@@ -85,6 +85,7 @@ INGEST_TOOLS: list[ToolDef] = [
         handler=_catch_up_ingest,
         cli_group="ingest",
         cli_name="catch-up",
+        writes_data=True,
     ),
 ]
 
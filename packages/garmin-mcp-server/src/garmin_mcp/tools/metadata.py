@@ -140,6 +140,7 @@ METADATA_TOOLS: list[ToolDef] = [
         handler=_get_activity_by_date,
         cli_group="metadata",
         cli_name="activity-by-date",
+        cacheable=True,
     ),
     ToolDef(
         name="get_date_by_activity_id",
@@ -148,6 +149,7 @@ METADATA_TOOLS: list[ToolDef] = [
         handler=_get_date_by_activity_id,
         cli_group="metadata",
         cli_name="date-by-activity-id",
+        cacheable=True,
     ),
     ToolDef(
         name="ingest_activity",
@@ -159,6 +161,7 @@ METADATA_TOOLS: list[ToolDef] = [
         handler=_ingest_activity,
         cli_group="metadata",
         cli_name="ingest",
+        writes_data=True,
     ),
 ]
 
@@ -54,6 +54,7 @@ PERFORMANCE_TOOLS: list[ToolDef] = [
         handler=_get_performance_trends,
         cli_group="performance",
         cli_name="trends",
+        cacheable=True,
     ),
     ToolDef(
         name="get_weather_data",
@@ -62,6 +63,7 @@ PERFORMANCE_TOOLS: list[ToolDef] = [
         handler=_get_weather_data,
         cli_group="performance",
         cli_name="weather",
+        cacheable=True,
     ),
     ToolDef(
         name="prefetch_activity_context",
@@ -76,6 +78,8 @@ PERFORMANCE_TOOLS: list[ToolDef] = [
         handler=_prefetch_activity_context,
         cli_group="performance",
         cli_name="prefetch-context",
+        # Self-healing: may write the missing monthly form baselines.
+        writes_data=True,
     ),
     ToolDef(
         name="get_objective_fitness_curve",
@@ -88,6 +92,7 @@ PERFORMANCE_TOOLS: list[ToolDef] = [
         handler=_get_objective_fitness_curve,
         cli_group="performance",
         cli_name="objective-fitness-curve",
+        cacheable=True,
     ),
 ]
 
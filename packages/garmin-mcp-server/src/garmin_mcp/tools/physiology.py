@@ -39,6 +39,7 @@ PHYSIOLOGY_TOOLS: list[ToolDef] = [
         handler=lambda r, p: r.get_form_efficiency_summary(p.activity_id),
         cli_group="physiology",
         cli_name="form-efficiency",
+        cacheable=True,
     ),
     ToolDef(
         name="get_form_evaluations",
@@ -50,6 +51,7 @@ PHYSIOLOGY_TOOLS: list[ToolDef] = [
         handler=lambda r, p: r.get_form_evaluations(p.activity_id),
         cli_group="physiology",
         cli_name="form-evaluations",
+        cacheable=True,
     ),
     ToolDef(
         name="get_form_baseline_trend",
@@ -66,6 +68,7 @@ PHYSIOLOGY_TOOLS: list[ToolDef] = [
         ),
         cli_group="physiology",
         cli_name="form-baseline-trend",
+        cacheable=True,
     ),
     ToolDef(
         name="get_hr_efficiency_analysis",
@@ -77,6 +80,7 @@ PHYSIOLOGY_TOOLS: list[ToolDef] = [
         handler=lambda r, p: r.get_hr_efficiency_analysis(p.activity_id),
         cli_group="physiology",
         cli_name="hr-efficiency",
+        cacheable=True,
     ),
     ToolDef(
         name="get_heart_rate_zones_detail",
@@ -88,6 +92,7 @@ PHYSIOLOGY_TOOLS: list[ToolDef] = [
         handler=lambda r, p: r.get_heart_rate_zones_detail(p.activity_id),
         cli_group="physiology",
         cli_name="heart-rate-zones",
+        cacheable=True,
     ),
     ToolDef(
         name="get_vo2_max_data",
@@ -96,6 +101,7 @@ PHYSIOLOGY_TOOLS: list[ToolDef] = [
         handler=lambda r, p: r.get_vo2_max_data(p.activity_id),
         cli_group="physiology",
         cli_name="vo2-max",
+        cacheable=True,
     ),
     ToolDef(
         name="get_lactate_threshold_data",
@@ -104,6 +110,7 @@ PHYSIOLOGY_TOOLS: list[ToolDef] = [
         handler=lambda r, p: r.get_lactate_threshold_data(p.activity_id),
         cli_group="physiology",
         cli_name="lactate-threshold",
+        cacheable=True,
     ),
 ]
 
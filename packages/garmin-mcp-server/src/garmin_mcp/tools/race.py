@@ -51,6 +51,7 @@ RACE_TOOLS: list[ToolDef] = [
         handler=_get_race_readiness,
         cli_group="race",
         cli_name="readiness",
+        cacheable=True,
     ),
 ]
 
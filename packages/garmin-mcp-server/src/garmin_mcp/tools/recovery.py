@@ -90,6 +90,7 @@ RECOVERY_TOOLS: list[ToolDef] = [
         handler=_get_recovery_trend,
         cli_group="physiology",
         cli_name="recovery-trend",
+        cacheable=True,
     ),
     ToolDef(
         name="get_recovery_status",
@@ -110,6 +111,7 @@ RECOVERY_TOOLS: list[ToolDef] = [
         handler=_get_recovery_status,
         cli_group="physiology",
         cli_name="recovery-status",
+        cacheable=True,
     ),
     ToolDef(
         name="get_wellness_baseline_deviation",
@@ -131,6 +133,7 @@ RECOVERY_TOOLS: list[ToolDef] = [
         handler=_get_wellness_baseline_deviation,
         cli_group="physiology",
         cli_name="wellness-baseline",
+        cacheable=True,
     ),
 ]
 
@@ -21,6 +21,8 @@ from typing import TYPE_CHECKING, Any
 from mcp.types import Tool
 from pydantic import BaseModel
 
+from garmin_mcp.utils.instrumentation import track_tool_call
+
 if TYPE_CHECKING:
     from garmin_mcp.database.db_reader import GarminDBReader
 
@@ -43,6 +45,10 @@ class ToolDef:
             applied after deriving the schema from ``params``. This lets several
             tools share a single params model while each gives a property (e.g.
             ``statistics_only``) its own MCP description.
+        cacheable: Pure read tool whose serialized result the MCP worker may
+            memoize per arguments and data version (``utils/result_cache``).
+        writes_data: Tool writes to the database; the worker drops its
+            result cache after each call.
     """
 
     name: str
@@ -53,6 +59,8 @@ class ToolDef:
     cli_name: str
     input_schema_override: dict[str, Any] | None = None
     field_descriptions: dict[str, str] | None = None
+    cacheable: bool = False
+    writes_data: bool = False
 
 
 def to_mcp_input_schema(
@@ -180,6 +188,9 @@ def dispatch(
 ) -> object:
     """Validate arguments and dispatch to the tool's handler.
 
+    Validation and the handler run inside ``track_tool_call`` so per-tool
+    latency and DB usage are recorded when instrumentation is enabled.
+
     Args:
         defs_by_name: Lookup of tool name -> ToolDef.
         reader: GarminDBReader instance passed to the handler.
@@ -193,5 +204,6 @@ def dispatch(
         KeyError: If ``name`` is not a registered tool.
     """
     tool_def = defs_by_name[name]
-    params_instance = tool_def.params(**arguments)
-    return tool_def.handler(reader, params_instance)
+    with track_tool_call(name):
+        params_instance = tool_def.params(**arguments)
+        return tool_def.handler(reader, params_instance)
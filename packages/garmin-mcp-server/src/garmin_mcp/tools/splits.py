@@ -94,6 +94,7 @@ SPLITS_TOOLS: list[ToolDef] = [
                 "Default: false"
             )
         },
+        cacheable=True,
     ),
     ToolDef(
         name="get_splits_form_metrics",
@@ -113,6 +114,7 @@ SPLITS_TOOLS: list[ToolDef] = [
                 "output size by ~80%. Default: false"
             )
         },
+        cacheable=True,
     ),
     ToolDef(
         name="get_splits_elevation",
@@ -131,6 +133,7 @@ SPLITS_TOOLS: list[ToolDef] = [
                 "Reduces output size by ~80%. Default: false"
             )
         },
+        cacheable=True,
     ),
     ToolDef(
         name="get_splits_comprehensive",
@@ -150,6 +153,7 @@ SPLITS_TOOLS: list[ToolDef] = [
                 "Default: false"
             )
         },
+        cacheable=True,
     ),
     ToolDef(
         name="get_interval_analysis",
@@ -161,6 +165,7 @@ SPLITS_TOOLS: list[ToolDef] = [
         handler=_get_interval_analysis,
         cli_group="splits",
         cli_name="interval-analysis",
+        cacheable=True,
     ),
 ]
 
@@ -93,6 +93,7 @@ STRENGTH_TOOLS: list[ToolDef] = [
         handler=_ingest_strength_sessions,
         cli_group="strength",
         cli_name="ingest",
+        writes_data=True,
     ),
     ToolDef(
         name="get_strength_sessions",
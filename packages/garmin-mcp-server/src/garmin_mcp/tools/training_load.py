@@ -87,6 +87,7 @@ LOAD_TOOLS: list[ToolDef] = [
         handler=_get_acwr,
         cli_group="load",
         cli_name="acwr",
+        cacheable=True,
     ),
     ToolDef(
         name="get_load_trend",
@@ -101,6 +102,7 @@ LOAD_TOOLS: list[ToolDef] = [
         handler=_get_load_trend,
         cli_group="load",
         cli_name="trend",
+        cacheable=True,
     ),
     ToolDef(
         name="get_injury_risk",
@@ -119,6 +121,7 @@ LOAD_TOOLS: list[ToolDef] = [
         handler=_get_injury_risk,
         cli_group="load",
         cli_name="injury-risk",
+        cacheable=True,
     ),
 ]
 
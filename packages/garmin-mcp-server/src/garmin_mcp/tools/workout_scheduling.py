@@ -495,6 +495,7 @@ WORKOUT_SCHEDULING_TOOLS: list[ToolDef] = [
         handler=_schedule_custom_workout,
         cli_group="workout",
         cli_name="schedule",
+        writes_data=True,
     ),
     ToolDef(
         name="cleanup_generated_workouts",
@@ -508,6 +509,7 @@ WORKOUT_SCHEDULING_TOOLS: list[ToolDef] = [
         handler=_cleanup_generated_workouts,
         cli_group="workout",
         cli_name="cleanup",
+        writes_data=True,
     ),
 ]
 
@@ -0,0 +1,282 @@
+"""Opt-in per-tool latency and resource instrumentation for the MCP worker.
+
+Enabled by setting ``GARMIN_MCP_INSTRUMENT=1`` in the server environment (the
+worker inherits it from the shim). When disabled every hook is a cheap no-op:
+``track_tool_call`` yields immediately and ``track_connection`` hands back the
+raw DuckDB connection.
+
+What is recorded, per tool:
+
+- wall time of each call (``tools/registry.dispatch``), kept in a bounded
+  window of recent samples from which ``p50_ms`` / ``p95_ms`` / ``max_ms``
+  are reported
+- SQL time (``execute`` plus ``fetch*`` on connections opened through
+  ``get_connection``, on the cursors ``BaseDBReader._get_connection`` takes on a
+  shared connection, and on the shared connection of a
+  ``GarminDBReader.from_connection`` reader), connection count and rows
+  fetched
+- serialization time and response bytes of the final MCP text (worker)
+
+``snapshot()`` returns the aggregate as a JSON-serializable dict (surfaced by
+``get_server_info``) and ``dump_stats()`` writes it to
+``get_result_dir()/instrumentation/`` (on ``get_server_info`` with
+``dump_instrumentation`` and at worker shutdown). Calls of a parallel batch
+finish on several threads, so the per-tool aggregate is updated under a lock.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import duckdb
+
+from garmin_mcp.utils.paths import get_result_dir
+
+ENV_VAR = "GARMIN_MCP_INSTRUMENT"
+
+# Recent samples kept per tool for the latency percentiles.
+SAMPLE_WINDOW = 1000
+
+
+def instrumentation_enabled() -> bool:
+    """Return True when ``GARMIN_MCP_INSTRUMENT`` opts in (``1``/``true``/``yes``)."""
+    return os.getenv(ENV_VAR, "").strip().lower() in {"1", "true", "yes"}
+
+
+@dataclass
+class _CallStats:
+    """Resources used by the tool call in progress."""
+
+    sql_ms: float = 0.0
+    connections: int = 0
+    rows: int = 0
+
+
+@dataclass
+class _ToolStats:
+    """Aggregate of every recorded call of one tool."""
+
+    calls: int = 0
+    errors: int = 0
+    durations_ms: deque[float] = field(
+        default_factory=lambda: deque(maxlen=SAMPLE_WINDOW)
+    )
+    total_ms: float = 0.0
+    sql_ms: float = 0.0
+    connections: int = 0
+    rows: int = 0
+    serialize_ms: float = 0.0
+    response_bytes: int = 0
+    max_response_bytes: int = 0
+
+
+_current_call: ContextVar[_CallStats | None] = ContextVar(
+    "garmin_mcp_current_call", default=None
+)
+_tools: dict[str, _ToolStats] = {}
+_tools_lock = threading.Lock()
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list (0.0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+@contextmanager
+def track_tool_call(name: str) -> Iterator[None]:
+    """Record the wall time and resources of one tool call.
+
+    Connections opened through ``track_connection`` while the block runs are
+    attributed to ``name``. Exceptions are counted as errors and re-raised.
+
+    Args:
+        name: Tool name.
+    """
+    if not instrumentation_enabled():
+        yield
+        return
+
+    call = _CallStats()
+    token = _current_call.set(call)
+    start = time.perf_counter()
+    failed = False
+    try:
+        yield
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        _current_call.reset(token)
+        with _tools_lock:
+            stats = _tools.setdefault(name, _ToolStats())
+            stats.calls += 1
+            stats.errors += int(failed)
+            stats.durations_ms.append(elapsed_ms)
+            stats.total_ms += elapsed_ms
+            stats.sql_ms += call.sql_ms
+            stats.connections += call.connections
+            stats.rows += call.rows
+
+
+def record_response(name: str, serialize_ms: float, text: str) -> None:
+    """Record serialization time and size of a tool's final MCP text.
+
+    Args:
+        name: Tool name.
+        serialize_ms: Time spent serializing the result.
+        text: The serialized text (its UTF-8 size is recorded).
+    """
+    if not instrumentation_enabled():
+        return
+    response_bytes = len(text.encode("utf-8"))
+    with _tools_lock:
+        stats = _tools.setdefault(name, _ToolStats())
+        stats.serialize_ms += serialize_ms
+        stats.response_bytes += response_bytes
+        stats.max_response_bytes = max(stats.max_response_bytes, response_bytes)
+
+
+class _InstrumentedConnection:
+    """DuckDB connection proxy charging query time and rows to the current call.
+
+    ``execute`` returns the proxy itself (DuckDB's ``execute`` returns the
+    connection), so chained ``conn.execute(...).fetchall()`` is measured end
+    to end. Other attributes pass through untouched.
+    """
+
+    def __init__(self, conn: duckdb.DuckDBPyConnection, call: _CallStats) -> None:
+        self._conn = conn
+        self._call = call
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def _timed(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return getattr(self._conn, method)(*args, **kwargs)
+        finally:
+            self._call.sql_ms += (time.perf_counter() - start) * 1000
+
+    def execute(self, *args: Any, **kwargs: Any) -> _InstrumentedConnection:
+        self._timed("execute", *args, **kwargs)
+        return self
+
+    def fetchone(self) -> Any:
+        row = self._timed("fetchone")
+        if row is not None:
+            self._call.rows += 1
+        return row
+
+    def fetchall(self) -> list[Any]:
+        rows: list[Any] = self._timed("fetchall")
+        self._call.rows += len(rows)
+        return rows
+
+    def fetchmany(self, *args: Any, **kwargs: Any) -> list[Any]:
+        rows: list[Any] = self._timed("fetchmany", *args, **kwargs)
+        self._call.rows += len(rows)
+        return rows
+
+    def fetchdf(self, *args: Any, **kwargs: Any) -> Any:
+        frame = self._timed("fetchdf", *args, **kwargs)
+        self._call.rows += len(frame)
+        return frame
+
+    def df(self, *args: Any, **kwargs: Any) -> Any:
+        frame = self._timed("df", *args, **kwargs)
+        self._call.rows += len(frame)
+        return frame
+
+
+@contextmanager
+def track_connection(
+    conn: duckdb.DuckDBPyConnection,
+) -> Iterator[duckdb.DuckDBPyConnection]:
+    """Count a connection and wrap it for SQL timing during a tracked call.
+
+    Outside a tracked call (or when disabled) the connection is yielded as is.
+
+    Args:
+        conn: Freshly opened DuckDB connection.
+
+    Yields:
+        The connection, or a measuring proxy with the same query interface.
+    """
+    call = _current_call.get()
+    if call is None:
+        yield conn
+        return
+    call.connections += 1
+    proxy: Any = _InstrumentedConnection(conn, call)
+    yield proxy
+
+
+def snapshot() -> dict[str, Any]:
+    """Return the aggregated per-tool statistics.
+
+    Returns:
+        ``{"enabled": bool, "tools": {name: {...}}}``; tools are ordered by
+        total wall time, slowest first.
+    """
+    tools: dict[str, Any] = {}
+    with _tools_lock:
+        ranked = sorted(_tools.items(), key=lambda item: item[1].total_ms, reverse=True)
+        for name, stats in ranked:
+            durations = sorted(stats.durations_ms)
+            calls = max(stats.calls, 1)
+            tools[name] = {
+                "calls": stats.calls,
+                "errors": stats.errors,
+                "p50_ms": round(_percentile(durations, 50), 2),
+                "p95_ms": round(_percentile(durations, 95), 2),
+                "max_ms": round(durations[-1], 2) if durations else 0.0,
+                "total_ms": round(stats.total_ms, 2),
+                "sql_ms": round(stats.sql_ms, 2),
+                "serialize_ms": round(stats.serialize_ms, 2),
+                "connections": stats.connections,
+                "rows_fetched": stats.rows,
+                "response_bytes": stats.response_bytes,
+                "avg_response_bytes": stats.response_bytes // calls,
+                "max_response_bytes": stats.max_response_bytes,
+            }
+    return {"enabled": instrumentation_enabled(), "tools": tools}
+
+
+def dump_stats(path: Path | None = None) -> Path:
+    """Write ``snapshot()`` as JSON to a local file.
+
+    Args:
+        path: Output file. Defaults to
+            ``get_result_dir()/instrumentation/mcp_worker_<pid>.json``.
+
+    Returns:
+        The path written.
+    """
+    if path is None:
+        path = get_result_dir() / "instrumentation" / f"mcp_worker_{os.getpid()}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"dumped_at": datetime.now(UTC).isoformat(), **snapshot()}
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+    return path
+
+
+def reset() -> None:
+    """Drop every recorded statistic."""
+    with _tools_lock:
+        _tools.clear()
@@ -0,0 +1,239 @@
+"""Incremental reading of large top-level JSON objects.
+
+``json.load`` materializes a whole document as nested Python objects, which for
+``activity_details.json`` of an ultra run or a long hike is hundreds of MB. The
+helpers here walk the top-level object of a file with a bounded text buffer:
+
+- :func:`load_top_level_fields` decodes only the requested fields and skips
+  every other value without building it (stopping once all are found).
+- :func:`iter_top_level_array` yields the items of one top-level array field
+  in fixed-size chunks, so callers hold at most ``chunk_size`` decoded items.
+
+Only the top level is navigated; each returned value / array item is decoded
+with the stdlib decoder. Malformed input raises ``json.JSONDecodeError``.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+DEFAULT_READ_CHARS = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Inside a string: everything up to the closing quote (escapes included).
+_STRING_BODY = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+# Characters that change nesting depth while skipping a container.
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+
+_DECODER = json.JSONDecoder()
+
+
+class _Scanner:
+    """Cursor over a text stream holding only the unconsumed tail in memory."""
+
+    def __init__(self, stream: TextIO, read_chars: int) -> None:
+        self._stream = stream
+        self._read_chars = read_chars
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, min_chars: int) -> bool:
+        """Drop the consumed prefix and read at least ``min_chars`` more."""
+        if self._eof:
+            return False
+        chunk = self._stream.read(max(min_chars, self._read_chars))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buf, self._pos)
+
+    def peek(self) -> str:
+        """Next non-whitespace character (``""`` at end of input)."""
+        while True:
+            match = _WHITESPACE.match(self._buf, self._pos)
+            self._pos = match.end() if match else self._pos
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill(1):
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume ``char`` (after whitespace) or raise."""
+        if self.peek() != char:
+            raise self._error(f"Expecting {char!r}")
+        self._pos += 1
+
+    def decode(self) -> Any:
+        """Decode the value at the cursor.
+
+        The buffer is grown until the value parses and does not end exactly at
+        the buffer end (a number there may continue in the next read).
+        """
+        self.peek()
+        want = self._read_chars
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill(want):
+                    raise
+                want *= 2
+                continue
+            if end == len(self._buf) and self._fill(want):
+                want *= 2
+                continue
+            self._pos = end
+            return value
+
+    def _skip_string(self) -> None:
+        """Skip a string whose opening quote is at the cursor."""
+        self._pos += 1
+        while True:
+            match = _STRING_BODY.match(self._buf, self._pos)
+            if match:
+                self._pos = match.end()
+                return
+            if not self._fill(self._read_chars):
+                raise self._error("Unterminated string")
+
+    def skip(self) -> None:
+        """Consume the value at the cursor without building Python objects."""
+        char = self.peek()
+        if char == '"':
+            self._skip_string()
+            return
+        if char not in "{[":
+            self.decode()
+            return
+        depth = 0
+        while True:
+            match = _STRUCTURAL.search(self._buf, self._pos)
+            if match is None:
+                self._pos = len(self._buf)
+                if not self._fill(self._read_chars):
+                    raise self._error("Unterminated container")
+                continue
+            self._pos = match.start()
+            token = match.group()
+            if token == '"':
+                self._skip_string()
+                continue
+            self._pos += 1
+            depth += 1 if token in "{[" else -1
+            if depth == 0:
+                return
+
+    def consume_separator(self, closing: str) -> bool:
+        """After a member/item: consume ``,`` (True) or ``closing`` (False)."""
+        char = self.peek()
+        if char == ",":
+            self._pos += 1
+            return True
+        self.expect(closing)
+        return False
+
+    def iter_keys(self) -> Iterator[str]:
+        """Iterate the keys of the object at the cursor.
+
+        After each yielded key the cursor is at its value, which the caller
+        must consume (``decode`` / ``skip`` / array iteration) before resuming.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self._error("Expecting property name")
+            key = self.decode()
+            self.expect(":")
+            yield key
+            if not self.consume_separator("}"):
+                return
+
+
+def load_top_level_fields(
+    path: str | Path,
+    fields: set[str] | frozenset[str],
+    *,
+    read_chars: int = DEFAULT_READ_CHARS,
+) -> dict[str, Any]:
+    """Decode selected fields of a file's top-level JSON object.
+
+    Args:
+        path: JSON file whose document is an object.
+        fields: Top-level keys to decode; all other values are skipped.
+        read_chars: Characters read from the file per buffer refill.
+
+    Returns:
+        ``{field: value}`` for the requested fields present in the file.
+    """
+    found: dict[str, Any] = {}
+    if not fields:
+        return found
+    with open(path, encoding="utf-8") as f:
+        scanner = _Scanner(f, read_chars)
+        for key in scanner.iter_keys():
+            if key in fields:
+                found[key] = scanner.decode()
+                if len(found) == len(fields):
+                    break
+            else:
+                scanner.skip()
+    return found
+
+
+def iter_top_level_array(
+    path: str | Path,
+    field: str,
+    chunk_size: int,
+    *,
+    read_chars: int = DEFAULT_READ_CHARS,
+) -> Iterator[list[Any]]:
+    """Yield the items of a top-level array field in chunks.
+
+    Args:
+        path: JSON file whose document is an object.
+        field: Top-level key holding an array.
+        chunk_size: Maximum number of decoded items per yielded list.
+        read_chars: Characters read from the file per buffer refill.
+
+    Yields:
+        Lists of at most ``chunk_size`` items, in document order. Nothing is
+        yielded when the field is missing, ``null`` or an empty array.
+
+    Raises:
+        json.JSONDecodeError: If the document is malformed or ``field`` holds
+            something other than an array.
+    """
+    with open(path, encoding="utf-8") as f:
+        scanner = _Scanner(f, read_chars)
+        for key in scanner.iter_keys():
+            if key != field:
+                scanner.skip()
+                continue
+            if scanner.peek() == "n":
+                scanner.decode()
+                return
+            scanner.expect("[")
+            if scanner.peek() == "]":
+                return
+            chunk: list[Any] = []
+            while True:
+                chunk.append(scanner.decode())
+                more = scanner.consume_separator("]")
+                if len(chunk) == chunk_size or not more:
+                    yield chunk
+                    chunk = []
+                if not more:
+                    return
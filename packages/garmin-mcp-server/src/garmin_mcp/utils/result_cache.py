@@ -0,0 +1,151 @@
+"""Bounded LRU memo of serialized tool results for the MCP worker.
+
+Only tools declared ``ToolDef(cacheable=True)`` (pure reads) are memoized. An
+entry is keyed by the tool name and its canonicalized arguments (validated
+through the tool's params model, so omitted and explicit defaults share an
+entry) and is valid for one *data version*:
+
+- the size / mtime of the DuckDB file and its WAL, which change on every write
+  from any process (worker write tools, ``garmin-db`` CLI ingests,
+  regeneration)
+- the current date, since several reads default to "today"
+
+When the version changes, the whole cache is dropped. Write tools
+(``ToolDef(writes_data=True)``) also drop it explicitly after they run, so
+invalidation never depends on file timestamp resolution.
+
+The capacity is read from ``GARMIN_MCP_RESULT_CACHE_SIZE`` (default 128
+entries, ``0`` disables caching). Hit/miss counters are reported by
+``get_server_info``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+ENV_VAR = "GARMIN_MCP_RESULT_CACHE_SIZE"
+DEFAULT_MAX_ENTRIES = 128
+
+
+def cache_size() -> int:
+    """Return the configured capacity (``GARMIN_MCP_RESULT_CACHE_SIZE``)."""
+    raw = os.getenv(ENV_VAR, "").strip()
+    if not raw:
+        return DEFAULT_MAX_ENTRIES
+    try:
+        return max(int(raw), 0)
+    except ValueError:
+        return DEFAULT_MAX_ENTRIES
+
+
+def canonical_args(args: dict[str, Any]) -> str:
+    """Serialize arguments deterministically (sorted keys, compact)."""
+    return json.dumps(args, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def data_version(db_path: str | Path) -> tuple[Any, ...]:
+    """Token that changes whenever the database may have been written.
+
+    Args:
+        db_path: DuckDB database file.
+
+    Returns:
+        Today's date plus ``(size, mtime_ns)`` of the database file and its
+        write-ahead log (``None`` for a missing file).
+    """
+    stats: list[Any] = [date.today().isoformat()]
+    for path in (Path(db_path), Path(f"{db_path}.wal")):
+        try:
+            stat = path.stat()
+        except OSError:
+            stats.append(None)
+        else:
+            stats.append((stat.st_size, stat.st_mtime_ns))
+    return tuple(stats)
+
+
+class ResultCache:
+    """LRU map of ``(tool, canonical args)`` to a serialized tool result.
+
+    Args:
+        max_entries: Capacity; ``0`` disables the cache (every lookup misses
+            and nothing is stored).
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+        self._version: tuple[Any, ...] | None = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        # Batched tool calls may run on several threads.
+        self._lock = threading.RLock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def _check_version(self, version: tuple[Any, ...]) -> None:
+        if version != self._version:
+            if self._entries:
+                self.invalidate()
+            self._version = version
+
+    def get(
+        self, tool: str, args_key: str, version: tuple[Any, ...]
+    ) -> dict[str, Any] | None:
+        """Return the cached result for the current data version, if any."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            self._check_version(version)
+            entry = self._entries.get((tool, args_key))
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((tool, args_key))
+            self.hits += 1
+            return entry
+
+    def put(
+        self,
+        tool: str,
+        args_key: str,
+        version: tuple[Any, ...],
+        result: dict[str, Any],
+    ) -> None:
+        """Store a result computed at ``version``, evicting the oldest entry."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._check_version(version)
+            self._entries[(tool, args_key)] = result
+            self._entries.move_to_end((tool, args_key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every entry (after a write)."""
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for ``get_server_info``."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "max_entries": self.max_entries,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "invalidations": self.invalidations,
+        }
@@ -9,19 +9,39 @@ live.
 
 IPC contract (one line = one JSON object):
 
-- request : ``{"id": int, "op": "schema"|"call"|"info", "tool": str, "args": {...}}``
+- request : ``{"id": int, "op": "schema"|"call"|"batch"|"info", "tool": str,
+  "args": {...}}``
 - response: ``{"id": int, "ok": true, "data": ...}``
            / ``{"id": int, "ok": false, "error": str}``
+- ``call`` / ``batch`` response: an envelope header line
+  ``{"id": int, "ok": true, "is_error": bool, "warnings": int, "text_bytes": int}``
+  followed by exactly ``text_bytes`` bytes of UTF-8 MCP text and a newline.
 
 ``op`` semantics:
 
 - ``schema`` -- JSON-ize ``build_mcp_tools(ALL_DEFS)`` (name/description/inputSchema
-  list) for the *domain* tools only. The two server tools (``get_server_info``,
-  ``reload_server``) are appended by the shim, not the worker.
-- ``call``   -- ``dispatch(ALL_DEFS_BY_NAME, GarminDBReader(...), tool, args)`` and
-  return a value that is ``json.dumps(..., default=str)``-serializable.
+  list) for the *domain* tools only. The server tools (``get_server_info``,
+  ``reload_server``, ``batch_tool_calls``) are appended by the shim, not the
+  worker.
+- ``call``   -- ``dispatch(ALL_DEFS_BY_NAME, GarminDBReader(...), tool, args)``,
+  serialized once into the final MCP text (``format_json_response``). Whether
+  the result is a tool error and how many ``_warnings`` it carries are read
+  from the Python object and sent in the header, so the shim forwards the text
+  without parsing it again. Results of ``cacheable`` tools are memoized per
+  arguments and data version (:mod:`garmin_mcp.utils.result_cache`);
+  ``writes_data`` tools drop the memo.
+- ``batch``  -- ``args = {"calls": [{"tool": str, "args": {...}}, ...],
+  "parallel": bool}``: every call goes through the same path as ``call``
+  (result cache included) against one read connection shared through
+  ``GarminDBReader.from_connection`` (one cursor per call, optionally on
+  threads). The text is ``{"results": [...]}`` in request order, each item
+  ``{"tool", "ok", "is_error", "warnings", "result"}`` or ``{"tool", "ok":
+  false, "error"}``; one failing call never fails the batch. ``writes_data``
+  tools are refused (the batch holds a read-only connection).
 - ``info``   -- DB diagnostics (``SHOW TABLES`` count, ``MAX(start_time_local)``,
-  ``started_at``).
+  ``started_at``), result-cache counters and the per-tool instrumentation
+  snapshot (:mod:`garmin_mcp.utils.instrumentation`), dumped to a local file
+  when ``GARMIN_MCP_INSTRUMENT`` is enabled.
 
 All exceptions are caught and returned as ``{"ok": false, "error": repr(e)}`` so
 the worker never crashes mid-loop. ``datetime.date`` values are made
@@ -34,20 +54,44 @@ import json
 import logging
 import signal
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from types import FrameType
-from typing import Any
+from typing import Any, BinaryIO
 
-from garmin_mcp.database.connection import get_connection, get_db_path
+from pydantic import ValidationError
+
+from garmin_mcp.database.connection import get_connection, get_db_path, open_cursor
 from garmin_mcp.database.db_reader import GarminDBReader
+from garmin_mcp.handlers.base import format_json_response
 from garmin_mcp.tools import ALL_DEFS, ALL_DEFS_BY_NAME
 from garmin_mcp.tools.registry import build_mcp_tools, dispatch
+from garmin_mcp.utils.instrumentation import (
+    dump_stats,
+    instrumentation_enabled,
+    record_response,
+    snapshot,
+)
+from garmin_mcp.utils.result_cache import (
+    ResultCache,
+    cache_size,
+    canonical_args,
+    data_version,
+)
 
 logger = logging.getLogger(__name__)
 
 # Captured at import so each fresh worker process reports its own start time.
 _STARTED_AT = datetime.now(UTC).isoformat()
 
+# Per-process memo of serialized results of ``cacheable`` tools.
+_RESULT_CACHE = ResultCache(cache_size())
+
+# ``batch`` op limits: calls per request and threads for ``parallel`` batches.
+BATCH_MAX_CALLS = 50
+BATCH_MAX_WORKERS = 4
+
 
 def _apply_startup_migrations(db_path: str | None = None) -> list[str]:
     """Bring the on-disk schema up to date before serving any request.
@@ -83,8 +127,9 @@ def _apply_startup_migrations(db_path: str | None = None) -> list[str]:
 def build_schema() -> list[dict[str, Any]]:
     """Return the domain tools' MCP schema as plain JSON-serializable dicts.
 
-    The two server tools (``get_server_info``, ``reload_server``) are *not*
-    included; the shim appends them after receiving the worker schema.
+    The server tools (``get_server_info``, ``reload_server``,
+    ``batch_tool_calls``) are *not* included; the shim appends them after
+    receiving the worker schema.
 
     Returns:
         A list of ``{"name", "description", "inputSchema"}`` dicts, one per
@@ -101,11 +146,14 @@ def build_schema() -> list[dict[str, Any]]:
     ]
 
 
-def _db_info() -> dict[str, Any]:
+def _db_info(dump_instrumentation: bool = False) -> dict[str, Any]:
     """Collect best-effort DB diagnostics.
 
     Never raises: connection/query failures degrade to ``table_count=0`` and
-    ``last_ingest_date=None`` so the response shape stays stable.
+    ``last_ingest_date=None`` so the response shape stays stable. When
+    ``dump_instrumentation`` is requested and instrumentation is enabled the
+    snapshot is also written to disk and the file path reported as
+    ``instrumentation_dump``.
     """
     info: dict[str, Any] = {
         "db_path": str(get_db_path()),
@@ -123,20 +171,162 @@ def _db_info() -> dict[str, Any]:
             info["last_ingest_date"] = str(row[0]) if row and row[0] else None
     except Exception as e:  # pragma: no cover - exercised via integration/info
         info["db_error"] = repr(e)
+    info["result_cache"] = _RESULT_CACHE.stats()
+    info["instrumentation"] = snapshot()
+    if dump_instrumentation and instrumentation_enabled():
+        try:
+            info["instrumentation_dump"] = str(dump_stats())
+        except OSError as e:
+            info["instrumentation_dump_error"] = repr(e)
     return info
 
 
+def _result_envelope(result: object) -> dict[str, Any]:
+    """Serialize a tool result into its final MCP text plus header metadata.
+
+    Serialization errors raise here, so ``handle`` reports them as ``ok=False``.
+
+    Args:
+        result: The tool handler's return value.
+
+    Returns:
+        ``{"text", "is_error", "warnings"}``: the MCP text, whether the result
+        is a ``{"error": ...}`` payload, and the length of its ``_warnings``.
+    """
+    is_error = isinstance(result, dict) and "error" in result
+    warnings = 0
+    if isinstance(result, dict) and isinstance(result.get("_warnings"), list):
+        warnings = len(result["_warnings"])
+    return {
+        "text": format_json_response(result, default=str),
+        "is_error": is_error,
+        "warnings": warnings,
+    }
+
+
+def _call_tool(
+    tool: str, args: dict[str, Any], reader: GarminDBReader
+) -> dict[str, Any]:
+    """Dispatch one tool call and return its envelope, using the result cache.
+
+    Only ``cacheable`` tools are looked up; arguments are canonicalized through
+    the tool's params model so omitted and explicit defaults share an entry.
+    Arguments that fail validation skip the cache and reach ``dispatch``, which
+    reports them like for any other tool. Error payloads are not cached. ``writes_data`` tools invalidate the cache
+    after running (whether or not they succeed).
+    """
+    tool_def = ALL_DEFS_BY_NAME.get(tool)
+    cache_key = None
+    if tool_def is not None and tool_def.cacheable and _RESULT_CACHE.enabled:
+        try:
+            params = tool_def.params.model_validate(args)
+        except ValidationError:
+            params = None
+        if params is not None:
+            cache_key = canonical_args(params.model_dump(mode="json"))
+            version = data_version(reader.db_path)
+            cached = _RESULT_CACHE.get(tool, cache_key, version)
+            if cached is not None:
+                return cached
+
+    try:
+        result = dispatch(ALL_DEFS_BY_NAME, reader, tool, args)
+    finally:
+        if tool_def is not None and tool_def.writes_data:
+            _RESULT_CACHE.invalidate()
+    start = time.perf_counter()
+    envelope = _result_envelope(result)
+    record_response(tool, (time.perf_counter() - start) * 1000, envelope["text"])
+    if cache_key is not None and not envelope["is_error"]:
+        _RESULT_CACHE.put(tool, cache_key, version, envelope)
+    return envelope
+
+
+def _batch_item_text(tool: Any, outcome: dict[str, Any]) -> str:
+    """Serialize one batch item, splicing the call's MCP text in verbatim."""
+    if "text" not in outcome:
+        return format_json_response({"tool": tool, **outcome}, default=str)
+    header = format_json_response(
+        {
+            "tool": tool,
+            "ok": True,
+            "is_error": outcome["is_error"],
+            "warnings": outcome["warnings"],
+        }
+    )
+    return f'{header[:-1]},"result":{outcome["text"]}}}'
+
+
+def _batch_tool_calls(
+    calls: list[dict[str, Any]], parallel: bool, db_path: str
+) -> dict[str, Any]:
+    """Run several tool calls on one read connection and merge the results.
+
+    Args:
+        calls: ``[{"tool": str, "args": {...}}, ...]`` (at most
+            ``BATCH_MAX_CALLS``).
+        parallel: Run the calls on up to ``BATCH_MAX_WORKERS`` threads.
+        db_path: Database the shared read connection is opened on.
+
+    Returns:
+        The envelope of the combined ``{"results": [...]}`` text (see the
+        module docstring); ``is_error`` is set when any call failed.
+
+    Raises:
+        ValueError: If ``calls`` is not a list of at most ``BATCH_MAX_CALLS``.
+    """
+    if not isinstance(calls, list) or len(calls) > BATCH_MAX_CALLS:
+        raise ValueError(f"calls must be a list of at most {BATCH_MAX_CALLS} items")
+
+    with get_connection(db_path) as conn:
+
+        def _one(call: Any) -> dict[str, Any]:
+            if not isinstance(call, dict):
+                return {"ok": False, "error": "each call must be an object"}
+            tool_def = ALL_DEFS_BY_NAME.get(call.get("tool", ""))
+            if tool_def is None:
+                return {"ok": False, "error": f"unknown tool: {call.get('tool')!r}"}
+            if tool_def.writes_data:
+                return {"ok": False, "error": "writes_data tools cannot be batched"}
+            try:
+                with open_cursor(conn) as cursor:
+                    reader = GarminDBReader.from_connection(cursor)
+                    return _call_tool(tool_def.name, call.get("args") or {}, reader)
+            except Exception as e:
+                return {"ok": False, "error": repr(e)}
+
+        if parallel and len(calls) > 1:
+            workers = min(BATCH_MAX_WORKERS, len(calls))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(_one, calls))
+        else:
+            outcomes = [_one(call) for call in calls]
+
+    items = [
+        _batch_item_text(call.get("tool") if isinstance(call, dict) else None, out)
+        for call, out in zip(calls, outcomes, strict=True)
+    ]
+    return {
+        "text": '{"results":[' + ",".join(items) + "]}",
+        "is_error": any("text" not in out or out["is_error"] for out in outcomes),
+        "warnings": sum(out.get("warnings", 0) for out in outcomes),
+    }
+
+
 def handle(req: dict[str, Any], reader: GarminDBReader) -> dict[str, Any]:
     """Handle a single IPC request and return a response dict.
 
     Args:
         req: Parsed request object (``id``/``op``/``tool``/``args``).
-        reader: A reused ``GarminDBReader`` for ``call`` dispatch.
+        reader: A reused ``GarminDBReader`` for ``call`` dispatch (``batch``
+            opens its own shared connection on the same database).
 
     Returns:
-        A response dict with ``ok`` plus either ``data`` (success) or ``error``.
-        ``id`` is echoed back when present in the request. Exceptions are caught
-        and reported as ``ok=False`` so the worker loop never dies.
+        A response dict with ``ok`` plus either ``data`` (success), the
+        ``text``/``is_error``/``warnings`` envelope (``call`` / ``batch``
+        success) or ``error``. ``id`` is echoed back when present in the
+        request. Exceptions are caught and reported as ``ok=False`` so the
+        worker loop never dies.
     """
     resp: dict[str, Any] = {}
     if "id" in req:
@@ -148,16 +338,22 @@ def handle(req: dict[str, Any], reader: GarminDBReader) -> dict[str, Any]:
             resp["ok"] = True
             resp["data"] = build_schema()
         elif op == "call":
-            tool = req["tool"]
+            envelope = _call_tool(req["tool"], req.get("args") or {}, reader)
+            resp["ok"] = True
+            resp.update(envelope)
+        elif op == "batch":
             args = req.get("args") or {}
-            result = dispatch(ALL_DEFS_BY_NAME, reader, tool, args)
-            # Round-trip through json to surface serialization errors here (where
-            # they can be reported as ok=False) rather than in the main loop.
+            envelope = _batch_tool_calls(
+                args.get("calls", []),
+                bool(args.get("parallel", False)),
+                str(reader.db_path),
+            )
             resp["ok"] = True
-            resp["data"] = json.loads(json.dumps(result, default=str))
+            resp.update(envelope)
         elif op == "info":
             resp["ok"] = True
-            resp["data"] = _db_info()
+            args = req.get("args") or {}
+            resp["data"] = _db_info(bool(args.get("dump_instrumentation", False)))
         else:
             resp["ok"] = False
             resp["error"] = f"unknown op: {op!r}"
@@ -167,13 +363,45 @@ def handle(req: dict[str, Any], reader: GarminDBReader) -> dict[str, Any]:
     return resp
 
 
+def _write_response(resp: dict[str, Any], out: BinaryIO | None = None) -> None:
+    """Write one response to ``out`` (default: stdout).
+
+    A response carrying ``text`` is framed as a header line with its UTF-8
+    length (``text_bytes``) followed by the text itself, so the text is written
+    as-is instead of being escaped into another JSON document.
+    """
+    if out is None:
+        out = sys.stdout.buffer
+    text = resp.pop("text", None)
+    if text is None:
+        out.write(json.dumps(resp, default=str).encode() + b"\n")
+    else:
+        body = text.encode("utf-8")
+        resp["text_bytes"] = len(body)
+        out.write(json.dumps(resp).encode() + b"\n")
+        out.write(body + b"\n")
+    out.flush()
+
+
+def _dump_instrumentation() -> None:
+    """Best-effort dump of instrumentation statistics at worker shutdown."""
+    if not instrumentation_enabled():
+        return
+    try:
+        dump_stats()
+    except OSError as e:
+        logger.warning("instrumentation dump failed: %s", e)
+
+
 def _install_sigterm_handler() -> None:
     """Run export/view cleanup on SIGTERM before exiting.
 
     Cleanup is best-effort: managers that were never initialized are skipped.
+    Instrumentation statistics (when enabled) are dumped first.
     """
 
     def _on_term(_signum: int, _frame: FrameType | None) -> None:
+        _dump_instrumentation()
         try:
             from garmin_mcp.mcp_server.export_manager import get_export_manager
 
@@ -192,14 +420,15 @@ def _install_sigterm_handler() -> None:
 
 
 def main() -> None:
-    """Read stdin line-by-line, dispatch each request, write one JSON line out.
+    """Read stdin line-by-line, dispatch each request, write one response out.
 
     Pending schema migrations are applied once at startup (before the reader is
     built or any request is served) so read-only paths never observe a stale
     schema. A single ``GarminDBReader`` is created up front and reused across
     requests. Blank lines are ignored; malformed JSON is reported as
     ``ok=False`` rather than crashing the loop. SIGTERM triggers export/view
-    cleanup then exit.
+    cleanup then exit; instrumentation statistics are dumped on SIGTERM and
+    when stdin closes.
     """
     _install_sigterm_handler()
     db_path = str(get_db_path())
@@ -218,8 +447,8 @@ def main() -> None:
             resp: dict[str, Any] = {"ok": False, "error": repr(e)}
         else:
             resp = handle(req, reader)
-        sys.stdout.write(json.dumps(resp, default=str) + "\n")
-        sys.stdout.flush()
+        _write_response(resp)
+    _dump_instrumentation()
 
 
 if __name__ == "__main__":
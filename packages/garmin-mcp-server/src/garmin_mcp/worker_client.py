@@ -11,6 +11,10 @@ Concurrency: a single ``asyncio.Lock`` serializes each request/response
 round-trip with the worker. Reads dominate the workload so the throughput cost
 is negligible; a future version may pool workers if write contention appears.
 
+Tool results arrive pre-serialized: a ``call`` reply is a small header line
+followed by ``text_bytes`` bytes of final MCP text, which the client reads with
+``readexactly`` and hands to the shim as ``resp["text"]`` without parsing it.
+
 Crash recovery: if the worker dies mid-flight (readline returns EOF), the
 current ``rpc`` triggers a respawn and returns an ``{"ok": false, "error": ...}``
 response. The shim process itself never dies, so the MCP session survives a
@@ -83,35 +87,47 @@ class WorkerClient:
         error, so the next call reads from a fresh, in-sync pipe.
 
         Args:
-            op: One of ``"schema"``, ``"call"``, ``"info"``.
+            op: One of ``"schema"``, ``"call"``, ``"batch"``, ``"info"``.
             tool: Tool name (only meaningful for ``op="call"``).
-            args: Tool arguments (only meaningful for ``op="call"``).
+            args: Tool arguments (``op="call"``) or the ``calls`` /
+                ``parallel`` payload (``op="batch"``).
 
         Returns:
-            ``{"ok": True, "data": ...}`` on success or
+            ``{"ok": True, "data": ...}`` on success (``{"ok": True, "text": str,
+            "is_error": bool, "warnings": int}`` for a framed ``call`` /
+            ``batch`` reply) or
             ``{"ok": False, "error": str}`` on failure.
         """
         async with self._lock:
             req = {"id": next(self._ids), "op": op, "tool": tool, "args": args or {}}
             try:
                 return await self._roundtrip(req)
-            except (BrokenPipeError, ConnectionResetError, ValueError) as e:
-                # Pipe died (broken/reset) or the response line was oversized /
-                # corrupt (ValueError: LimitOverrunError / JSONDecodeError).
+            except (
+                BrokenPipeError,
+                ConnectionResetError,
+                asyncio.IncompleteReadError,
+                ValueError,
+            ) as e:
+                # Pipe died (broken/reset, or EOF inside a framed reply) or the
+                # response was oversized / corrupt (ValueError:
+                # LimitOverrunError / JSONDecodeError).
                 # Either way the pipe may be desynchronized: respawn and report.
                 await self._respawn()
                 return {"ok": False, "error": repr(e)}
 
     async def _roundtrip(self, req: dict[str, Any]) -> dict[str, Any]:
-        """Write one request line and read one response line.
+        """Write one request line and read one response (plus its text frame).
 
         Raises:
             BrokenPipeError/ConnectionResetError: propagated to ``rpc`` for
                 respawn handling.
+            asyncio.IncompleteReadError: the worker died inside a text frame;
+                propagated to ``rpc`` for respawn handling.
             ValueError: ``readline()`` raises ``LimitOverrunError`` on a response
-                line larger than ``_STREAM_LIMIT``, and ``json.loads`` raises
-                ``JSONDecodeError`` on a corrupt line; both propagate to ``rpc``
-                for respawn handling.
+                line larger than ``_STREAM_LIMIT``, ``json.loads`` raises
+                ``JSONDecodeError`` on a corrupt line, and a text frame larger
+                than ``_STREAM_LIMIT`` is refused; all propagate to ``rpc`` for
+                respawn handling.
         """
         await self.start()
         assert self._proc is not None
@@ -129,6 +145,14 @@ class WorkerClient:
             await self._respawn()
             return {"ok": False, "error": "worker crashed (EOF on stdout)"}
         resp: dict[str, Any] = json.loads(raw.decode())
+        size = resp.pop("text_bytes", None)
+        if size is not None:
+            if size > _STREAM_LIMIT:
+                raise ValueError(
+                    f"text frame of {size} bytes exceeds {_STREAM_LIMIT} bytes"
+                )
+            frame = await self._proc.stdout.readexactly(size + 1)
+            resp["text"] = frame[:-1].decode("utf-8")
         return resp
 
     async def restart(self) -> None:
@@ -205,3 +205,118 @@ def test_get_injury_risk_tool_returns_serializable(tmp_path: Path) -> None:
     assert "acwr" in payload["available_inputs"]
     assert payload["band"] in {"low", "moderate", "high"}
     assert isinstance(payload["score"], int)
+
+
+@pytest.mark.integration
+def test_injury_risk_series_matches_per_day(tmp_path: Path, mocker) -> None:
+    """Every day of the series equals a standalone get_injury_risk(day)."""
+    from datetime import date, timedelta
+
+    from garmin_mcp.database.connection import get_write_connection
+    from garmin_mcp.database.db_reader import GarminDBReader
+    from garmin_mcp.database.db_writer import GarminDBWriter
+    from garmin_mcp.database.time_series_layout import time_series_insert_sql
+
+    db_path = tmp_path / "injury_risk_series.duckdb"
+    GarminDBWriter(db_path=str(db_path))
+
+    first = date(2025, 6, 1)
+    scan_items = []
+    with get_write_connection(db_path=str(db_path)) as conn:
+        for i in range(0, 120, 2):
+            day = first + timedelta(days=i)
+            # Volume ramps up in the last month -> ACWR leaves the safe zone.
+            distance = 8.0 if i < 90 else 16.0
+            if i % 14 == 0:
+                distance = 20.0
+            activity_id = 910000 + i
+            conn.execute(
+                "INSERT INTO activities (activity_id, activity_date, "
+                "total_distance_km, total_time_seconds) VALUES (?, ?, ?, ?)",
+                (activity_id, str(day), distance, int(distance * 330)),
+            )
+            if distance >= 10.0:
+                # Decoupling grows over the season (durability worsening).
+                back_hr = 150.0 * (1.0 + (2.0 + i / 10.0) / 100.0)
+                for seq_no, (hr, speed) in enumerate(
+                    [(150.0, 3.0)] * 5 + [(back_hr, 3.0)] * 5
+                ):
+                    conn.execute(
+                        time_series_insert_sql(["heart_rate", "speed"]),
+                        [activity_id, seq_no, seq_no, hr, speed],
+                    )
+            scan_items.append(
+                {
+                    "activity_id": activity_id,
+                    "activity_date": str(day),
+                    "hours": distance * 330 / 3600.0,
+                    "events": 1 + (i // 30),
+                    "severity_high": 0,
+                    "top_recommendation": None,
+                }
+            )
+        for i in range(120):
+            conn.execute(
+                "INSERT INTO daily_wellness (wellness_id, date, hrv_overnight_ms, "
+                "training_readiness, resting_hr) VALUES (?, ?, ?, ?, ?)",
+                (
+                    i + 1,
+                    str(first + timedelta(days=i)),
+                    60 - i % 9,
+                    70 - i % 13,
+                    48 + i % 5,
+                ),
+            )
+
+    def _scan(self, start_date: str, end_date: str):
+        window = [
+            item
+            for item in scan_items
+            if start_date <= item["activity_date"] <= end_date
+        ]
+        return window[::-1] or None
+
+    mocker.patch.object(GarminDBReader, "_material_event_scan", _scan)
+    reader = GarminDBReader(db_path=str(db_path))
+
+    series = reader.get_injury_risk_series(
+        start_date="2025-07-20", end_date="2025-09-27"
+    )
+
+    assert series["start_date"] == "2025-07-20"
+    assert len(series["days"]) == 70
+    inputs = set()
+    for day in series["days"][::23]:
+        expected = reader.get_injury_risk(date=day["date"])
+        assert day == {"date": day["date"], **expected}
+    for day in series["days"]:
+        inputs.update(day.get("available_inputs", []))
+    assert inputs == {"acwr", "durability", "wellness", "form_anomaly"}
+
+
+@pytest.mark.integration
+def test_injury_risk_series_defaults_and_empty(tmp_path: Path) -> None:
+    """No activities -> empty series; default range is 12 weeks to the latest run."""
+    from garmin_mcp.database.connection import get_write_connection
+    from garmin_mcp.database.db_reader import GarminDBReader
+    from garmin_mcp.database.db_writer import GarminDBWriter
+
+    db_path = tmp_path / "injury_risk_series_empty.duckdb"
+    GarminDBWriter(db_path=str(db_path))
+    reader = GarminDBReader(db_path=str(db_path))
+
+    assert reader.get_injury_risk_series() == {
+        "start_date": None,
+        "end_date": None,
+        "days": [],
+    }
+
+    with get_write_connection(db_path=str(db_path)) as conn:
+        conn.execute(
+            "INSERT INTO activities (activity_id, activity_date, total_distance_km) "
+            "VALUES (1, '2025-10-31', 5.0)"
+        )
+    series = reader.get_injury_risk_series()
+
+    assert (series["start_date"], series["end_date"]) == ("2025-08-09", "2025-10-31")
+    assert len(series["days"]) == 84
@@ -18,6 +18,7 @@ import pytest
 from garmin_mcp.analysis.wellness_baseline import (
     compute_metric_baseline,
     compute_wellness_baseline_deviation,
+    compute_wellness_baseline_series,
 )
 
 # mean=60, population SD=8
@@ -174,3 +175,48 @@ def test_compute_metric_baseline_label_fallback() -> None:
     result = compute_metric_baseline(_HRV_SERIES, 60.0, direction="low_is_bad")
 
     assert result.metric == "hrv"
+
+
+def _noisy_rows(count: int) -> list[dict[str, Any]]:
+    """Every-other-day rows with gaps, a flat stretch and integer metrics."""
+    rows: list[dict[str, Any]] = []
+    for i in range(count):
+        rows.append(
+            {
+                "date": f"2026-{1 + (2 * i) // 28:02d}-{1 + (2 * i) % 28:02d}",
+                "hrv_overnight_ms": None if i % 7 == 3 else 55 + (i * 7) % 13,
+                "training_readiness": 70 if 10 <= i < 25 else 60 + (i * 5) % 17,
+                "resting_hr": None if i % 11 == 0 else 46 + (i * 3) % 7,
+            }
+        )
+    return rows
+
+
+@pytest.mark.unit
+def test_baseline_series_matches_per_day_deviation() -> None:
+    """Each day equals compute_wellness_baseline_deviation on its trailing rows."""
+    rows = _noisy_rows(60)
+    days = [f"2026-{m:02d}-{d:02d}" for m in (1, 2, 3, 4, 5) for d in range(1, 29)]
+
+    series = compute_wellness_baseline_series(rows, days, window_days=10)
+
+    assert len(series) == len(days)
+    flags = set()
+    for day, result in zip(days, series, strict=True):
+        history = [r for r in rows if r["date"] <= day][-11:]
+        assert result == compute_wellness_baseline_deviation(history, window_days=10)
+        flags.update(result[m]["flag"] for m in ("hrv", "readiness", "rhr"))
+    assert flags == {"low", "high", "within", "insufficient"}
+
+
+@pytest.mark.unit
+def test_baseline_series_day_before_first_row_is_empty() -> None:
+    """Days before the first row (or no rows at all) get the empty result."""
+    rows = _noisy_rows(3)
+    empty = compute_wellness_baseline_deviation([])
+
+    assert compute_wellness_baseline_series(rows, ["2025-12-31"]) == [empty]
+    assert compute_wellness_baseline_series([], ["2026-01-01", "2026-01-02"]) == [
+        empty,
+        empty,
+    ]
@@ -0,0 +1,82 @@
+"""Tests for the end-to-end synthetic dataset benchmark."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from garmin_mcp.benchmarks.benchmark_end_to_end import (
+    EXCLUDED_TOOLS,
+    benchmark_output_path,
+    check_regressions,
+    run_benchmark,
+)
+
+
+def _results(tool_ms: float = 0.0, **metrics: float) -> dict:
+    return {
+        "sizes": {
+            "100": {
+                "metrics": metrics,
+                "tools": {"t": {"status": "ok", "median_ms": tool_ms}},
+                "endpoints": {},
+            }
+        }
+    }
+
+
+@pytest.mark.unit
+def test_benchmark_output_path_follows_env(monkeypatch, tmp_path) -> None:
+    """Results land under $GARMIN_RESULT_DIR/benchmarks, never under docs/."""
+    monkeypatch.setenv("GARMIN_RESULT_DIR", str(tmp_path))
+    assert benchmark_output_path() == tmp_path / "benchmarks" / "end_to_end.json"
+
+
+@pytest.mark.unit
+class TestCheckRegressions:
+    def test_absolute_budget(self) -> None:
+        regressions = check_regressions(
+            _results(ingest_s_per_activity=2.0), thresholds={"ingest_s_per_activity": 1}
+        )
+        assert regressions == ["100: ingest_s_per_activity 2.00 > budget 1"]
+
+    def test_relative_to_baseline(self) -> None:
+        baseline = _results(100.0, slowest_tool_median_ms=100.0)
+        current = _results(200.0, slowest_tool_median_ms=200.0)
+
+        regressions = check_regressions(current, baseline, thresholds={})
+
+        assert len(regressions) == 2
+        assert regressions[1].startswith("100: t median 200.0 ms")
+
+    def test_noise_floor_ignores_small_tool_deltas(self) -> None:
+        regressions = check_regressions(_results(30.0), _results(10.0), thresholds={})
+        assert regressions == []
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+def test_run_benchmark_covers_all_phases(monkeypatch, tmp_path) -> None:
+    """A tiny run ingests, queries every tool and regenerates the database.
+
+    Takes ~90 s (every tool against a fresh ingest), so it only runs with
+    ``-m slow``.
+    """
+    monkeypatch.setenv("GARMIN_DATA_DIR", str(tmp_path / "untouched"))
+    output_path = tmp_path / "e2e.json"
+
+    results = run_benchmark(
+        sizes=(3,), repeat=1, sample_interval_s=60, output_path=output_path
+    )
+
+    size = results["sizes"]["3"]
+    assert size["ingest"]["errors"] == 0
+    assert size["regenerate"]["errors"] == 0
+    tools = size["tools"]
+    assert {n for n, t in tools.items() if t["status"] == "skipped"} >= EXCLUDED_TOOLS
+    assert tools["get_splits_comprehensive"]["status"] == "ok"
+    assert tools["get_splits_comprehensive"]["response_bytes"] > 0
+    assert not [n for n, t in tools.items() if t["status"] == "error"]
+    assert not (tmp_path / "untouched").exists()
+    assert json.loads(output_path.read_text())["sizes"]["3"]["n_activities"] == 3
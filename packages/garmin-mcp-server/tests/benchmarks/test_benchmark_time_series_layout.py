@@ -0,0 +1,38 @@
+"""Tests for the time_series_metrics layout benchmark."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from garmin_mcp.benchmarks.benchmark_time_series_layout import (
+    benchmark_output_path,
+    run_benchmark,
+)
+
+
+@pytest.mark.unit
+def test_benchmark_output_path_follows_env(monkeypatch, tmp_path) -> None:
+    """Results land under $GARMIN_RESULT_DIR/benchmarks, never under docs/."""
+    monkeypatch.setenv("GARMIN_RESULT_DIR", str(tmp_path))
+    assert benchmark_output_path() == (
+        tmp_path / "benchmarks" / "time_series_layout.json"
+    )
+
+
+@pytest.mark.integration
+def test_run_benchmark_compares_both_layouts(tmp_path) -> None:
+    """A small run measures both layouts and writes the results JSON."""
+    output_path = tmp_path / "layout.json"
+
+    results = run_benchmark(
+        n_activities=3, n_seconds=120, repeat=1, output_path=output_path
+    )
+
+    assert set(results["layouts"]) == {"legacy", "compact"}
+    assert results["rows"] == 360
+    for stats in results["layouts"].values():
+        assert stats["size_bytes"] > 0
+        assert set(stats["scan_s"]) == {"activity_range_stats", "full_table_aggregate"}
+    assert json.loads(output_path.read_text())["rows"] == 360
@@ -0,0 +1,110 @@
+"""Tests for the synthetic raw dataset generator."""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+
+import pytest
+
+from garmin_mcp.benchmarks.synthetic_dataset import (
+    ACTIVITY_ID_BASE,
+    generate_dataset,
+)
+from garmin_mcp.ingest.raw_data_fetcher import load_from_cache
+
+END_DATE = date(2025, 3, 30)
+
+
+def _tree(root):
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in sorted(root.rglob("*.json"))
+    }
+
+
+@pytest.mark.unit
+class TestGenerateDataset:
+    def test_same_seed_is_byte_identical(self, tmp_path):
+        for name in ("a", "b"):
+            generate_dataset(
+                tmp_path / name, n_activities=3, end_date=END_DATE, sample_interval_s=30
+            )
+
+        assert _tree(tmp_path / "a") == _tree(tmp_path / "b")
+
+    def test_seed_changes_samples(self, tmp_path):
+        generate_dataset(tmp_path / "a", n_activities=1, sample_interval_s=30)
+        generate_dataset(tmp_path / "b", n_activities=1, seed=1, sample_interval_s=30)
+
+        assert _tree(tmp_path / "a") != _tree(tmp_path / "b")
+
+    def test_layout_is_loadable_from_cache(self, tmp_path):
+        dataset = generate_dataset(
+            tmp_path, n_activities=5, end_date=END_DATE, sample_interval_s=30
+        )
+        raw_dir = tmp_path / "raw"
+
+        assert dataset.activity_ids == [ACTIVITY_ID_BASE + i for i in range(5)]
+        assert [a.workout for a in dataset.activities] == [
+            "intervals",
+            "easy",
+            "tempo",
+            "easy",
+            "long",
+        ]
+        raw = load_from_cache(raw_dir, dataset.activity_ids[0])
+        assert raw is not None
+        assert raw["activity_basic"]["summaryDTO"]["startTimeLocal"].startswith(
+            dataset.activities[0].date
+        )
+        assert {lap["intensityType"] for lap in raw["splits"]["lapDTOs"]} == {
+            "WARMUP",
+            "INTERVAL",
+            "RECOVERY",
+            "COOLDOWN",
+        }
+        zone_seconds = sum(zone["secsInZone"] for zone in raw["hr_zones"])
+        assert zone_seconds == dataset.activities[0].duration_s
+
+    def test_details_sample_interval(self, tmp_path):
+        dataset = generate_dataset(
+            tmp_path, n_activities=1, end_date=END_DATE, sample_interval_s=10
+        )
+        activity = dataset.activities[0]
+        details = json.loads(
+            (
+                tmp_path
+                / "raw"
+                / "activity"
+                / str(activity.activity_id)
+                / "activity_details.json"
+            ).read_text()
+        )
+
+        keys = [d["key"] for d in details["metricDescriptors"]]
+        duration_index = keys.index("sumDuration")
+        samples = [row["metrics"] for row in details["activityDetailMetrics"]]
+        assert len(samples) == activity.duration_s // 10
+        assert samples[1][duration_index] - samples[0][duration_index] == 10
+
+    def test_daily_files_cover_weight_window(self, tmp_path):
+        dataset = generate_dataset(
+            tmp_path, n_activities=5, end_date=END_DATE, sample_interval_s=60
+        )
+
+        days = sorted(p.stem for p in (tmp_path / "raw" / "weight").iterdir())
+        assert days[0] == dataset.start_date
+        assert days[-1] == dataset.end_date == END_DATE.isoformat()
+        assert days == sorted(p.stem for p in (tmp_path / "raw" / "wellness").iterdir())
+        # Weight files start a week before the first run (7-day median).
+        assert dataset.start_date < dataset.activities[0].date
+
+    def test_years_sets_activity_count(self, tmp_path):
+        dataset = generate_dataset(tmp_path, years=0.1, sample_interval_s=120)
+
+        assert len(dataset.activities) == 26
+
+    def test_requires_size(self, tmp_path):
+        with pytest.raises(ValueError, match="n_activities or years"):
+            generate_dataset(tmp_path)
@@ -0,0 +1,147 @@
+"""Tests for the daily_load training-load ledger."""
+
+from datetime import date
+
+import duckdb
+import pytest
+
+from garmin_mcp.database.inserters.activities import insert_activities
+from garmin_mcp.database.inserters.daily_load import (
+    ACTIVITIES_DIGEST_SQL,
+    activities_fingerprint,
+    rebuild_all_daily_load,
+    refresh_daily_load,
+)
+
+
+def _insert_raw(conn, activity_id, activity_date, distance_km, seconds=None):
+    conn.execute(
+        "INSERT OR REPLACE INTO activities "
+        "(activity_id, activity_date, total_distance_km, total_time_seconds) "
+        "VALUES (?, ?, ?, ?)",
+        [activity_id, activity_date, distance_km, seconds],
+    )
+
+
+def _ledger(conn):
+    return {
+        row[0]: row[1:]
+        for row in conn.execute(
+            "SELECT load_date, activity_count, load_km, longest_run_sec, "
+            "load_7d_km, load_28d_km FROM daily_load ORDER BY load_date"
+        ).fetchall()
+    }
+
+
+def _watermark_in_sync(conn):
+    row = conn.execute(
+        f"SELECT (SELECT activities_digest FROM daily_load_state) "
+        f"= ({ACTIVITIES_DIGEST_SQL})"
+    ).fetchone()
+    return row[0]
+
+
+def _fingerprint_in_sync(conn):
+    row = conn.execute(
+        "SELECT activity_count, max_rowid FROM daily_load_state"
+    ).fetchone()
+    return tuple(row) == activities_fingerprint(conn)
+
+
+def _expected_ledger(conn):
+    """Ledger recomputed from scratch (the reference for incremental refreshes)."""
+    rebuild_all_daily_load(conn)
+    return _ledger(conn)
+
+
+@pytest.mark.unit
+class TestRefreshDailyLoad:
+    def test_dense_rows_with_rolling_sums(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            _insert_raw(conn, 1, "2025-10-01", 10.0, 3000)
+            _insert_raw(conn, 2, "2025-10-01", 5.0, 1500)
+            _insert_raw(conn, 3, "2025-10-09", 8.0, 2400)
+
+            written = rebuild_all_daily_load(conn)
+            ledger = _ledger(conn)
+
+        assert written == 9
+        assert list(ledger) == [date(2025, 10, d) for d in range(1, 10)]
+        assert ledger[date(2025, 10, 1)] == (2, 15.0, 3000, 15.0, 15.0)
+        # Rest day: zero load, no run, rolling sums still carried.
+        assert ledger[date(2025, 10, 5)] == (0, 0.0, None, 15.0, 15.0)
+        # 2025-10-01 has left the 7-day window but not the 28-day one.
+        assert ledger[date(2025, 10, 9)] == (1, 8.0, 2400, 8.0, 23.0)
+
+    def test_incremental_refresh_matches_full_rebuild(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            _insert_raw(conn, 1, "2025-09-01", 10.0)
+            _insert_raw(conn, 2, "2025-09-20", 12.0)
+            rebuild_all_daily_load(conn)
+
+            # Appended day beyond the ledger end, then a backfilled older day.
+            _insert_raw(conn, 3, "2025-10-15", 6.0)
+            refresh_daily_load(conn, since="2025-10-15")
+            _insert_raw(conn, 4, "2025-08-20", 4.0)
+            refresh_daily_load(conn, since="2025-08-20")
+            incremental = _ledger(conn)
+
+            assert incremental == _expected_ledger(conn)
+
+    def test_empty_activities_clears_ledger(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            _insert_raw(conn, 1, "2025-10-01", 10.0)
+            rebuild_all_daily_load(conn)
+            conn.execute("DELETE FROM activities")
+
+            assert rebuild_all_daily_load(conn) == 0
+            assert _ledger(conn) == {}
+
+
+@pytest.mark.unit
+def test_insert_activities_refreshes_ledger(initialized_db_path):
+    with duckdb.connect(str(initialized_db_path)) as conn:
+        assert insert_activities(1, "2025-10-01", conn)
+        assert insert_activities(2, "2025-10-03", conn)
+        # Re-ingest moves activity 2 to an earlier day.
+        assert insert_activities(2, "2025-09-30", conn)
+        incremental = _ledger(conn)
+
+        assert min(incremental) == date(2025, 9, 30)
+        assert max(incremental) == date(2025, 10, 1)
+        assert incremental == _expected_ledger(conn)
+
+
+@pytest.mark.unit
+class TestLedgerWatermark:
+    def test_insert_activities_keeps_watermark_in_sync(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            assert insert_activities(1, "2025-10-01", conn)
+            assert insert_activities(2, "2025-10-03", conn)
+            assert insert_activities(2, "2025-09-30", conn)
+
+            assert _watermark_in_sync(conn) is True
+            assert _fingerprint_in_sync(conn) is True
+
+    def test_outside_write_is_not_masked_by_later_refresh(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            assert insert_activities(1, "2025-10-01", conn)
+            # Written behind the ledger's back on an earlier day, then an
+            # incremental refresh that starts after it.
+            _insert_raw(conn, 2, "2025-09-01", 10.0)
+            assert insert_activities(3, "2025-10-05", conn)
+
+            assert _watermark_in_sync(conn) is False
+            assert _fingerprint_in_sync(conn) is False
+            rebuild_all_daily_load(conn)
+            assert _watermark_in_sync(conn) is True
+            assert _fingerprint_in_sync(conn) is True
+
+    def test_outside_delete_is_not_masked_by_later_refresh(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            assert insert_activities(1, "2025-10-01", conn)
+            assert insert_activities(2, "2025-10-03", conn)
+            conn.execute("DELETE FROM activities WHERE activity_id = 1")
+            assert insert_activities(3, "2025-10-05", conn)
+
+            assert _fingerprint_in_sync(conn) is False
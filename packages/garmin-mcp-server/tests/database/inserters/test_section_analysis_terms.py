@@ -0,0 +1,99 @@
+"""Tests for the section_analysis_terms keyword index."""
+
+import json
+
+import duckdb
+import pytest
+
+from garmin_mcp.database.db_writer import GarminDBWriter
+from garmin_mcp.database.inserters.section_analysis_terms import (
+    rebuild_all_section_analysis_terms,
+    refresh_section_analysis_terms,
+)
+
+
+def _insert_raw(conn, analysis_id, activity_id, section_type, analysis_data):
+    conn.execute(
+        "INSERT INTO section_analyses (analysis_id, activity_id, activity_date, "
+        "section_type, analysis_data) VALUES (?, ?, ?, ?, ?)",
+        [analysis_id, activity_id, "2025-10-01", section_type, analysis_data],
+    )
+
+
+def _terms(conn):
+    return conn.execute(
+        "SELECT analysis_id, term FROM section_analysis_terms "
+        "ORDER BY analysis_id, term"
+    ).fetchall()
+
+
+@pytest.mark.unit
+class TestRefreshSectionAnalysisTerms:
+    def test_indexes_only_non_empty_top_level_keys(self, initialized_db_path):
+        data = {
+            "key_strengths": ["Negative split"],
+            "improvement_areas": [],
+            "evaluation": {"gct": "Good"},
+            "empty_dict": {},
+            "summary": "",
+            "missing": None,
+            "score": 0,
+        }
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            _insert_raw(conn, 1, 10, "efficiency", json.dumps(data))
+            written = refresh_section_analysis_terms(conn, [1])
+            terms = _terms(conn)
+
+        assert written == 3
+        assert terms == [(1, "evaluation"), (1, "key_strengths"), (1, "score")]
+
+    def test_rebuild_skips_invalid_json(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            _insert_raw(conn, 1, 10, "phase", json.dumps({"key_strengths": ["a"]}))
+            _insert_raw(conn, 2, 10, "split", "not json")
+            _insert_raw(conn, 3, 11, "summary", json.dumps(["a", "b"]))
+
+            written = rebuild_all_section_analysis_terms(conn)
+            terms = _terms(conn)
+
+        assert written == 1
+        assert terms == [(1, "key_strengths")]
+
+    def test_refresh_replaces_existing_rows(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            _insert_raw(conn, 1, 10, "phase", json.dumps({"key_strengths": ["a"]}))
+            refresh_section_analysis_terms(conn, [1])
+            conn.execute(
+                "UPDATE section_analyses SET analysis_data = ? WHERE analysis_id = 1",
+                [json.dumps({"improvement_areas": ["b"]})],
+            )
+            refresh_section_analysis_terms(conn, [1])
+            terms = _terms(conn)
+            assert refresh_section_analysis_terms(conn, []) == 0
+
+        assert terms == [(1, "improvement_areas")]
+
+
+@pytest.mark.integration
+def test_insert_section_analysis_indexes_new_row(tmp_path):
+    db_path = tmp_path / "terms.duckdb"
+    writer = GarminDBWriter(str(db_path))
+
+    assert writer.insert_section_analysis(
+        activity_id=42,
+        activity_date="2025-10-05",
+        section_type="efficiency",
+        analysis_data={"key_strengths": ["Cadence"], "improvement_areas": []},
+    )
+
+    with duckdb.connect(str(db_path), read_only=True) as conn:
+        rows = conn.execute(
+            "SELECT t.term, t.activity_id, CAST(t.activity_date AS VARCHAR), "
+            "t.section_type FROM section_analysis_terms t "
+            "JOIN section_analyses s USING (analysis_id) ORDER BY t.term"
+        ).fetchall()
+
+    assert rows == [
+        ("key_strengths", 42, "2025-10-05", "efficiency"),
+        ("metadata", 42, "2025-10-05", "efficiency"),
+    ]
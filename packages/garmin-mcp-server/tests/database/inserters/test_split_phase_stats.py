@@ -0,0 +1,129 @@
+"""Tests for the split_phase_stats materialized statistics table."""
+
+import duckdb
+import pytest
+
+from garmin_mcp.database.inserters.split_phase_stats import (
+    rebuild_all_split_phase_stats,
+    refresh_split_phase_stats,
+)
+from garmin_mcp.database.readers import splits_query_builder as qb
+
+_FIELDS = qb.COMPREHENSIVE_STAT_FIELDS
+
+
+def _insert_split(conn, activity_id, split_index, role_phase, pace, hr, gain, loss):
+    conn.execute(
+        "INSERT INTO splits (activity_id, split_index, role_phase, "
+        "pace_seconds_per_km, heart_rate, ground_contact_time, cadence, "
+        "elevation_gain, elevation_loss, max_heart_rate) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            activity_id,
+            split_index,
+            role_phase,
+            pace,
+            hr,
+            240.0 + split_index,
+            180.0 - split_index,
+            gain,
+            loss,
+            hr + 8,
+        ],
+    )
+
+
+def _seed(conn):
+    _insert_split(conn, 1, 1, "warmup", 360.0, 130, 5.0, 1.0)
+    _insert_split(conn, 1, 2, "run", 290.0, 155, 2.0, 4.0)
+    _insert_split(conn, 1, 3, "run", 285.0, 158, 3.0, 3.0)
+    _insert_split(conn, 1, 4, "cooldown", 370.0, 140, 0.0, 6.0)
+    _insert_split(conn, 1, 5, None, 400.0, 120, 1.0, 0.0)
+    _insert_split(conn, 2, 1, None, 300.0, 150, 4.0, 4.0)
+
+
+def _phases(conn):
+    return dict(
+        conn.execute(
+            "SELECT activity_id || ':' || phase, split_count FROM split_phase_stats"
+        ).fetchall()
+    )
+
+
+@pytest.mark.unit
+class TestRefreshSplitPhaseStats:
+    def test_rebuild_writes_all_and_role_phase_rows(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            _seed(conn)
+            written = rebuild_all_split_phase_stats(conn)
+            phases = _phases(conn)
+
+        assert written == 5
+        assert phases == {
+            "1:all": 5,
+            "1:warmup": 1,
+            "1:run": 2,
+            "1:cooldown": 1,
+            "2:all": 1,
+        }
+
+    def test_all_row_matches_on_the_fly_aggregate(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            _seed(conn)
+            rebuild_all_split_phase_stats(conn)
+            materialized = conn.execute(
+                qb.build_phase_stats_sql(_FIELDS), [1]
+            ).fetchone()
+            aggregated = conn.execute(qb.build_statistics_sql(_FIELDS), [1]).fetchone()
+
+        assert materialized == pytest.approx(aggregated)
+
+    def test_phase_row_and_elevation_totals(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            _seed(conn)
+            rebuild_all_split_phase_stats(conn)
+            run = conn.execute(
+                "SELECT pace_seconds_per_km_mean, heart_rate_max, "
+                "elevation_gain_sum, elevation_loss_sum, elevation_change_max "
+                "FROM split_phase_stats WHERE activity_id = 1 AND phase = 'run'"
+            ).fetchone()
+            overall = conn.execute(
+                "SELECT elevation_gain_sum, elevation_loss_sum, "
+                "elevation_change_max FROM split_phase_stats "
+                "WHERE activity_id = 1 AND phase = 'all'"
+            ).fetchone()
+
+        assert run == (287.5, 158.0, 5.0, 7.0, 6.0)
+        assert overall == (11.0, 14.0, 6.0)
+
+    def test_refresh_one_activity_replaces_only_its_rows(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            _seed(conn)
+            rebuild_all_split_phase_stats(conn)
+
+            # save_data re-inserts the splits and refreshes in one transaction.
+            conn.execute("BEGIN TRANSACTION")
+            conn.execute("DELETE FROM splits WHERE activity_id = 1")
+            _insert_split(conn, 1, 1, "run", 280.0, 160, 1.0, 1.0)
+            written = refresh_split_phase_stats(conn, [1])
+            conn.execute("COMMIT")
+            phases = _phases(conn)
+
+        assert written == 2
+        assert phases == {"1:all": 1, "1:run": 1, "2:all": 1}
+
+    def test_refresh_removes_rows_of_deleted_splits(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            _seed(conn)
+            rebuild_all_split_phase_stats(conn)
+
+            conn.execute("DELETE FROM splits WHERE activity_id = 2")
+            written = refresh_split_phase_stats(conn, [2])
+            phases = _phases(conn)
+
+        assert written == 0
+        assert "2:all" not in phases
+
+    def test_empty_id_list_is_noop(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            assert refresh_split_phase_stats(conn, []) == 0
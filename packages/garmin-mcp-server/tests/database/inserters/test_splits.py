@@ -11,7 +11,7 @@ import json
 import duckdb
 import pytest
 
-from garmin_mcp.database.inserters.splits import insert_splits
+from garmin_mcp.database.inserters.splits import insert_splits, insert_splits_batch
 from garmin_mcp.database.inserters.splits_helpers.cadence_power import (
     CadencePowerCalculator,
 )
@@ -1925,3 +1925,137 @@ class TestSplitsInserter:
         assert splits[2][1] == "COOLDOWN"  # Estimated from NULL
 
         conn.close()
+
+
+def _write_splits_file(path, laps) -> str:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"lapDTOs": laps}, f)
+    return str(path)
+
+
+def _batch_laps(seed: int) -> list[dict]:
+    """Varied laps: mixed phases, NULL intensities, fractional durations,
+    missing fields, hilly terrain and one invalid (cadence 5) split."""
+    laps = []
+    for i in range(1, 9):
+        lap = {
+            "lapIndex": i,
+            "distance": 1000.0 if i != 4 else 412.5,
+            "duration": 300.5 + seed * 7 + i * 3.25,
+            "startTimeGMT": f"2026-07-24T00:{i:02d}:00.0",
+            "intensityType": [None, "WARMUP", "INTERVAL", "RECOVERY", "ACTIVE"][
+                (i + seed) % 5
+            ],
+            "averageHR": 130 + i * 3 + seed,
+            "maxHR": 150 + i,
+            "averageRunCadence": 176.0 + i,
+            "groundContactTime": 240.0 + i,
+            "verticalOscillation": 8.1,
+            "verticalRatio": 7.9,
+            "elevationGain": float(i * 4 * (seed % 2)),
+            "elevationLoss": 1.5 * i,
+            "averagePower": 250 + i,
+            "strideLength": 110.0,
+            "averageSpeed": 3.2,
+        }
+        if i == 6:
+            lap.pop("elevationGain")
+            lap.pop("averageHR")
+            lap["duration"] = None
+        if i == 7 and seed == 2:
+            lap["averageRunCadence"] = 5  # invalid -> skipped
+        laps.append(lap)
+    return laps
+
+
+_ALL_SPLIT_COLUMNS = (
+    "activity_id, split_index, distance, duration_seconds, start_time_gmt, "
+    "start_time_s, end_time_s, intensity_type, role_phase, pace_str, "
+    "pace_seconds_per_km, heart_rate, cadence, power, ground_contact_time, "
+    "vertical_oscillation, vertical_ratio, elevation_gain, elevation_loss, "
+    "terrain_type, stride_length, max_heart_rate, max_cadence, max_power, "
+    "normalized_power, average_speed, grade_adjusted_speed"
+)
+
+
+def _all_splits(conn) -> list[tuple]:
+    return conn.execute(
+        f"SELECT {_ALL_SPLIT_COLUMNS} FROM splits ORDER BY activity_id, split_index"
+    ).fetchall()
+
+
+@pytest.mark.unit
+class TestInsertSplitsBatch:
+    """insert_splits_batch writes the same rows as insert_splits."""
+
+    def test_matches_per_activity_insert(
+        self, tmp_path, initialized_db_path, _schema_template_path
+    ):
+        files = {
+            1000
+            + seed: _write_splits_file(
+                tmp_path / str(seed) / "splits.json", _batch_laps(seed)
+            )
+            for seed in range(4)
+        }
+
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            result = insert_splits_batch(conn, files)
+            batched = _all_splits(conn)
+
+        single_db = tmp_path / "single.duckdb"
+        single_db.write_bytes(_schema_template_path.read_bytes())
+        with duckdb.connect(str(single_db)) as conn:
+            for activity_id, path in files.items():
+                assert insert_splits(activity_id, conn, path) is True
+            single = _all_splits(conn)
+
+        assert result == dict.fromkeys(files, True)
+        assert len(batched) == 4 * 8 - 1
+        assert batched == single
+
+    def test_replaces_existing_splits_and_keeps_failed_ones(
+        self, tmp_path, initialized_db_path
+    ):
+        good = _write_splits_file(tmp_path / "a" / "splits.json", _batch_laps(0))
+        empty = _write_splits_file(tmp_path / "b" / "splits.json", [])
+
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            insert_splits(1, conn, good)
+            insert_splits(2, conn, good)
+            result = insert_splits_batch(
+                conn, {1: good, 2: empty, 3: str(tmp_path / "missing.json")}
+            )
+            counts = dict(
+                conn.execute(
+                    "SELECT activity_id, COUNT(*) FROM splits GROUP BY activity_id"
+                ).fetchall()
+            )
+
+        assert result == {1: True, 2: False, 3: False}
+        # Activity 2's file has no laps: its existing splits are untouched.
+        assert counts == {1: 8, 2: 8}
+
+    def test_logs_skipped_invalid_split(self, tmp_path, initialized_db_path, caplog):
+        path = _write_splits_file(tmp_path / "splits.json", _batch_laps(2))
+
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            with caplog.at_level("WARNING"):
+                insert_splits_batch(conn, {7: path})
+            indexes = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT split_index FROM splits ORDER BY split_index"
+                ).fetchall()
+            ]
+
+        assert 7 not in indexes
+        assert any("Skipping invalid split" in r.message for r in caplog.records)
+
+    def test_map_intensity_to_phase_array_matches_scalar(self):
+        values = ["WARMUP", "interval", "Active", "RECOVERY", "COOLDOWN", "", None, "X"]
+
+        result = PhaseMapper.map_intensity_to_phase_array(values)
+
+        assert list(result) == [PhaseMapper.map_intensity_to_phase(v) for v in values]
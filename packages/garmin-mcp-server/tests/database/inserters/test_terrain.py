@@ -4,6 +4,7 @@ Pure function tests — no DB required. Validates terrain classification
 thresholds: <5=平坦, <15=起伏, <30=丘陵, >=30=山岳.
 """
 
+import numpy as np
 import pytest
 
 from garmin_mcp.database.inserters.splits_helpers.terrain import TerrainClassifier
@@ -68,3 +69,19 @@ class TestClassifyTerrain:
     def test_negative_values_use_abs(self):
         """Negative elevation values should be treated via abs()."""
         assert TerrainClassifier.classify_terrain(-15.0, -15.0) == "山岳"
+
+
+@pytest.mark.unit
+class TestClassifyTerrainArray:
+    """classify_terrain_array() agrees with classify_terrain() element-wise."""
+
+    def test_matches_scalar_across_boundaries(self):
+        gains = np.array([0.0, 2.5, 3.0, 7.5, 7.4, 15.0, 14.9, 60.0])
+        losses = np.array([0.0, 2.4, 2.0, 7.5, 7.5, 15.0, 15.0, 0.0])
+
+        result = TerrainClassifier.classify_terrain_array(gains, losses)
+
+        assert list(result) == [
+            TerrainClassifier.classify_terrain(g, loss)
+            for g, loss in zip(gains, losses, strict=True)
+        ]
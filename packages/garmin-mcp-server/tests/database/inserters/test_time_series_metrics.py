@@ -505,3 +505,144 @@ class TestTimeSeriesMetricsInserter:
         assert seq_rows[3] == (3, 1)  # seq_no=3, timestamp_s=1
         assert seq_rows[4] == (4, 1)  # seq_no=4, timestamp_s=1
         assert seq_rows[5] == (5, 1)  # seq_no=5, timestamp_s=1
+
+    @staticmethod
+    def _streaming_details(descriptors_last: bool = False) -> dict:
+        """Details with gaps: skipped points, short rows, nulls, fractions."""
+        descriptors = [
+            {"metricsIndex": 0, "key": "directHeartRate", "unit": {"factor": 1.0}},
+            {"metricsIndex": 1, "key": "sumDuration", "unit": {"factor": 1000.0}},
+            {"metricsIndex": 2, "key": "directSpeed", "unit": {"factor": 0.1}},
+            {"metricsIndex": 3, "key": "directLatitude", "unit": {"factor": 1.0}},
+        ]
+        points: list[dict] = []
+        for i in range(11):
+            if i == 3:
+                points.append({})  # no metrics -> skipped, still numbered
+            elif i == 5:
+                points.append({"metrics": [150, None, 3.1, 35.0]})  # skipped
+            elif i == 7:
+                points.append({"metrics": [151, 7.9]})  # short row
+            else:
+                points.append(
+                    {"metrics": [140 + i, i + 0.6, 3.0 + i / 7, 35.123456789 + i]}
+                )
+        members = [("activityId", 1), ("activityDetailMetrics", points)]
+        members.insert(2 if descriptors_last else 1, ("metricDescriptors", descriptors))
+        return dict(members)
+
+    @staticmethod
+    def _rows(conn, activity_id):
+        return conn.execute(
+            "SELECT seq_no, timestamp_s, heart_rate, sum_duration, speed, "
+            "latitude, cadence FROM time_series_metrics "
+            "WHERE activity_id = ? ORDER BY seq_no",
+            [activity_id],
+        ).fetchall()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("chunk_rows", [1, 4, 4096])
+    @pytest.mark.parametrize("descriptors_last", [False, True])
+    def test_streamed_chunks_match_per_point_conversion(
+        self, tmp_path, initialized_db_path, chunk_rows, descriptors_last
+    ):
+        """Rows are identical whatever the chunk size / descriptor position."""
+        details = self._streaming_details(descriptors_last)
+        details_file = tmp_path / "activity_details.json"
+        details_file.write_text(json.dumps(details))
+
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            assert insert_time_series_metrics(
+                str(details_file), 1, conn, chunk_rows=chunk_rows
+            )
+            rows = self._rows(conn, 1)
+
+        expected = []
+        for seq_no, point in enumerate(details["activityDetailMetrics"]):
+            metrics = point.get("metrics")
+            if not metrics or metrics[1] is None:
+                continue
+            hr, duration, speed, lat = (metrics + [None, None])[:4]
+            expected.append(
+                (
+                    seq_no,
+                    int(duration),
+                    hr,
+                    duration,
+                    speed,
+                    lat,
+                    None,
+                )
+            )
+        assert rows == expected
+        assert [row[0] for row in rows] == [0, 1, 2, 4, 6, 7, 8, 9, 10]
+
+    @pytest.mark.unit
+    def test_invalid_metrics_array_keeps_existing_rows(
+        self, sample_activity_details_file, tmp_path, initialized_db_path
+    ):
+        """A non-array activityDetailMetrics fails before anything is deleted."""
+        broken_file = tmp_path / "broken_details.json"
+        details = json.loads(sample_activity_details_file.read_text())
+        details["activityDetailMetrics"] = {"metrics": [1, 2]}
+        broken_file.write_text(json.dumps(details))
+
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            assert insert_time_series_metrics(
+                str(sample_activity_details_file), 20636804823, conn
+            )
+            assert not insert_time_series_metrics(str(broken_file), 20636804823, conn)
+            rows = self._rows(conn, 20636804823)
+
+        assert len(rows) == 3
+
+    @pytest.mark.unit
+    def test_truncated_file_keeps_existing_series(self, tmp_path, initialized_db_path):
+        """A decode error after some chunks leaves rows, rollups and offsets as-is."""
+        descriptors = [
+            {"metricsIndex": 0, "key": "directHeartRate", "unit": {"factor": 1.0}},
+            {"metricsIndex": 1, "key": "sumDuration", "unit": {"factor": 1000.0}},
+        ]
+        details = {
+            "activityId": 1,
+            "metricDescriptors": descriptors,
+            "activityDetailMetrics": [
+                {"metrics": [140 + i % 10, float(i)]} for i in range(100)
+            ],
+        }
+        good_file = tmp_path / "good_details.json"
+        good_file.write_text(json.dumps(details))
+        text = good_file.read_text()
+        truncated_file = tmp_path / "truncated_details.json"
+        truncated_file.write_text(text[: int(len(text) * 0.6)])
+
+        def snapshot(conn):
+            return (
+                conn.execute(
+                    "SELECT COUNT(*), MAX(timestamp_s) FROM time_series_metrics "
+                    "WHERE activity_id = 1"
+                ).fetchone(),
+                conn.execute(
+                    "SELECT * FROM time_series_rollups WHERE activity_id = 1 "
+                    "ORDER BY ALL"
+                ).fetchall(),
+                conn.execute(
+                    "SELECT * FROM time_series_offsets WHERE activity_id = 1"
+                ).fetchall(),
+            )
+
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            assert insert_time_series_metrics(str(good_file), 1, conn, chunk_rows=16)
+            before = snapshot(conn)
+            assert not insert_time_series_metrics(
+                str(truncated_file), 1, conn, chunk_rows=16
+            )
+            after = snapshot(conn)
+            staged = conn.execute(
+                "SELECT COUNT(*) FROM information_schema.tables "
+                "WHERE table_name = 'time_series_metrics_stage'"
+            ).fetchone()
+
+        assert before[0] == (100, 99)
+        assert after == before
+        assert staged == (0,)
@@ -0,0 +1,89 @@
+"""Tests for the time_series_offsets catalog."""
+
+import duckdb
+import pytest
+
+from garmin_mcp.database.inserters.time_series_offsets import (
+    ROW_GROUP_SIZE,
+    insert_time_series_offsets,
+    rebuild_all_time_series_offsets,
+)
+
+ACTIVITY_ID = 20636804823
+
+
+def _insert_raw_rows(db_path, activity_id=ACTIVITY_ID, n_seconds=120, offset_s=5):
+    rows = [(activity_id, t, t + offset_s, 140.0) for t in range(n_seconds)]
+    with duckdb.connect(str(db_path)) as conn:
+        conn.executemany(
+            "INSERT INTO time_series_metrics "
+            "(activity_id, seq_no, timestamp_s, heart_rate) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+
+
+def _catalog_row(conn, activity_id=ACTIVITY_ID):
+    return conn.execute(
+        "SELECT first_row, last_row, first_row_group, last_row_group, "
+        "sample_count, min_timestamp_s, max_timestamp_s "
+        "FROM time_series_offsets WHERE activity_id = ?",
+        [activity_id],
+    ).fetchone()
+
+
+@pytest.mark.unit
+class TestInsertTimeSeriesOffsets:
+    def test_catalog_row_describes_raw_rows(self, initialized_db_path):
+        _insert_raw_rows(initialized_db_path, ACTIVITY_ID + 1, n_seconds=30)
+        _insert_raw_rows(initialized_db_path)
+
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            assert insert_time_series_offsets(ACTIVITY_ID, conn) is True
+            row = _catalog_row(conn)
+
+        # Row positions are only recorded by the full rebuild.
+        assert row == (None, None, None, None, 120, 5, 124)
+
+    def test_reinsert_replaces_row(self, initialized_db_path):
+        _insert_raw_rows(initialized_db_path)
+
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            insert_time_series_offsets(ACTIVITY_ID, conn)
+            conn.execute(
+                "DELETE FROM time_series_metrics WHERE timestamp_s > 64",
+            )
+            insert_time_series_offsets(ACTIVITY_ID, conn)
+            count = conn.execute("SELECT COUNT(*) FROM time_series_offsets").fetchone()
+            row = _catalog_row(conn)
+
+        assert count == (1,)
+        assert row[4:] == (60, 5, 64)
+
+    def test_activity_without_rows_has_no_catalog_row(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            assert insert_time_series_offsets(ACTIVITY_ID, conn) is False
+            assert _catalog_row(conn) is None
+
+    def test_rebuild_covers_every_activity(self, initialized_db_path):
+        _insert_raw_rows(initialized_db_path)
+        _insert_raw_rows(initialized_db_path, ACTIVITY_ID + 1, n_seconds=30)
+
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            total = rebuild_all_time_series_offsets(conn)
+            row = _catalog_row(conn, ACTIVITY_ID + 1)
+
+        assert total == 2
+        # Rows of the second activity follow the 120 rows of the first.
+        assert row == (120, 149, 0, 0, 30, 5, 34)
+
+    def test_rebuild_row_groups_follow_rowid(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            conn.execute(
+                "INSERT INTO time_series_metrics (activity_id, seq_no, timestamp_s) "
+                "SELECT ?, range, range FROM range(?)",
+                [ACTIVITY_ID, ROW_GROUP_SIZE + 1],
+            )
+            rebuild_all_time_series_offsets(conn)
+            row = _catalog_row(conn)
+
+        assert row[2:4] == (0, 1)
@@ -0,0 +1,164 @@
+"""Tests for time_series_rollups materialization and the rollup read path."""
+
+import duckdb
+import pytest
+
+from garmin_mcp.database.db_reader import GarminDBReader
+from garmin_mcp.database.inserters.time_series_rollups import (
+    insert_time_series_rollups,
+    rebuild_all_time_series_rollups,
+)
+from garmin_mcp.database.readers.time_series import (
+    RAW_RESOLUTION_S,
+    select_time_series_resolution,
+)
+
+ACTIVITY_ID = 20636804823
+N_SECONDS = 605
+
+
+def _insert_raw_rows(db_path, activity_id=ACTIVITY_ID, n_seconds=N_SECONDS):
+    """Insert 1 Hz rows; power is NULL every 7th second."""
+    rows = [
+        (
+            activity_id,
+            t,
+            t,
+            140.0 + (t % 23),
+            3.0 + (t % 11) * 0.05,
+            None if t % 7 == 0 else 200.0 + (t % 13),
+        )
+        for t in range(n_seconds)
+    ]
+    with duckdb.connect(str(db_path)) as conn:
+        conn.executemany(
+            "INSERT INTO time_series_metrics "
+            "(activity_id, seq_no, timestamp_s, heart_rate, speed, power) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+
+def _raw_statistics(db_path, metric, start_s, end_s):
+    with duckdb.connect(str(db_path)) as conn:
+        return conn.execute(
+            f"SELECT AVG({metric}), STDDEV({metric}), MIN({metric}), "
+            f"MAX({metric}), COUNT(*) FROM time_series_metrics "
+            "WHERE activity_id = ? AND timestamp_s >= ? AND timestamp_s < ?",
+            [ACTIVITY_ID, start_s, end_s],
+        ).fetchone()
+
+
+@pytest.mark.unit
+class TestSelectTimeSeriesResolution:
+    def test_statistics_pick_coarsest_full_bucket(self):
+        assert select_time_series_resolution(600) == 60
+        assert select_time_series_resolution(59) == 10
+        assert select_time_series_resolution(9) == RAW_RESOLUTION_S
+
+    def test_point_budget_limits_resolution(self):
+        assert select_time_series_resolution(7200, max_points=100) == 60
+        assert select_time_series_resolution(7200, max_points=500) == 10
+        assert select_time_series_resolution(2000, max_points=500) == RAW_RESOLUTION_S
+
+
+@pytest.mark.unit
+class TestInsertTimeSeriesRollups:
+    def test_buckets_aggregate_raw_rows(self, initialized_db_path):
+        _insert_raw_rows(initialized_db_path)
+
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            written = insert_time_series_rollups(ACTIVITY_ID, conn)
+            bucket = conn.execute(
+                "SELECT sample_count, power_n, power_mean, power_min, power_max, "
+                "power_m2 FROM time_series_rollups WHERE activity_id = ? "
+                "AND resolution_s = 10 AND bucket_start_s = 0",
+                [ACTIVITY_ID],
+            ).fetchone()
+            last = conn.execute(
+                "SELECT MAX(bucket_start_s), SUM(sample_count), COUNT(*) "
+                "FROM time_series_rollups WHERE activity_id = ? "
+                "AND resolution_s = 60",
+                [ACTIVITY_ID],
+            ).fetchone()
+
+        # One row per bucket: 61 ten-second + 11 sixty-second buckets
+        assert written == 61 + 11
+        # t=0 and t=7 are NULL in seconds 0-9
+        values = [200.0 + (t % 13) for t in range(10) if t % 7 != 0]
+        mean = sum(values) / len(values)
+        assert bucket[0] == 10
+        assert bucket[1] == len(values)
+        assert bucket[2] == pytest.approx(mean)
+        assert bucket[3] == min(values)
+        assert bucket[4] == max(values)
+        assert bucket[5] == pytest.approx(sum((v - mean) ** 2 for v in values))
+        # Trailing partial bucket [600, 605) holds the last 5 samples
+        assert last == (600, N_SECONDS, 11)
+
+    def test_reinsert_replaces_buckets(self, initialized_db_path):
+        _insert_raw_rows(initialized_db_path)
+
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            first = insert_time_series_rollups(ACTIVITY_ID, conn)
+            second = insert_time_series_rollups(ACTIVITY_ID, conn)
+            rebuilt = rebuild_all_time_series_rollups(conn)
+
+        assert first == second == rebuilt
+
+    def test_activity_without_rows_writes_nothing(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            assert insert_time_series_rollups(ACTIVITY_ID, conn) == 0
+
+
+@pytest.mark.unit
+class TestStatisticsFromRollups:
+    @pytest.mark.parametrize(
+        ("start_s", "end_s"),
+        [(0, N_SECONDS), (0, 600), (37, 541), (120, 180), (3, 17), (595, 10_000)],
+    )
+    @pytest.mark.parametrize("metric", ["heart_rate", "power"])
+    def test_matches_raw_scan(self, initialized_db_path, metric, start_s, end_s):
+        _insert_raw_rows(initialized_db_path)
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            insert_time_series_rollups(ACTIVITY_ID, conn)
+
+        result = GarminDBReader(db_path=initialized_db_path).get_time_series_statistics(
+            ACTIVITY_ID, start_s, end_s, [metric]
+        )
+
+        avg, std, min_value, max_value, count = _raw_statistics(
+            initialized_db_path, metric, start_s, end_s
+        )
+        stats = result["statistics"][metric]
+        assert result["data_points"] == count
+        assert stats["avg"] == pytest.approx(avg)
+        assert stats["std"] == pytest.approx(std)
+        assert stats["min"] == min_value
+        assert stats["max"] == max_value
+
+    def test_several_metrics_share_bucket_rows(self, initialized_db_path):
+        _insert_raw_rows(initialized_db_path)
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            insert_time_series_rollups(ACTIVITY_ID, conn)
+        reader = GarminDBReader(db_path=initialized_db_path)
+
+        combined = reader.get_time_series_statistics(
+            ACTIVITY_ID, 37, 541, ["power", "heart_rate", "power"]
+        )
+
+        assert list(combined["statistics"]) == ["power", "heart_rate"]
+        for metric in ("power", "heart_rate"):
+            single = reader.get_time_series_statistics(ACTIVITY_ID, 37, 541, [metric])
+            assert combined["statistics"][metric] == single["statistics"][metric]
+        assert combined["data_points"] == 541 - 37
+
+    def test_falls_back_to_raw_without_buckets(self, initialized_db_path):
+        _insert_raw_rows(initialized_db_path)
+
+        result = GarminDBReader(db_path=initialized_db_path).get_time_series_statistics(
+            ACTIVITY_ID, 0, N_SECONDS, ["heart_rate"]
+        )
+
+        assert result["data_points"] == N_SECONDS
+        assert result["statistics"]["heart_rate"]["max"] == 162.0
@@ -0,0 +1,116 @@
+"""Tests for the workout_features similarity table."""
+
+from datetime import date
+
+import duckdb
+import pytest
+
+from garmin_mcp.database.inserters.workout_features import (
+    rebuild_all_workout_features,
+    refresh_workout_features,
+)
+
+
+def _insert_activity(conn, activity_id, activity_date, pace, distance_km, hr=150):
+    conn.execute(
+        "INSERT OR REPLACE INTO activities (activity_id, activity_date, "
+        "activity_name, avg_pace_seconds_per_km, total_distance_km, "
+        "avg_heart_rate, temp_celsius) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [activity_id, activity_date, f"Run {activity_id}", pace, distance_km, hr, 18.5],
+    )
+
+
+def _insert_split(conn, activity_id, split_index, intensity, pace, gain):
+    conn.execute(
+        "INSERT INTO splits (activity_id, split_index, intensity_type, "
+        "pace_seconds_per_km, elevation_gain) VALUES (?, ?, ?, ?, ?)",
+        [activity_id, split_index, intensity, pace, gain],
+    )
+
+
+def _features(conn):
+    return {
+        row[0]: row[1:]
+        for row in conn.execute(
+            "SELECT activity_id, activity_date, avg_pace, distance_km, "
+            "avg_heart_rate, temperature_c, elevation_gain_m, training_type, "
+            "main_set_pace FROM workout_features ORDER BY activity_id"
+        ).fetchall()
+    }
+
+
+@pytest.mark.unit
+class TestRefreshWorkoutFeatures:
+    def test_rebuild_aggregates_splits_and_training_type(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            _insert_activity(conn, 1, "2025-10-01", 300.0, 10.0)
+            _insert_split(conn, 1, 1, "WARMUP", 360.0, 5.0)
+            _insert_split(conn, 1, 2, "INTERVAL", 240.0, 3.0)
+            _insert_split(conn, 1, 3, "ACTIVE", 250.0, 2.0)
+            conn.execute(
+                "INSERT INTO hr_efficiency (activity_id, training_type) "
+                "VALUES (1, 'vo2max')"
+            )
+            _insert_activity(conn, 2, "2025-10-03", 330.0, 8.0)
+
+            written = rebuild_all_workout_features(conn)
+            features = _features(conn)
+
+        assert written == 2
+        assert features[1] == (
+            date(2025, 10, 1),
+            300.0,
+            10.0,
+            150.0,
+            18.5,
+            10.0,
+            "vo2max",
+            245.0,
+        )
+        # No splits / hr_efficiency: no elevation or main set, unknown type.
+        assert features[2][5:] == (None, "unknown", None)
+
+    def test_refresh_one_activity_bumps_its_revision(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            _insert_activity(conn, 1, "2025-10-01", 300.0, 10.0)
+            _insert_activity(conn, 2, "2025-10-03", 330.0, 8.0)
+            rebuild_all_workout_features(conn)
+            before = dict(
+                conn.execute(
+                    "SELECT activity_id, revision FROM workout_features"
+                ).fetchall()
+            )
+
+            # save_data refreshes inside its ingest transaction.
+            conn.execute("BEGIN TRANSACTION")
+            _insert_activity(conn, 2, "2025-10-03", 320.0, 8.0)
+            written = refresh_workout_features(conn, [2])
+            conn.execute("COMMIT")
+            after = dict(
+                conn.execute(
+                    "SELECT activity_id, revision FROM workout_features"
+                ).fetchall()
+            )
+            features = _features(conn)
+
+        assert written == 1
+        assert after[1] == before[1]
+        assert after[2] > max(before.values())
+        assert features[2][1] == 320.0
+
+    def test_refresh_removes_deleted_activity(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            _insert_activity(conn, 1, "2025-10-01", 300.0, 10.0)
+            _insert_activity(conn, 2, "2025-10-03", 330.0, 8.0)
+            rebuild_all_workout_features(conn)
+
+            conn.execute("DELETE FROM activities WHERE activity_id = 2")
+            written = refresh_workout_features(conn, [2])
+            features = _features(conn)
+
+        assert written == 0
+        assert list(features) == [1]
+
+    def test_empty_id_list_is_noop(self, initialized_db_path):
+        with duckdb.connect(str(initialized_db_path)) as conn:
+            assert refresh_workout_features(conn, []) == 0
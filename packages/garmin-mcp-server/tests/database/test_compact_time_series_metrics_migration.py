@@ -0,0 +1,209 @@
+"""Tests for migration v23 (compact_time_series_metrics).
+
+Verifies that a legacy ``time_series_metrics`` (PK + two ART indexes) is
+rewritten without them in activity order with every value unchanged, that its
+rollups are left as they are, and that fresh / already compact databases are
+left untouched.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import duckdb
+import pytest
+
+from garmin_mcp.database.db_writer import GarminDBWriter
+from garmin_mcp.database.inserters import time_series_rollups
+from garmin_mcp.database.migrations.add_time_series_rollups import (
+    add_time_series_rollups,
+)
+from garmin_mcp.database.migrations.compact_time_series_metrics import (
+    compact_time_series_metrics,
+)
+from garmin_mcp.database.migrations.runner import MigrationRunner
+from garmin_mcp.database.time_series_layout import TIME_SERIES_METRICS
+
+_ROWS = [
+    (
+        12345,
+        t,
+        t,
+        float(t),
+        2.52 * t,
+        150.0 + t,
+        2.517,
+        171.5,
+        243.4,
+        35.6543219 + t * 1e-6,
+        139.7012345,
+        4.8,
+    )
+    for t in range(5)
+]
+
+
+def _create_legacy_table(conn: duckdb.DuckDBPyConnection) -> None:
+    metric_columns = ", ".join(f"{metric} DOUBLE" for metric in TIME_SERIES_METRICS)
+    conn.execute(
+        "CREATE TABLE time_series_metrics (activity_id BIGINT NOT NULL, "
+        "seq_no INTEGER NOT NULL, timestamp_s INTEGER NOT NULL, "
+        f"{metric_columns}, PRIMARY KEY (activity_id, seq_no))"
+    )
+    conn.execute(
+        "CREATE INDEX idx_time_series_activity ON time_series_metrics(activity_id)"
+    )
+    conn.execute(
+        "CREATE INDEX idx_time_series_timestamp "
+        "ON time_series_metrics(activity_id, timestamp_s)"
+    )
+    conn.executemany(
+        "INSERT INTO time_series_metrics (activity_id, seq_no, timestamp_s, "
+        "sum_duration, sum_distance, heart_rate, speed, cadence, "
+        "ground_contact_time, latitude, longitude, elevation) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        _ROWS,
+    )
+
+
+def _column_types(conn: duckdb.DuckDBPyConnection) -> dict[str, str]:
+    rows = conn.execute(
+        "SELECT column_name, data_type FROM information_schema.columns "
+        "WHERE table_name = 'time_series_metrics'"
+    ).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+@pytest.mark.unit
+def test_migration_rewrites_legacy_table(tmp_path: Path) -> None:
+    """Legacy rows survive the rewrite; PK and ART indexes are dropped."""
+    conn = duckdb.connect(str(tmp_path / "legacy.duckdb"))
+    try:
+        _create_legacy_table(conn)
+        compact_time_series_metrics(conn)
+
+        types = _column_types(conn)
+        rows = conn.execute(
+            "SELECT activity_id, seq_no, timestamp_s, sum_duration, sum_distance, "
+            "heart_rate, speed, cadence, ground_contact_time, latitude, longitude, "
+            "elevation FROM time_series_metrics ORDER BY seq_no"
+        ).fetchall()
+        indexes = conn.execute(
+            "SELECT index_name FROM duckdb_indexes() "
+            "WHERE table_name = 'time_series_metrics'"
+        ).fetchall()
+        constraints = conn.execute(
+            "SELECT constraint_type FROM duckdb_constraints() "
+            "WHERE table_name = 'time_series_metrics' "
+            "AND constraint_type = 'PRIMARY KEY'"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    assert {types[metric] for metric in TIME_SERIES_METRICS} == {"DOUBLE"}
+    assert indexes == []
+    assert constraints == []
+    assert rows == _ROWS
+
+
+@pytest.mark.unit
+def test_migration_keeps_rollups(tmp_path: Path) -> None:
+    """Values are copied unchanged, so the rollup buckets are not rebuilt."""
+    conn = duckdb.connect(str(tmp_path / "rollups.duckdb"))
+    try:
+        _create_legacy_table(conn)
+        add_time_series_rollups(conn)
+        before = conn.execute(
+            "SELECT * FROM time_series_rollups ORDER BY ALL"
+        ).fetchall()
+        with patch(
+            "garmin_mcp.database.inserters.time_series_rollups."
+            "rebuild_all_time_series_rollups"
+        ) as rebuild:
+            compact_time_series_metrics(conn)
+        after = conn.execute(
+            "SELECT * FROM time_series_rollups ORDER BY ALL"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    rebuild.assert_not_called()
+    assert before and after == before
+
+
+@pytest.mark.integration
+def test_upgrade_backfills_rollups_once(tmp_path: Path) -> None:
+    """Upgrading across v22 + v23 scans the raw rows for rollups only once."""
+    db_path = tmp_path / "upgrade.duckdb"
+    writer = object.__new__(GarminDBWriter)
+    writer.db_path = db_path
+    writer._ensure_tables()
+    conn = duckdb.connect(str(db_path))
+    try:
+        conn.execute("DROP TABLE time_series_metrics")
+        _create_legacy_table(conn)
+    finally:
+        conn.close()
+
+    # Every rollup write builds its SELECT here; "" is the all-activities scan.
+    with patch.object(
+        time_series_rollups,
+        "_rollup_select_sql",
+        wraps=time_series_rollups._rollup_select_sql,
+    ) as rollup_select:
+        MigrationRunner(db_path).run_pending()
+
+    conn = duckdb.connect(str(db_path), read_only=True)
+    try:
+        mean = conn.execute(
+            "SELECT speed_mean FROM time_series_rollups WHERE activity_id = 12345 "
+            "AND resolution_s = 10 AND bucket_start_s = 0"
+        ).fetchone()
+    finally:
+        conn.close()
+
+    assert [c.args for c in rollup_select.call_args_list] == [("",)]
+    assert mean is not None
+    assert mean[0] == pytest.approx(2.517)
+
+
+@pytest.mark.unit
+def test_migration_is_idempotent(tmp_path: Path) -> None:
+    """Running v23 twice leaves the compact table and its rows unchanged."""
+    conn = duckdb.connect(str(tmp_path / "idempotent.duckdb"))
+    try:
+        _create_legacy_table(conn)
+        compact_time_series_metrics(conn)
+        compact_time_series_metrics(conn)
+        count = conn.execute("SELECT COUNT(*) FROM time_series_metrics").fetchone()
+    finally:
+        conn.close()
+
+    assert count == (len(_ROWS),)
+
+
+@pytest.mark.unit
+def test_migration_skips_missing_table(tmp_path: Path) -> None:
+    """A bare database without time_series_metrics is a no-op."""
+    conn = duckdb.connect(str(tmp_path / "bare.duckdb"))
+    try:
+        compact_time_series_metrics(conn)
+        assert _column_types(conn) == {}
+    finally:
+        conn.close()
+
+
+@pytest.mark.integration
+def test_fresh_db_uses_compact_layout(tmp_path: Path) -> None:
+    """GarminDBWriter creates the compact layout directly."""
+    db_path = tmp_path / "fresh.duckdb"
+    GarminDBWriter(db_path=str(db_path))
+
+    conn = duckdb.connect(str(db_path), read_only=True)
+    try:
+        types = _column_types(conn)
+    finally:
+        conn.close()
+
+    assert types["speed"] == "DOUBLE"
+    assert types["heart_rate"] == "DOUBLE"
+    assert set(types) == {"activity_id", "seq_no", "timestamp_s", *TIME_SERIES_METRICS}
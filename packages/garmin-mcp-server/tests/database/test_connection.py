@@ -1,9 +1,10 @@
 """Tests for database connection utilities.
 
 Covers get_db_path(), get_connection(), get_write_connection(),
-and _connect_with_retry().
+_connect_with_retry(), open_cursor() and interrupt_connection().
 """
 
+import threading
 from pathlib import Path
 from unittest.mock import patch
 
@@ -12,9 +13,12 @@ import pytest
 
 from garmin_mcp.database.connection import (
     _connect_with_retry,
+    _live_cursors,
     get_connection,
     get_db_path,
     get_write_connection,
+    interrupt_connection,
+    open_cursor,
 )
 
 
@@ -211,3 +215,50 @@ class TestConnectWithRetry:
             with pytest.raises(duckdb.IOException, match="Could not set lock"):
                 _connect_with_retry(db_file, read_only=True, retries=0, backoff=0.01)
             assert mock_connect.call_count == 1
+
+
+@pytest.mark.unit
+class TestInterruptConnection:
+    """interrupt_connection() reaches queries running on tracked cursors."""
+
+    def test_open_cursor_unregisters_on_exit(self):
+        conn = duckdb.connect()
+        try:
+            with open_cursor(conn) as cursor:
+                assert _live_cursors[id(conn)] == [cursor]
+            assert id(conn) not in _live_cursors
+        finally:
+            conn.close()
+
+    @pytest.mark.parametrize("depth", [1, 2])
+    def test_interrupts_query_on_nested_cursor(self, depth: int):
+        conn = duckdb.connect()
+        started = threading.Event()
+        outcome: list[str] = []
+
+        def _run(parent: duckdb.DuckDBPyConnection, remaining: int) -> None:
+            with open_cursor(parent) as cursor:
+                if remaining > 1:
+                    _run(cursor, remaining - 1)
+                    return
+                started.set()
+                try:
+                    cursor.execute("SELECT COUNT(*) FROM range(1000000000000)")
+                    cursor.fetchone()
+                    outcome.append("finished")
+                except duckdb.InterruptException:
+                    outcome.append("interrupted")
+
+        worker = threading.Thread(target=_run, args=(conn, depth), daemon=True)
+        worker.start()
+        try:
+            assert started.wait(timeout=5)
+            # Let the query start before interrupting it.
+            worker.join(timeout=0.3)
+            interrupt_connection(conn)
+            worker.join(timeout=10)
+        finally:
+            conn.close()
+
+        assert not worker.is_alive()
+        assert outcome == ["interrupted"]
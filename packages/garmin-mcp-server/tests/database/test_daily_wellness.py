@@ -1,7 +1,8 @@
 """Unit tests for daily_wellness row mapping and insertion (issue #498).
 
 Covers :func:`_wellness_row` field mapping / null-safety and
-:meth:`GarminDBWriter.insert_daily_wellness` date-level idempotency.
+:meth:`GarminDBWriter.insert_daily_wellness` date-level idempotency and the
+single-transaction :meth:`GarminDBWriter.insert_daily_wellness_batch`.
 """
 
 from __future__ import annotations
@@ -130,3 +131,90 @@ def test_insert_daily_wellness_idempotent(initialized_db_path: Path) -> None:
 
     assert count_row is not None and count_row[0] == 1
     assert rhr_row is not None and rhr_row[0] == 51
+
+
+@pytest.mark.unit
+def test_insert_daily_wellness_batch_upserts_window(initialized_db_path: Path) -> None:
+    """Batch replaces existing dates, skips empty days, ids follow date order."""
+    from garmin_mcp.database.connection import get_connection
+
+    writer = GarminDBWriter(db_path=str(initialized_db_path))
+    assert writer.insert_daily_wellness("2026-06-21", _full_wellness()) is True
+
+    updated = _full_wellness()
+    updated["stats"]["restingHeartRate"] = 55
+    written = writer.insert_daily_wellness_batch(
+        {
+            "2026-06-23": _full_wellness(),
+            "2026-06-21": updated,
+            "2026-06-22": {"stats": {}, "hrv": {}},
+        }
+    )
+
+    with get_connection(str(initialized_db_path)) as conn:
+        rows = conn.execute(
+            "SELECT wellness_id, CAST(date AS VARCHAR), resting_hr "
+            "FROM daily_wellness ORDER BY date"
+        ).fetchall()
+
+    assert written == 2
+    assert [(d, rhr) for _, d, rhr in rows] == [
+        ("2026-06-21", 55),
+        ("2026-06-23", 48),
+    ]
+    assert rows[0][0] < rows[1][0]
+    assert writer.insert_daily_wellness_batch({}) == 0
+
+
+@pytest.mark.unit
+def test_insert_daily_wellness_batch_resyncs_sequence(
+    initialized_db_path: Path,
+) -> None:
+    """A row inserted with an explicit id ahead of the sequence is skipped over."""
+    from garmin_mcp.database.connection import get_connection, get_write_connection
+
+    with get_write_connection(str(initialized_db_path)) as conn:
+        conn.execute(
+            "INSERT INTO daily_wellness (wellness_id, date, resting_hr) "
+            "VALUES (1, '2026-06-01', 47), (2, '2026-06-02', 46)"
+        )
+
+    writer = GarminDBWriter(db_path=str(initialized_db_path))
+    written = writer.insert_daily_wellness_batch(
+        {"2026-06-22": _full_wellness(), "2026-06-23": _full_wellness()}
+    )
+
+    with get_connection(str(initialized_db_path)) as conn:
+        ids = conn.execute(
+            "SELECT wellness_id FROM daily_wellness ORDER BY date"
+        ).fetchall()
+
+    assert written == 2
+    assert [row[0] for row in ids] == [1, 2, 3, 4]
+
+
+@pytest.mark.unit
+def test_insert_daily_wellness_batch_keeps_good_days_when_one_fails(
+    initialized_db_path: Path,
+) -> None:
+    """A day that breaks the batch transaction only loses that day."""
+    from garmin_mcp.database.connection import get_connection
+
+    broken = _full_wellness()
+    broken["stats"]["restingHeartRate"] = "not-a-number"
+    writer = GarminDBWriter(db_path=str(initialized_db_path))
+    written = writer.insert_daily_wellness_batch(
+        {
+            "2026-06-21": _full_wellness(),
+            "2026-06-22": broken,
+            "2026-06-23": _full_wellness(),
+        }
+    )
+
+    with get_connection(str(initialized_db_path)) as conn:
+        dates = conn.execute(
+            "SELECT CAST(date AS VARCHAR) FROM daily_wellness ORDER BY date"
+        ).fetchall()
+
+    assert written == 2
+    assert dates == [("2026-06-21",), ("2026-06-23",)]
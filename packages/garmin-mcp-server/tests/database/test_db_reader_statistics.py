@@ -417,3 +417,54 @@ class TestGarminDBReaderStatistics:
         assert "metrics" in result_stats
         assert result_stats["metrics"] == {}
         # Metrics should be empty or have null values
+
+
+class TestMaterializedSplitStatistics:
+    """statistics_only reads the split_phase_stats row written at ingest."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        from garmin_mcp.database.inserters.split_phase_stats import (
+            refresh_split_phase_stats,
+        )
+
+        db_path = tmp_path / "test.duckdb"
+        GarminDBWriter(db_path=str(db_path))
+        with duckdb.connect(str(db_path)) as conn:
+            for i in range(1, 6):
+                conn.execute(
+                    "INSERT INTO splits (activity_id, split_index, "
+                    "pace_seconds_per_km, heart_rate, ground_contact_time, "
+                    "vertical_oscillation, vertical_ratio, elevation_gain, "
+                    "elevation_loss) VALUES (1, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [i, 300.0 + i, 150 + i, 240.0 + i, 7.0, 8.0, i, 1.0],
+                )
+            refresh_split_phase_stats(conn, [1])
+        return db_path
+
+    @pytest.mark.unit
+    def test_materialized_matches_aggregate(self, db_path):
+        reader = GarminDBReader(db_path=str(db_path))
+        materialized = reader.get_splits_comprehensive(1, statistics_only=True)
+
+        with duckdb.connect(str(db_path)) as conn:
+            conn.execute("DELETE FROM split_phase_stats")
+        aggregated = reader.get_splits_comprehensive(1, statistics_only=True)
+
+        assert materialized["metrics"].keys() == aggregated["metrics"].keys()
+        for key, stats in aggregated["metrics"].items():
+            assert materialized["metrics"][key] == pytest.approx(stats), key
+
+    @pytest.mark.unit
+    def test_reads_the_materialized_row(self, db_path):
+        with duckdb.connect(str(db_path)) as conn:
+            conn.execute(
+                "UPDATE split_phase_stats SET pace_seconds_per_km_mean = 1.0 "
+                "WHERE activity_id = 1 AND phase = 'all'"
+            )
+
+        result = GarminDBReader(db_path=str(db_path)).get_splits_pace_hr(
+            1, statistics_only=True
+        )
+
+        assert result["metrics"]["pace"]["mean"] == 1.0
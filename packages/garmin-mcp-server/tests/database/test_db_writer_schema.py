@@ -278,3 +278,50 @@ class TestDBWriterSchema:
 
             assert "training_plans" not in table_names
             assert "planned_workouts" not in table_names
+
+
+@pytest.mark.unit
+class TestSchemaReadyFastPath:
+    """Writers on an already-initialized database skip DDL and migrations."""
+
+    def test_second_writer_skips_schema_work(self, tmp_path, monkeypatch):
+        db_path = tmp_path / "ready.duckdb"
+        GarminDBWriter(db_path=str(db_path))
+
+        def _fail(self):
+            raise AssertionError("schema work on an initialized database")
+
+        monkeypatch.setattr(GarminDBWriter, "_ensure_tables", _fail)
+        monkeypatch.setattr(GarminDBWriter, "_run_migrations", _fail)
+
+        writer = GarminDBWriter(db_path=str(db_path))
+
+        assert writer.db_path == db_path
+
+    def test_changed_catalog_reinitializes(self, tmp_path):
+        db_path = tmp_path / "ready.duckdb"
+        GarminDBWriter(db_path=str(db_path))
+        with duckdb.connect(str(db_path)) as conn:
+            conn.execute("DROP TABLE daily_wellness")
+
+        GarminDBWriter(db_path=str(db_path))
+
+        with duckdb.connect(str(db_path)) as conn:
+            tables = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT table_name FROM information_schema.tables"
+                ).fetchall()
+            }
+        assert "daily_wellness" in tables
+
+    def test_replaced_file_reinitializes(self, tmp_path):
+        db_path = tmp_path / "ready.duckdb"
+        GarminDBWriter(db_path=str(db_path))
+        db_path.unlink()
+
+        GarminDBWriter(db_path=str(db_path))
+
+        with duckdb.connect(str(db_path)) as conn:
+            row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+        assert row is not None and row[0] > 0
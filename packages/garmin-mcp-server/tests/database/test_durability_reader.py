@@ -18,6 +18,7 @@ from garmin_mcp.database.readers.durability import (
     _P_VALUE_THRESHOLD,
     DurabilityReader,
 )
+from garmin_mcp.database.time_series_layout import time_series_insert_sql
 
 
 def _insert_activity(
@@ -58,17 +59,13 @@ def _insert_time_series(
 ) -> None:
     """Insert ``(timestamp_s, heart_rate, speed)`` rows for an activity.
 
-    ``seq_no`` is assigned sequentially (PK is activity_id + seq_no).
+    ``seq_no`` is assigned sequentially (rows are keyed by activity_id + seq_no).
     """
     conn = duckdb.connect(str(db_path))
     try:
         for seq_no, (timestamp_s, heart_rate, speed) in enumerate(rows):
             conn.execute(
-                """
-                INSERT INTO time_series_metrics (
-                    activity_id, seq_no, timestamp_s, heart_rate, speed
-                ) VALUES (?, ?, ?, ?, ?)
-                """,
+                time_series_insert_sql(["heart_rate", "speed"]),
                 [activity_id, seq_no, timestamp_s, heart_rate, speed],
             )
     finally:
@@ -99,12 +96,15 @@ def _insert_time_series_with_form(
     try:
         for seq_no, (timestamp_s, hr, speed, gct, vo, vr) in enumerate(rows):
             conn.execute(
-                """
-                INSERT INTO time_series_metrics (
-                    activity_id, seq_no, timestamp_s, heart_rate, speed,
-                    ground_contact_time, vertical_oscillation, vertical_ratio
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                time_series_insert_sql(
+                    [
+                        "heart_rate",
+                        "speed",
+                        "ground_contact_time",
+                        "vertical_oscillation",
+                        "vertical_ratio",
+                    ]
+                ),
                 [activity_id, seq_no, timestamp_s, hr, speed, gct, vo, vr],
             )
     finally:
@@ -307,6 +307,75 @@ def test_durability_trend_uses_date_axis(reader_db_path: Path) -> None:
     assert result["trend"]["direction"] == "improving"
 
 
+@pytest.mark.integration
+def test_rolling_trends_match_per_day_trend(reader_db_path: Path) -> None:
+    """Each rolling window equals get_durability_trend over the same window."""
+    from datetime import date, timedelta
+
+    reader = DurabilityReader(db_path=str(reader_db_path))
+    plan = [
+        ("2025-06-01", 7101, 2.0),
+        ("2025-07-10", 7102, 6.0),
+        ("2025-08-20", 7103, 7.0),
+        ("2025-09-15", 7104, 12.0),
+        ("2025-10-05", 7105, 15.0),
+    ]
+    for activity_date, activity_id, decoupling_pct in plan:
+        _insert_activity(
+            reader_db_path,
+            activity_id=activity_id,
+            activity_date=activity_date,
+            distance_km=20.0,
+        )
+        _insert_time_series(
+            reader_db_path,
+            activity_id=activity_id,
+            rows=_series(
+                front_hr=150.0,
+                front_speed=3.0,
+                back_hr=150.0 * (1.0 + decoupling_pct / 100.0),
+                back_speed=3.0,
+            ),
+        )
+    days = [str(date(2025, 8, 1) + timedelta(days=i)) for i in range(0, 80, 7)]
+
+    rolling = reader.get_rolling_trends(days, window_days=90)
+
+    for day, trend in zip(days, rolling, strict=True):
+        window_start = str(date.fromisoformat(day) - timedelta(days=90))
+        assert trend == reader.get_durability_trend(window_start, day)["trend"]
+    # Runs entering and leaving the window move the fit through every state.
+    directions = {t["direction"] for t in rolling if t is not None}
+    assert directions == {"insufficient_data", "stable", "worsening"}
+
+
+@pytest.mark.integration
+def test_rolling_trends_poison_window_with_failed_run(
+    reader_db_path: Path, mocker
+) -> None:
+    """A run whose analysis raises makes only the windows containing it None."""
+    reader = DurabilityReader(db_path=str(reader_db_path))
+    for activity_date, activity_id in (("2025-06-01", 7201), ("2025-09-01", 7202)):
+        _insert_activity(
+            reader_db_path,
+            activity_id=activity_id,
+            activity_date=activity_date,
+            distance_km=20.0,
+        )
+
+    def _durability(activity_id: int) -> None:
+        if activity_id == 7201:
+            raise RuntimeError("boom")
+
+    mocker.patch.object(reader, "get_activity_durability", side_effect=_durability)
+
+    rolling = reader.get_rolling_trends(["2025-06-15", "2025-09-15"], window_days=30)
+
+    assert rolling[0] is None
+    assert rolling[1] is not None
+    assert rolling[1]["direction"] == "insufficient_data"
+
+
 @pytest.mark.integration
 def test_durability_trend_insufficient(reader_db_path: Path) -> None:
     """Fewer than 3 qualifying activities -> direction='insufficient_data'."""
@@ -91,10 +91,10 @@ class TestMigrationRunner:
         runner = MigrationRunner(db_path)
         applied = runner.run_pending()
 
-        assert len(applied) == 21
+        assert len(applied) == 31
         assert applied[0] == "phase0_power_prep"
-        assert applied[-1] == "add_athlete_profile_versions"
-        assert runner.get_current_version() == 21
+        assert applied[-1] == "add_daily_load_state"
+        assert runner.get_current_version() == 31
 
     def test_run_pending_skips_applied(self, db_path: Path) -> None:
         """Running twice applies nothing the second time."""
@@ -102,7 +102,7 @@ class TestMigrationRunner:
         first = runner.run_pending()
         second = runner.run_pending()
 
-        assert len(first) == 21
+        assert len(first) == 31
         assert second == []
 
     def test_run_pending_partial(self, db_path: Path) -> None:
@@ -129,7 +129,7 @@ class TestMigrationRunner:
         runner = MigrationRunner(db_path)
         applied = runner.run_pending()
 
-        assert runner.get_current_version() == 21
+        assert runner.get_current_version() == 31
         assert applied == [
             "remove_fk_constraints",
             "add_plan_versioning",
@@ -149,6 +149,16 @@ class TestMigrationRunner:
             "add_pace_consistency_full",
             "add_hiking_sessions",
             "add_athlete_profile_versions",
+            "add_time_series_rollups",
+            "compact_time_series_metrics",
+            "add_time_series_offsets",
+            "add_daily_load",
+            "add_workout_features",
+            "add_section_analysis_terms",
+            "add_wellness_id_sequences",
+            "add_form_baseline_population_hash",
+            "add_split_phase_stats",
+            "add_daily_load_state",
         ]
 
     def test_migration_records_applied_at(self, db_path: Path) -> None:
@@ -162,7 +172,7 @@ class TestMigrationRunner:
         ).fetchall()
         conn.close()
 
-        assert len(rows) == 21
+        assert len(rows) == 31
         for version, name, applied_at in rows:
             assert applied_at is not None
             assert isinstance(name, str)
@@ -174,7 +184,7 @@ class TestEnsureSchemaCurrent:
     """Tests for the ensure_schema_current startup helper."""
 
     def test_ensure_schema_current_applies_pending(self, tmp_path: Path) -> None:
-        """A DB at version 11 is migrated to 21 and gains week_start_day."""
+        """A DB at version 11 is migrated to 31 and gains week_start_day."""
         db_path = tmp_path / "v11.duckdb"
         _make_v11_db(db_path)
         runner = MigrationRunner(db_path)
@@ -193,8 +203,18 @@ class TestEnsureSchemaCurrent:
             "add_pace_consistency_full",
             "add_hiking_sessions",
             "add_athlete_profile_versions",
+            "add_time_series_rollups",
+            "compact_time_series_metrics",
+            "add_time_series_offsets",
+            "add_daily_load",
+            "add_workout_features",
+            "add_section_analysis_terms",
+            "add_wellness_id_sequences",
+            "add_form_baseline_population_hash",
+            "add_split_phase_stats",
+            "add_daily_load_state",
         ]
-        assert runner.get_current_version() == 21
+        assert runner.get_current_version() == 31
 
         conn = duckdb.connect(str(db_path), read_only=True)
         columns = [
@@ -207,11 +227,11 @@ class TestEnsureSchemaCurrent:
     def test_ensure_schema_current_noop_when_uptodate(self, db_path: Path) -> None:
         """An up-to-date DB yields no applied migrations and re-runs cleanly."""
         MigrationRunner(db_path).run_pending()
-        assert MigrationRunner(db_path).get_current_version() == 21
+        assert MigrationRunner(db_path).get_current_version() == 31
 
         first = ensure_schema_current(db_path)
         second = ensure_schema_current(db_path)
 
         assert first == []
         assert second == []
-        assert MigrationRunner(db_path).get_current_version() == 21
+        assert MigrationRunner(db_path).get_current_version() == 31
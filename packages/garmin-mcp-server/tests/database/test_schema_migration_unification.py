@@ -54,12 +54,11 @@ REQUIRED_SEQUENCES = {
     "seq_weekly_reviews_id",
 }
 
-REQUIRED_INDEXES = {
-    "idx_time_series_activity",
-    "idx_time_series_timestamp",
-    # idx_activity_section removed in #720: section_analyses is append-only, so
-    # the unique index on (activity_id, section_type) is no longer created.
-}
+# idx_activity_section removed in #720: section_analyses is append-only, so
+# the unique index on (activity_id, section_type) is no longer created.
+# idx_time_series_activity / idx_time_series_timestamp removed with the compact
+# time_series_metrics layout (zone maps replace the ART indexes).
+REQUIRED_INDEXES: set[str] = set()
 
 
 def _table_names(db_path: Path) -> set[str]:
@@ -7,6 +7,7 @@ metric is distance only, so these never depend on ``avg_heart_rate``.
 
 from __future__ import annotations
 
+from datetime import date
 from pathlib import Path
 
 import duckdb
@@ -370,6 +371,7 @@ def test_acwr_unchanged_rolling(mocker) -> None:
 
     reader = TrainingLoadReader.__new__(TrainingLoadReader)
     reader.db_path = mocker.MagicMock()
+    mocker.patch.object(reader, "_get_connection")
 
     end = date(2026, 6, 24)
     daily: dict[date, float] = {}
@@ -377,6 +379,7 @@ def test_acwr_unchanged_rolling(mocker) -> None:
         daily[end - timedelta(days=i)] = 10.0
     for i in range(7, 28):  # days 8-28: 5 km each
         daily[end - timedelta(days=i)] = 5.0
+    mocker.patch.object(reader, "_ledger_rolling_sums", return_value=None)
     mocker.patch.object(reader, "_daily_loads", return_value=daily)
 
     result = reader.get_acwr(end_date="2026-06-24")
@@ -386,3 +389,119 @@ def test_acwr_unchanged_rolling(mocker) -> None:
     assert result["chronic_load_28d_weekly"] == pytest.approx(43.75)
     assert result["acwr"] == pytest.approx(1.6)
     assert result["status"] == "high_risk"
+
+
+def _rebuild_ledger(db_path: Path) -> None:
+    """Refresh ``daily_load`` as ``insert_activities`` would after raw inserts."""
+    from garmin_mcp.database.inserters.daily_load import rebuild_all_daily_load
+
+    conn = duckdb.connect(str(db_path))
+    try:
+        rebuild_all_daily_load(conn)
+    finally:
+        conn.close()
+
+
+@pytest.mark.integration
+def test_acwr_ledger_point_lookup_matches_aggregate(reader_db_path: Path) -> None:
+    """The daily_load point read returns the same ACWR as the aggregate path."""
+    _seed_even_load(reader_db_path, daily_km=10.0, days=20)
+    reader = TrainingLoadReader(db_path=str(reader_db_path))
+    from_activities = reader.get_acwr(end_date=END_DATE)
+
+    _rebuild_ledger(reader_db_path)
+
+    assert reader._ledger_rolling_sums(date.fromisoformat(END_DATE)) == (70.0, 200.0)
+    assert reader.get_acwr(end_date=END_DATE) == from_activities
+    assert reader.get_load_trend(end_date=END_DATE)["weeks"]
+
+
+@pytest.mark.integration
+def test_stale_ledger_falls_back_to_activities(reader_db_path: Path) -> None:
+    """Activities written without refreshing the ledger are still counted."""
+    _seed_even_load(reader_db_path, daily_km=10.0, days=28)
+    _rebuild_ledger(reader_db_path)
+    _insert_activity(
+        reader_db_path, activity_id=5000, activity_date=END_DATE, distance_km=30.0
+    )
+
+    result = TrainingLoadReader(db_path=str(reader_db_path)).get_acwr(end_date=END_DATE)
+
+    assert result["acute_load_7d"] == 100.0
+
+
+@pytest.mark.integration
+def test_ledger_detects_replaced_row_outside_inserter(reader_db_path: Path) -> None:
+    """A delete plus insert keeps the row count but moves max(rowid)."""
+    _seed_even_load(reader_db_path, daily_km=10.0, days=28)
+    _rebuild_ledger(reader_db_path)
+    conn = duckdb.connect(str(reader_db_path))
+    try:
+        conn.execute("DELETE FROM activities WHERE activity_date = ?", [END_DATE])
+    finally:
+        conn.close()
+    _insert_activity(
+        reader_db_path, activity_id=5001, activity_date=END_DATE, distance_km=40.0
+    )
+
+    result = TrainingLoadReader(db_path=str(reader_db_path)).get_acwr(end_date=END_DATE)
+
+    assert result["acute_load_7d"] == 100.0
+
+
+@pytest.mark.integration
+def test_ledger_check_runs_once_per_call(reader_db_path: Path, mocker) -> None:
+    """get_load_trend resolves the per-day source once for both helpers."""
+    _seed_even_load(reader_db_path, daily_km=10.0, days=28)
+    _rebuild_ledger(reader_db_path)
+    from garmin_mcp.database.readers import training_load
+
+    check = mocker.spy(training_load, "_ledger_in_sync")
+
+    TrainingLoadReader(db_path=str(reader_db_path)).get_load_trend(end_date=END_DATE)
+
+    assert check.call_count == 1
+    assert check.spy_return is True
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("with_ledger", [False, True])
+def test_acwr_series_matches_point_acwr(
+    reader_db_path: Path, with_ledger: bool
+) -> None:
+    """Every day of the vectorized series equals get_acwr for that day."""
+    _seed_even_load(reader_db_path, daily_km=10.0, days=10)
+    _insert_activity(
+        reader_db_path, activity_id=6000, activity_date="2025-09-20", distance_km=15.0
+    )
+    if with_ledger:
+        _rebuild_ledger(reader_db_path)
+    reader = TrainingLoadReader(db_path=str(reader_db_path))
+
+    series = reader.get_acwr_series(end_date="2025-11-05")
+
+    assert series["start_date"] == "2025-09-20"
+    assert series["end_date"] == "2025-11-05"
+    assert len(series["days"]) == 47
+    for day in series["days"][::5]:
+        point = reader.get_acwr(end_date=day["date"])
+        assert day == {
+            "date": point["end_date"],
+            "acute_load_7d": point["acute_load_7d"],
+            "chronic_load_28d_weekly": point["chronic_load_28d_weekly"],
+            "acwr": point["acwr"],
+            "status": point["status"],
+        }
+
+
+@pytest.mark.integration
+def test_acwr_series_empty_db(reader_db_path: Path) -> None:
+    """No activities -> an empty series with null bounds."""
+    result = TrainingLoadReader(db_path=str(reader_db_path)).get_acwr_series()
+
+    assert result == {
+        "start_date": None,
+        "end_date": None,
+        "days": [],
+        "load_metric": "distance_km",
+    }
@@ -100,3 +100,47 @@ def test_e2e_get_wellness_baseline_deviation_insufficient(reader_db_path: Path)
         assert result[key]["mean"] is None
     assert result["overall_flag"] is False
     json.dumps(result, default=str)
+
+
+@pytest.mark.integration
+def test_get_wellness_baseline_series_matches_per_day(reader_db_path: Path) -> None:
+    """Each day of the series equals get_wellness_baseline_deviation(day)."""
+    start = datetime(2026, 3, 1)
+    for i in range(40):
+        if i % 6 == 5:
+            continue  # device-off day: no row
+        _insert_wellness(
+            reader_db_path,
+            wellness_id=i + 1,
+            date=(start + timedelta(days=i)).strftime("%Y-%m-%d"),
+            resting_hr=None if i % 9 == 0 else 48 + (i * 3) % 7,
+            hrv_overnight_ms=55.0 + (i * 7) % 13,
+            training_readiness=60 + (i * 5) % 17,
+        )
+    reader = GarminDBReader(db_path=str(reader_db_path))
+
+    series = reader.get_wellness_baseline_series(window_days=14)
+
+    assert (series["start_date"], series["end_date"]) == ("2026-03-01", "2026-04-09")
+    assert len(series["days"]) == 40
+    for i, result in enumerate(series["days"]):
+        day = (start + timedelta(days=i)).strftime("%Y-%m-%d")
+        assert result == reader.get_wellness_baseline_deviation(day, window_days=14)
+
+    assert reader.get_wellness_baseline_series("2026-04-09", "2026-03-01") == {
+        "start_date": None,
+        "end_date": None,
+        "days": [],
+    }
+
+
+@pytest.mark.integration
+def test_get_wellness_baseline_series_empty(reader_db_path: Path) -> None:
+    """No wellness rows -> empty series."""
+    reader = GarminDBReader(db_path=str(reader_db_path))
+
+    assert reader.get_wellness_baseline_series() == {
+        "start_date": None,
+        "end_date": None,
+        "days": [],
+    }
@@ -88,13 +88,13 @@ def test_readme_tool_count_matches_registry() -> None:
 
 
 @pytest.mark.unit
-def test_doc_magic_numbers_tools_61() -> None:
-    """After #937 the live MCP surface is 61 tools; docs/registry must agree."""
-    assert _expected_tool_count() == 61
+def test_doc_magic_numbers_tools_62() -> None:
+    """With batch_tool_calls the live MCP surface is 62 tools; docs must agree."""
+    assert _expected_tool_count() == 62
     for doc in _DOC_PATHS:
         text = doc.read_text(encoding="utf-8")
         for count in _numbers_before(r"(?:MCP )?tools", text):
-            assert count == 61, f"{doc.name}: doc says {count} tools, expected 61"
+            assert count == 62, f"{doc.name}: doc says {count} tools, expected 62"
 
 
 @pytest.mark.integration
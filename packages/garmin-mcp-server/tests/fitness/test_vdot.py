@@ -3,9 +3,10 @@
 Verifies against published Daniels' VDOT tables for known race performances.
 """
 
+import numpy as np
 import pytest
 
-from garmin_mcp.fitness.vdot import VDOTCalculator
+from garmin_mcp.fitness.vdot import VDOTCalculator, _race_time_grid
 
 
 @pytest.mark.unit
@@ -150,3 +151,76 @@ class TestVDOTFitnessModuleLocation:
         assert FitnessVDOT.__module__ == "garmin_mcp.fitness.vdot"
         # VDOT 40: 5K ≈ 24:06 (1446s) — unchanged behaviour after the move.
         assert FitnessVDOT.predict_race_time(40, 5.0) == pytest.approx(1446, abs=30)
+
+
+@pytest.mark.unit
+class TestRaceTimeGrid:
+    """Precomputed race-time grid vs the exact bisection solver."""
+
+    def test_grid_matches_exact_solver(self):
+        vdots = np.arange(20.0, 85.0, 1.7)
+        distances = np.array([0.8, 1.5, 3.0, 5.0, 10.0, 21.0975, 42.195, 100.0])
+        grid = VDOTCalculator.predict_race_time_array(
+            vdots[:, None], distances[None, :]
+        )
+        for i, vdot in enumerate(vdots):
+            for j, distance_km in enumerate(distances):
+                exact = VDOTCalculator._solve_race_time(float(vdot), float(distance_km))
+                # The bisection stops within 0.01 VDOT of the target, which is
+                # worth a few seconds at marathon+ distances.
+                assert grid[i, j] == pytest.approx(exact, rel=1e-3, abs=2)
+
+    def test_scalar_returns_int(self):
+        assert isinstance(VDOTCalculator.predict_race_time(50.0, 10.0), int)
+
+    def test_scalar_does_not_build_grid(self):
+        _race_time_grid.cache_clear()
+        VDOTCalculator.predict_race_time(50.0, 10.0)
+        assert _race_time_grid.cache_info().currsize == 0
+
+    def test_out_of_grid_falls_back_to_exact_solver(self):
+        result = VDOTCalculator.predict_race_time_array([100.0, 50.0], [5.0, 0.1])
+        assert result.tolist() == [
+            VDOTCalculator._solve_race_time(100.0, 5.0),
+            VDOTCalculator._solve_race_time(50.0, 0.1),
+        ]
+
+    def test_near_time_cap_falls_back_to_exact_solver(self):
+        # The true time exceeds the solver's 24 h bracket; grid cells touching
+        # capped nodes would interpolate below the cap.
+        result = VDOTCalculator.predict_race_time_array([19.0, 15.0], 149.0)
+        assert result.tolist() == [
+            VDOTCalculator._solve_race_time(19.0, 149.0),
+            VDOTCalculator._solve_race_time(15.0, 149.0),
+        ]
+
+    def test_array_matches_scalar(self):
+        vdots = np.array([30.0, 42.5, 48.2, 55.0, 100.0])
+        distances = np.array([5.0, 10.0, 21.0975, 42.195])
+        result = VDOTCalculator.predict_race_time_array(
+            vdots[:, None], distances[None, :]
+        )
+        assert result.shape == (5, 4)
+        for i, vdot in enumerate(vdots):
+            for j, distance_km in enumerate(distances):
+                assert result[i, j] == pytest.approx(
+                    VDOTCalculator.predict_race_time(float(vdot), float(distance_km)),
+                    rel=1e-3,
+                    abs=2,
+                )
+
+    def test_vdot_from_race_array_matches_scalar(self):
+        distances = np.array([5.0, 10.0, 21.0975, 42.195])
+        times = np.array([1446, 3001, 5491, 11439])
+        result = VDOTCalculator.vdot_from_race_array(distances, times)
+        expected = [
+            VDOTCalculator.vdot_from_race(float(d), int(t))
+            for d, t in zip(distances, times, strict=True)
+        ]
+        assert result == pytest.approx(expected, rel=1e-12)
+
+    def test_array_roundtrip(self):
+        times = np.array([900, 1400, 2000, 2600])
+        vdots = VDOTCalculator.vdot_from_race_array(5.0, times)
+        predicted = VDOTCalculator.predict_race_time_array(vdots, 5.0)
+        assert predicted == pytest.approx(times, abs=1)
@@ -0,0 +1,167 @@
+"""Tests for form_baseline.incremental (population-hash retraining)."""
+
+from datetime import date
+
+import duckdb
+import pytest
+
+from garmin_mcp.form_baseline.incremental import (
+    refresh_form_baselines_for_dates,
+    retrain_form_baselines,
+    window_population_hashes,
+)
+from garmin_mcp.form_baseline.trainer import train_form_baselines
+from tests.form_baseline.test_trainer import _make_splits, _seed_two_month_window
+
+MARCH = "2026-03-31"
+FEBRUARY = "2026-02-28"
+
+
+def _add_activity(db_path: str, activity_id: int, activity_date: date) -> None:
+    """Insert one activity with five full 1 km splits."""
+    conn = duckdb.connect(db_path)
+    try:
+        conn.execute(
+            "INSERT INTO activities VALUES (?, ?, ?)",
+            [activity_id, activity_date, 70.0],
+        )
+        conn.executemany(
+            "INSERT INTO splits VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            _make_splits(activity_id),
+        )
+    finally:
+        conn.close()
+
+
+def _stored_hashes(db_path: str) -> dict[tuple[str, str], str | None]:
+    """``{(period_end, metric): population_hash}`` of every stored row."""
+    conn = duckdb.connect(db_path, read_only=True)
+    try:
+        rows = conn.execute("""
+            SELECT CAST(period_end AS VARCHAR), metric, population_hash
+            FROM form_baseline_history
+            """).fetchall()
+    finally:
+        conn.close()
+    return {(period_end, metric): h for period_end, metric, h in rows}
+
+
+def _coefficients(db_path: str, period_end: str) -> dict[str, tuple]:
+    conn = duckdb.connect(db_path, read_only=True)
+    try:
+        rows = conn.execute(
+            """
+            SELECT metric, coef_alpha, coef_d, coef_a, coef_b, n_samples,
+                   power_a, power_b
+            FROM form_baseline_history WHERE period_end = ?
+            """,
+            [period_end],
+        ).fetchall()
+    finally:
+        conn.close()
+    return {row[0]: row[1:] for row in rows}
+
+
+@pytest.fixture
+def seeded_db(tmp_path) -> str:
+    db_path = str(tmp_path / "incremental.duckdb")
+    _seed_two_month_window(db_path, "2026-03-15", splits_per_month=12)
+    return db_path
+
+
+@pytest.mark.integration
+class TestRetrainFormBaselines:
+    def test_fits_several_windows_and_records_hash(self, seeded_db):
+        result = retrain_form_baselines([MARCH, FEBRUARY], db_path=seeded_db)
+
+        assert result == {
+            "generated": [MARCH, FEBRUARY],
+            "skipped": [],
+            "insufficient": [],
+        }
+        hashes = _stored_hashes(seeded_db)
+        conn = duckdb.connect(seeded_db, read_only=True)
+        try:
+            current = window_population_hashes(conn, [MARCH, FEBRUARY])
+        finally:
+            conn.close()
+        for (period_end, metric), stored in hashes.items():
+            assert stored == current[period_end], (period_end, metric)
+        assert {metric for _, metric in hashes} >= {"gct", "vo", "vr", "cadence"}
+
+    def test_unchanged_population_is_skipped(self, seeded_db):
+        retrain_form_baselines([MARCH, FEBRUARY], db_path=seeded_db)
+        before = _coefficients(seeded_db, MARCH)
+
+        second = retrain_form_baselines([MARCH, FEBRUARY], db_path=seeded_db)
+
+        assert second["skipped"] == [MARCH, FEBRUARY]
+        assert second["generated"] == []
+        assert _coefficients(seeded_db, MARCH) == before
+
+    def test_new_split_refits_only_the_windows_it_falls_in(self, seeded_db):
+        retrain_form_baselines([MARCH, FEBRUARY], db_path=seeded_db)
+
+        _add_activity(seeded_db, 9000, date(2026, 3, 28))
+        result = retrain_form_baselines([MARCH, FEBRUARY], db_path=seeded_db)
+
+        assert result["generated"] == [MARCH]
+        assert result["skipped"] == [FEBRUARY]
+        assert _coefficients(seeded_db, MARCH)["gct"][4] == 125  # n_samples
+
+    def test_legacy_rows_without_hash_are_refit(self, seeded_db):
+        retrain_form_baselines([MARCH], db_path=seeded_db)
+        conn = duckdb.connect(seeded_db)
+        try:
+            conn.execute("UPDATE form_baseline_history SET population_hash = NULL")
+        finally:
+            conn.close()
+
+        result = retrain_form_baselines([MARCH], db_path=seeded_db)
+
+        assert result["generated"] == [MARCH]
+        assert all(h is not None for h in _stored_hashes(seeded_db).values())
+
+    def test_force_refits_unchanged_windows(self, seeded_db):
+        retrain_form_baselines([MARCH], db_path=seeded_db)
+
+        result = retrain_form_baselines([MARCH], db_path=seeded_db, force=True)
+
+        assert result["generated"] == [MARCH]
+
+    def test_matches_full_trainer(self, seeded_db):
+        retrain_form_baselines([MARCH], db_path=seeded_db)
+        incremental = _coefficients(seeded_db, MARCH)
+
+        train_form_baselines(end_date=MARCH, window_months=2, db_path=seeded_db)
+
+        full = _coefficients(seeded_db, MARCH)
+        assert full.keys() == incremental.keys()
+        for metric, values in full.items():
+            assert values == pytest.approx(incremental[metric], nan_ok=True), metric
+
+    def test_insufficient_windows_are_not_written(self, tmp_path):
+        db_path = str(tmp_path / "sparse.duckdb")
+        _seed_two_month_window(db_path, "2026-03-15", splits_per_month=1)
+
+        result = retrain_form_baselines([MARCH], db_path=db_path)
+
+        assert result["insufficient"] == [MARCH]
+        assert _stored_hashes(db_path) == {}
+
+
+@pytest.mark.integration
+class TestRefreshFormBaselinesForDates:
+    def test_refits_only_stored_windows_covering_the_dates(self, seeded_db):
+        retrain_form_baselines([MARCH, FEBRUARY], db_path=seeded_db)
+        _add_activity(seeded_db, 9000, date(2026, 3, 28))
+
+        result = refresh_form_baselines_for_dates(["2026-03-28"], db_path=seeded_db)
+
+        assert result == {"generated": [MARCH], "skipped": [], "insufficient": []}
+
+    def test_no_stored_window_is_a_no_op(self, seeded_db):
+        result = refresh_form_baselines_for_dates(["2026-03-28"], db_path=seeded_db)
+
+        assert result == {"generated": [], "skipped": [], "insufficient": []}
+        assert _stored_hashes(seeded_db) == {}
@@ -1,8 +1,12 @@
 """Tests for form baseline predictor module."""
 
+import numpy as np
 import pytest
 
-from garmin_mcp.form_baseline.predictor import predict_expectations
+from garmin_mcp.form_baseline.predictor import (
+    predict_expectations,
+    predict_expectations_batch,
+)
 from garmin_mcp.form_baseline.trainer import LinearModel
 
 
@@ -123,3 +127,39 @@ class TestPredictExpectations:
         """cadence_exp is absent when no cadence model (backward compatible)."""
         result = predict_expectations(sample_models, 300.0)
         assert "cadence_exp" not in result
+
+
+@pytest.mark.unit
+class TestPredictExpectationsBatch:
+    """predict_expectations_batch matches the scalar path element for element."""
+
+    def test_batch_matches_scalar(self, sample_models: dict) -> None:
+        models = dict(sample_models)
+        models["cadence"] = LinearModel(
+            a=160.0, b=5.0, rmse=2.0, n_samples=100, speed_range=(2.0, 5.0)
+        )
+        paces = [210.0, 240.0, 300.0, 365.5, 420.0]
+
+        batch = predict_expectations_batch(models, paces)
+
+        for i, pace in enumerate(paces):
+            scalar = predict_expectations(models, pace)
+            assert set(batch) == set(scalar)
+            for key, value in scalar.items():
+                assert batch[key][i] == pytest.approx(value, rel=1e-12), key
+
+    def test_degenerate_model_is_flat(self, sample_models: dict) -> None:
+        models = dict(sample_models)
+        models["vo"] = LinearModel(
+            a=8.0,
+            b=0.0,
+            rmse=0.1,
+            n_samples=100,
+            speed_range=(3.0, 5.0),
+            degenerate=True,
+        )
+
+        batch = predict_expectations_batch(models, np.array([240.0, 300.0]))
+
+        assert batch["vo_cm_exp"].tolist() == [8.0, 8.0]
+        assert "cadence_exp" not in batch
@@ -1,5 +1,8 @@
 """Tests for form baseline scorer module."""
 
+import math
+
+import numpy as np
 import pytest
 
 from garmin_mcp.form_baseline.scorer import (
@@ -8,7 +11,9 @@ from garmin_mcp.form_baseline.scorer import (
     _compute_penalty,
     _sigma_pct,
     compute_star_rating,
+    compute_star_ratings_batch,
     score_observation,
+    score_observations_batch,
 )
 from garmin_mcp.form_baseline.trainer import GCTPowerModel, LinearModel
 
@@ -529,3 +534,87 @@ class TestConsistencyAdjustment:
         # VO improved -10%, VR degraded +6% = 16% spread (> 15)
         adj = _compute_consistency_adjustment(-5.0, -10.0, 6.0)
         assert adj == -10.0
+
+
+# Splits spanning perfect, improved, degraded and mixed form at several paces.
+_SPLIT_OBSERVATIONS = [
+    {"pace_s_per_km": 240.0, "gct_ms": 210.0, "vo_cm": 1.67, "vr_pct": 7.92},
+    {"pace_s_per_km": 255.0, "gct_ms": 195.0, "vo_cm": 1.2, "vr_pct": 7.1},
+    {"pace_s_per_km": 270.0, "gct_ms": 260.0, "vo_cm": 2.6, "vr_pct": 9.5},
+    {"pace_s_per_km": 300.0, "gct_ms": 240.0, "vo_cm": 3.9, "vr_pct": 8.0},
+    {"pace_s_per_km": 330.0, "gct_ms": 300.0, "vo_cm": 4.0, "vr_pct": 8.6},
+    {"pace_s_per_km": 225.0, "gct_ms": 180.0, "vo_cm": 0.9, "vr_pct": 8.9},
+]
+
+
+def _columns(observations: list[dict], cadence: list[float] | None = None) -> dict:
+    columns = {key: [o[key] for o in observations] for key in observations[0]}
+    if cadence is not None:
+        columns["cadence"] = cadence
+    return columns
+
+
+def _assert_matches(batch_value, scalar_value, key: str) -> None:
+    if scalar_value is None:
+        assert math.isnan(batch_value), key
+    elif isinstance(scalar_value, bool):
+        assert bool(batch_value) is scalar_value, key
+    else:
+        assert batch_value == pytest.approx(scalar_value, rel=1e-12, abs=1e-12), key
+
+
+@pytest.mark.unit
+class TestScoreObservationsBatch:
+    """score_observations_batch matches score_observation for every split."""
+
+    def test_batch_matches_scalar(self, models_2026_07_31: dict) -> None:
+        cadence = [178.0, 182.0, 170.0, 176.0, 168.0, 185.0]
+        batch = score_observations_batch(
+            models_2026_07_31, _columns(_SPLIT_OBSERVATIONS, cadence)
+        )
+
+        for i, obs in enumerate(_SPLIT_OBSERVATIONS):
+            scalar = score_observation(
+                models_2026_07_31, {**obs, "cadence": cadence[i]}
+            )
+            assert set(batch) == set(scalar)
+            for key, value in scalar.items():
+                _assert_matches(batch[key][i], value, key)
+
+    def test_batch_matches_scalar_with_legacy_sigma(self, sample_models: dict) -> None:
+        models = {
+            name: type(model)(**{**model.__dict__, "rmse": 0.0})
+            for name, model in sample_models.items()
+        }
+
+        batch = score_observations_batch(models, _columns(_SPLIT_OBSERVATIONS))
+
+        for i, obs in enumerate(_SPLIT_OBSERVATIONS):
+            for key, value in score_observation(models, obs).items():
+                _assert_matches(batch[key][i], value, key)
+
+    def test_missing_cadence_is_not_scored(self, models_with_cadence: dict) -> None:
+        batch = score_observations_batch(
+            models_with_cadence,
+            _columns(_SPLIT_OBSERVATIONS[:2], cadence=[170.0, float("nan")]),
+        )
+
+        assert batch["cadence_penalty"][0] > 0.0
+        assert math.isnan(batch["cadence_penalty"][1])
+        assert batch["cadence_needs_improvement"].tolist() == [True, False]
+
+
+@pytest.mark.unit
+class TestComputeStarRatingsBatch:
+    """compute_star_ratings_batch matches compute_star_rating, bounds included."""
+
+    def test_batch_matches_scalar(self) -> None:
+        penalties = [0.0, 9.99, 10.0, 19.9, 20.0, 39.0, 40.0, 59.9, 60.0, 100.0]
+
+        batch = compute_star_ratings_batch(np.array(penalties))
+
+        for i, penalty in enumerate(penalties):
+            scalar = compute_star_rating(penalty=penalty, delta_pct=0.0)
+            assert batch["star_rating"][i] == scalar["star_rating"]
+            assert batch["score"][i] == scalar["score"]
+            assert batch["category"][i] == scalar["category"]
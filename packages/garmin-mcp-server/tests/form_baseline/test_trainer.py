@@ -46,6 +46,21 @@ class TestGCTPowerModel:
         expected = np.exp(2.0 + (-0.5) * np.log(250.0))
         assert abs(speed - expected) < 0.01
 
+    def test_batch_predictions_match_scalar(self):
+        """Array predictions equal the per-value scalar predictions."""
+        model = GCTPowerModel(
+            alpha=5.3, d=-0.15, rmse=0.003, n_samples=100, speed_range=(3.0, 5.0)
+        )
+        speeds = np.array([2.5, 3.0, 3.7, 4.2])
+        gcts = np.array([190.0, 230.0, 275.0])
+
+        assert model.predict_inverse_batch(speeds) == pytest.approx(
+            [model.predict_inverse(v) for v in speeds], rel=1e-12
+        )
+        assert model.predict_batch(gcts) == pytest.approx(
+            [model.predict(g) for g in gcts], rel=1e-12
+        )
+
 
 @pytest.mark.unit
 class TestLinearModel:
@@ -76,6 +91,26 @@ class TestLinearModel:
         assert model.predict(3.33) == 178.0
         assert model.predict(2.0) == 178.0
 
+    def test_batch_predict_matches_scalar(self):
+        """Array predictions equal the scalar ones, flat models included."""
+        speeds = np.array([2.0, 3.33, 4.1])
+        sloped = LinearModel(
+            a=10.0, b=-1.0, rmse=0.5, n_samples=100, speed_range=(2.0, 5.0)
+        )
+        flat = LinearModel(
+            a=178.0,
+            b=0.0,
+            rmse=4.0,
+            n_samples=150,
+            speed_range=(2.0, 4.0),
+            degenerate=True,
+        )
+
+        for model in (sloped, flat):
+            assert model.predict_batch(speeds).tolist() == [
+                model.predict(v) for v in speeds
+            ]
+
 
 @pytest.mark.unit
 class TestFitGCTPower:
@@ -359,6 +394,7 @@ def _seed_baseline_db(db_path: str) -> None:
             power_a FLOAT,
             power_b FLOAT,
             power_rmse FLOAT,
+            population_hash VARCHAR,
             UNIQUE (user_id, condition_group, metric, period_start, period_end)
         )
         """)
@@ -525,6 +561,7 @@ def _create_baseline_schema(conn: duckdb.DuckDBPyConnection) -> None:
             power_a FLOAT,
             power_b FLOAT,
             power_rmse FLOAT,
+            population_hash VARCHAR,
             UNIQUE (user_id, condition_group, metric, period_start, period_end)
         )
         """)
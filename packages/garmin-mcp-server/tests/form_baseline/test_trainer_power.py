@@ -66,6 +66,7 @@ def _base_tmp_db(tmp_path_factory: pytest.TempPathFactory) -> str:
             power_a FLOAT,
             power_b FLOAT,
             power_rmse FLOAT,
+            population_hash VARCHAR,
             UNIQUE (user_id, condition_group, metric, period_start, period_end)
         )
     """)
@@ -4,8 +4,8 @@ Shared fixtures for MCP tool dispatch tests using a mock GarminDBReader.
 
 The per-domain handler classes were removed in #340; these tests now exercise
 the production dispatch path directly via ``dispatch_tool`` (registry lookup +
-``format_json_response(..., default=str)``), which is exactly what
-``server._dispatch_tool`` does for non-server tools.
+``format_json_response(..., default=str)``), which is exactly the text the
+worker's ``call`` op emits and ``server._dispatch_tool`` forwards.
 """
 
 from typing import Any
@@ -25,8 +25,9 @@ def dispatch_tool(
 ) -> list[TextContent]:
     """Dispatch a registry tool and wrap the result like the MCP server does.
 
-    Mirrors ``garmin_mcp.server._dispatch_tool`` for non-server tools so the
-    tests assert against the exact bytes the live server would emit.
+    Mirrors the worker's ``call`` serialization (forwarded as-is by
+    ``garmin_mcp.server._dispatch_tool``) so the tests assert against the exact
+    bytes the live server would emit.
     """
     result = dispatch(ALL_DEFS_BY_NAME, reader, name, arguments)
     return [TextContent(type="text", text=format_json_response(result, default=str))]
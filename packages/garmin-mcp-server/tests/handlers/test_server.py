@@ -2,12 +2,13 @@
 
 The shim delegates all domain work to a ``WorkerClient``; these tests mock that
 client so they stay fast and process-free. They cover the three shim responsibilities:
-``list_tools`` (worker schema + 2 server tools), ``get_server_info`` (shim
+``list_tools`` (worker schema + 3 server tools), ``get_server_info`` (shim
 started_at + worker DB diagnostics), and ``reload_server`` (worker restart +
-tools/list_changed, no process suicide).
+tools/list_changed, no process suicide), plus ``batch_tool_calls`` forwarding.
 """
 
 import json
+import logging
 from datetime import date
 from unittest.mock import AsyncMock, patch
 
@@ -19,6 +20,7 @@ from garmin_mcp.server import (
     _handle_get_server_info,
     _handle_reload_server,
     _serialize_result,
+    call_tool,
     list_tools,
 )
 
@@ -35,11 +37,11 @@ def _mock_worker(rpc_side_effect=None, rpc_return=None) -> AsyncMock:
 
 @pytest.mark.unit
 class TestListTools:
-    """Tests for list_tools (worker schema + 2 server tools)."""
+    """Tests for list_tools (worker schema + 3 server tools)."""
 
     @pytest.mark.asyncio
-    async def test_appends_two_server_tools(self) -> None:
-        """Domain tools from the worker are returned plus get_server_info/reload_server."""
+    async def test_appends_server_tools(self) -> None:
+        """Domain tools from the worker are returned plus the shim's server tools."""
         worker = _mock_worker(
             rpc_return={
                 "ok": True,
@@ -60,18 +62,19 @@ class TestListTools:
             "get_performance_trends",
             "get_server_info",
             "reload_server",
+            "batch_tool_calls",
         ]
         worker.rpc.assert_awaited_once_with("schema")
 
     @pytest.mark.asyncio
     async def test_worker_schema_failure_still_returns_server_tools(self) -> None:
-        """If the worker schema rpc fails, the 2 server tools are still listed."""
+        """If the worker schema rpc fails, the server tools are still listed."""
         worker = _mock_worker(rpc_return={"ok": False, "error": "boom"})
         with patch.object(server, "worker", worker):
             tools = await list_tools()
 
         names = {t.name for t in tools}
-        assert names == {"get_server_info", "reload_server"}
+        assert names == {"get_server_info", "reload_server", "batch_tool_calls"}
 
 
 @pytest.mark.unit
@@ -102,7 +105,9 @@ class TestHandleGetServerInfo:
         assert data["table_count"] == 14
         assert data["last_ingest_date"] == "2025-10-15"
         assert data["worker_started_at"] == "2025-10-15T00:00:00+00:00"
-        worker.rpc.assert_awaited_once_with("info")
+        worker.rpc.assert_awaited_once_with(
+            "info", args={"dump_instrumentation": False}
+        )
 
     @pytest.mark.asyncio
     async def test_worker_info_failure_reports_error(self) -> None:
@@ -140,6 +145,21 @@ class TestHandleGetServerInfo:
         assert data["db_status"] == "error"
         assert data["db_error"] == "RuntimeError('locked')"
 
+    @pytest.mark.asyncio
+    async def test_result_cache_counters_passed_through(self) -> None:
+        """Worker result-cache stats are forwarded unchanged."""
+        stats = {"enabled": True, "hits": 3, "misses": 1}
+        worker = _mock_worker(
+            rpc_return={
+                "ok": True,
+                "data": {"db_path": "/x/db.duckdb", "result_cache": stats},
+            }
+        )
+        with patch.object(server, "worker", worker):
+            result = await _handle_get_server_info()
+
+        assert json.loads(result[0].text)["result_cache"] == stats
+
 
 @pytest.mark.unit
 class TestHandleReloadServer:
@@ -224,7 +244,9 @@ class TestDispatchTool:
             rpc_return={"ok": True, "data": {"activity_id": 7, "date": "2025-10-09"}}
         )
         with patch.object(server, "worker", worker):
-            result = await _dispatch_tool("get_date_by_activity_id", {"activity_id": 7})
+            result = (
+                await _dispatch_tool("get_date_by_activity_id", {"activity_id": 7})
+            ).content
 
         assert len(result) == 1
         data = json.loads(result[0].text)
@@ -238,10 +260,11 @@ class TestDispatchTool:
         """A worker ok=False response surfaces as an {'error': ...} payload."""
         worker = _mock_worker(rpc_return={"ok": False, "error": "Unknown tool: nope"})
         with patch.object(server, "worker", worker):
-            result = await _dispatch_tool("nope", {})
+            outcome = await _dispatch_tool("nope", {})
 
-        data = json.loads(result[0].text)
+        data = json.loads(outcome.content[0].text)
         assert data["error"] == "Unknown tool: nope"
+        assert outcome.is_error is True
 
     @pytest.mark.asyncio
     async def test_dispatch_server_tool_get_server_info(self) -> None:
@@ -253,7 +276,7 @@ class TestDispatchTool:
             }
         )
         with patch.object(server, "worker", worker):
-            result = await _dispatch_tool("get_server_info", {})
+            result = (await _dispatch_tool("get_server_info", {})).content
 
         data = json.loads(result[0].text)
         assert "started_at" in data
@@ -264,13 +287,61 @@ class TestDispatchTool:
         """Japanese in a worker payload reaches the client raw, not \\uXXXX escaped."""
         worker = _mock_worker(rpc_return={"ok": True, "data": {"note": "評価"}})
         with patch.object(server, "worker", worker):
-            result = await _dispatch_tool("get_section_analyses", {"activity_id": 7})
+            result = (
+                await _dispatch_tool("get_section_analyses", {"activity_id": 7})
+            ).content
 
         text = result[0].text
         assert "評価" in text
         assert "\\u" not in text
         assert json.loads(text) == {"note": "評価"}
 
+    @pytest.mark.asyncio
+    async def test_dispatch_forwards_framed_text_untouched(self) -> None:
+        """A framed worker reply's text and header metadata pass through as-is."""
+        text = '{"error":"no data","_warnings":["a","b"]}'
+        worker = _mock_worker(
+            rpc_return={"ok": True, "text": text, "is_error": True, "warnings": 2}
+        )
+        with patch.object(server, "worker", worker):
+            outcome = await _dispatch_tool("get_section_analyses", {"activity_id": 7})
+
+        assert outcome.content[0].text is text
+        assert outcome.is_error is True
+        assert outcome.warning_count == 2
+
+    @pytest.mark.asyncio
+    async def test_dispatch_batch_uses_batch_op(self) -> None:
+        """batch_tool_calls is one ``batch`` rpc whose framed text is forwarded."""
+        text = '{"results":[{"tool":"a","ok":false,"error":"x"}]}'
+        worker = _mock_worker(
+            rpc_return={"ok": True, "text": text, "is_error": True, "warnings": 0}
+        )
+        arguments = {"calls": [{"tool": "a", "args": {}}], "parallel": True}
+        with patch.object(server, "worker", worker):
+            outcome = await _dispatch_tool("batch_tool_calls", arguments)
+
+        worker.rpc.assert_awaited_once_with("batch", args=arguments)
+        assert outcome.content[0].text is text
+        assert outcome.is_error is True
+
+    @pytest.mark.asyncio
+    async def test_call_tool_logs_from_envelope_header(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """call_tool logs status and warning count from the header, not the text."""
+        worker = _mock_worker(
+            rpc_return={"ok": True, "text": "{}", "is_error": True, "warnings": 3}
+        )
+        with (
+            patch.object(server, "worker", worker),
+            caplog.at_level(logging.INFO, logger="garmin_mcp.server"),
+        ):
+            await call_tool("get_section_analyses", {"activity_id": 7})
+
+        assert "status=tool_error" in caplog.text
+        assert "warning_count=3" in caplog.text
+
 
 @pytest.mark.unit
 class TestSerializeResult:
@@ -6,7 +6,11 @@ from collections.abc import Generator
 import pytest
 from pytest_mock import MockerFixture
 
-from garmin_mcp.ingest.api_client import get_garmin_client, reset_client
+from garmin_mcp.ingest.api_client import (
+    get_garmin_client,
+    reauthenticate,
+    reset_client,
+)
 
 
 @pytest.mark.unit
@@ -124,3 +128,42 @@ class TestGetGarminClient:
         assert first is not second
         assert second is second_mock
         assert mock_garmin_cls.call_count == 2  # Constructed twice
+
+
+@pytest.mark.unit
+class TestReauthenticate:
+    @pytest.fixture(autouse=True)
+    def _cleanup_singleton(self) -> Generator[None, None, None]:  # noqa: PT004
+        yield
+        reset_client()
+
+    @pytest.fixture
+    def garmin_cls(self, mocker: MockerFixture):
+        mocker.patch.dict(
+            os.environ,
+            {
+                "GARMIN_EMAIL": "test@test.com",
+                "GARMIN_PASSWORD": "pass",
+                "GARMINTOKENS": "/tmp/test_tokens",
+            },
+        )
+        return mocker.patch(
+            "garmin_mcp.ingest.api_client.Garmin",
+            side_effect=lambda *_: mocker.MagicMock(),
+        )
+
+    def test_replaces_the_failed_client(self, garmin_cls) -> None:
+        expired = get_garmin_client()
+
+        fresh = reauthenticate(expired)
+
+        assert fresh is not expired
+        assert get_garmin_client() is fresh
+        assert garmin_cls.call_count == 2
+
+    def test_keeps_a_client_another_caller_already_replaced(self, garmin_cls) -> None:
+        expired = get_garmin_client()
+        fresh = reauthenticate(expired)
+
+        assert reauthenticate(expired) is fresh
+        assert garmin_cls.call_count == 2
@@ -390,7 +390,7 @@ def test_catch_up_wellness_ingests_range(tmp_path: Path) -> None:
             "garmin_mcp.ingest.wellness_ingest.get_wellness_raw_dir",
             return_value=wellness_dir,
         ),
-        patch("garmin_mcp.ingest.wellness_ingest.time.sleep"),
+        patch("garmin_mcp.ingest.day_range.time.sleep"),
     ):
         result = catch_up_ingest(
             start_date="2026-06-20",
@@ -2,12 +2,14 @@
 
 The wellness raw dir is a per-test ``tmp_path``; the Garmin client is mocked so
 no network access occurs. A present ``{date}.json`` exercises the cache-first
-path (no API call); an empty ``{}`` marker short-circuits to ``None``.
+path (no API call); an empty ``{}`` marker short-circuits to ``None``. A cache
+miss fans the four endpoints out concurrently.
 """
 
 from __future__ import annotations
 
 import json
+import threading
 from datetime import date
 from pathlib import Path
 from typing import Any
@@ -16,6 +18,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from garmin_mcp.ingest.raw_data_fetcher import collect_wellness_data
+from garmin_mcp.ingest.retry import RateLimiter
 
 
 def _write_cache(wellness_dir: Path, date_str: str, payload: dict[str, Any]) -> None:
@@ -153,3 +156,52 @@ def test_wellness_past_day_empty_writes_marker(tmp_path: Path) -> None:
     assert cache_file.exists()
     with open(cache_file, encoding="utf-8") as f:
         assert json.load(f) == {}
+
+
+class _BarrierClient:
+    """Fake client whose endpoints only return once all four are in flight."""
+
+    def __init__(self) -> None:
+        self._barrier = threading.Barrier(4, timeout=5)
+
+    def _call(self, payload: Any) -> Any:
+        self._barrier.wait()
+        return payload
+
+    def get_stats(self, date_str: str) -> Any:
+        return self._call({"restingHeartRate": 48})
+
+    def get_hrv_data(self, date_str: str) -> Any:
+        self._barrier.wait()
+        raise RuntimeError("hrv endpoint down")
+
+    def get_sleep_data(self, date_str: str) -> Any:
+        return self._call({"dailySleepDTO": {"sleepTimeSeconds": 27000}})
+
+    def get_training_readiness(self, date_str: str) -> Any:
+        return self._call([{"score": 70}])
+
+
+@pytest.mark.unit
+def test_wellness_endpoints_fetched_concurrently(tmp_path: Path) -> None:
+    """Cache miss → four endpoints in flight at once; a failure stays isolated."""
+    wellness_dir = tmp_path / "wellness"
+
+    with patch(
+        "garmin_mcp.ingest.raw_data_fetcher.get_garmin_client",
+        return_value=_BarrierClient(),
+    ):
+        result = collect_wellness_data(
+            wellness_dir,
+            "2026-06-25",
+            today=date(2026, 6, 25),
+            rate_limiter=RateLimiter(0.0),
+        )
+
+    assert result == {
+        "stats": {"restingHeartRate": 48},
+        "hrv": None,
+        "sleep": {"dailySleepDTO": {"sleepTimeSeconds": 27000}},
+        "training_readiness": [{"score": 70}],
+    }
+    assert (wellness_dir / "2026-06-25.json").exists()
@@ -0,0 +1,56 @@
+"""Unit tests for the cache-first day-window collector."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from garmin_mcp.ingest.day_range import collect_day_range
+
+
+def _cached_collect(raw_dir: Path, date_str: str) -> dict[str, Any] | None:
+    """Collector stub: read the cache, otherwise 'fetch' and cache ``{}``."""
+    path = raw_dir / f"{date_str}.json"
+    if not path.exists():
+        path.write_text("{}")
+        return None
+    return json.loads(path.read_text()) or None
+
+
+@pytest.mark.unit
+def test_collect_day_range_returns_window_and_data(tmp_path: Path) -> None:
+    """Every day is listed; only non-empty payloads are returned by date."""
+    (tmp_path / "2026-06-01.json").write_text(json.dumps({"v": 1}))
+    (tmp_path / "2026-06-03.json").write_text(json.dumps({"v": 3}))
+    (tmp_path / "2026-06-04.json").write_text("{}")
+
+    with patch("garmin_mcp.ingest.day_range.time.sleep") as sleep_mock:
+        dates, data = collect_day_range(
+            tmp_path, "2026-06-01", "2026-06-05", _cached_collect, throttle_seconds=1.0
+        )
+
+    assert dates == [
+        "2026-06-01",
+        "2026-06-02",
+        "2026-06-03",
+        "2026-06-04",
+        "2026-06-05",
+    ]
+    assert data == {"2026-06-01": {"v": 1}, "2026-06-03": {"v": 3}}
+    # Misses on 06-02 and 06-05 → one sleep between the two API calls.
+    sleep_mock.assert_called_once_with(1.0)
+
+
+@pytest.mark.unit
+def test_collect_day_range_empty_window(tmp_path: Path) -> None:
+    """An end before the start yields no days and no collector calls."""
+    dates, data = collect_day_range(
+        tmp_path, "2026-06-02", "2026-06-01", _cached_collect, throttle_seconds=0.0
+    )
+
+    assert dates == []
+    assert data == {}
@@ -83,6 +83,7 @@ class TestSaveData:
             "lactate_threshold": "garmin_mcp.ingest.duckdb_saver._insert_lactate_threshold",
             "vo2_max": "garmin_mcp.ingest.duckdb_saver._insert_vo2_max",
             "time_series": "garmin_mcp.ingest.duckdb_saver._insert_time_series",
+            "workout_features": "garmin_mcp.ingest.duckdb_saver._refresh_workout_features",
         }
         mocks = {}
         for name, target in targets.items():
@@ -121,6 +122,8 @@ class TestSaveData:
         inserter_mocks["activities"].assert_called_once()
         # _insert_table is called twice: once for splits, once for form_efficiency
         assert inserter_mocks["splits"].call_count == 2
+        # The derived similarity row is refreshed inside the same transaction
+        inserter_mocks["workout_features"].assert_called_once_with([12345], mock_conn)
 
         # Verify return value
         assert "raw_dir" in result
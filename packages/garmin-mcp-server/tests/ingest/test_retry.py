@@ -1,19 +1,22 @@
 """Unit tests for the shared Garmin API retry helpers (issue #711).
 
 Exercises :func:`call_with_retry` (429 exponential backoff, 401 re-auth,
-immediate raise for non-retryable errors) plus the pure classification helpers
-moved from ``scripts/backfill_wellness.py``. All sleeps are injected so no real
-wait occurs, and the singleton reset / re-auth hooks are monkeypatched.
+immediate raise for non-retryable errors), the pure classification helpers
+moved from ``scripts/backfill_wellness.py`` and :class:`RateLimiter` spacing. All sleeps are injected so no real
+wait occurs, and the singleton re-auth hooks are monkeypatched.
 """
 
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
 import pytest
 
 from garmin_mcp.ingest import retry
 from garmin_mcp.ingest.retry import (
+    RateLimiter,
     call_with_retry,
     is_auth_error,
     is_rate_limit_error,
@@ -73,11 +76,11 @@ def test_call_with_retry_raises_after_max_attempts() -> None:
 
 @pytest.mark.unit
 def test_call_with_retry_reauths_on_401(monkeypatch: pytest.MonkeyPatch) -> None:
-    """A 401 resets the client, re-authenticates once, then retries to success."""
-    reset_mock = MagicMock()
-    getclient_mock = MagicMock()
-    monkeypatch.setattr(retry, "reset_client", reset_mock)
-    monkeypatch.setattr(retry, "get_garmin_client", getclient_mock)
+    """A 401 re-authenticates the failed client once, then retries to success."""
+    stale = MagicMock()
+    reauth_mock = MagicMock()
+    monkeypatch.setattr(retry, "current_client", lambda: stale)
+    monkeypatch.setattr(retry, "reauthenticate", reauth_mock)
 
     calls = {"n": 0}
 
@@ -91,8 +94,41 @@ def test_call_with_retry_reauths_on_401(monkeypatch: pytest.MonkeyPatch) -> None
 
     assert result == "ok"
     assert calls["n"] == 2
-    reset_mock.assert_called_once()
-    getclient_mock.assert_called_once()
+    reauth_mock.assert_called_once_with(stale)
+
+
+@pytest.mark.unit
+def test_concurrent_401s_reauthenticate_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Threads failing on the same expired client log in once between them."""
+    from garmin_mcp.ingest import api_client
+
+    expired = MagicMock(name="expired")
+    logins: list[MagicMock] = []
+
+    def _login() -> MagicMock:
+        logins.append(MagicMock(name="fresh"))
+        return logins[-1]
+
+    monkeypatch.setattr(api_client, "_client", expired)
+    monkeypatch.setattr(api_client, "_login", _login)
+    barrier = threading.Barrier(4)
+
+    def fn() -> str:
+        client = api_client.get_garmin_client()
+        if client is expired:
+            # Every thread fails on the expired session before any re-auth.
+            barrier.wait(timeout=5)
+            raise _FakeAuthError("401 Unauthorized")
+        return "ok"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(lambda _: call_with_retry(fn, sleep=lambda _s: None), range(4))
+        )
+
+    assert results == ["ok"] * 4
+    assert len(logins) == 1
+    assert api_client.current_client() is logins[0]
 
 
 @pytest.mark.unit
@@ -126,3 +162,34 @@ def test_is_rate_limit_error_not_auth() -> None:
     exc = _FakeTooManyRequestsError("429 Too Many Requests")
     assert is_rate_limit_error(exc) is True
     assert is_auth_error(exc) is False
+
+
+# --------------------------------------------------------------------------- #
+# RateLimiter
+# --------------------------------------------------------------------------- #
+@pytest.mark.unit
+def test_rate_limiter_spaces_call_starts() -> None:
+    """Three calls at t=0 wait 0/1/2s; a call after the window does not wait."""
+    now = {"t": 0.0}
+    sleeps: list[float] = []
+    limiter = RateLimiter(1.0, clock=lambda: now["t"], sleep=sleeps.append)
+
+    limiter.acquire()
+    limiter.acquire()
+    limiter.acquire()
+    now["t"] = 10.0
+    limiter.acquire()
+
+    assert sleeps == [1.0, 2.0]
+
+
+@pytest.mark.unit
+def test_rate_limiter_limited_wraps_callable() -> None:
+    """``limited`` forwards arguments; a zero interval never sleeps."""
+    sleeps: list[float] = []
+    limiter = RateLimiter(0.0, sleep=sleeps.append)
+
+    wrapped = limiter.limited(lambda a, b=0: a + b)
+
+    assert wrapped(1, b=2) == 3
+    assert sleeps == []
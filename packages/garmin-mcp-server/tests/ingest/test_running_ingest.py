@@ -107,6 +107,12 @@ def test_ingest_running_discovers_and_filters(temp_db_path: Path) -> None:
     assert result["skipped_existing"] == 0
     assert result["activity_ids"] == [_RUN_A, _RUN_B]
     assert worker.process_activity.call_count == 2
+    # No stored baseline window covers the new runs: nothing to refit.
+    assert result["form_baselines"] == {
+        "generated": [],
+        "skipped": [],
+        "insufficient": [],
+    }
     called_ids = [c.args[0] for c in worker.process_activity.call_args_list]
     assert _STRENGTH not in called_ids
 
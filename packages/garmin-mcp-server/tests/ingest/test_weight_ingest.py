@@ -85,7 +85,7 @@ def test_ingest_weight_range_cache_first_no_api(tmp_path: Path) -> None:
             "garmin_mcp.ingest.raw_data_fetcher.get_garmin_client",
             return_value=client,
         ),
-        patch("garmin_mcp.ingest.weight_ingest.time.sleep") as sleep_mock,
+        patch("garmin_mcp.ingest.day_range.time.sleep") as sleep_mock,
     ):
         result = ingest_weight_range(
             "2026-06-01", "2026-06-03", db_path=str(db_path), throttle_seconds=1.0
@@ -60,7 +60,7 @@ def test_ingest_wellness_range_fills_window(tmp_path: Path) -> None:
             "garmin_mcp.ingest.wellness_ingest.get_wellness_raw_dir",
             return_value=wellness_dir,
         ),
-        patch("garmin_mcp.ingest.wellness_ingest.time.sleep") as sleep_mock,
+        patch("garmin_mcp.ingest.day_range.time.sleep") as sleep_mock,
     ):
         result = ingest_wellness_range(
             "2026-06-20", "2026-06-22", db_path=str(db_path), throttle_seconds=1.0
@@ -71,7 +71,7 @@ class TestMCPSmoke:
             "data": {"table_count": 1, "started_at": "t", "last_ingest_date": None},
         }
         with patch.object(server, "worker", worker):
-            result = await _dispatch_tool("get_server_info", {})
+            result = (await _dispatch_tool("get_server_info", {})).content
 
         assert len(result) == 1
         data = json.loads(result[0].text)
@@ -88,7 +88,7 @@ class TestMCPSmoke:
             "error": "Unknown tool: nonexistent_tool",
         }
         with patch.object(server, "worker", worker):
-            result = await _dispatch_tool("nonexistent_tool", {})
+            result = (await _dispatch_tool("nonexistent_tool", {})).content
 
         data = json.loads(result[0].text)
         assert "Unknown tool: nonexistent_tool" in data["error"]
@@ -63,7 +63,7 @@ def worker_env(
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_rpc_roundtrip(worker_env: Path) -> None:
-    """start() then a real ``call`` round-trips to ok=True with data."""
+    """start() then a real ``call`` round-trips to ok=True with framed text."""
     client = WorkerClient()
     try:
         await client.start()
@@ -76,7 +76,10 @@ async def test_rpc_roundtrip(worker_env: Path) -> None:
         await client.aclose()
 
     assert resp["ok"] is True, f"call failed: {resp.get('error')}"
-    assert resp["data"] is not None
+    assert resp["is_error"] is False
+    assert resp["warnings"] == 0
+    data = json.loads(resp["text"])
+    assert data["activity_id"] == FIXTURE_ACTIVITY_ID
 
 
 @pytest.mark.integration
@@ -154,7 +157,7 @@ async def test_rpc_after_worker_crash_recovers(worker_env: Path) -> None:
             {"activity_id": FIXTURE_ACTIVITY_ID},
         )
         assert resp["ok"] is True, f"recovery call failed: {resp.get('error')}"
-        assert resp["data"] is not None
+        assert resp["text"]
     finally:
         await client.aclose()
 
@@ -348,14 +351,15 @@ async def test_call_after_reload_serves_new_code(worker_env: Path) -> None:
             ),
         ):
             await server._handle_reload_server()
-            result = await server._dispatch_tool(
+            outcome = await server._dispatch_tool(
                 "get_date_by_activity_id",
                 {"activity_id": FIXTURE_ACTIVITY_ID},
             )
     finally:
         await client.aclose()
 
-    data = json.loads(result[0].text)
+    assert outcome.is_error is False
+    data = json.loads(outcome.content[0].text)
     assert "error" not in data
     assert data is not None
 
@@ -59,8 +59,18 @@ def test_server_startup_applies_migrations(tmp_path: Path) -> None:
         "add_pace_consistency_full",
         "add_hiking_sessions",
         "add_athlete_profile_versions",
+        "add_time_series_rollups",
+        "compact_time_series_metrics",
+        "add_time_series_offsets",
+        "add_daily_load",
+        "add_workout_features",
+        "add_section_analysis_terms",
+        "add_wellness_id_sequences",
+        "add_form_baseline_population_hash",
+        "add_split_phase_stats",
+        "add_daily_load_state",
     ]
-    assert MigrationRunner(db_path).get_current_version() == 21
+    assert MigrationRunner(db_path).get_current_version() == 31
 
 
 @pytest.mark.integration
@@ -39,7 +39,7 @@ def _worker_env(data_dir: Path, db_src: Path) -> dict[str, str]:
 def test_worker_subprocess_roundtrip(
     verification_db_path: Path, tmp_path: Path
 ) -> None:
-    """A spawned worker answers one ``call`` request with one parseable JSON line."""
+    """A spawned worker answers one ``call`` with a header line and its text."""
     env = _worker_env(tmp_path / "wdata", verification_db_path)
 
     proc = subprocess.Popen(
@@ -71,7 +71,10 @@ def test_worker_subprocess_roundtrip(
     resp = json.loads(lines[0])  # must be valid JSON
     assert resp["id"] == 42
     assert resp["ok"] is True, f"call failed: {resp.get('error')}"
-    assert resp["data"] is not None
+    assert resp["is_error"] is False
+    text = lines[1]
+    assert len(text.encode("utf-8")) == resp["text_bytes"]
+    assert json.loads(text)["activity_id"] == FIXTURE_ACTIVITY_ID
 
 
 @pytest.mark.integration
@@ -170,3 +170,25 @@ class TestActivityDetailsLoader:
         result = loader.load_activity_details(activity_id)
 
         assert result["activityId"] == activity_id
+
+    def test_streamed_metrics_match_full_load(
+        self, fixture_base_path, dummy_activity_id
+    ):
+        """load_metric_descriptors / iter_detail_metrics match the full load."""
+        loader = ActivityDetailsLoader(base_path=fixture_base_path)
+        full = loader.load_activity_details(dummy_activity_id)
+
+        chunks = list(loader.iter_detail_metrics(dummy_activity_id, chunk_size=7))
+
+        assert loader.load_metric_descriptors(dummy_activity_id) == (
+            full["metricDescriptors"]
+        )
+        assert all(0 < len(chunk) <= 7 for chunk in chunks)
+        assert [m for chunk in chunks for m in chunk] == full["activityDetailMetrics"]
+
+    def test_iter_detail_metrics_file_not_found(self):
+        """Streaming raises FileNotFoundError like load_activity_details."""
+        loader = ActivityDetailsLoader()
+
+        with pytest.raises(FileNotFoundError):
+            next(loader.iter_detail_metrics(99999999999))
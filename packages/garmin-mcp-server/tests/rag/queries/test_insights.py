@@ -328,3 +328,83 @@ class TestInsightExtractorEdgeCases:
 
         # Should return empty results
         assert len(results) == 0
+
+
+@pytest.mark.integration
+class TestInsightExtractorTermIndex:
+    """The section_analysis_terms index returns what the json_extract scan does."""
+
+    KEYWORD_SETS = [
+        ["key_strengths"],
+        ["improvement_areas"],
+        ["evaluation", "environmental_impact"],
+        ["key_strengths", "improvement_areas", "evaluation"],
+    ]
+
+    @staticmethod
+    def _drop_index(db_path: Path) -> None:
+        """Drop the term index so the extractor falls back to the scan."""
+        import duckdb
+
+        with duckdb.connect(str(db_path)) as conn:
+            conn.execute("DROP TABLE section_analysis_terms")
+
+    def test_search_matches_scan(
+        self, extractor: InsightExtractor, db_path: Path
+    ) -> None:
+        """Every keyword set / filter / page gives identical results."""
+        cases = [
+            (keywords, section_types, limit, offset)
+            for keywords in self.KEYWORD_SETS
+            for section_types in (None, ["efficiency"], ["phase", "environment"])
+            for limit, offset in ((10, 0), (1, 1), (2, 2))
+        ]
+        indexed = [extractor.search_by_keywords(*case) for case in cases]
+        self._drop_index(db_path)
+        scanned = [extractor.search_by_keywords(*case) for case in cases]
+
+        assert indexed == scanned
+        assert any(indexed)
+
+    def test_extract_insights_matches_scan(
+        self, extractor: InsightExtractor, db_path: Path
+    ) -> None:
+        """extract_insights reads the same sections through the index."""
+        cases = [
+            (activity_id, keywords, max_tokens)
+            for activity_id in (20594901208, 20615445009)
+            for keywords in self.KEYWORD_SETS
+            for max_tokens in (None, 40)
+        ]
+        indexed = [extractor.extract_insights(*case) for case in cases]
+        self._drop_index(db_path)
+        scanned = [extractor.extract_insights(*case) for case in cases]
+
+        assert indexed == scanned
+
+    def test_json_path_keyword_uses_scan(self, extractor: InsightExtractor) -> None:
+        """Nested paths are not in the index and still match via json_extract."""
+        results = extractor.search_by_keywords(
+            keywords=["efficiency.hr_zone_distribution"],
+            limit=10,
+            offset=0,
+        )
+
+        assert [r["activity_id"] for r in results] == [20615445009, 20594901208]
+
+    def test_orphaned_terms_do_not_take_page_slots(
+        self, extractor: InsightExtractor, db_path: Path
+    ) -> None:
+        """Terms left behind by deleted analyses never push live hits off a page."""
+        import duckdb
+
+        with duckdb.connect(str(db_path)) as conn:
+            conn.execute("DELETE FROM section_analyses WHERE activity_id = 20615445009")
+
+        results = extractor.search_by_keywords(
+            keywords=["improvement_areas"], limit=1, offset=0
+        )
+
+        assert [(r["activity_id"], r["section_type"]) for r in results] == [
+            (20594901208, "phase")
+        ]
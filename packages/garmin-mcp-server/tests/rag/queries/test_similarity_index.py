@@ -0,0 +1,197 @@
+"""Tests for the in-memory workout similarity index."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeout
+from pathlib import Path
+from unittest.mock import patch
+
+import duckdb
+import pytest
+
+from garmin_mcp.database.db_writer import GarminDBWriter
+from garmin_mcp.database.inserters.workout_features import (
+    rebuild_all_workout_features,
+    refresh_workout_features,
+)
+from garmin_mcp.rag.queries.comparisons import WorkoutComparator
+from garmin_mcp.rag.queries.similarity_index import get_index
+
+_TYPES = ["aerobic_base", "tempo", "lactate_threshold", "recovery"]
+
+
+def _insert_run(conn, activity_id: int, i: int) -> None:
+    """Deterministic, tie-free run ``i`` (distinct pace / date per run)."""
+    pace = 280.0 + (i * 7.3) % 60
+    distance = 6.0 + (i * 1.7) % 8
+    conn.execute(
+        "INSERT OR REPLACE INTO activities (activity_id, activity_date, "
+        "activity_name, avg_pace_seconds_per_km, total_distance_km, "
+        "avg_heart_rate, temp_celsius) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            activity_id,
+            f"2025-{1 + i // 28:02d}-{1 + i % 28:02d}",
+            "Tempo Run" if i % 3 == 0 else "Easy Run",
+            pace,
+            distance,
+            140 + i % 17,
+            None if i % 5 == 0 else 10.0 + i % 12,
+        ],
+    )
+    if i % 4 != 3:
+        conn.execute(
+            "INSERT OR REPLACE INTO hr_efficiency (activity_id, training_type) "
+            "VALUES (?, ?)",
+            [activity_id, _TYPES[i % len(_TYPES)]],
+        )
+    if i % 2 == 0:
+        for split_index, intensity in enumerate(["WARMUP", "INTERVAL", "ACTIVE"]):
+            conn.execute(
+                "INSERT OR REPLACE INTO splits (activity_id, split_index, "
+                "intensity_type, pace_seconds_per_km, elevation_gain) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [activity_id, split_index + 1, intensity, pace - 10 * split_index, 3.0],
+            )
+
+
+@pytest.fixture
+def features_db(temp_db_path: Path) -> Path:
+    GarminDBWriter(db_path=str(temp_db_path))
+    with duckdb.connect(str(temp_db_path)) as conn:
+        for i in range(40):
+            _insert_run(conn, 1000 + i, i)
+        rebuild_all_workout_features(conn)
+    return temp_db_path
+
+
+def _sql_only(comparator: WorkoutComparator, **kwargs):
+    with patch.object(comparator, "_similarity_index", return_value=None):
+        return comparator.find_similar_workouts(**kwargs)
+
+
+@pytest.mark.integration
+class TestFindSimilarIndexed:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"activity_id": 1004},
+            {"activity_id": 1011, "pace_tolerance": 0.1, "limit": 3},
+            {"activity_id": 1020, "activity_type_filter": "Tempo"},
+            {"activity_id": 1006, "date_range": ("2025-01-10", "2025-02-05")},
+            {"activity_id": 1008, "target_pace_override": 275.0},
+        ],
+    )
+    def test_matches_sql_search(self, features_db: Path, kwargs):
+        comparator = WorkoutComparator(str(features_db))
+
+        # The indexed path never touches SQL or per-candidate lookups.
+        with (
+            patch.object(comparator, "_execute_query", side_effect=AssertionError),
+            patch.object(comparator.db_reader, "get_weather_data") as weather,
+        ):
+            indexed = comparator.find_similar_workouts(**kwargs)
+        weather.assert_not_called()
+        expected = _sql_only(comparator, **kwargs)
+
+        assert indexed == expected
+        assert indexed["similar_activities"]
+
+    def test_unknown_target_falls_back_to_sql(self, features_db: Path):
+        comparator = WorkoutComparator(str(features_db))
+
+        result = comparator.find_similar_workouts(activity_id=999)
+
+        assert result == {"target_activity": None, "similar_activities": []}
+
+
+@pytest.mark.integration
+class TestIndexSync:
+    def test_new_rows_are_upserted_incrementally(self, features_db: Path):
+        comparator = WorkoutComparator(str(features_db))
+        index = get_index(features_db, comparator.TRAINING_TYPE_SIMILARITY)
+        revision = index.revision
+
+        with duckdb.connect(str(features_db)) as conn:
+            _insert_run(conn, 2000, 3)
+            refresh_workout_features(conn, [2000])
+
+        with patch.object(index, "_clear", wraps=index._clear) as clear:
+            assert get_index(features_db, {}) is index
+        clear.assert_not_called()
+        assert len(index) == 41
+        assert index.revision > revision
+        assert index.row(2000) == {**index.row(1003), "activity_id": 2000}
+
+    def test_deleted_rows_trigger_reload(self, features_db: Path):
+        index = get_index(features_db, WorkoutComparator.TRAINING_TYPE_SIMILARITY)
+
+        with duckdb.connect(str(features_db)) as conn:
+            conn.execute("DELETE FROM activities WHERE activity_id = 1005")
+            refresh_workout_features(conn, [1005])
+
+        get_index(features_db, {})
+        assert len(index) == 39
+        assert index.row(1005) is None
+
+    def test_queries_wait_for_running_sync(self, features_db: Path):
+        """A query never reads the arrays while sync is replacing them."""
+        index = get_index(features_db, WorkoutComparator.TRAINING_TYPE_SIMILARITY)
+        with duckdb.connect(str(features_db)) as conn:
+            _insert_run(conn, 2000, 12)
+            refresh_workout_features(conn, [2000])
+
+        upserting, release = threading.Event(), threading.Event()
+        upsert = index._upsert
+
+        def paused_upsert(rows):
+            upserting.set()
+            release.wait(timeout=5)
+            upsert(rows)
+
+        with (
+            patch.object(index, "_upsert", side_effect=paused_upsert),
+            ThreadPoolExecutor(max_workers=2) as pool,
+        ):
+            syncing = pool.submit(index.sync)
+            assert upserting.wait(timeout=5)
+            query = pool.submit(index.nearest, [1012], 1)
+            with pytest.raises(FuturesTimeout):
+                query.result(timeout=0.2)
+            release.set()
+            syncing.result(timeout=5)
+            neighbours = query.result(timeout=5)
+
+        assert neighbours[1012][0]["activity_id"] == 2000
+
+
+@pytest.mark.integration
+class TestFindNearestWorkouts:
+    def test_batch_neighbours(self, features_db: Path):
+        with duckdb.connect(str(features_db)) as conn:
+            _insert_run(conn, 2000, 12)  # feature twin of 1012
+            refresh_workout_features(conn, [2000])
+        comparator = WorkoutComparator(str(features_db))
+
+        result = comparator.find_nearest_workouts([1012, 1030, 999], k=5)
+
+        assert result["k"] == 5
+        by_target = {r["activity_id"]: r["neighbors"] for r in result["results"]}
+        assert list(by_target) == [1012, 1030, 999]
+        assert by_target[999] == []
+        for target, neighbors in by_target.items():
+            if target == 999:
+                continue
+            assert len(neighbors) == 5
+            assert target not in [n["activity_id"] for n in neighbors]
+            distances = [n["distance"] for n in neighbors]
+            assert distances == sorted(distances)
+        assert by_target[1012][0]["activity_id"] == 2000
+        assert by_target[1012][0]["distance"] == 0.0
+
+    def test_unavailable_index(self, temp_db_path: Path):
+        comparator = WorkoutComparator(str(temp_db_path))  # no database file
+
+        assert comparator.find_nearest_workouts([1], k=3) == {
+            "k": 3,
+            "results": [{"activity_id": 1, "neighbors": []}],
+        }
@@ -355,3 +355,24 @@ def test_metric_name_validation(extractor: TimeSeriesDetailExtractor):
 
     # Should have error or warning about invalid metrics
     assert "error" in result or "invalid_metrics" in result
+
+
+@pytest.mark.unit
+def test_is_in_duckdb_reads_offsets_catalog(tmp_path, monkeypatch):
+    """Existence check is answered by time_series_offsets, not a raw scan."""
+    import duckdb
+
+    database_dir = tmp_path / "database"
+    database_dir.mkdir()
+    monkeypatch.setenv("GARMIN_DATA_DIR", str(tmp_path))
+    with duckdb.connect(str(database_dir / "garmin_performance.duckdb")) as conn:
+        conn.execute(
+            "CREATE TABLE time_series_offsets "
+            "(activity_id BIGINT, sample_count INTEGER)"
+        )
+        conn.execute("INSERT INTO time_series_offsets VALUES (12345678901, 1800)")
+
+    extractor = TimeSeriesDetailExtractor()
+
+    assert extractor._is_in_duckdb(12345678901) is True
+    assert extractor._is_in_duckdb(99999999999) is False
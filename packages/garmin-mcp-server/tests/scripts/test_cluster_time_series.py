@@ -0,0 +1,127 @@
+"""Tests for the time_series_metrics clustering job."""
+
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from garmin_mcp.database.db_writer import GarminDBWriter
+from garmin_mcp.scripts.cluster_time_series import (
+    assess_time_series_clustering,
+    cluster_time_series_metrics,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    path = tmp_path / "cluster.duckdb"
+    GarminDBWriter(db_path=str(path))
+    return path
+
+
+def _insert_activity(
+    conn: duckdb.DuckDBPyConnection, activity_id: int, n_seconds: int = 20
+) -> None:
+    conn.executemany(
+        "INSERT INTO time_series_metrics "
+        "(activity_id, seq_no, timestamp_s, heart_rate, speed) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [(activity_id, t, t, 140.0 + t, 3.0 + t / 1000) for t in range(n_seconds)],
+    )
+
+
+def _rows(conn: duckdb.DuckDBPyConnection) -> list[tuple]:
+    return conn.execute(
+        "SELECT activity_id, seq_no, timestamp_s, heart_rate, speed "
+        "FROM time_series_metrics ORDER BY activity_id, seq_no"
+    ).fetchall()
+
+
+@pytest.mark.unit
+class TestAssessTimeSeriesClustering:
+    def test_ordered_table_needs_no_clustering(self, db_path: Path):
+        with duckdb.connect(str(db_path)) as conn:
+            _insert_activity(conn, 1)
+            _insert_activity(conn, 2)
+            assessment = assess_time_series_clustering(conn)
+
+        assert assessment == {
+            "activities": 2,
+            "rows": 40,
+            "row_groups": 1,
+            "scattered_activities": 0,
+            "out_of_order_activities": 0,
+            "needs_clustering": False,
+        }
+
+    def test_out_of_order_and_scattered_activities(self, db_path: Path):
+        with duckdb.connect(str(db_path)) as conn:
+            _insert_activity(conn, 2)
+            _insert_activity(conn, 1)
+            # Activity 3 is split around a re-inserted activity 1.
+            _insert_activity(conn, 3, n_seconds=10)
+            conn.execute("DELETE FROM time_series_metrics WHERE activity_id = 1")
+            _insert_activity(conn, 1)
+            conn.execute(
+                "INSERT INTO time_series_metrics (activity_id, seq_no, timestamp_s) "
+                "VALUES (3, 10, 10)"
+            )
+            assessment = assess_time_series_clustering(conn)
+
+        assert assessment["scattered_activities"] == 1
+        assert assessment["out_of_order_activities"] == 1
+        assert assessment["needs_clustering"] is True
+
+    def test_is_read_only(self, db_path: Path):
+        with duckdb.connect(str(db_path)) as conn:
+            _insert_activity(conn, 2)
+            _insert_activity(conn, 1)
+            conn.execute("DELETE FROM time_series_offsets")
+
+        with duckdb.connect(str(db_path), read_only=True) as conn:
+            assessment = assess_time_series_clustering(conn)
+            catalog = conn.execute(
+                "SELECT COUNT(*) FROM time_series_offsets"
+            ).fetchone()
+
+        assert assessment["out_of_order_activities"] == 1
+        assert catalog == (0,)
+
+
+@pytest.mark.unit
+class TestClusterTimeSeriesMetrics:
+    def test_rewrites_fragmented_table_in_activity_order(self, db_path: Path):
+        with duckdb.connect(str(db_path)) as conn:
+            _insert_activity(conn, 2)
+            _insert_activity(conn, 1)
+            before = _rows(conn)
+
+            result = cluster_time_series_metrics(conn)
+
+            after = _rows(conn)
+            physical = conn.execute(
+                "SELECT activity_id FROM time_series_metrics ORDER BY rowid"
+            ).fetchall()
+            catalog = conn.execute(
+                "SELECT activity_id, first_row, last_row FROM time_series_offsets "
+                "ORDER BY activity_id"
+            ).fetchall()
+            reassessed = assess_time_series_clustering(conn)
+
+        assert result["clustered"] is True
+        assert after == before
+        assert physical == sorted(physical)
+        assert catalog == [(1, 0, 19), (2, 20, 39)]
+        assert reassessed["needs_clustering"] is False
+
+    def test_clustered_table_is_left_untouched(self, db_path: Path):
+        with duckdb.connect(str(db_path)) as conn:
+            _insert_activity(conn, 1)
+            conn.execute("DELETE FROM time_series_offsets")
+            assert cluster_time_series_metrics(conn)["clustered"] is False
+            # The catalog is refreshed even when no rewrite is needed.
+            assert conn.execute(
+                "SELECT activity_id, first_row, last_row FROM time_series_offsets"
+            ).fetchall() == [(1, 0, 19)]
+            assert cluster_time_series_metrics(conn, force=True)["clustered"] is True
+            assert len(_rows(conn)) == 20
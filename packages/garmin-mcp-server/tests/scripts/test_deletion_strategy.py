@@ -9,6 +9,7 @@ from pathlib import Path
 import duckdb
 import pytest
 
+from garmin_mcp.database.migrations.add_daily_load import add_daily_load
 from garmin_mcp.scripts.regenerate.deletion_strategy import (
     delete_activity_records,
     delete_table_all_records,
@@ -85,6 +86,61 @@ class TestDeleteActivityRecords:
         # Data should still be intact (rollback)
         assert _count(db_with_data, "splits") == original_count
 
+    def test_time_series_deletes_derived_tables(self, db_with_data: Path):
+        """Rollups and the offsets catalog go with their time series rows."""
+        with duckdb.connect(str(db_with_data)) as conn:
+            for table in (
+                "time_series_metrics",
+                "time_series_rollups",
+                "time_series_offsets",
+            ):
+                conn.execute(f"CREATE TABLE {table} (activity_id BIGINT)")
+                conn.execute(f"INSERT INTO {table} VALUES (1001), (1002)")
+
+        delete_activity_records([1001], ["time_series_metrics"], db_with_data)
+
+        assert _count(db_with_data, "time_series_metrics") == 1
+        assert _count(db_with_data, "time_series_rollups") == 1
+        assert _count(db_with_data, "time_series_offsets") == 1
+
+    def test_activities_delete_removes_workout_features(self, db_with_data: Path):
+        """Similar-workout feature rows go with their activity."""
+        with duckdb.connect(str(db_with_data)) as conn:
+            conn.execute("CREATE TABLE workout_features (activity_id BIGINT)")
+            conn.execute("INSERT INTO workout_features VALUES (1001), (1002)")
+
+        delete_activity_records([1001], ["activities"], db_with_data)
+
+        assert _count(db_with_data, "workout_features") == 1
+
+    def test_section_analyses_delete_removes_terms(self, db_with_data: Path):
+        """Keyword index rows go with their section analyses."""
+        with duckdb.connect(str(db_with_data)) as conn:
+            for table in ("section_analyses", "section_analysis_terms"):
+                conn.execute(f"CREATE TABLE {table} (activity_id BIGINT)")
+                conn.execute(f"INSERT INTO {table} VALUES (1001), (1002)")
+
+        delete_activity_records([1001], ["section_analyses"], db_with_data)
+
+        assert _count(db_with_data, "section_analyses") == 1
+        assert _count(db_with_data, "section_analysis_terms") == 1
+
+    def test_activities_delete_rebuilds_daily_load(self, db_with_data: Path):
+        """The date-keyed load ledger is recomputed from remaining activities."""
+        with duckdb.connect(str(db_with_data)) as conn:
+            conn.execute("ALTER TABLE activities ADD COLUMN total_distance_km DOUBLE")
+            conn.execute("ALTER TABLE activities ADD COLUMN total_time_seconds INT")
+            conn.execute("UPDATE activities SET total_distance_km = 10.0")
+            add_daily_load(conn)
+
+        delete_activity_records([1003], ["activities"], db_with_data)
+
+        with duckdb.connect(str(db_with_data), read_only=True) as conn:
+            rows = conn.execute(
+                "SELECT load_28d_km FROM daily_load ORDER BY load_date"
+            ).fetchall()
+        assert rows == [(10.0,), (20.0,)]
+
 
 # ---------------------------------------------------------------------------
 # delete_table_all_records
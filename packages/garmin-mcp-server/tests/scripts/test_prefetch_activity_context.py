@@ -505,3 +505,152 @@ class TestPrefetchActivityContext:
         assert result["activity_date"] == "2026-02-16"
         assert result["training_type"] == "aerobic_base"
         assert result["terrain_category"] == "flat"
+
+
+@pytest.fixture
+def seeded_db(tmp_path, monkeypatch):
+    """Writer-created DB under GARMIN_DATA_DIR with three seeded activities.
+
+    - 1001: own VO2 max / lactate threshold rows, HR zones and two splits
+    - 1002: interval run without its own VO2 max (reader falls back to 1001's)
+    - 1003: activity row only
+    """
+    from garmin_mcp.database.db_writer import GarminDBWriter
+
+    monkeypatch.setenv("GARMIN_DATA_DIR", str(tmp_path / "data"))
+    monkeypatch.setenv("GARMIN_RESULT_DIR", str(tmp_path / "result"))
+    db_path = tmp_path / "data" / "database" / "garmin_performance.duckdb"
+    db_path.parent.mkdir(parents=True)
+    GarminDBWriter(db_path=str(db_path))
+
+    with duckdb.connect(str(db_path)) as conn:
+        conn.executemany(
+            "INSERT INTO activities (activity_id, activity_date, start_time_local, "
+            "temp_celsius, wind_speed_kmh, avg_heart_rate, avg_pace_seconds_per_km) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (1001, "2026-02-10", "2026-02-10 07:00:00", 7.84, 4.0, 148, 330.0),
+                (1002, "2026-02-16", "2026-02-16 07:00:00", 9.0, None, 160, 290.0),
+                (1003, "2026-03-01", "2026-03-01 07:00:00", None, None, None, None),
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO hr_efficiency (activity_id, training_type, primary_zone) "
+            "VALUES (?, ?, ?)",
+            [(1001, "tempo", "Zone 3"), (1002, "interval", "Zone 4")],
+        )
+        conn.executemany(
+            "INSERT INTO splits (activity_id, split_index, elevation_gain, "
+            "elevation_loss) VALUES (?, ?, ?, ?)",
+            [(1001, 1, 3.0, 1.0), (1001, 2, 9.0, 8.0)],
+        )
+        conn.executemany(
+            "INSERT INTO heart_rate_zones (activity_id, zone_number, "
+            "zone_low_boundary, zone_high_boundary, time_in_zone_seconds, "
+            "zone_percentage) VALUES (?, ?, ?, ?, ?, ?)",
+            [(1001, 2, 120, 140, 600.0, 40.0), (1001, 1, 100, 120, 900.0, 60.0)],
+        )
+        conn.execute(
+            "INSERT INTO vo2_max (activity_id, precise_value, value, date) "
+            "VALUES (1001, 52.3, 52, '2026-02-10')"
+        )
+        conn.execute(
+            "INSERT INTO lactate_threshold (activity_id, heart_rate, speed_mps, "
+            "date_hr) VALUES (1001, 168, 3.9, '2026-02-10')"
+        )
+    return db_path
+
+
+@pytest.mark.integration
+class TestPrefetchActivityContexts:
+    """Batched prefetch against a real DuckDB."""
+
+    def test_batched_bundles_match_single_activity_path(self, seeded_db):
+        from garmin_mcp.scripts.prefetch_activity_context import (
+            prefetch_activity_contexts,
+        )
+
+        bundles = prefetch_activity_contexts([1001, 1002, 1003, 1001], use_cache=False)
+
+        assert list(bundles) == [1001, 1002, 1003]
+        for activity_id, bundle in bundles.items():
+            assert bundle == prefetch_activity_context(activity_id)
+        assert bundles[1001]["hr_zones_detail"]["zones"][0]["zone_number"] == 1
+        assert bundles[1001]["max_split_elevation_gain"] == 9.0
+        assert bundles[1001]["lactate_threshold"]["heart_rate"] == 168
+        # 1002 has no own VO2 max row: most recent measurement before its date.
+        assert bundles[1002]["vo2_max"]["precise_value"] == 52.3
+        assert bundles[1003]["phase_structure"] is None
+
+    def test_unknown_activity_reports_error(self, seeded_db):
+        from garmin_mcp.scripts.prefetch_activity_context import (
+            prefetch_activity_contexts,
+        )
+
+        bundles = prefetch_activity_contexts([1003, 9999], use_cache=False)
+
+        assert "error" in bundles[9999]
+        assert "error" not in bundles[1003]
+
+    def test_cache_hit_skips_expansion_until_data_changes(self, seeded_db, tmp_path):
+        from garmin_mcp.scripts import prefetch_activity_context as module
+
+        cache_dir = tmp_path / "bundle_cache"
+        first = module.prefetch_activity_contexts([1001, 1002], cache_dir=cache_dir)
+
+        with patch.object(
+            module, "_expand_bundle", wraps=module._expand_bundle
+        ) as expand:
+            second = module.prefetch_activity_contexts(
+                [1001, 1002], cache_dir=cache_dir
+            )
+            assert expand.call_count == 0
+            assert second == first
+
+            with duckdb.connect(str(seeded_db)) as conn:
+                conn.execute(
+                    "UPDATE hr_efficiency SET primary_zone = 'Zone 2' "
+                    "WHERE activity_id = 1001"
+                )
+            third = module.prefetch_activity_contexts([1001, 1002], cache_dir=cache_dir)
+
+        assert expand.call_count == 1
+        assert third[1001]["primary_zone"] == "Zone 2"
+        assert third[1002] == first[1002]
+
+    def test_ranked_column_edit_invalidates_every_bundle(self, seeded_db, tmp_path):
+        """A distance correction keeps the activity count but re-ranks similars."""
+        from garmin_mcp.scripts import prefetch_activity_context as module
+
+        cache_dir = tmp_path / "bundle_cache"
+        module.prefetch_activity_contexts([1001, 1002], cache_dir=cache_dir)
+
+        with duckdb.connect(str(seeded_db)) as conn:
+            conn.execute(
+                "UPDATE activities SET total_distance_km = 12.0 "
+                "WHERE activity_id = 1003"
+            )
+        with patch.object(
+            module, "_expand_bundle", wraps=module._expand_bundle
+        ) as expand:
+            module.prefetch_activity_contexts([1001, 1002], cache_dir=cache_dir)
+
+        assert expand.call_count == 2
+
+    def test_workout_features_revision_invalidates_cache(self, seeded_db, tmp_path):
+        from garmin_mcp.database.inserters.workout_features import (
+            refresh_workout_features,
+        )
+        from garmin_mcp.scripts import prefetch_activity_context as module
+
+        cache_dir = tmp_path / "bundle_cache"
+        module.prefetch_activity_contexts([1001], cache_dir=cache_dir)
+
+        with duckdb.connect(str(seeded_db)) as conn:
+            refresh_workout_features(conn, [1002])
+        with patch.object(
+            module, "_expand_bundle", wraps=module._expand_bundle
+        ) as expand:
+            module.prefetch_activity_contexts([1001], cache_dir=cache_dir)
+
+        assert expand.call_count == 1
@@ -5,6 +5,9 @@ Tests for table filtering, validation, and selective deletion features.
 Phase 1: Core Infrastructure (Table Filtering & Validation)
 """
 
+import json
+
+import duckdb
 import pytest
 
 from garmin_mcp.scripts.regenerate_duckdb import DuckDBRegenerator
@@ -183,6 +186,9 @@ class TestDeleteActivityRecords:
         mock_conn.cursor.return_value = mock_cursor
         mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
         mock_conn.__exit__ = mocker.MagicMock(return_value=False)
+        # No daily_load table: the ledger rebuild after deleting activities
+        # is skipped.
+        mock_conn.execute.return_value.fetchone.return_value = (0,)
         mocker.patch(
             "garmin_mcp.scripts.regenerate.deletion_strategy.duckdb.connect",
             return_value=mock_conn,
@@ -901,3 +907,83 @@ class TestDateRangeScopedDeletion:
 
         mock_delete_table_all.assert_called_once_with(["splits"])
         mock_delete_activity.assert_not_called()
+
+
+@pytest.mark.integration
+class TestRegenerateSplitsBatched:
+    """--batch-size: splits regeneration with bulk inserts."""
+
+    @staticmethod
+    def _write_activity(raw_dir, activity_id, laps):
+        activity_dir = raw_dir / "activity" / str(activity_id)
+        activity_dir.mkdir(parents=True)
+        (activity_dir / "splits.json").write_text(json.dumps({"lapDTOs": laps}))
+
+    @staticmethod
+    def _laps(count):
+        return [
+            {
+                "lapIndex": i,
+                "distance": 1000.0,
+                "duration": 300.0 + i,
+                "intensityType": "ACTIVE",
+                "averageHR": 150,
+                "averageRunCadence": 180.0,
+            }
+            for i in range(1, count + 1)
+        ]
+
+    def test_batch_size_requires_splits_only(self, tmp_path):
+        with pytest.raises(ValueError, match="--batch-size"):
+            DuckDBRegenerator(
+                db_path=tmp_path / "test.db",
+                tables=["splits", "form_efficiency"],
+                batch_size=10,
+            )
+        with pytest.raises(ValueError, match="at least 1"):
+            DuckDBRegenerator(
+                db_path=tmp_path / "test.db", tables=["splits"], batch_size=0
+            )
+
+    def test_writes_splits_and_phase_stats_per_batch(self, tmp_path):
+        from garmin_mcp.database.db_writer import GarminDBWriter
+
+        db_path = tmp_path / "test.duckdb"
+        GarminDBWriter(db_path=str(db_path))
+        raw_dir = tmp_path / "raw"
+        self._write_activity(raw_dir, 1, self._laps(3))
+        self._write_activity(raw_dir, 2, self._laps(5))
+        self._write_activity(raw_dir, 3, [])
+
+        regenerator = DuckDBRegenerator(
+            raw_dir=raw_dir,
+            db_path=db_path,
+            tables=["splits"],
+            force=True,
+            batch_size=2,
+        )
+        results = regenerator.regenerate_splits_batched(
+            [(1, "2026-07-01"), (2, "2026-07-02"), (3, "2026-07-03"), (4, None)]
+        )
+
+        assert [r["status"] for r in results] == [
+            "success",
+            "success",
+            "error",
+            "error",
+        ]
+        assert results[3]["error"] == "Raw data not found"
+        with duckdb.connect(str(db_path), read_only=True) as conn:
+            split_counts = dict(
+                conn.execute(
+                    "SELECT activity_id, COUNT(*) FROM splits GROUP BY activity_id"
+                ).fetchall()
+            )
+            stat_counts = dict(
+                conn.execute(
+                    "SELECT activity_id, split_count FROM split_phase_stats "
+                    "WHERE phase = 'all'"
+                ).fetchall()
+            )
+        assert split_counts == {1: 3, 2: 5}
+        assert stat_counts == {1: 3, 2: 5}
@@ -74,13 +74,13 @@ def test_registry_internally_consistent() -> None:
     assert len(ALL_DEFS_BY_NAME) == len(ALL_DEFS)
     assert set(ALL_DEFS_BY_NAME) == set(names)
 
-    # The live MCP surface = domain tools + the two server tools, unique.
+    # The live MCP surface = domain tools + the server tools, unique.
     live_names = [t.name for t in get_tool_definitions()]
     server_names = {t["name"] for t in _SERVER_TOOLS}
     assert len(live_names) == len(set(live_names)), "duplicate names on MCP surface"
     assert set(live_names) == set(ALL_DEFS_BY_NAME) | server_names
     assert len(live_names) == len(ALL_DEFS) + len(_SERVER_TOOLS)
-    assert server_names == {"get_server_info", "reload_server"}
+    assert server_names == {"get_server_info", "reload_server", "batch_tool_calls"}
 
 
 @pytest.mark.unit
@@ -119,11 +119,11 @@ def test_kept_tools_present() -> None:
 
 
 @pytest.mark.unit
-def test_tool_count_is_61() -> None:
-    """The live MCP surface is exactly 61 tools (60 -> 61 after #937)."""
-    assert len(ALL_DEFS) + len(_SERVER_TOOLS) == 61
+def test_tool_count_is_62() -> None:
+    """The live MCP surface is exactly 62 tools (61 -> 62 with batch_tool_calls)."""
+    assert len(ALL_DEFS) + len(_SERVER_TOOLS) == 62
     golden = json.loads(_GOLDEN_PATH.read_text(encoding="utf-8"))
-    assert len(golden) == 61
+    assert len(golden) == 62
 
 
 @pytest.mark.integration
@@ -136,7 +136,7 @@ def test_hiking_tools_registered() -> None:
         t["name"] for t in json.loads(_GOLDEN_PATH.read_text(encoding="utf-8"))
     }
     assert {"ingest_hiking_sessions", "get_hiking_sessions"} <= golden_names
-    assert len(golden_names) == 61
+    assert len(golden_names) == 62
 
     # get_hiking_sessions -> GarminDBReader.get_hiking_sessions
     reader = MagicMock()
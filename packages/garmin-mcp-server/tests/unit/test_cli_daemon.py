@@ -0,0 +1,151 @@
+"""Unit tests for the ``garmin-db`` daemon and its stdlib client.
+
+The daemon is served on a thread against a short-lived Unix socket; the
+detached ``start_daemon`` spawn is exercised manually, not here.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from garmin_mcp import cli_client
+from garmin_mcp.cli_client import DaemonUnavailableError, request, run_via_daemon
+from garmin_mcp.cli_daemon import CLIDaemon, daemon_status, stop_daemon
+from garmin_mcp.database.connection import get_db_path
+from garmin_mcp.database.db_writer import GarminDBWriter
+
+
+@pytest.fixture
+def sock_path() -> Iterator[Path]:
+    """Socket path short enough for ``AF_UNIX`` (pytest tmp paths may not be)."""
+    directory = Path(tempfile.mkdtemp(prefix="gdb-"))
+    yield directory / "d.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def _serve(daemon: CLIDaemon) -> tuple[threading.Thread, list[str]]:
+    reasons: list[str] = []
+    thread = threading.Thread(target=lambda: reasons.append(daemon.serve()))
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not daemon.path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return thread, reasons
+
+
+@pytest.fixture
+def running(sock_path: Path) -> Iterator[CLIDaemon]:
+    daemon = CLIDaemon(sock_path, idle_timeout=30, fingerprint=lambda: "v1")
+    thread, _ = _serve(daemon)
+    yield daemon
+    stop_daemon(sock_path)
+    thread.join(timeout=5)
+
+
+@pytest.mark.unit
+class TestCLIDaemon:
+    def test_cli_op_runs_tool_and_captures_output(self, running):
+        db_path = get_db_path()
+        db_path.parent.mkdir(parents=True)
+        GarminDBWriter(str(db_path))
+
+        argv = ["metadata", "activity-by-date", "2025-10-09"]
+        resp = request({"op": "cli", "args": {"argv": argv}}, path=running.path)
+
+        assert resp["ok"] is True
+        assert resp["exit_code"] == 0
+        assert json.loads(resp["text"]) == {
+            "success": False,
+            "error": "No activities found for 2025-10-09",
+            "activities": [],
+        }
+
+    def test_usage_error_reports_exit_code_and_stderr(self, running):
+        resp = request({"op": "cli", "args": {"argv": ["bogus"]}}, path=running.path)
+
+        assert resp["exit_code"] == 2
+        assert resp["text"] == ""
+        assert "No such command" in resp["stderr"]
+
+    def test_worker_ops_are_delegated(self, running):
+        resp = request({"op": "nope"}, path=running.path)
+
+        assert resp == {"id": 1, "ok": False, "error": "unknown op: 'nope'"}
+
+    def test_status_and_shutdown(self, sock_path):
+        daemon = CLIDaemon(sock_path, idle_timeout=30, fingerprint=lambda: "v1")
+        thread, reasons = _serve(daemon)
+
+        status = daemon_status(sock_path)
+        assert status is not None
+        assert status["socket"] == str(sock_path)
+        assert stop_daemon(sock_path) is True
+        thread.join(timeout=5)
+
+        assert reasons == ["shutdown"]
+        assert not sock_path.exists()
+        assert daemon_status(sock_path) is None
+        assert stop_daemon(sock_path) is False
+
+    def test_exits_when_idle(self, sock_path):
+        daemon = CLIDaemon(sock_path, idle_timeout=0.1, fingerprint=lambda: "v1")
+
+        assert daemon.serve() == "idle"
+        assert not sock_path.exists()
+
+    def test_code_change_refuses_with_retry(self, sock_path):
+        versions = iter(["v1", "v2"])
+        daemon = CLIDaemon(
+            sock_path,
+            idle_timeout=30,
+            fingerprint=lambda: next(versions),
+            clock=iter([0.0, 10.0]).__next__,
+        )
+        thread, reasons = _serve(daemon)
+
+        resp = request({"op": "cli", "args": {"argv": ["--help"]}}, path=sock_path)
+        thread.join(timeout=5)
+
+        assert resp["ok"] is False
+        assert resp["retry"] is True
+        assert reasons == ["code_changed"]
+
+    def test_replaces_stale_socket_file(self, sock_path):
+        sock_path.write_text("")
+        daemon = CLIDaemon(sock_path, idle_timeout=0.1, fingerprint=lambda: "v1")
+
+        assert daemon.serve() == "idle"
+
+    def test_refuses_to_bind_over_live_daemon(self, running):
+        with pytest.raises(RuntimeError, match="already running"):
+            CLIDaemon(running.path, fingerprint=lambda: "v1").serve()
+
+
+@pytest.mark.unit
+class TestClient:
+    def test_run_via_daemon_replays_output(self, running, capsys):
+        code = run_via_daemon(["bogus"], path=running.path)
+
+        assert code == 2
+        assert "No such command" in capsys.readouterr().err
+
+    def test_no_daemon_raises_unavailable(self, sock_path):
+        with pytest.raises(DaemonUnavailableError):
+            run_via_daemon(["--help"], path=sock_path)
+
+    def test_socket_path_keyed_on_data_dir(self, monkeypatch):
+        monkeypatch.delenv(cli_client.SOCKET_ENV, raising=False)
+        first = cli_client.socket_path()
+        monkeypatch.setenv("GARMIN_DATA_DIR", "/elsewhere")
+
+        assert cli_client.socket_path() != first
+        monkeypatch.setenv(cli_client.SOCKET_ENV, "/tmp/explicit.sock")
+        assert cli_client.socket_path() == Path("/tmp/explicit.sock")
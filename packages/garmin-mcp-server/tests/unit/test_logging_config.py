@@ -121,10 +121,16 @@ class TestCallToolLogging:
     @pytest.fixture
     def _patch_handlers(self, mocker: MockerFixture) -> None:
         """Patch _dispatch_tool to return a canned result (no DB/registry)."""
+        from mcp.types import TextContent
+
+        from garmin_mcp.server import _ToolOutcome
+
         mocker.patch(
             "garmin_mcp.server._dispatch_tool",
             new=mocker.AsyncMock(
-                return_value=[{"type": "text", "text": "ok"}],
+                return_value=_ToolOutcome(
+                    [TextContent(type="text", text="ok")], False, 0
+                ),
             ),
         )
 
@@ -14,7 +14,7 @@ from garmin_mcp.tool_schemas import TOOL_NAMES, get_tool_definitions
 from garmin_mcp.tools import ALL_DEFS, ALL_DEFS_BY_NAME
 
 # Tools handled directly in server.py, not registered in ALL_DEFS_BY_NAME.
-SERVER_TOOLS = {"reload_server", "get_server_info"}
+SERVER_TOOLS = {"reload_server", "get_server_info", "batch_tool_calls"}
 
 
 @pytest.mark.unit
@@ -1,19 +1,49 @@
 """Unit tests for the worker IPC ``handle()`` dispatcher.
 
-These exercise the in-process request handling (schema/call/info/unknown op)
-with a mocked ``GarminDBReader``; the subprocess round-trip lives in the
-integration suite.
+These exercise the in-process request handling (schema/call/batch/info/unknown
+op) with a mocked ``GarminDBReader`` (``batch`` against a real DuckDB file);
+the subprocess round-trip lives in the integration suite.
 """
 
 from __future__ import annotations
 
+import io
 import json
-from unittest.mock import MagicMock
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from garmin_mcp import worker
+from garmin_mcp.database.connection import get_write_connection
+from garmin_mcp.database.db_writer import GarminDBWriter
 from garmin_mcp.tools import ALL_DEFS
-from garmin_mcp.worker import handle
+from garmin_mcp.utils.result_cache import ResultCache
+from garmin_mcp.worker import _result_envelope, _write_response, handle
+
+
+@pytest.fixture(autouse=True)
+def _fresh_result_cache(monkeypatch: pytest.MonkeyPatch) -> ResultCache:
+    """Isolate the per-process result cache between tests."""
+    cache = ResultCache(8)
+    monkeypatch.setattr(worker, "_RESULT_CACHE", cache)
+    return cache
+
+
+@pytest.fixture
+def file_reader(tmp_path: Path) -> MagicMock:
+    """Mocked reader pointing at a real file (the cache stats it)."""
+    db_path = tmp_path / "garmin.duckdb"
+    db_path.write_bytes(b"v1")
+    reader = MagicMock()
+    reader.db_path = db_path
+    reader.get_load_trend.return_value = {"weeks": []}
+    return reader
+
+
+def _call(reader: MagicMock, tool: str, args: dict) -> dict:
+    return handle({"op": "call", "tool": tool, "args": args}, reader)
 
 
 @pytest.mark.unit
@@ -53,12 +83,48 @@ def test_handle_call_dispatches_to_registry() -> None:
 
     assert resp["ok"] is True
     assert resp["id"] == 7
-    assert resp["data"] is not None
-    assert resp["data"]["activity_id"] == 20636804823
-    assert resp["data"]["date"] == "2025-10-09"
+    assert "data" not in resp
+    assert resp["is_error"] is False
+    assert resp["warnings"] == 0
+    data = json.loads(resp["text"])
+    assert data["activity_id"] == 20636804823
+    assert data["date"] == "2025-10-09"
     reader.get_activity_date.assert_called_once_with(20636804823)
 
 
+@pytest.mark.unit
+def test_result_envelope_carries_error_and_warnings() -> None:
+    """The envelope header is derived from the result object, not its text."""
+    envelope = _result_envelope(
+        {"error": "not found", "note": "評価", "_warnings": ["a", "b"]}
+    )
+
+    assert envelope["is_error"] is True
+    assert envelope["warnings"] == 2
+    # Final MCP text: compact, unescaped Japanese.
+    assert envelope["text"] == (
+        '{"error":"not found","note":"評価","_warnings":["a","b"]}'
+    )
+
+
+@pytest.mark.unit
+def test_write_response_frames_text(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A ``text`` response is a header line plus exactly ``text_bytes`` bytes."""
+    out = io.BytesIO()
+    monkeypatch.setattr(
+        sys, "stdout", io.TextIOWrapper(out, encoding="ascii", write_through=True)
+    )
+
+    _write_response({"id": 1, "ok": True, "text": '{"note":"評価"}', "warnings": 0})
+
+    header_line, rest = out.getvalue().split(b"\n", 1)
+    header = json.loads(header_line)
+    assert "text" not in header
+    body = rest[: header["text_bytes"]]
+    assert body.decode("utf-8") == '{"note":"評価"}'
+    assert rest[header["text_bytes"] :] == b"\n"
+
+
 @pytest.mark.unit
 def test_handle_call_invalid_args_returns_error() -> None:
     """Missing/invalid args surface as ``ok=False`` with a Pydantic message."""
@@ -101,3 +167,208 @@ def test_handle_info_returns_db_diagnostics() -> None:
     assert "started_at" in data
     # Whole response must be JSON-serializable (MCP boundary).
     json.dumps(resp)
+
+
+@pytest.mark.unit
+def test_handle_info_reports_and_dumps_instrumentation(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """With instrumentation on, ``info`` carries the snapshot and its dump path."""
+    monkeypatch.setenv("GARMIN_MCP_INSTRUMENT", "1")
+    monkeypatch.setenv("GARMIN_RESULT_DIR", str(tmp_path))
+    reader = MagicMock()
+    reader.get_activity_date.return_value = "2025-10-09"
+    handle(
+        {
+            "op": "call",
+            "tool": "get_date_by_activity_id",
+            "args": {"activity_id": 1},
+        },
+        reader,
+    )
+
+    plain = handle({"op": "info"}, reader)["data"]
+    data = handle({"op": "info", "args": {"dump_instrumentation": True}}, reader)[
+        "data"
+    ]
+
+    stats = data["instrumentation"]["tools"]["get_date_by_activity_id"]
+    assert stats["calls"] >= 1
+    assert stats["response_bytes"] > 0
+    # Only an explicit request writes the dump file.
+    assert "instrumentation_dump" not in plain
+    dump = json.loads(Path(data["instrumentation_dump"]).read_text())
+    assert "get_date_by_activity_id" in dump["tools"]
+    assert list((tmp_path / "instrumentation").iterdir()) == [
+        Path(data["instrumentation_dump"])
+    ]
+
+
+@pytest.mark.unit
+class TestResultCache:
+    def test_cacheable_tool_is_memoized_by_canonical_args(
+        self, file_reader: MagicMock
+    ) -> None:
+        """Omitted and explicit defaults hit the same entry."""
+        first = _call(file_reader, "get_load_trend", {})
+        second = _call(file_reader, "get_load_trend", {"lookback_weeks": 12})
+
+        assert second["text"] == first["text"]
+        file_reader.get_load_trend.assert_called_once()
+
+    def test_other_args_miss(self, file_reader: MagicMock) -> None:
+        _call(file_reader, "get_load_trend", {})
+        _call(file_reader, "get_load_trend", {"lookback_weeks": 4})
+
+        assert file_reader.get_load_trend.call_count == 2
+
+    def test_database_write_changes_version(self, file_reader: MagicMock) -> None:
+        _call(file_reader, "get_load_trend", {})
+        file_reader.db_path.write_bytes(b"v2 (ingested)")
+        _call(file_reader, "get_load_trend", {})
+
+        assert file_reader.get_load_trend.call_count == 2
+
+    def test_write_tool_invalidates_even_on_failure(
+        self, file_reader: MagicMock, _fresh_result_cache: ResultCache
+    ) -> None:
+        _call(file_reader, "get_load_trend", {})
+        resp = _call(file_reader, "insert_section_analysis_dict", {})
+        _call(file_reader, "get_load_trend", {})
+
+        assert resp["ok"] is False
+        assert _fresh_result_cache.invalidations == 1
+        assert file_reader.get_load_trend.call_count == 2
+
+    def test_invalid_args_skip_cache_and_reach_dispatch(
+        self, file_reader: MagicMock
+    ) -> None:
+        """Validation errors of cacheable tools come from dispatch, as for others."""
+        with patch.object(worker, "dispatch", wraps=worker.dispatch) as dispatch:
+            resp = _call(file_reader, "get_load_trend", {"lookback_weeks": "many"})
+
+        assert resp["ok"] is False
+        assert "lookback_weeks" in resp["error"]
+        dispatch.assert_called_once()
+        file_reader.get_load_trend.assert_not_called()
+
+    def test_self_healing_prefetch_invalidates(
+        self, file_reader: MagicMock, _fresh_result_cache: ResultCache
+    ) -> None:
+        """prefetch_activity_context may write form baselines."""
+        with patch(
+            "garmin_mcp.scripts.prefetch_activity_context.prefetch_activity_context",
+            return_value={"activity_id": 1},
+        ):
+            _call(file_reader, "prefetch_activity_context", {"activity_id": 1})
+
+        assert _fresh_result_cache.invalidations == 1
+
+    def test_error_results_are_not_cached(self, file_reader: MagicMock) -> None:
+        file_reader.get_load_trend.return_value = {"error": "busy"}
+        _call(file_reader, "get_load_trend", {})
+        _call(file_reader, "get_load_trend", {})
+
+        assert file_reader.get_load_trend.call_count == 2
+
+    def test_non_cacheable_tool_always_dispatches(self, file_reader: MagicMock) -> None:
+        file_reader.get_strength_sessions.return_value = []
+        args = {"start_date": "2025-10-01", "end_date": "2025-10-31"}
+        for _ in range(2):
+            _call(file_reader, "get_strength_sessions", args)
+
+        assert file_reader.get_strength_sessions.call_count == 2
+
+    def test_info_reports_counters(self, file_reader: MagicMock) -> None:
+        for _ in range(3):
+            _call(file_reader, "get_load_trend", {})
+
+        stats = handle({"op": "info"}, file_reader)["data"]["result_cache"]
+
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+
+@pytest.fixture
+def activity_db(tmp_path: Path) -> Path:
+    """Initialized DuckDB with two activities."""
+    db_path = tmp_path / "batch.duckdb"
+    GarminDBWriter(db_path=str(db_path))
+    with get_write_connection(db_path) as conn:
+        conn.execute(
+            "INSERT INTO activities (activity_id, activity_date) "
+            "VALUES (1, '2025-10-01'), (2, '2025-10-02')"
+        )
+    return db_path
+
+
+@pytest.mark.unit
+class TestBatch:
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_results_in_order_with_per_call_errors(
+        self, activity_db: Path, parallel: bool
+    ) -> None:
+        reader = MagicMock()
+        reader.db_path = activity_db
+        calls = [
+            {"tool": "get_date_by_activity_id", "args": {"activity_id": 2}},
+            {"tool": "no_such_tool", "args": {}},
+            {"tool": "get_date_by_activity_id", "args": {}},
+            {"tool": "insert_section_analysis_dict", "args": {}},
+            {"tool": "get_date_by_activity_id", "args": {"activity_id": 1}},
+        ]
+
+        resp = handle(
+            {"id": 3, "op": "batch", "args": {"calls": calls, "parallel": parallel}},
+            reader,
+        )
+
+        assert resp["ok"] is True
+        assert resp["id"] == 3
+        assert resp["is_error"] is True
+        results = json.loads(resp["text"])["results"]
+        assert [r["tool"] for r in results] == [c["tool"] for c in calls]
+        assert [r["ok"] for r in results] == [True, False, False, False, True]
+        assert results[0]["result"] == {"activity_id": 2, "date": "2025-10-02"}
+        assert results[4]["result"] == {"activity_id": 1, "date": "2025-10-01"}
+        assert "unknown tool" in results[1]["error"]
+        assert "cannot be batched" in results[3]["error"]
+        # The batch never used the worker's own per-call reader.
+        reader.get_activity_date.assert_not_called()
+
+    def test_calls_share_one_connection(self, activity_db: Path) -> None:
+        """Readers built for a batch never open the database file again."""
+        calls = [
+            {"tool": "get_date_by_activity_id", "args": {"activity_id": i}}
+            for i in (1, 2, 1)
+        ]
+        with patch(
+            "garmin_mcp.database.readers.base.get_connection",
+            side_effect=AssertionError("opened a second connection"),
+        ):
+            envelope = worker._batch_tool_calls(calls, True, str(activity_db))
+
+        results = json.loads(envelope["text"])["results"]
+        assert envelope["is_error"] is False
+        assert [r["result"]["date"] for r in results] == [
+            "2025-10-01",
+            "2025-10-02",
+            "2025-10-01",
+        ]
+
+    def test_too_many_calls_is_rejected(self, activity_db: Path) -> None:
+        reader = MagicMock()
+        reader.db_path = activity_db
+        calls = [{"tool": "get_date_by_activity_id", "args": {"activity_id": 1}}]
+
+        resp = handle(
+            {
+                "op": "batch",
+                "args": {"calls": calls * (worker.BATCH_MAX_CALLS + 1)},
+            },
+            reader,
+        )
+
+        assert resp["ok"] is False
+        assert "at most" in resp["error"]
@@ -0,0 +1,160 @@
+"""Tests for the opt-in MCP worker instrumentation."""
+
+import json
+import threading
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import duckdb
+import pytest
+
+from garmin_mcp.database.connection import get_connection
+from garmin_mcp.database.db_reader import GarminDBReader
+from garmin_mcp.database.readers.base import BaseDBReader
+from garmin_mcp.tools import ALL_DEFS_BY_NAME
+from garmin_mcp.tools.registry import dispatch
+from garmin_mcp.utils import instrumentation
+from garmin_mcp.utils.instrumentation import (
+    ENV_VAR,
+    dump_stats,
+    record_response,
+    snapshot,
+    track_tool_call,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_stats() -> Iterator[None]:
+    instrumentation.reset()
+    yield
+    instrumentation.reset()
+
+
+@pytest.fixture
+def enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(ENV_VAR, "1")
+
+
+@pytest.fixture
+def reader(tmp_path) -> BaseDBReader:
+    db_path = tmp_path / "test.duckdb"
+    with duckdb.connect(str(db_path)) as conn:
+        conn.execute("CREATE TABLE t AS SELECT range AS x FROM range(5)")
+    return BaseDBReader(str(db_path))
+
+
+def _count_rows(reader: BaseDBReader) -> list[tuple]:
+    with reader._get_connection() as conn:
+        conn.execute("SELECT COUNT(*) FROM t").fetchone()
+        return conn.execute("SELECT x FROM t").fetchall()
+
+
+@pytest.mark.unit
+class TestTrackToolCall:
+    def test_disabled_records_nothing(self, monkeypatch, reader):
+        monkeypatch.delenv(ENV_VAR, raising=False)
+
+        with track_tool_call("t"):
+            _count_rows(reader)
+        record_response("t", 1.0, "{}")
+
+        assert snapshot() == {"enabled": False, "tools": {}}
+
+    def test_records_sql_connections_and_rows(self, enabled, reader):
+        for _ in range(2):
+            with track_tool_call("t"):
+                assert len(_count_rows(reader)) == 5
+
+        stats = snapshot()["tools"]["t"]
+        assert stats["calls"] == 2
+        assert stats["connections"] == 2
+        assert stats["rows_fetched"] == 12
+        assert 0 < stats["sql_ms"] <= stats["total_ms"]
+        assert 0 < stats["p50_ms"] <= stats["p95_ms"] <= stats["max_ms"]
+
+    def test_connection_outside_call_is_not_wrapped(self, enabled, reader):
+        with reader._get_connection() as conn:
+            assert isinstance(conn, duckdb.DuckDBPyConnection)
+        assert snapshot()["tools"] == {}
+
+    def test_exception_counts_as_error(self, enabled):
+        with pytest.raises(RuntimeError), track_tool_call("t"):
+            raise RuntimeError("boom")
+
+        assert snapshot()["tools"]["t"]["errors"] == 1
+
+    def test_response_bytes_are_utf8_size(self, enabled):
+        record_response("t", 2.5, '{"note":"評価"}')
+
+        stats = snapshot()["tools"]["t"]
+        assert stats["response_bytes"] == len('{"note":"評価"}'.encode())
+        assert stats["serialize_ms"] == 2.5
+
+
+@pytest.mark.unit
+def test_concurrent_calls_are_all_counted(enabled):
+    """Parallel batch calls update the shared per-tool aggregate under a lock."""
+
+    def _calls() -> None:
+        for _ in range(200):
+            with track_tool_call("t"):
+                pass
+            record_response("t", 1.0, "x")
+
+    threads = [threading.Thread(target=_calls) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = snapshot()["tools"]["t"]
+    assert (stats["calls"], stats["response_bytes"]) == (8 * 200, 8 * 200)
+
+
+@pytest.mark.unit
+class TestReaderPaths:
+    def test_get_connection_is_tracked(self, enabled, reader):
+        with track_tool_call("t"), get_connection(reader.db_path) as conn:
+            conn.execute("SELECT x FROM t").fetchall()
+
+        stats = snapshot()["tools"]["t"]
+        assert (stats["connections"], stats["rows_fetched"]) == (1, 5)
+
+    def test_execute_read_query_on_shared_connection_is_tracked(self, enabled, reader):
+        with get_connection(reader.db_path) as conn:
+            db_reader = GarminDBReader.from_connection(conn)
+            with track_tool_call("t"):
+                db_reader.execute_read_query("SELECT x FROM t")
+                db_reader.execute_read_query_with_columns("SELECT x FROM t")
+
+        stats = snapshot()["tools"]["t"]
+        assert (stats["connections"], stats["rows_fetched"]) == (2, 10)
+        assert stats["sql_ms"] > 0
+
+
+@pytest.mark.unit
+def test_dispatch_is_tracked(enabled):
+    reader = MagicMock()
+    reader.get_activity_date.return_value = "2025-10-09"
+
+    dispatch(
+        ALL_DEFS_BY_NAME,
+        reader,
+        "get_date_by_activity_id",
+        {"activity_id": 1},
+    )
+
+    assert snapshot()["tools"]["get_date_by_activity_id"]["calls"] == 1
+
+
+@pytest.mark.unit
+def test_dump_stats_writes_json(enabled, tmp_path):
+    with track_tool_call("t"):
+        pass
+
+    path = dump_stats(tmp_path / "stats.json")
+
+    data = json.loads(path.read_text())
+    assert data["enabled"] is True
+    assert data["tools"]["t"]["calls"] == 1
+    assert "dumped_at" in data
@@ -0,0 +1,85 @@
+"""Tests for incremental top-level JSON reading."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from garmin_mcp.utils.json_stream import iter_top_level_array, load_top_level_fields
+
+DOCUMENT = {
+    "activityId": 1234567890123,
+    "tricky": {"text": 'brace } bracket ] quote " backslash \\', "nested": [[{}]]},
+    "activityDetailMetrics": [
+        {"metrics": [i, 140.5 + i, None, -1.25e-3 * i, True]} for i in range(23)
+    ],
+    "label": "日本語   text",
+    "metricDescriptors": [{"metricsIndex": 0, "key": "sumDuration"}],
+    "count": 98765,
+}
+
+
+@pytest.fixture
+def document_path(tmp_path: Path) -> Path:
+    path = tmp_path / "doc.json"
+    path.write_text(json.dumps(DOCUMENT, indent=1, ensure_ascii=False))
+    return path
+
+
+@pytest.mark.unit
+class TestLoadTopLevelFields:
+    @pytest.mark.parametrize("read_chars", [1, 3, 7, 64, 1 << 16])
+    def test_matches_json_load(self, document_path, read_chars):
+        fields = {"activityId", "label", "metricDescriptors", "count", "tricky"}
+
+        found = load_top_level_fields(document_path, fields, read_chars=read_chars)
+
+        assert found == {key: DOCUMENT[key] for key in fields}
+
+    def test_missing_fields_are_absent(self, document_path):
+        found = load_top_level_fields(document_path, {"count", "nope"})
+
+        assert found == {"count": 98765}
+
+    def test_malformed_document_raises(self, tmp_path):
+        path = tmp_path / "bad.json"
+        path.write_text('{"a": [1, 2, "b": 3}')
+
+        with pytest.raises(json.JSONDecodeError):
+            load_top_level_fields(path, {"b"}, read_chars=4)
+
+
+@pytest.mark.unit
+class TestIterTopLevelArray:
+    @pytest.mark.parametrize("read_chars", [1, 5, 1 << 16])
+    @pytest.mark.parametrize("chunk_size", [1, 4, 23, 100])
+    def test_chunks_match_json_load(self, document_path, read_chars, chunk_size):
+        chunks = list(
+            iter_top_level_array(
+                document_path,
+                "activityDetailMetrics",
+                chunk_size,
+                read_chars=read_chars,
+            )
+        )
+
+        assert all(len(chunk) <= chunk_size for chunk in chunks)
+        assert all(chunks)
+        assert [item for chunk in chunks for item in chunk] == DOCUMENT[
+            "activityDetailMetrics"
+        ]
+
+    @pytest.mark.parametrize("value", ["null", "[]", None])
+    def test_missing_null_or_empty_yields_nothing(self, tmp_path, value):
+        path = tmp_path / "doc.json"
+        members = ['"other": [1, 2]'] + ([f'"items": {value}'] if value else [])
+        path.write_text("{" + ", ".join(members) + "}")
+
+        assert list(iter_top_level_array(path, "items", 10)) == []
+
+    def test_non_array_raises(self, tmp_path):
+        path = tmp_path / "doc.json"
+        path.write_text('{"items": {"a": 1}}')
+
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_top_level_array(path, "items", 10))
@@ -0,0 +1,98 @@
+"""Tests for the MCP worker result cache."""
+
+from pathlib import Path
+
+import pytest
+
+from garmin_mcp.utils.result_cache import (
+    DEFAULT_MAX_ENTRIES,
+    ENV_VAR,
+    ResultCache,
+    cache_size,
+    canonical_args,
+    data_version,
+)
+
+V1 = ("2025-10-18", (1, 1), None)
+V2 = ("2025-10-18", (2, 2), None)
+
+
+def _entry(text: str) -> dict:
+    return {"text": text, "is_error": False, "warnings": 0}
+
+
+@pytest.mark.unit
+class TestResultCache:
+    def test_hit_and_miss_counters(self):
+        cache = ResultCache(4)
+
+        assert cache.get("t", "{}", V1) is None
+        cache.put("t", "{}", V1, _entry("a"))
+
+        assert cache.get("t", "{}", V1) == _entry("a")
+        assert cache.stats() == {
+            "enabled": True,
+            "max_entries": 4,
+            "entries": 1,
+            "hits": 1,
+            "misses": 1,
+            "hit_rate": 0.5,
+            "invalidations": 0,
+        }
+
+    def test_evicts_least_recently_used(self):
+        cache = ResultCache(2)
+        cache.put("t", "a", V1, _entry("a"))
+        cache.put("t", "b", V1, _entry("b"))
+        cache.get("t", "a", V1)
+        cache.put("t", "c", V1, _entry("c"))
+
+        assert cache.get("t", "b", V1) is None
+        assert cache.get("t", "a", V1) == _entry("a")
+
+    def test_version_change_drops_everything(self):
+        cache = ResultCache(4)
+        cache.put("t", "a", V1, _entry("a"))
+
+        assert cache.get("t", "a", V2) is None
+        assert cache.stats()["invalidations"] == 1
+        assert cache.stats()["entries"] == 0
+
+    def test_zero_capacity_disables(self):
+        cache = ResultCache(0)
+        cache.put("t", "a", V1, _entry("a"))
+
+        assert cache.enabled is False
+        assert cache.get("t", "a", V1) is None
+        assert cache.stats()["misses"] == 0
+
+
+@pytest.mark.unit
+def test_canonical_args_ignores_key_order():
+    assert canonical_args({"b": 1, "a": [2]}) == canonical_args({"a": [2], "b": 1})
+
+
+@pytest.mark.unit
+def test_data_version_tracks_db_and_wal(tmp_path: Path):
+    db_path = tmp_path / "garmin.duckdb"
+    db_path.write_bytes(b"db")
+    before = data_version(db_path)
+
+    Path(f"{db_path}.wal").write_bytes(b"pending write")
+
+    assert before[2] is None
+    assert data_version(db_path) != before
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, DEFAULT_MAX_ENTRIES), ("0", 0), ("16", 16), ("lots", DEFAULT_MAX_ENTRIES)],
+)
+def test_cache_size_from_env(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv(ENV_VAR, raising=False)
+    else:
+        monkeypatch.setenv(ENV_VAR, value)
+
+    assert cache_size() == expected
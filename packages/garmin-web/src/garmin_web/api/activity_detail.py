@@ -3,8 +3,8 @@
 from typing import Annotated
 
 from fastapi import APIRouter, HTTPException, Query, Request
-from garmin_mcp.database.connection import get_connection
 
+from garmin_web.db_executor import run_query
 from garmin_web.queries.detail import get_activity_detail
 from garmin_web.queries.sections import get_sections, list_section_versions
 from garmin_web.queries.time_series import get_time_series
@@ -14,18 +14,16 @@ router = APIRouter(prefix="/api")
 
 
 @router.get("/activities/{activity_id}")
-def get_detail(request: Request, activity_id: int) -> dict:
+async def get_detail(request: Request, activity_id: int) -> dict:
     """Return aggregated detail for one activity, or 404 if unknown."""
-    db_path = getattr(request.app.state, "db_path", None)
-    with get_connection(db_path) as conn:
-        detail = get_activity_detail(conn, activity_id)
+    detail = await run_query(request, get_activity_detail, activity_id)
     if detail is None:
         raise HTTPException(status_code=404, detail="Activity not found")
     return detail
 
 
 @router.get("/activities/{activity_id}/time-series")
-def get_activity_time_series(
+async def get_activity_time_series(
     request: Request,
     activity_id: int,
     metrics: Annotated[str, Query(min_length=1)],
@@ -37,30 +35,28 @@ def get_activity_time_series(
     Unknown metric names are rejected with 422.
     """
     metric_names = [name.strip() for name in metrics.split(",") if name.strip()]
-    db_path = getattr(request.app.state, "db_path", None)
     try:
-        with get_connection(db_path) as conn:
-            return get_time_series(
-                conn, activity_id, metric_names, max_points=max_points
-            )
+        return await run_query(
+            request, get_time_series, activity_id, metric_names, max_points
+        )
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
 
 
 @router.get("/activities/{activity_id}/track")
-def get_activity_track(request: Request, activity_id: int) -> dict:
+async def get_activity_track(request: Request, activity_id: int) -> dict:
     """Return the GPS track for an activity.
 
     Activities without GPS data (e.g. indoor runs) return 200 with an
     empty points array.
     """
-    db_path = getattr(request.app.state, "db_path", None)
-    with get_connection(db_path) as conn:
-        return {"points": get_track(conn, activity_id)}
+    return {"points": await run_query(request, get_track, activity_id)}
 
 
 @router.get("/activities/{activity_id}/sections/versions")
-def get_activity_section_versions(request: Request, activity_id: int) -> list[dict]:
+async def get_activity_section_versions(
+    request: Request, activity_id: int
+) -> list[dict]:
     """Return saved analysis runs for an activity (newest first).
 
     Each entry is one analysis run (``run_id``); a full-activity analysis of 5
@@ -68,13 +64,11 @@ def get_activity_section_versions(request: Request, activity_id: int) -> list[di
     activity has no section analyses. The more specific ``/versions`` path is
     declared before the bare ``/sections`` route so it is matched first.
     """
-    db_path = getattr(request.app.state, "db_path", None)
-    with get_connection(db_path) as conn:
-        return list_section_versions(conn, activity_id)
+    return await run_query(request, list_section_versions, activity_id)
 
 
 @router.get("/activities/{activity_id}/sections")
-def get_activity_sections(
+async def get_activity_sections(
     request: Request,
     activity_id: int,
     run_id: Annotated[int | None, Query()] = None,
@@ -85,6 +79,4 @@ def get_activity_sections(
     view to that analysis run (each section's latest version at or before that
     run).
     """
-    db_path = getattr(request.app.state, "db_path", None)
-    with get_connection(db_path) as conn:
-        return get_sections(conn, activity_id, run_id=run_id)
+    return await run_query(request, get_sections, activity_id, run_id)
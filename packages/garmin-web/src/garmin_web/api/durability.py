@@ -7,14 +7,31 @@ never re-implements the durability logic.
 
 from typing import Any, cast
 
+import duckdb
 from fastapi import APIRouter, Request
 from garmin_mcp.database.db_reader import GarminDBReader
 
+from garmin_web.db_executor import Priority, run_query
+
 router = APIRouter(prefix="/api")
 
 
+def _durability_trend(
+    conn: duckdb.DuckDBPyConnection,
+    start_date: str,
+    end_date: str,
+    min_distance_km: float,
+) -> dict[str, Any]:
+    return cast(
+        "dict[str, Any]",
+        GarminDBReader.from_connection(conn).get_durability_trend(
+            start_date, end_date, min_distance_km
+        ),
+    )
+
+
 @router.get("/durability-trend")
-def get_durability_trend_endpoint(
+async def get_durability_trend_endpoint(
     request: Request,
     start_date: str,
     end_date: str,
@@ -26,9 +43,11 @@ def get_durability_trend_endpoint(
     ``start_date`` / ``end_date`` are required query parameters (inclusive,
     ``YYYY-MM-DD``); the frontend passes a default window of the trailing N days.
     """
-    db_path = getattr(request.app.state, "db_path", None)
-    reader = GarminDBReader(db_path=str(db_path) if db_path is not None else None)
-    return cast(
-        "dict[str, Any]",
-        reader.get_durability_trend(start_date, end_date, min_distance_km),
+    return await run_query(
+        request,
+        _durability_trend,
+        start_date,
+        end_date,
+        min_distance_km,
+        priority=Priority.HEAVY,
     )
@@ -7,14 +7,28 @@ re-implements it.
 
 from typing import Any
 
+import duckdb
 from fastapi import APIRouter, Request
 from garmin_mcp.database.db_reader import GarminDBReader
 
+from garmin_web.db_executor import run_query
+
 router = APIRouter(prefix="/api")
 
 
+def _race_readiness(
+    conn: duckdb.DuckDBPyConnection, user_id: str, lookback_weeks: int
+) -> dict[str, Any]:
+    # Bind to a typed local so the reader's (mypy-untyped) Any result narrows
+    # to the declared return type without leaking `Any`.
+    readiness: dict[str, Any] = GarminDBReader.from_connection(conn).get_race_readiness(
+        user_id=user_id, lookback_weeks=lookback_weeks
+    )
+    return readiness
+
+
 @router.get("/race-readiness")
-def get_race_readiness_endpoint(
+async def get_race_readiness_endpoint(
     request: Request,
     user_id: str = "default",
     lookback_weeks: int = 8,
@@ -23,11 +37,4 @@ def get_race_readiness_endpoint(
 
     Read-only: delegates entirely to the reader (no Web-side VDOT logic).
     """
-    db_path = getattr(request.app.state, "db_path", None)
-    reader = GarminDBReader(db_path=str(db_path) if db_path is not None else None)
-    # Bind to a typed local so the reader's (mypy-untyped) Any result narrows
-    # to the declared return type without leaking `Any`.
-    readiness: dict[str, Any] = reader.get_race_readiness(
-        user_id=user_id, lookback_weeks=lookback_weeks
-    )
-    return readiness
+    return await run_query(request, _race_readiness, user_id, lookback_weeks)
@@ -8,30 +8,27 @@ Web layer stays a thin pass-through.
 from typing import Any
 
 from fastapi import APIRouter, Request
-from garmin_mcp.database.connection import get_connection
 
+from garmin_web.db_executor import Priority, run_query
 from garmin_web.queries import recovery as recovery_queries
 
 router = APIRouter(prefix="/api")
 
 
-def _db_path(request: Request) -> Any:
-    return getattr(request.app.state, "db_path", None)
-
-
 @router.get("/recovery-trend")
-def get_recovery_trend_endpoint(request: Request, weeks: int = 8) -> dict[str, Any]:
+async def get_recovery_trend_endpoint(
+    request: Request, weeks: int = 8
+) -> dict[str, Any]:
     """RHR / HRV recovery trend over the trailing ``weeks`` weeks (#499).
 
     Read-only: delegates entirely to the reader. ``series`` is date-ascending;
     ``rhr`` / ``hrv`` summary fields are null-safe when data is missing.
     """
-    with get_connection(_db_path(request)) as conn:
-        return recovery_queries.get_recovery_trend(conn, weeks)
+    return await run_query(request, recovery_queries.get_recovery_trend, weeks)
 
 
 @router.get("/recovery-status")
-def get_recovery_status_endpoint(
+async def get_recovery_status_endpoint(
     request: Request, date: str | None = None
 ) -> dict[str, Any]:
     """Morning go/no-go recovery status for ``date`` (#500).
@@ -39,12 +36,11 @@ def get_recovery_status_endpoint(
     ``date`` defaults to the latest day in ``daily_wellness``. A device-off day
     returns ``recommendation="unknown"`` with a "go by feel" reason.
     """
-    with get_connection(_db_path(request)) as conn:
-        return recovery_queries.get_recovery_status(conn, date)
+    return await run_query(request, recovery_queries.get_recovery_status, date)
 
 
 @router.get("/body-composition-trend")
-def get_body_composition_trend_endpoint(
+async def get_body_composition_trend_endpoint(
     request: Request, weeks: int = 12
 ) -> dict[str, Any]:
     """Body-composition trend over the trailing ``weeks`` weeks (#501).
@@ -52,12 +48,11 @@ def get_body_composition_trend_endpoint(
     Read-only: ``series`` is date-ascending with fat/lean decomposition, and
     ``change`` carries the first-to-last weight delta breakdown.
     """
-    with get_connection(_db_path(request)) as conn:
-        return recovery_queries.get_body_composition_trend(conn, weeks)
+    return await run_query(request, recovery_queries.get_body_composition_trend, weeks)
 
 
 @router.get("/form-anomaly-flags")
-def get_form_anomaly_flags_endpoint(
+async def get_form_anomaly_flags_endpoint(
     request: Request, weeks: int = 2, max_activities: int = 12
 ) -> dict[str, Any]:
     """ "今週の注意点": form-anomaly flags across the trailing ``weeks`` runs (#636).
@@ -66,14 +61,17 @@ def get_form_anomaly_flags_endpoint(
     ``max_activities`` caps the scan; ``limited`` is True when more candidate
     runs existed than were scanned (``scanned``). Never 500s on missing raw data.
     """
-    with get_connection(_db_path(request)) as conn:
-        return recovery_queries.get_recent_form_anomaly_flags(
-            conn, weeks, max_activities
-        )
+    return await run_query(
+        request,
+        recovery_queries.get_recent_form_anomaly_flags,
+        weeks,
+        max_activities,
+        priority=Priority.HEAVY,
+    )
 
 
 @router.get("/weight-economy-coupling")
-def get_weight_economy_coupling_endpoint(
+async def get_weight_economy_coupling_endpoint(
     request: Request, weeks: int = 52
 ) -> dict[str, Any]:
     """Weight <-> easy-run economy (EF) coupling over the trailing ``weeks`` (#554).
@@ -83,12 +81,11 @@ def get_weight_economy_coupling_endpoint(
     longitudinal effect size + collinearity (association) caveat, or ``None``
     when too few runs matched. Never 500s on insufficient data.
     """
-    with get_connection(_db_path(request)) as conn:
-        return recovery_queries.get_weight_economy_coupling(conn, weeks)
+    return await run_query(request, recovery_queries.get_weight_economy_coupling, weeks)
 
 
 @router.get("/wellness-baseline-deviation")
-def get_wellness_baseline_deviation_endpoint(
+async def get_wellness_baseline_deviation_endpoint(
     request: Request, date: str | None = None, window_days: int = 30
 ) -> dict[str, Any]:
     """Personal-baseline deviation for HRV / readiness / RHR on ``date`` (#555).
@@ -100,5 +97,6 @@ def get_wellness_baseline_deviation_endpoint(
     ``flag="insufficient"`` (null-safe, never 500s). ``overall_flag`` is True
     when any metric sits in an unfavorable deviation.
     """
-    with get_connection(_db_path(request)) as conn:
-        return recovery_queries.get_wellness_baseline_deviation(conn, date, window_days)
+    return await run_query(
+        request, recovery_queries.get_wellness_baseline_deviation, date, window_days
+    )
@@ -1,20 +1,51 @@
 """Training-load (ACWR) API router (read-only).
 
-Thin wrapper over ``GarminDBReader.get_acwr`` / ``get_load_trend`` (Issue #357):
-all ACWR computation lives in the reader, so the Web layer never re-implements
-the injury-risk logic.
+Thin wrapper over ``GarminDBReader.get_acwr`` / ``get_load_trend`` /
+``get_acwr_series`` (Issue #357) and ``get_injury_risk_series``: all ACWR and
+injury-risk computation lives in the reader, so the Web layer never
+re-implements the injury-risk logic.
 """
 
 from typing import Any
 
+import duckdb
 from fastapi import APIRouter, Request
 from garmin_mcp.database.db_reader import GarminDBReader
 
+from garmin_web.db_executor import Priority, run_query
+
 router = APIRouter(prefix="/api")
 
 
+def _training_load(
+    conn: duckdb.DuckDBPyConnection, lookback_weeks: int
+) -> dict[str, Any]:
+    reader = GarminDBReader.from_connection(conn)
+    current: dict[str, Any] = reader.get_acwr()
+    trend: dict[str, Any] = reader.get_load_trend(lookback_weeks)
+    return {"current": current, "trend": trend}
+
+
+def _acwr_series(
+    conn: duckdb.DuckDBPyConnection, start_date: str | None, end_date: str | None
+) -> dict[str, Any]:
+    series: dict[str, Any] = GarminDBReader.from_connection(conn).get_acwr_series(
+        start_date, end_date
+    )
+    return series
+
+
+def _injury_risk_series(
+    conn: duckdb.DuckDBPyConnection, start_date: str | None, end_date: str | None
+) -> dict[str, Any]:
+    series: dict[str, Any] = GarminDBReader.from_connection(
+        conn
+    ).get_injury_risk_series(start_date, end_date)
+    return series
+
+
 @router.get("/training-load")
-def get_training_load_endpoint(
+async def get_training_load_endpoint(
     request: Request,
     lookback_weeks: int = 12,
 ) -> dict[str, Any]:
@@ -22,8 +53,34 @@ def get_training_load_endpoint(
 
     Read-only: delegates entirely to the reader (no Web-side ACWR logic).
     """
-    db_path = getattr(request.app.state, "db_path", None)
-    reader = GarminDBReader(db_path=str(db_path) if db_path is not None else None)
-    current: dict[str, Any] = reader.get_acwr()
-    trend: dict[str, Any] = reader.get_load_trend(lookback_weeks)
-    return {"current": current, "trend": trend}
+    return await run_query(request, _training_load, lookback_weeks)
+
+
+@router.get("/training-load/acwr-series")
+async def get_acwr_series_endpoint(
+    request: Request,
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> dict[str, Any]:
+    """Return the daily ACWR series (whole history by default).
+
+    Read-only: delegates entirely to the reader (no Web-side ACWR logic).
+    """
+    return await run_query(
+        request, _acwr_series, start_date, end_date, priority=Priority.HEAVY
+    )
+
+
+@router.get("/training-load/injury-risk-series")
+async def get_injury_risk_series_endpoint(
+    request: Request,
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> dict[str, Any]:
+    """Return the daily composite injury-risk series (last 12 weeks by default).
+
+    Read-only: delegates entirely to the reader (no Web-side risk logic).
+    """
+    return await run_query(
+        request, _injury_risk_series, start_date, end_date, priority=Priority.HEAVY
+    )
@@ -3,9 +3,10 @@
 from datetime import date, timedelta
 from typing import Annotated, Literal
 
+import duckdb
 from fastapi import APIRouter, HTTPException, Query, Request
-from garmin_mcp.database.connection import get_connection
 
+from garmin_web.db_executor import Priority, run_query
 from garmin_web.queries import objective_fitness as objective_fitness_queries
 from garmin_web.queries import settings as settings_queries
 from garmin_web.queries import trends as trends_queries
@@ -13,12 +14,15 @@ from garmin_web.queries import trends as trends_queries
 router = APIRouter(prefix="/api/trends")
 
 
-def _db_path(request: Request):
-    return getattr(request.app.state, "db_path", None)
+def _volume_trend(conn: duckdb.DuckDBPyConnection, granularity: str) -> list[dict]:
+    week_start_day = settings_queries.get_week_start_day(conn)
+    return trends_queries.get_volume_trend(
+        conn, granularity=granularity, week_start_day=week_start_day
+    )
 
 
 @router.get("/volume")
-def get_volume(
+async def get_volume(
     request: Request,
     granularity: Annotated[Literal["week", "month"], Query()] = "week",
 ) -> list[dict]:
@@ -28,36 +32,29 @@ def get_volume(
     (``athlete_profile``; defaults to Monday). Invalid granularity values are
     rejected with 422 by FastAPI validation.
     """
-    with get_connection(_db_path(request)) as conn:
-        week_start_day = settings_queries.get_week_start_day(conn)
-        return trends_queries.get_volume_trend(
-            conn, granularity=granularity, week_start_day=week_start_day
-        )
+    return await run_query(request, _volume_trend, granularity)
 
 
 @router.get("/physiology")
-def get_physiology(request: Request) -> dict:
+async def get_physiology(request: Request) -> dict:
     """VO2max and lactate threshold time series."""
-    with get_connection(_db_path(request)) as conn:
-        return trends_queries.get_physiology_trend(conn)
+    return await run_query(request, trends_queries.get_physiology_trend)
 
 
 @router.get("/form")
-def get_form(request: Request) -> list[dict]:
+async def get_form(request: Request) -> list[dict]:
     """Form evaluation score trend."""
-    with get_connection(_db_path(request)) as conn:
-        return trends_queries.get_form_trend(conn)
+    return await run_query(request, trends_queries.get_form_trend)
 
 
 @router.get("/efficiency")
-def get_efficiency(request: Request) -> list[dict]:
+async def get_efficiency(request: Request) -> list[dict]:
     """HR efficiency trend with zone distribution."""
-    with get_connection(_db_path(request)) as conn:
-        return trends_queries.get_efficiency_trend(conn)
+    return await run_query(request, trends_queries.get_efficiency_trend)
 
 
 @router.get("/heat-adjusted")
-def get_heat_adjusted(
+async def get_heat_adjusted(
     request: Request,
     days: Annotated[int, Query(ge=30, le=1825)] = 365,
 ) -> dict:
@@ -68,25 +65,29 @@ def get_heat_adjusted(
     """
     end = date.today()
     start = end - timedelta(days=days)
-    with get_connection(_db_path(request)) as conn:
-        return trends_queries.get_heat_adjusted_trend(
-            conn, start.isoformat(), end.isoformat()
-        )
+    return await run_query(
+        request,
+        trends_queries.get_heat_adjusted_trend,
+        start.isoformat(),
+        end.isoformat(),
+        priority=Priority.HEAVY,
+    )
 
 
 @router.get("/critical-speed")
-def get_critical_speed(request: Request) -> list[dict]:
+async def get_critical_speed(request: Request) -> list[dict]:
     """Quarterly threshold-anchored Critical Speed fit (CS pace + R^2).
 
     D' is intentionally omitted: without short/long max efforts the intercept
     is invalid, so CS is presented only as a lactate-threshold speed proxy.
     """
-    with get_connection(_db_path(request)) as conn:
-        return objective_fitness_queries.get_quarterly_critical_speed(conn)
+    return await run_query(
+        request, objective_fitness_queries.get_quarterly_critical_speed
+    )
 
 
 @router.get("/narration/versions")
-def get_trend_narration_versions_endpoint(
+async def get_trend_narration_versions_endpoint(
     request: Request,
     granularity: Annotated[Literal["week", "month"], Query()] = "week",
     period_start: str = Query(...),
@@ -97,14 +98,16 @@ def get_trend_narration_versions_endpoint(
     latest-period route. Invalid granularity values are rejected with 422 by
     FastAPI validation; an unknown period returns ``[]`` (200).
     """
-    with get_connection(_db_path(request)) as conn:
-        return trends_queries.list_trend_narration_versions(
-            conn, granularity, period_start
-        )
+    return await run_query(
+        request,
+        trends_queries.list_trend_narration_versions,
+        granularity,
+        period_start,
+    )
 
 
 @router.get("/narration")
-def get_trend_narration_endpoint(
+async def get_trend_narration_endpoint(
     request: Request,
     granularity: Annotated[Literal["week", "month"], Query()] = "week",
 ) -> dict:
@@ -113,20 +116,24 @@ def get_trend_narration_endpoint(
     Invalid granularity values are rejected with 422 by FastAPI validation. When
     no narration exists yet, responds with 404.
     """
-    with get_connection(_db_path(request)) as conn:
-        narration = trends_queries.get_trend_narration(conn, granularity)
+    narration = await run_query(
+        request, trends_queries.get_trend_narration, granularity
+    )
     if narration is None:
         raise HTTPException(status_code=404, detail="No trend narration found")
     return narration
 
 
 @router.get("/objective-fitness")
-def get_objective_fitness(request: Request) -> dict:
+async def get_objective_fitness(request: Request) -> dict:
     """Objective (real-run derived) fitness curve vs Garmin VO2max + optimism gap.
 
     Overlays a rolling 90-day best-effort performance-VDOT curve on Garmin's own
     VO2max series and surfaces the optimism gap (Garmin-derived VDOT minus the
     objective VDOT, in VDOT and s/km).
     """
-    with get_connection(_db_path(request)) as conn:
-        return objective_fitness_queries.get_objective_fitness_trend(conn)
+    return await run_query(
+        request,
+        objective_fitness_queries.get_objective_fitness_trend,
+        priority=Priority.HEAVY,
+    )
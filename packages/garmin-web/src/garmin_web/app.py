@@ -1,6 +1,8 @@
 """FastAPI application factory for garmin-web."""
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException
@@ -16,6 +18,7 @@ from garmin_web.api.recovery import router as recovery_router
 from garmin_web.api.training_load import router as training_load_router
 from garmin_web.api.trends import router as trends_router
 from garmin_web.api.weekly_reviews import router as weekly_reviews_router
+from garmin_web.db_executor import DEFAULT_HEAVY_WORKERS, DEFAULT_WORKERS, DBExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +30,17 @@ _DEFAULT_STATIC_DIR = (
 )
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    app.state.db_executor.shutdown()
+
+
 def create_app(
     db_path: str | Path | None = None,
     static_dir: str | Path | None = None,
+    db_workers: int = DEFAULT_WORKERS,
+    heavy_db_workers: int = DEFAULT_HEAVY_WORKERS,
 ) -> FastAPI:
     """Create the garmin-web FastAPI application.
 
@@ -40,12 +51,15 @@ def create_app(
             assets). If None, defaults to the package-relative
             `frontend/dist`. If the directory or its index.html is missing,
             a warning is logged and the API still works without the SPA.
+        db_workers: Threads running the interactive (cheap) API queries.
+        heavy_db_workers: Threads running the heavy API queries, which queue
+            separately so they cannot starve the interactive ones.
 
     Returns:
         Configured FastAPI application.
     """
-    app = FastAPI(title="garmin-web", version="0.1.0")
-    app.state.db_path = db_path
+    app = FastAPI(title="garmin-web", version="0.1.0", lifespan=_lifespan)
+    app.state.db_executor = DBExecutor(db_path, db_workers, heavy_db_workers)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=[VITE_DEV_ORIGIN],
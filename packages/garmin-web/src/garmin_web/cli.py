@@ -6,6 +6,7 @@ import logging
 import uvicorn
 
 from garmin_web.app import create_app
+from garmin_web.db_executor import DEFAULT_HEAVY_WORKERS, DEFAULT_WORKERS
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +14,8 @@ logger = logging.getLogger(__name__)
 def main() -> None:
     """Start the garmin-web server with uvicorn.
 
-    Options: --host (default 127.0.0.1), --port (default 8765).
+    Options: --host (default 127.0.0.1), --port (default 8765),
+    --db-workers / --heavy-db-workers (DuckDB query threads per priority lane).
     """
     parser = argparse.ArgumentParser(
         prog="garmin-web",
@@ -30,6 +32,21 @@ def main() -> None:
         default=8765,
         help="Bind port (default: 8765)",
     )
+    parser.add_argument(
+        "--db-workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Threads for interactive API queries (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--heavy-db-workers",
+        type=int,
+        default=DEFAULT_HEAVY_WORKERS,
+        help=(
+            "Threads for heavy API queries such as trends and durability "
+            f"(default: {DEFAULT_HEAVY_WORKERS})"
+        ),
+    )
     args = parser.parse_args()
     if args.host not in ("127.0.0.1", "localhost"):
         logger.warning(
@@ -37,7 +54,8 @@ def main() -> None:
             "Use only on a trusted network.",
             args.host,
         )
-    uvicorn.run(create_app(), host=args.host, port=args.port)
+    app = create_app(db_workers=args.db_workers, heavy_db_workers=args.heavy_db_workers)
+    uvicorn.run(app, host=args.host, port=args.port)
 
 
 if __name__ == "__main__":
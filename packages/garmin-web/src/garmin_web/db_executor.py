@@ -0,0 +1,168 @@
+"""Bounded DuckDB executor for the async API handlers.
+
+The route handlers are ``async`` and never touch DuckDB on the event loop:
+every query is dispatched through :func:`run_query` to the :class:`DBExecutor`
+owned by the app (``app.state.db_executor``). The executor has one fixed-size
+thread pool per :class:`Priority` lane, so a burst of heavy endpoints
+(heat-adjusted trend, durability, objective fitness, form-anomaly flags) queues
+behind its own few workers while the cheap dashboard queries keep theirs.
+
+A request whose client disconnects before its query finishes is cancelled: a
+query that has not started yet never runs, and a running one is interrupted
+with ``interrupt_connection``, which also reaches the cursors a
+``GarminDBReader.from_connection`` reader opens on the connection. The handler then answers 499
+(client closed request), which nobody receives.
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+import duckdb
+from fastapi import HTTPException, Request
+from garmin_mcp.database.connection import get_connection, interrupt_connection
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+DEFAULT_HEAVY_WORKERS = 2
+# How often a waiting handler checks whether its client is still connected.
+DISCONNECT_POLL_SECONDS = 0.1
+
+CLIENT_CLOSED_REQUEST = 499
+
+
+class Priority(StrEnum):
+    """Executor lane of an endpoint."""
+
+    INTERACTIVE = "interactive"
+    HEAVY = "heavy"
+
+
+class _Call:
+    """One query; cancellable before it starts and interruptible while it runs."""
+
+    def __init__(
+        self, fn: Callable[..., Any], args: tuple[Any, ...], db_path: str | Path | None
+    ) -> None:
+        self._fn = fn
+        self._args = args
+        self._db_path = db_path
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._conn: duckdb.DuckDBPyConnection | None = None
+
+    def __call__(self) -> Any:
+        with self._lock:
+            if self._cancelled:
+                raise CancelledError
+        with get_connection(self._db_path) as conn:
+            with self._lock:
+                if self._cancelled:
+                    raise CancelledError
+                self._conn = conn
+            try:
+                return self._fn(conn, *self._args)
+            finally:
+                with self._lock:
+                    self._conn = None
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._cancelled = True
+            if self._conn is not None:
+                interrupt_connection(self._conn)
+
+
+class DBExecutor:
+    """Run DuckDB work for the API on bounded, per-priority thread pools.
+
+    Args:
+        db_path: DuckDB file the queries open (``None``: garmin_mcp default).
+        workers: Threads of the :attr:`Priority.INTERACTIVE` lane.
+        heavy_workers: Threads of the :attr:`Priority.HEAVY` lane.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        workers: int = DEFAULT_WORKERS,
+        heavy_workers: int = DEFAULT_HEAVY_WORKERS,
+    ) -> None:
+        if workers < 1 or heavy_workers < 1:
+            raise ValueError("workers and heavy_workers must be at least 1")
+        self.db_path = db_path
+        self._lanes = {
+            Priority.INTERACTIVE: ThreadPoolExecutor(
+                workers, thread_name_prefix="garmin-web-db"
+            ),
+            Priority.HEAVY: ThreadPoolExecutor(
+                heavy_workers, thread_name_prefix="garmin-web-db-heavy"
+            ),
+        }
+
+    async def query[T](
+        self,
+        request: Request,
+        fn: Callable[..., T],
+        *args: Any,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> T:
+        """Run ``fn(conn, *args)`` on a read-only connection off the event loop.
+
+        Raises:
+            HTTPException: 499 when the client disconnected first.
+        """
+        result: T = await self._submit(request, _Call(fn, args, self.db_path), priority)
+        return result
+
+    async def _submit(self, request: Request, call: _Call, priority: Priority) -> Any:
+        future = asyncio.get_running_loop().run_in_executor(self._lanes[priority], call)
+        watcher = asyncio.ensure_future(_wait_for_disconnect(request))
+        try:
+            await asyncio.wait({future, watcher}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
+        finally:
+            watcher.cancel()
+        if not future.done():
+            call.cancel()
+            future.cancel()
+            logger.info("Client disconnected, cancelled %s", request.url.path)
+            raise HTTPException(
+                status_code=CLIENT_CLOSED_REQUEST, detail="Client closed request"
+            )
+        return future.result()
+
+    def shutdown(self) -> None:
+        """Stop the worker threads (queued work is dropped)."""
+        for lane in self._lanes.values():
+            lane.shutdown(wait=False, cancel_futures=True)
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    while not await request.is_disconnected():
+        await asyncio.sleep(DISCONNECT_POLL_SECONDS)
+
+
+async def run_query[T](
+    request: Request,
+    fn: Callable[..., T],
+    *args: Any,
+    priority: Priority = Priority.INTERACTIVE,
+) -> T:
+    """Run ``fn(conn, *args)`` on the executor of the app serving ``request``.
+
+    Handlers that need a ``GarminDBReader`` build it with
+    ``GarminDBReader.from_connection(conn)`` inside ``fn``; its specialized
+    readers query on cursors opened with ``open_cursor(conn)``, which a
+    disconnect interrupts along with ``conn``.
+    """
+    executor: DBExecutor = request.app.state.db_executor
+    return await executor.query(request, fn, *args, priority=priority)
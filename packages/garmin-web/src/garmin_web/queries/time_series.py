@@ -1,6 +1,16 @@
 """Read-only queries for the time_series_metrics table with downsampling."""
 
 import duckdb
+from garmin_mcp.database.inserters.time_series_rollups import (
+    ROLLUP_METRICS,
+    ROLLUP_RESOLUTIONS_S,
+    rollup_column,
+)
+from garmin_mcp.database.readers.time_series import (
+    RAW_RESOLUTION_S,
+    has_time_series_rollups,
+    select_time_series_resolution,
+)
 
 # Metric columns of time_series_metrics (everything except the key columns
 # activity_id / seq_no / timestamp_s). Source of truth:
@@ -48,6 +58,12 @@ def get_time_series(
     rows are picked at equal intervals; the first and last rows are
     always kept.
 
+    Long activities are read from ``time_series_rollups`` instead of the
+    raw rows when the coarsest rollup still has at least max_points
+    buckets (see ``select_time_series_resolution``). Each point is then a
+    bucket mean stamped with the bucket start, and the same equal-interval
+    picking is applied to the buckets.
+
     Args:
         conn: Open DuckDB connection (read-only is sufficient).
         activity_id: Target activity ID.
@@ -72,13 +88,17 @@ def get_time_series(
     # Deduplicate while preserving order
     metric_names = list(dict.fromkeys(metrics))
 
-    # Safe to interpolate: validated against ALLOWED_METRICS above.
-    columns = ", ".join(metric_names)
-    rows = conn.execute(
-        f"SELECT timestamp_s, {columns} FROM time_series_metrics"
-        " WHERE activity_id = ? ORDER BY seq_no",
-        [activity_id],
-    ).fetchall()
+    resolution_s = _rollup_resolution(conn, activity_id, metric_names, max_points)
+    if resolution_s is not None:
+        rows = _fetch_rollup_rows(conn, activity_id, metric_names, resolution_s)
+    else:
+        # Safe to interpolate: validated against ALLOWED_METRICS above.
+        columns = ", ".join(metric_names)
+        rows = conn.execute(
+            f"SELECT timestamp_s, {columns} FROM time_series_metrics"
+            " WHERE activity_id = ? ORDER BY seq_no",
+            [activity_id],
+        ).fetchall()
 
     n = len(rows)
     if n > max_points:
@@ -91,3 +111,46 @@ def get_time_series(
             name: [row[i + 1] for row in rows] for i, name in enumerate(metric_names)
         },
     }
+
+
+def _rollup_resolution(
+    conn: duckdb.DuckDBPyConnection,
+    activity_id: int,
+    metric_names: list[str],
+    max_points: int,
+) -> int | None:
+    """Rollup resolution to chart from; None when raw rows should be read."""
+    if not set(metric_names) <= set(ROLLUP_METRICS):
+        return None
+    if not has_time_series_rollups(conn):
+        return None
+    finest_s = min(ROLLUP_RESOLUTIONS_S)
+    extent = conn.execute(
+        "SELECT MIN(bucket_start_s), MAX(bucket_start_s), SUM(sample_count)"
+        " FROM time_series_rollups"
+        " WHERE activity_id = ? AND resolution_s = ?",
+        [activity_id, finest_s],
+    ).fetchone()
+    if extent is None or extent[2] is None or extent[2] <= max_points:
+        # No buckets, or few enough raw rows to return them all.
+        return None
+    range_s = extent[1] - extent[0] + finest_s
+    resolution_s = int(select_time_series_resolution(range_s, max_points))
+    return None if resolution_s == RAW_RESOLUTION_S else resolution_s
+
+
+def _fetch_rollup_rows(
+    conn: duckdb.DuckDBPyConnection,
+    activity_id: int,
+    metric_names: list[str],
+    resolution_s: int,
+) -> list[tuple]:
+    """Bucket means as ``(bucket_start_s, *metric values)`` rows."""
+    # Safe to interpolate: validated against ROLLUP_METRICS by the caller.
+    means = ", ".join(rollup_column(name, "mean") for name in metric_names)
+    return conn.execute(
+        f"SELECT bucket_start_s, {means} FROM time_series_rollups"
+        " WHERE activity_id = ? AND resolution_s = ?"
+        " ORDER BY bucket_start_s",
+        [activity_id, resolution_s],
+    ).fetchall()
@@ -57,3 +57,55 @@ def test_training_load_high_risk(training_load_high_risk_db_path):
     current = payload["current"]
     assert current["status"] == "high_risk"
     assert current["acwr"] > 1.5
+
+
+@pytest.mark.integration
+def test_acwr_series_endpoint(training_load_db_path):
+    client = TestClient(create_app(db_path=training_load_db_path))
+    payload = client.get("/api/training-load").json()
+    end_date = payload["current"]["end_date"]
+
+    response = client.get("/api/training-load/acwr-series")
+
+    assert response.status_code == 200
+    series = response.json()
+    assert series["end_date"] == end_date
+    assert series["load_metric"] == "distance_km"
+    days = series["days"]
+    assert days[0]["date"] == series["start_date"]
+    # The last day of the series is the current snapshot.
+    assert days[-1]["acwr"] == payload["current"]["acwr"]
+    assert days[-1]["status"] == payload["current"]["status"]
+
+
+@pytest.mark.integration
+def test_acwr_series_endpoint_date_range(training_load_db_path):
+    client = TestClient(create_app(db_path=training_load_db_path))
+    end_date = client.get("/api/training-load").json()["current"]["end_date"]
+
+    response = client.get(
+        "/api/training-load/acwr-series",
+        params={"start_date": end_date, "end_date": end_date},
+    )
+
+    assert response.status_code == 200
+    assert [day["date"] for day in response.json()["days"]] == [end_date]
+
+
+@pytest.mark.integration
+def test_injury_risk_series_endpoint(training_load_db_path):
+    client = TestClient(create_app(db_path=training_load_db_path))
+    end_date = client.get("/api/training-load").json()["current"]["end_date"]
+
+    response = client.get(
+        "/api/training-load/injury-risk-series",
+        params={"start_date": end_date, "end_date": end_date},
+    )
+
+    assert response.status_code == 200
+    series = response.json()
+    assert (series["start_date"], series["end_date"]) == (end_date, end_date)
+    [day] = series["days"]
+    assert day["date"] == end_date
+    assert "acwr" in day["available_inputs"]
+    assert day["band"] in {"low", "moderate", "high"}
@@ -17,11 +17,26 @@ def test_cli_default_args(monkeypatch):
     ):
         main()
 
+    mock_create_app.assert_called_once_with(db_workers=4, heavy_db_workers=2)
     mock_run.assert_called_once_with(
         mock_create_app.return_value, host="127.0.0.1", port=8765
     )
 
 
+@pytest.mark.unit
+def test_cli_db_worker_args(monkeypatch):
+    monkeypatch.setattr(
+        "sys.argv", ["garmin-web", "--db-workers", "8", "--heavy-db-workers", "1"]
+    )
+    with (
+        patch("garmin_web.cli.uvicorn.run"),
+        patch("garmin_web.cli.create_app") as mock_create_app,
+    ):
+        main()
+
+    mock_create_app.assert_called_once_with(db_workers=8, heavy_db_workers=1)
+
+
 @pytest.mark.unit
 def test_cli_warns_on_public_host(monkeypatch, caplog):
     monkeypatch.setattr("sys.argv", ["garmin-web", "--host", "0.0.0.0"])
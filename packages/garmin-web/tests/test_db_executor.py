@@ -0,0 +1,186 @@
+"""Tests for the bounded DuckDB executor behind the async API handlers."""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import duckdb
+import pytest
+from fastapi import HTTPException
+from garmin_mcp.database.db_reader import GarminDBReader
+
+from garmin_web.db_executor import DBExecutor, Priority
+
+
+class _FakeRequest:
+    """The parts of ``starlette.requests.Request`` the executor uses."""
+
+    def __init__(self) -> None:
+        self.url = SimpleNamespace(path="/api/test")
+        self.disconnected = threading.Event()
+
+    async def is_disconnected(self) -> bool:
+        return self.disconnected.is_set()
+
+
+def _count_activities(conn: duckdb.DuckDBPyConnection, min_distance: float) -> int:
+    row = conn.execute(
+        "SELECT COUNT(*) FROM activities WHERE total_distance_km >= ?",
+        [min_distance],
+    ).fetchone()
+    return int(row[0]) if row else 0
+
+
+@pytest.fixture
+def executor(fixture_db_path: Path):
+    db_executor = DBExecutor(fixture_db_path, workers=1, heavy_workers=1)
+    yield db_executor
+    db_executor.shutdown()
+
+
+@pytest.mark.unit
+def test_rejects_empty_lanes() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        DBExecutor(workers=0)
+
+
+@pytest.mark.integration
+def test_query_passes_connection_and_args(executor: DBExecutor) -> None:
+    result = asyncio.run(executor.query(_FakeRequest(), _count_activities, 6.0))
+
+    assert result == 1
+
+
+@pytest.mark.integration
+def test_busy_heavy_lane_does_not_block_interactive(executor: DBExecutor) -> None:
+    release = threading.Event()
+
+    def _blocking(conn: duckdb.DuckDBPyConnection) -> str:
+        release.wait(timeout=10)
+        return "heavy"
+
+    async def scenario() -> tuple[str, int, bool]:
+        heavy = asyncio.ensure_future(
+            executor.query(_FakeRequest(), _blocking, priority=Priority.HEAVY)
+        )
+        count = await asyncio.wait_for(
+            executor.query(_FakeRequest(), _count_activities, 0.0), timeout=5
+        )
+        heavy_pending = not heavy.done()
+        release.set()
+        return await heavy, count, heavy_pending
+
+    heavy, count, heavy_pending = asyncio.run(scenario())
+
+    assert (heavy, count, heavy_pending) == ("heavy", 2, True)
+
+
+@pytest.mark.integration
+def test_disconnect_before_start_never_runs(executor: DBExecutor) -> None:
+    release = threading.Event()
+    ran: list[str] = []
+
+    def _blocking(conn: duckdb.DuckDBPyConnection) -> None:
+        release.wait(timeout=10)
+
+    def _record(conn: duckdb.DuckDBPyConnection) -> None:
+        ran.append("queued")
+
+    async def scenario() -> int:
+        blocker = asyncio.ensure_future(
+            executor.query(_FakeRequest(), _blocking, priority=Priority.HEAVY)
+        )
+        request = _FakeRequest()
+        request.disconnected.set()
+        try:
+            await executor.query(request, _record, priority=Priority.HEAVY)
+        except HTTPException as exc:
+            return exc.status_code
+        finally:
+            release.set()
+            await blocker
+        return 200
+
+    status = asyncio.run(scenario())
+    # Let the heavy worker drain anything still queued.
+    asyncio.run(executor.query(_FakeRequest(), _count_activities, 0.0))
+
+    assert status == 499
+    assert ran == []
+
+
+@pytest.mark.integration
+def test_disconnect_interrupts_running_query(executor: DBExecutor) -> None:
+    outcome: list[str] = []
+
+    def _endless(conn: duckdb.DuckDBPyConnection) -> None:
+        try:
+            conn.execute("SELECT COUNT(*) FROM range(1000000000000)").fetchone()
+            outcome.append("finished")
+        except duckdb.InterruptException:
+            outcome.append("interrupted")
+
+    async def scenario() -> int:
+        request = _FakeRequest()
+        threading.Timer(0.3, request.disconnected.set).start()
+        try:
+            await executor.query(request, _endless, priority=Priority.HEAVY)
+        except HTTPException as exc:
+            return exc.status_code
+        return 200
+
+    started = time.monotonic()
+    status = asyncio.run(scenario())
+    # The interrupted worker frees its lane for the next heavy query.
+    count = asyncio.run(
+        executor.query(_FakeRequest(), _count_activities, 0.0, priority=Priority.HEAVY)
+    )
+
+    assert status == 499
+    assert outcome == ["interrupted"]
+    assert count == 2
+    assert time.monotonic() - started < 10
+
+
+@pytest.mark.integration
+def test_disconnect_interrupts_reader_cursor_query(executor: DBExecutor) -> None:
+    """A from_connection reader queries on a cursor; the disconnect reaches it."""
+    outcome: list[str] = []
+
+    def _endless_reader_query(conn: duckdb.DuckDBPyConnection) -> None:
+        reader = GarminDBReader.from_connection(conn)
+        with reader.training_load._get_connection() as cursor:
+            try:
+                cursor.execute("SELECT COUNT(*) FROM range(1000000000000)")
+                cursor.fetchone()
+                outcome.append("finished")
+            except duckdb.InterruptException:
+                outcome.append("interrupted")
+
+    async def scenario() -> int:
+        request = _FakeRequest()
+        threading.Timer(0.3, request.disconnected.set).start()
+        try:
+            await executor.query(
+                request, _endless_reader_query, priority=Priority.HEAVY
+            )
+        except HTTPException as exc:
+            return exc.status_code
+        return 200
+
+    status = asyncio.run(scenario())
+    # The lane's only heavy worker is free again once the cursor query stops.
+    count = asyncio.run(
+        asyncio.wait_for(
+            executor.query(
+                _FakeRequest(), _count_activities, 0.0, priority=Priority.HEAVY
+            ),
+            timeout=10,
+        )
+    )
+
+    assert status == 499
+    assert outcome == ["interrupted"]
+    assert count == 2
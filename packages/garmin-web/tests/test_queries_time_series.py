@@ -1,5 +1,6 @@
 """Unit tests for garmin_web.queries.time_series.get_time_series."""
 
+import duckdb
 import pytest
 from garmin_mcp.database.connection import get_connection
 
@@ -56,3 +57,37 @@ def test_allowed_metrics_excludes_key_columns():
     assert "timestamp_s" not in ALLOWED_METRICS
     assert "heart_rate" in ALLOWED_METRICS
     assert "speed" in ALLOWED_METRICS
+
+
+LONG_ACTIVITY_ID = 9000000199  # 2 h at 1 Hz, served from rollups
+
+
+@pytest.mark.unit
+def test_time_series_long_activity_reads_rollups(tmp_path):
+    from garmin_mcp.database.migrations.add_time_series_rollups import (
+        add_time_series_rollups,
+    )
+
+    db_path = tmp_path / "rollups.duckdb"
+    with duckdb.connect(str(db_path)) as conn:
+        add_time_series_rollups(conn)
+        conn.executemany(
+            "INSERT INTO time_series_rollups (activity_id, resolution_s,"
+            " bucket_start_s, sample_count, heart_rate_n, heart_rate_mean)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (LONG_ACTIVITY_ID, r, b, r, r, 140.0 + b % 20)
+                for r in (10, 60)
+                for b in range(0, 7200, r)
+            ],
+        )
+
+    with get_connection(db_path) as conn:
+        result = get_time_series(conn, LONG_ACTIVITY_ID, ["heart_rate"], max_points=500)
+
+    # 720 ten-second buckets, picked down to the budget
+    assert len(result["timestamps"]) == 500
+    assert all(ts % 10 == 0 for ts in result["timestamps"])
+    assert result["timestamps"][0] == 0
+    assert result["timestamps"][-1] == 7190
+    assert set(result["metrics"]["heart_rate"]) == {140.0, 150.0}